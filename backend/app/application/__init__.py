@@ -2,6 +2,7 @@
 from .dto import PredictionRequest, PredictionResponse
 from .use_cases import (
     PredictExoplanetUseCase,
+    PredictExoplanetBatchUseCase,
     GetPredictionsUseCase,
     GetPredictionByIdUseCase,
     DeletePredictionUseCase,
@@ -12,6 +13,7 @@ __all__ = [
     'PredictionRequest',
     'PredictionResponse',
     'PredictExoplanetUseCase',
+    'PredictExoplanetBatchUseCase',
     'GetPredictionsUseCase',
     'GetPredictionByIdUseCase',
     'DeletePredictionUseCase',
@@ -1,5 +1,6 @@
 """Data Transfer Objects"""
 from .prediction_request import PredictionRequest
 from .prediction_response import PredictionResponse
+from .prediction_page import PredictionPage
 
-__all__ = ['PredictionRequest', 'PredictionResponse']
+__all__ = ['PredictionRequest', 'PredictionResponse', 'PredictionPage']
@@ -0,0 +1,24 @@
+"""
+예측 목록 페이지 DTO
+목록 조회 결과 (조건에 맞는 전체 개수와 다음 페이지 커서 포함)
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+from .prediction_response import PredictionResponse
+
+
+@dataclass
+class PredictionPage:
+    """
+    예측 목록 페이지 DTO
+
+    Attributes:
+        predictions: 이번 페이지의 예측 응답 DTO 리스트
+        total: 조건에 맞는 전체 예측 개수
+        next_cursor: 다음 페이지 커서 (마지막 페이지 또는 OFFSET 조회면 None)
+    """
+
+    predictions: List[PredictionResponse]
+    total: int
+    next_cursor: Optional[str] = None
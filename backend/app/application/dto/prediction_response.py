@@ -24,6 +24,7 @@ class PredictionResponse:
         created_at: 생성 시간
         light_curve_data: 광도 곡선 데이터 (선택)
         input_features: 입력 특징값 (선택)
+        light_curve_preview: 광도 곡선 미리보기 (선택)
     """
 
     id: str
@@ -36,6 +37,7 @@ class PredictionResponse:
     created_at: datetime
     light_curve_data: Optional[dict] = None
     input_features: Optional[Dict[str, float]] = None
+    light_curve_preview: Optional[dict] = None
 
     @classmethod
     def from_domain(cls, prediction, classification: str, confidence_level: str):
@@ -50,5 +52,6 @@ class PredictionResponse:
             confidence_level=confidence_level,
             created_at=prediction.created_at,
             light_curve_data=prediction.light_curve_data,
-            input_features=prediction.input_features
+            input_features=prediction.input_features,
+            light_curve_preview=prediction.light_curve_preview
         )
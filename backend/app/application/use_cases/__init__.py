@@ -1,10 +1,11 @@
 """Use Cases - 애플리케이션 비즈니스 로직"""
-from .predict_exoplanet import PredictExoplanetUseCase
+from .predict_exoplanet import PredictExoplanetUseCase, PredictExoplanetBatchUseCase
 from .get_predictions import GetPredictionsUseCase, GetPredictionByIdUseCase
 from .delete_prediction import DeletePredictionUseCase, DeleteAllPredictionsUseCase
 
 __all__ = [
     'PredictExoplanetUseCase',
+    'PredictExoplanetBatchUseCase',
     'GetPredictionsUseCase',
     'GetPredictionByIdUseCase',
     'DeletePredictionUseCase',
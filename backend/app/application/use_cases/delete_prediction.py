@@ -2,14 +2,27 @@
 예측 결과 삭제 Use Cases
 """
 
+from typing import Optional
 from ...domain.repositories.prediction_repository import IPredictionRepository
+from ...domain.repositories.prediction_writer import IPredictionWriter
+from ...domain.value_objects.prediction_filter import PredictionFilter
 
 
 class DeletePredictionUseCase:
     """단일 예측 결과 삭제 Use Case"""
 
-    def __init__(self, repository: IPredictionRepository):
+    def __init__(
+        self,
+        repository: IPredictionRepository,
+        writer: Optional[IPredictionWriter] = None
+    ):
+        """
+        Parameters:
+            repository: 예측 리포지토리
+            writer: write-behind 쓰기 버퍼 (삭제 전에 대기 중인 예측을 먼저 저장)
+        """
         self.repository = repository
+        self.writer = writer
 
     async def execute(self, prediction_id: str) -> bool:
         """
@@ -24,6 +37,10 @@ class DeletePredictionUseCase:
         Raises:
             ValueError: 존재하지 않는 예측 ID
         """
+        # 저장 대기 중인 예측이 삭제 후에 저장되지 않도록 먼저 저장
+        if self.writer is not None:
+            await self.writer.flush()
+
         # 예측 존재 여부 확인
         prediction = await self.repository.find_by_id(prediction_id)
         if not prediction:
@@ -36,8 +53,18 @@ class DeletePredictionUseCase:
 class DeleteAllPredictionsUseCase:
     """모든 예측 결과 삭제 Use Case"""
 
-    def __init__(self, repository: IPredictionRepository):
+    def __init__(
+        self,
+        repository: IPredictionRepository,
+        writer: Optional[IPredictionWriter] = None
+    ):
+        """
+        Parameters:
+            repository: 예측 리포지토리
+            writer: write-behind 쓰기 버퍼 (삭제 전에 대기 중인 예측을 먼저 저장)
+        """
         self.repository = repository
+        self.writer = writer
 
     async def execute(self, is_exoplanet: bool = None) -> int:
         """
@@ -52,21 +79,13 @@ class DeleteAllPredictionsUseCase:
         Returns:
             삭제된 예측 개수
         """
+        # 저장 대기 중인 예측이 삭제 후에 저장되지 않도록 먼저 저장
+        if self.writer is not None:
+            await self.writer.flush()
+
         if is_exoplanet is None:
             # 모든 예측 삭제
             return await self.repository.delete_all()
-        else:
-            # 특정 분류만 삭제
-            predictions = await self.repository.find_all(limit=10000)
-            filtered_predictions = [
-                p for p in predictions
-                if p.is_exoplanet == is_exoplanet
-            ]
-
-            deleted_count = 0
-            for prediction in filtered_predictions:
-                success = await self.repository.delete(prediction.id)
-                if success:
-                    deleted_count += 1
-
-            return deleted_count
+
+        # 특정 분류만 삭제 (DELETE ... WHERE 한 번)
+        return await self.repository.delete_matching(PredictionFilter(is_exoplanet=is_exoplanet))
@@ -2,10 +2,14 @@
 예측 결과 조회 Use Cases
 """
 
-from typing import List, Optional
+from typing import Optional
 from ...domain.repositories.prediction_repository import IPredictionRepository
+from ...domain.repositories.prediction_writer import IPredictionWriter
 from ...domain.value_objects.confidence_score import ConfidenceScore
+from ...domain.value_objects.page_cursor import PageCursor
+from ...domain.value_objects.prediction_filter import PredictionFilter
 from ...domain.value_objects.prediction_result import PredictionResult, PredictionClass
+from ..dto.prediction_page import PredictionPage
 from ..dto.prediction_response import PredictionResponse
 
 
@@ -19,37 +23,72 @@ class GetPredictionsUseCase:
         self,
         skip: int = 0,
         limit: int = 100,
-        is_exoplanet: Optional[bool] = None
-    ) -> List[PredictionResponse]:
+        filters: Optional[PredictionFilter] = None
+    ) -> PredictionPage:
         """
-        예측 결과 목록 조회
+        예측 결과 목록 조회 (OFFSET 페이지네이션)
 
         Parameters:
             skip: 건너뛸 개수 (페이지네이션)
             limit: 최대 조회 개수
-            is_exoplanet: 외계행성 여부 필터 (None이면 전체 조회)
+            filters: 조회 조건 (None이면 전체 조회, DB 쿼리에서 적용)
 
         Returns:
-            예측 응답 DTO 리스트
+            예측 목록 페이지 DTO (조건에 맞는 전체 개수 포함)
         """
-        # 리포지토리에서 데이터 조회
+        # 리포지토리에서 데이터 조회 (필터는 SQL에서 적용되므로 페이지가 항상 limit개까지 채워짐)
         predictions = await self.repository.find_all(
             skip=skip,
-            limit=limit
+            limit=limit,
+            filters=filters
         )
 
-        # 필터 적용
-        if is_exoplanet is not None:
-            predictions = [
-                p for p in predictions
-                if p.is_exoplanet == is_exoplanet
-            ]
-
         # DTO로 변환
-        return [
-            self._to_response_dto(prediction)
-            for prediction in predictions
-        ]
+        return PredictionPage(
+            predictions=[self._to_response_dto(prediction) for prediction in predictions],
+            total=await self.repository.count(filters)
+        )
+
+    async def execute_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[PredictionFilter] = None
+    ) -> PredictionPage:
+        """
+        예측 결과 목록 키셋 페이지네이션 조회
+
+        Parameters:
+            limit: 최대 조회 개수
+            cursor: 이전 응답의 next_cursor (None이면 첫 페이지)
+            filters: 조회 조건 (None이면 전체 조회, DB 쿼리에서 적용)
+
+        Returns:
+            예측 목록 페이지 DTO (조건에 맞는 전체 개수, 다음 페이지가 있으면 next_cursor 포함)
+
+        Raises:
+            ValueError: 유효하지 않은 커서
+        """
+        page_cursor = PageCursor.decode(cursor) if cursor else None
+
+        # 다음 페이지 존재 여부를 알기 위해 한 개 더 조회
+        predictions = await self.repository.find_page(
+            limit=limit + 1,
+            cursor=page_cursor,
+            filters=filters
+        )
+
+        next_cursor = None
+        if len(predictions) > limit:
+            predictions = predictions[:limit]
+            last = predictions[-1]
+            next_cursor = PageCursor(created_at=last.created_at, id=last.id).encode()
+
+        return PredictionPage(
+            predictions=[self._to_response_dto(prediction) for prediction in predictions],
+            total=await self.repository.count(filters),
+            next_cursor=next_cursor
+        )
 
     def _to_response_dto(self, prediction) -> PredictionResponse:
         """도메인 엔티티를 응답 DTO로 변환"""
@@ -91,8 +130,18 @@ class GetPredictionsUseCase:
 class GetPredictionByIdUseCase:
     """단일 예측 결과 조회 Use Case"""
 
-    def __init__(self, repository: IPredictionRepository):
+    def __init__(
+        self,
+        repository: IPredictionRepository,
+        writer: Optional[IPredictionWriter] = None
+    ):
+        """
+        Parameters:
+            repository: 예측 리포지토리
+            writer: write-behind 쓰기 버퍼 (아직 저장되지 않은 예측도 조회)
+        """
         self.repository = repository
+        self.writer = writer
 
     async def execute(self, prediction_id: str) -> Optional[PredictionResponse]:
         """
@@ -104,8 +153,10 @@ class GetPredictionByIdUseCase:
         Returns:
             예측 응답 DTO 또는 None
         """
-        # 리포지토리에서 데이터 조회
-        prediction = await self.repository.find_by_id(prediction_id)
+        # 리포지토리에서 데이터 조회 (쓰기 버퍼에서 저장 대기 중이면 버퍼에서)
+        prediction = self.writer.find_pending(prediction_id) if self.writer else None
+        if prediction is None:
+            prediction = await self.repository.find_by_id(prediction_id)
 
         if not prediction:
             return None
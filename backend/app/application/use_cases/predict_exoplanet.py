@@ -2,12 +2,15 @@
 외계행성 예측 Use Case
 """
 
-from typing import Optional
+from typing import List, Optional
 from ...domain.entities.light_curve import LightCurve
 from ...domain.entities.prediction import Prediction
 from ...domain.repositories.prediction_repository import IPredictionRepository
+from ...domain.repositories.prediction_writer import IPredictionWriter
 from ...domain.services.exoplanet_detector import IExoplanetDetector
 from ...domain.value_objects.confidence_score import ConfidenceScore
+from ...domain.value_objects.prediction_result import PredictionResult
+from ...domain.value_objects.storage_policy import LightCurveStoragePolicy
 from ..dto.prediction_request import PredictionRequest
 from ..dto.prediction_response import PredictionResponse
 
@@ -18,10 +21,21 @@ class PredictExoplanetUseCase:
     def __init__(
         self,
         detector: IExoplanetDetector,
-        repository: IPredictionRepository
+        repository: IPredictionRepository,
+        storage_policy: Optional[LightCurveStoragePolicy] = None,
+        writer: Optional[IPredictionWriter] = None
     ):
+        """
+        Parameters:
+            detector: 외계행성 탐지기
+            repository: 예측 리포지토리
+            storage_policy: 광도 곡선 저장 정책 (None이면 원본 그대로 저장)
+            writer: write-behind 쓰기 버퍼 (None이거나 예약에 실패하면 리포지토리로 직접 저장)
+        """
         self.detector = detector
         self.repository = repository
+        self.storage_policy = storage_policy or LightCurveStoragePolicy()
+        self.writer = writer
 
     async def execute(
         self,
@@ -46,15 +60,73 @@ class PredictExoplanetUseCase:
             prediction_result = await self.detector.detect_from_features(
                 request.features
             )
-            light_curve_data = None
+            return await self._build_response(
+                prediction_result=prediction_result,
+                light_curve=None,
+                input_features=request.features,
+                save_result=save_result
+            )
+
         # 광도 곡선 데이터로부터 예측
-        elif request.has_light_curve():
-            prediction_result = await self._predict_from_light_curve(
-                request.light_curve_data
+        if request.has_light_curve():
+            light_curve = self._to_light_curve(request.light_curve_data)
+            prediction_result = await self.detector.detect(light_curve)
+            return await self._build_response(
+                prediction_result=prediction_result,
+                light_curve=light_curve,
+                input_features=None,
+                save_result=save_result,
+                light_curve_data=request.light_curve_data
             )
-            light_curve_data = request.light_curve_data
-        else:
-            raise ValueError("광도 곡선 데이터 또는 특징값이 필요합니다")
+
+        raise ValueError("광도 곡선 데이터 또는 특징값이 필요합니다")
+
+    async def execute_light_curve(
+        self,
+        light_curve: LightCurve,
+        save_result: bool = True
+    ) -> PredictionResponse:
+        """
+        광도 곡선 엔티티로부터 외계행성 예측 실행 (파일 업로드용)
+
+        Parameters:
+            light_curve: 광도 곡선 엔티티 (배열을 복사 없이 특징 추출에 사용)
+            save_result: 결과 저장 여부 (기본값: True)
+
+        Returns:
+            예측 응답 DTO
+
+        Raises:
+            ValueError: 유효하지 않은 광도 곡선
+        """
+        light_curve.validate()
+        prediction_result = await self.detector.detect(light_curve)
+
+        return await self._build_response(
+            prediction_result=prediction_result,
+            light_curve=light_curve,
+            input_features=None,
+            save_result=save_result
+        )
+
+    async def _build_response(
+        self,
+        prediction_result: PredictionResult,
+        light_curve: Optional[LightCurve],
+        input_features: Optional[dict],
+        save_result: bool,
+        light_curve_data: Optional[dict] = None
+    ) -> PredictionResponse:
+        """
+        예측 결과 → 도메인 엔티티 생성, 저장(옵션), 응답 DTO 변환
+
+        광도 곡선은 저장할 때만 저장 정책에 따라 JSON 직렬화용 리스트로 변환
+        (light_curve_data는 요청으로 받은 원본, full 정책이면 그대로 저장)
+        """
+        stored_data, preview = None, None
+        if save_result and light_curve is not None:
+            stored_data = self.storage_policy.stored_data(light_curve, light_curve_data)
+            preview = self.storage_policy.preview(light_curve)
 
         # 신뢰도 점수 계산
         confidence = ConfidenceScore(
@@ -66,8 +138,9 @@ class PredictExoplanetUseCase:
 
         # 도메인 엔티티 생성
         prediction = Prediction(
-            light_curve_data=light_curve_data,
-            input_features=request.features if request.has_features() else None,
+            light_curve_data=stored_data,
+            light_curve_preview=preview,
+            input_features=input_features,
             is_exoplanet=prediction_result.is_exoplanet,
             confidence_score=confidence.score,
             planet_probability=prediction_result.planet_probability,
@@ -76,7 +149,7 @@ class PredictExoplanetUseCase:
 
         # 결과 저장 (옵션)
         if save_result:
-            prediction = await self.repository.save(prediction)
+            prediction = await _save(self.repository, self.writer, prediction)
 
         # 응답 DTO 생성
         return PredictionResponse.from_domain(
@@ -85,9 +158,8 @@ class PredictExoplanetUseCase:
             confidence_level=confidence.get_level()
         )
 
-    async def _predict_from_light_curve(self, light_curve_data: dict):
-        """광도 곡선 데이터로부터 예측"""
-        # 광도 곡선 엔티티 생성
+    def _to_light_curve(self, light_curve_data: dict) -> LightCurve:
+        """광도 곡선 데이터 → 검증된 광도 곡선 엔티티"""
         light_curve = LightCurve(
             time=light_curve_data.get('time', []),
             flux=light_curve_data.get('flux', []),
@@ -97,5 +169,132 @@ class PredictExoplanetUseCase:
         # 데이터 검증
         light_curve.validate()
 
-        # 예측 수행
-        return await self.detector.detect(light_curve)
+        return light_curve
+
+
+class PredictExoplanetBatchUseCase:
+    """외계행성 일괄 예측 Use Case"""
+
+    def __init__(
+        self,
+        detector: IExoplanetDetector,
+        repository: IPredictionRepository,
+        storage_policy: Optional[LightCurveStoragePolicy] = None,
+        writer: Optional[IPredictionWriter] = None
+    ):
+        """
+        Parameters:
+            detector: 외계행성 탐지기
+            repository: 예측 리포지토리
+            storage_policy: 광도 곡선 저장 정책 (None이면 원본 그대로 저장)
+            writer: write-behind 쓰기 버퍼 (None이거나 예약에 실패하면 리포지토리로 직접 저장)
+        """
+        self.detector = detector
+        self.repository = repository
+        self.storage_policy = storage_policy or LightCurveStoragePolicy()
+        self.writer = writer
+
+    async def execute(
+        self,
+        requests: List[PredictionRequest],
+        save_result: bool = True
+    ) -> List[PredictionResponse]:
+        """
+        여러 요청에 대한 외계행성 예측을 한 번의 모델 호출로 실행
+
+        Parameters:
+            requests: 예측 요청 DTO 리스트
+            save_result: 결과 저장 여부 (기본값: True)
+
+        Returns:
+            요청 순서와 동일한 예측 응답 DTO 리스트
+
+        Raises:
+            ValueError: 유효하지 않은 요청 데이터
+        """
+        # 요청별 입력 준비 (특징값 우선, 없으면 광도 곡선)
+        inputs = []
+        for index, request in enumerate(requests):
+            if request.has_features():
+                inputs.append(request.features)
+            elif request.has_light_curve():
+                inputs.append(LightCurve(
+                    time=request.light_curve_data.get('time', []),
+                    flux=request.light_curve_data.get('flux', []),
+                    flux_err=request.light_curve_data.get('flux_err')
+                ))
+            else:
+                raise ValueError(
+                    f"광도 곡선 데이터 또는 특징값이 필요합니다 (index={index})"
+                )
+
+        # 일괄 예측 수행
+        prediction_results = await self.detector.detect_batch(inputs)
+
+        predictions, confidences = [], []
+        for request, item, prediction_result in zip(requests, inputs, prediction_results):
+            # 신뢰도 점수 계산
+            confidence = ConfidenceScore(
+                score=max(
+                    prediction_result.planet_probability,
+                    prediction_result.candidate_probability
+                )
+            )
+
+            # 광도 곡선은 저장할 때만 저장 정책 적용
+            has_features = request.has_features()
+            stored_data, preview = None, None
+            if save_result and not has_features:
+                stored_data = self.storage_policy.stored_data(item, request.light_curve_data)
+                preview = self.storage_policy.preview(item)
+
+            # 도메인 엔티티 생성
+            prediction = Prediction(
+                light_curve_data=stored_data,
+                light_curve_preview=preview,
+                input_features=request.features if has_features else None,
+                is_exoplanet=prediction_result.is_exoplanet,
+                confidence_score=confidence.score,
+                planet_probability=prediction_result.planet_probability,
+                candidate_probability=prediction_result.candidate_probability
+            )
+
+            predictions.append(prediction)
+            confidences.append(confidence)
+
+        # 결과 저장 (옵션, 버퍼에 예약되지 않은 예측은 한 번에 일괄 저장)
+        if save_result:
+            await _save_many(self.repository, self.writer, predictions)
+
+        # 응답 DTO 생성
+        return [
+            PredictionResponse.from_domain(
+                prediction=prediction,
+                classification=prediction_result.classification,
+                confidence_level=confidence.get_level()
+            )
+            for prediction, prediction_result, confidence
+            in zip(predictions, prediction_results, confidences)
+        ]
+
+
+async def _save(
+    repository: IPredictionRepository,
+    writer: Optional[IPredictionWriter],
+    prediction: Prediction
+) -> Prediction:
+    """쓰기 버퍼에 저장을 예약하고, 버퍼가 없거나 가득 찼으면 리포지토리로 직접 저장"""
+    if writer is not None and writer.enqueue(prediction):
+        return prediction
+    return await repository.save(prediction)
+
+
+async def _save_many(
+    repository: IPredictionRepository,
+    writer: Optional[IPredictionWriter],
+    predictions: List[Prediction]
+):
+    """쓰기 버퍼에 저장을 예약하고, 예약되지 않은 예측은 리포지토리로 한 번에 저장"""
+    if writer is not None:
+        predictions = [prediction for prediction in predictions if not writer.enqueue(prediction)]
+    await repository.save_many(predictions)
@@ -3,16 +3,30 @@
 별의 밝기 변화 데이터를 나타내는 도메인 엔티티
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional, Sequence, Union
 import numpy as np
 
 
-@dataclass
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+# 허용하는 배열 자료형 (float32는 메모리 절반, 통계 계산은 float64로 수행)
+SUPPORTED_DTYPES = (np.float64, np.float32)
+
+# 다운샘플링 방식 (lttb: 모양 보존, minmax: 구간별 최소·최대 보존)
+DOWNSAMPLE_METHODS = ('lttb', 'minmax')
+
+
 class LightCurve:
     """
     광도 곡선 엔티티
 
+    time, flux, flux_err는 연속된 읽기 전용 float64(또는 float32) 배열로 보관하고,
+    중앙값·최소값·최대값은 처음 사용할 때 한 번만 계산하여 캐시.
+    호출자가 쓸 수 있는 메모리를 공유하는 입력은 복사하므로 이후 호출자가 원본을
+    바꿔도 엔티티와 캐시는 영향을 받지 않음. 기반 버퍼까지 모두 읽기 전용인 배열
+    (업로드 버퍼의 뷰 등)만 복사 없이 감싸며, 슬라이싱과 정규화 결과는 엔티티 배열을
+    공유하는 뷰로 만들어짐
+
     Attributes:
         time: 시간 배열
         flux: 밝기(flux) 배열
@@ -20,39 +34,147 @@ class LightCurve:
         metadata: 추가 메타데이터
     """
 
-    time: List[float]
-    flux: List[float]
-    flux_err: Optional[List[float]] = None
-    metadata: Optional[dict] = None
+    __slots__ = ('time', 'flux', 'flux_err', 'metadata', '_median', '_min', '_max')
+
+    def __init__(
+        self,
+        time: ArrayLike,
+        flux: ArrayLike,
+        flux_err: Optional[ArrayLike] = None,
+        metadata: Optional[dict] = None,
+        dtype=np.float64
+    ):
+        """
+        Parameters:
+            time: 시간 배열
+            flux: 밝기 배열
+            flux_err: 밝기 오차 배열 (선택)
+            metadata: 추가 메타데이터
+            dtype: 배열 자료형 (np.float64 또는 np.float32)
+
+        Raises:
+            ValueError: 지원하지 않는 자료형이거나 도메인 규칙 위반
+        """
+        if np.dtype(dtype) not in [np.dtype(value) for value in SUPPORTED_DTYPES]:
+            raise ValueError("광도 곡선 자료형은 float64 또는 float32여야 합니다")
 
-    def __post_init__(self):
-        """엔티티 검증"""
-        self._validate()
+        self.time = _readonly_array(time, dtype)
+        self.flux = _readonly_array(flux, dtype)
+        self.flux_err = _readonly_array(flux_err, dtype) if flux_err is not None else None
+        self.metadata = metadata
+        self._median = None
+        self._min = None
+        self._max = None
 
-    def _validate(self):
-        """도메인 규칙 검증"""
-        if len(self.time) != len(self.flux):
+        self.validate()
+
+    @classmethod
+    def _from_views(
+        cls,
+        time: np.ndarray,
+        flux: np.ndarray,
+        flux_err: Optional[np.ndarray],
+        metadata: Optional[dict]
+    ) -> 'LightCurve':
+        """이미 검증된 읽기 전용 배열로 생성 (변환·검증 생략)"""
+        light_curve = cls.__new__(cls)
+        light_curve.time = time
+        light_curve.flux = flux
+        light_curve.flux_err = flux_err
+        light_curve.metadata = metadata
+        light_curve._median = None
+        light_curve._min = None
+        light_curve._max = None
+        return light_curve
+
+    def validate(self):
+        """
+        도메인 규칙 검증
+
+        Raises:
+            ValueError: 배열 차원·길이가 맞지 않거나 데이터가 비어있는 경우
+        """
+        if self.time.ndim != 1 or self.flux.ndim != 1:
+            raise ValueError("시간과 밝기는 1차원 배열이어야 합니다")
+
+        if self.time.size != self.flux.size:
             raise ValueError("시간과 밝기 배열의 길이가 같아야 합니다")
 
-        if len(self.time) == 0:
+        if self.time.size == 0:
             raise ValueError("광도 곡선 데이터가 비어있을 수 없습니다")
 
-        if self.flux_err and len(self.flux_err) != len(self.flux):
+        if self.flux_err is not None and self.flux_err.shape != self.flux.shape:
             raise ValueError("밝기 오차 배열의 길이가 밝기 배열과 같아야 합니다")
 
+    def __len__(self) -> int:
+        return self.flux.size
+
+    def __getitem__(self, index: slice) -> 'LightCurve':
+        """
+        구간 슬라이싱 (원본 메모리를 공유하는 뷰)
+
+        Parameters:
+            index: 슬라이스 (step 포함 가능)
+
+        Returns:
+            슬라이스된 광도 곡선
+
+        Raises:
+            TypeError: 슬라이스가 아닌 인덱스
+            ValueError: 결과 구간이 비어있는 경우
+        """
+        if not isinstance(index, slice):
+            raise TypeError("광도 곡선은 슬라이스로만 인덱싱할 수 있습니다")
+
+        light_curve = LightCurve._from_views(
+            time=self.time[index],
+            flux=self.flux[index],
+            flux_err=self.flux_err[index] if self.flux_err is not None else None,
+            metadata=self.metadata
+        )
+        light_curve.validate()
+        return light_curve
+
+    def __repr__(self) -> str:
+        return (
+            f"LightCurve(length={len(self)}, dtype={self.flux.dtype}, "
+            f"has_flux_err={self.flux_err is not None})"
+        )
+
+    @property
+    def median_flux(self) -> float:
+        """밝기 중앙값 (캐시)"""
+        if self._median is None:
+            self._median = float(np.median(self.flux))
+        return self._median
+
+    @property
+    def min_flux(self) -> float:
+        """밝기 최소값 (캐시)"""
+        if self._min is None:
+            self._min = float(np.min(self.flux))
+        return self._min
+
+    @property
+    def max_flux(self) -> float:
+        """밝기 최대값 (캐시)"""
+        if self._max is None:
+            self._max = float(np.max(self.flux))
+        return self._max
+
     def get_length(self) -> int:
         """데이터 포인트 개수"""
-        return len(self.time)
+        return len(self)
 
     def get_time_span(self) -> float:
         """관측 기간 (일)"""
-        if len(self.time) < 2:
+        if self.time.size < 2:
             return 0.0
-        return max(self.time) - min(self.time)
+        return float(np.max(self.time) - np.min(self.time))
 
     def get_flux_range(self) -> tuple[float, float]:
         """밝기 범위 (최소, 최대)"""
-        return (min(self.flux), max(self.flux))
+        return (self.min_flux, self.max_flux)
 
     def has_transit_signal(self, threshold: float = 0.01) -> bool:
         """
@@ -61,37 +183,182 @@ class LightCurve:
         Parameters:
             threshold: 밝기 감소 임계값 (기본 1%)
         """
-        flux_array = np.array(self.flux)
-        median_flux = np.median(flux_array)
-        min_flux = np.min(flux_array)
-
         # 중간값 대비 최소값의 감소량
-        drop = (median_flux - min_flux) / median_flux
+        drop = (self.median_flux - self.min_flux) / self.median_flux
 
         return drop > threshold
 
+    def phase_fold(self, period: float, epoch: float) -> np.ndarray:
+        """
+        궤도 위상 (-0.5 ~ 0.5, 0이 트랜짓 중심)
+
+        Parameters:
+            period: 궤도 주기 (일)
+            epoch: 트랜짓 중심 시각
+
+        Returns:
+            시간 배열과 같은 길이의 위상 배열
+        """
+        if period <= 0:
+            raise ValueError("주기는 0보다 커야 합니다")
+
+        cycles = (self.time - epoch) / period + 0.5
+        return cycles - np.floor(cycles) - 0.5
+
+    def downsample(self, max_points: int, method: str = 'lttb') -> 'LightCurve':
+        """
+        최대 max_points개 점으로 줄인 광도 곡선 (저장·미리보기용)
+
+        원본 점 중 일부를 그대로 고르므로 트랜짓 바닥처럼 눈에 띄는 점이 유지됨.
+        lttb는 이웃 구간 평균과 만드는 삼각형 면적이 가장 큰 점을 구간마다 하나씩,
+        minmax는 구간마다 최소·최대 두 점을 고름. 점 수가 이미 max_points 이하이면 자신을 반환
+
+        Parameters:
+            max_points: 최대 점 수 (lttb는 3 이상, minmax는 4 이상)
+            method: 'lttb' 또는 'minmax'
+
+        Returns:
+            다운샘플링된 광도 곡선 (첫 점과 마지막 점 포함, 시간 순서 유지)
+
+        Raises:
+            ValueError: 지원하지 않는 방식이거나 max_points가 너무 작은 경우
+        """
+        if method not in DOWNSAMPLE_METHODS:
+            raise ValueError(f"지원하지 않는 다운샘플링 방식입니다: {method}")
+        minimum = 3 if method == 'lttb' else 4
+        if max_points < minimum:
+            raise ValueError(f"{method} 다운샘플링 점 수는 {minimum} 이상이어야 합니다")
+
+        if len(self) <= max_points:
+            return self
+
+        if method == 'lttb':
+            indices = _lttb_indices(self.time, self.flux, max_points)
+        else:
+            indices = _minmax_indices(self.flux, max_points)
+
+        return LightCurve._from_views(
+            time=_readonly_take(self.time, indices),
+            flux=_readonly_take(self.flux, indices),
+            flux_err=_readonly_take(self.flux_err, indices) if self.flux_err is not None else None,
+            metadata=self.metadata
+        )
+
     def normalize(self) -> 'LightCurve':
-        """정규화된 광도 곡선 반환"""
-        flux_array = np.array(self.flux)
-        median_flux = np.median(flux_array)
+        """
+        정규화된 광도 곡선 반환
 
-        normalized_flux = (flux_array / median_flux).tolist()
+        밝기만 중앙값으로 나눈 새 배열이고 time, flux_err, metadata는 원본을 공유.
+        정규화 결과의 중앙값·최소값·최대값은 원본 캐시에서 바로 계산하여 설정
+        """
+        median_flux = self.median_flux
+        normalized_flux = self.flux / self.flux.dtype.type(median_flux)
+        normalized_flux.flags.writeable = False
 
-        return LightCurve(
-            time=self.time.copy(),
+        light_curve = LightCurve._from_views(
+            time=self.time,
             flux=normalized_flux,
-            flux_err=self.flux_err.copy() if self.flux_err else None,
+            flux_err=self.flux_err,
             metadata=self.metadata
         )
+        light_curve._median = 1.0
+        light_curve._min = self.min_flux / median_flux
+        light_curve._max = self.max_flux / median_flux
+        return light_curve
 
     def to_dict(self) -> dict:
-        """딕셔너리로 변환"""
+        """딕셔너리로 변환 (JSON 직렬화용 리스트)"""
         return {
-            'time': self.time,
-            'flux': self.flux,
-            'flux_err': self.flux_err,
+            'time': self.time.tolist(),
+            'flux': self.flux.tolist(),
+            'flux_err': self.flux_err.tolist() if self.flux_err is not None else None,
             'metadata': self.metadata,
             'length': self.get_length(),
             'time_span': self.get_time_span(),
             'flux_range': self.get_flux_range()
         }
+
+
+def _readonly_array(values: ArrayLike, dtype) -> np.ndarray:
+    """
+    엔티티 전용 읽기 전용 연속 배열
+
+    변환 과정에서 새로 만든 배열은 그대로 읽기 전용으로 설정하고, 입력 메모리를
+    공유하는 배열은 입력과 기반 버퍼가 모두 읽기 전용일 때만 복사 없이 뷰로 감쌈
+    (호출자의 배열 플래그는 바꾸지 않음)
+    """
+    array = np.ascontiguousarray(values, dtype=dtype)
+    if isinstance(values, np.ndarray) and np.may_share_memory(array, values):
+        array = array.view() if _is_frozen(array) else array.copy()
+    array.flags.writeable = False
+    return array
+
+
+def _is_frozen(array: np.ndarray) -> bool:
+    """배열과 기반 배열·버퍼가 모두 읽기 전용인지 여부 (다른 참조로 내용을 바꿀 수 없는지)"""
+    base = array
+    while isinstance(base, np.ndarray):
+        if base.flags.writeable:
+            return False
+        base = base.base
+
+    if base is None:
+        return True
+    try:
+        return memoryview(base).readonly
+    except TypeError:
+        return False
+
+
+def _readonly_take(values: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """선택한 점의 읽기 전용 복사본"""
+    array = values[indices]
+    array.flags.writeable = False
+    return array
+
+
+def _lttb_indices(time: np.ndarray, flux: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets 선택 점 색인
+
+    첫 점과 마지막 점 사이를 n_out - 2개 구간으로 나누고, 구간마다 직전에 고른 점과
+    다음 구간 평균점이 이루는 삼각형의 면적이 가장 큰 점을 고름
+    """
+    n = time.size
+    time = np.asarray(time, dtype=np.float64)
+    flux = np.asarray(flux, dtype=np.float64)
+
+    # 구간 b = [edges[b], edges[b + 1]) (n > n_out이므로 경계가 겹치지 않음)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    counts = np.diff(edges)
+    mean_time = np.add.reduceat(time[:n - 1], edges[:-1]) / counts
+    mean_flux = np.add.reduceat(flux[:n - 1], edges[:-1]) / counts
+    # 마지막 구간의 다음 평균점은 마지막 점
+    mean_time = np.append(mean_time[1:], time[n - 1])
+    mean_flux = np.append(mean_flux[1:], flux[n - 1])
+
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        dt = time[selected] - mean_time[bucket]
+        df = mean_flux[bucket] - flux[selected]
+        area = np.abs(dt * (flux[start:stop] - flux[selected]) + (time[start:stop] - time[selected]) * df)
+        selected = start + int(np.argmax(area))
+        indices[bucket + 1] = selected
+
+    return indices
+
+
+def _minmax_indices(flux: np.ndarray, n_out: int) -> np.ndarray:
+    """구간마다 최소·최대 점 색인 ((n_out - 2) // 2개 구간 + 첫·마지막 점, 시간 순서)"""
+    n = flux.size
+    edges = np.linspace(0, n, (n_out - 2) // 2 + 1).astype(np.intp)
+    selected = [0, n - 1]
+    for start, stop in zip(edges[:-1], edges[1:]):
+        segment = flux[start:stop]
+        selected.append(start + int(np.argmin(segment)))
+        selected.append(start + int(np.argmax(segment)))
+
+    return np.unique(selected)
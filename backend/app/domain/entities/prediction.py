@@ -23,6 +23,7 @@ class Prediction:
         candidate_probability: 후보 확률
         created_at: 생성 시간
         input_features: 입력된 특징값들
+        light_curve_preview: 목록 조회용 광도 곡선 미리보기 (JSON)
     """
 
     # 필수 속성
@@ -38,6 +39,7 @@ class Prediction:
     id: str = field(default_factory=lambda: str(uuid4()))
     created_at: datetime = field(default_factory=datetime.utcnow)
     input_features: Optional[dict] = None
+    light_curve_preview: Optional[dict] = None
 
     def __post_init__(self):
         """엔티티 검증"""
@@ -78,5 +80,6 @@ class Prediction:
             'candidate_probability': self.candidate_probability,
             'classification': self.get_classification(),
             'created_at': self.created_at.isoformat(),
-            'input_features': self.input_features
+            'input_features': self.input_features,
+            'light_curve_preview': self.light_curve_preview
         }
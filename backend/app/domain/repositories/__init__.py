@@ -1,4 +1,5 @@
 """Domain Repository Interfaces"""
 from .prediction_repository import IPredictionRepository
+from .prediction_writer import IPredictionWriter
 
-__all__ = ['IPredictionRepository']
+__all__ = ['IPredictionRepository', 'IPredictionWriter']
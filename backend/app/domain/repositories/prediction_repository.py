@@ -6,6 +6,8 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..entities.prediction import Prediction
+from ..value_objects.page_cursor import PageCursor
+from ..value_objects.prediction_filter import PredictionFilter
 
 
 class IPredictionRepository(ABC):
@@ -24,6 +26,19 @@ class IPredictionRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_many(self, predictions: List[Prediction]) -> List[Prediction]:
+        """
+        여러 예측을 한 번에 저장
+
+        Parameters:
+            predictions: 저장할 예측 엔티티 리스트 (ID는 엔티티에서 생성됨)
+
+        Returns:
+            저장된 예측 엔티티 리스트 (입력 순서 유지)
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, prediction_id: str) -> Optional[Prediction]:
         """
@@ -38,19 +53,45 @@ class IPredictionRepository(ABC):
         pass
 
     @abstractmethod
-    async def find_all(self, skip: int = 0, limit: int = 100) -> List[Prediction]:
+    async def find_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[PredictionFilter] = None
+    ) -> List[Prediction]:
         """
         모든 예측 조회 (페이지네이션)
 
         Parameters:
             skip: 건너뛸 개수
             limit: 최대 개수
+            filters: 조회 조건 (None이면 전체)
 
         Returns:
             예측 엔티티 리스트
         """
         pass
 
+    @abstractmethod
+    async def find_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None,
+        filters: Optional[PredictionFilter] = None
+    ) -> List[Prediction]:
+        """
+        키셋 페이지네이션 조회 ((created_at, id) 내림차순)
+
+        Parameters:
+            limit: 최대 개수
+            cursor: 이전 페이지 마지막 행의 위치 (None이면 첫 페이지)
+            filters: 조회 조건 (None이면 전체)
+
+        Returns:
+            cursor 이후의 예측 엔티티 리스트
+        """
+        pass
+
     @abstractmethod
     async def find_by_classification(
         self,
@@ -95,9 +136,25 @@ class IPredictionRepository(ABC):
         pass
 
     @abstractmethod
-    async def count(self) -> int:
+    async def delete_matching(self, filters: PredictionFilter) -> int:
+        """
+        조건에 맞는 예측 삭제
+
+        Parameters:
+            filters: 삭제 조건
+
+        Returns:
+            삭제된 개수
+        """
+        pass
+
+    @abstractmethod
+    async def count(self, filters: Optional[PredictionFilter] = None) -> int:
         """
-        전체 예측 개수
+        예측 개수
+
+        Parameters:
+            filters: 조회 조건 (None이면 전체)
 
         Returns:
             예측 개수
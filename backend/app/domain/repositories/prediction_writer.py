@@ -0,0 +1,52 @@
+"""
+예측 쓰기 버퍼 인터페이스
+도메인 계층에서 정의, 인프라 계층에서 구현
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..entities.prediction import Prediction
+
+
+class IPredictionWriter(ABC):
+    """
+    예측 쓰기 버퍼 인터페이스 (write-behind)
+
+    저장할 예측을 받아 즉시 반환하고, 실제 저장은 나중에 묶어서 수행
+    """
+
+    @abstractmethod
+    def enqueue(self, prediction: Prediction) -> bool:
+        """
+        예측 저장 예약
+
+        Parameters:
+            prediction: 저장할 예측 엔티티
+
+        Returns:
+            예약 성공 여부 (False면 호출자가 리포지토리로 직접 저장)
+        """
+        pass
+
+    @abstractmethod
+    def find_pending(self, prediction_id: str) -> Optional[Prediction]:
+        """
+        아직 저장되지 않은 예측 조회
+
+        Parameters:
+            prediction_id: 예측 ID
+
+        Returns:
+            대기 중인 예측 엔티티 또는 None
+        """
+        pass
+
+    @abstractmethod
+    async def flush(self) -> int:
+        """
+        대기 중인 예측을 모두 저장
+
+        Returns:
+            저장된 개수
+        """
+        pass
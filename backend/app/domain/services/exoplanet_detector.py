@@ -4,6 +4,7 @@ ML 모델을 사용한 예측 로직
 """
 
 from abc import ABC, abstractmethod
+from typing import Dict, List, Sequence, Union
 from ..entities.light_curve import LightCurve
 from ..value_objects.prediction_result import PredictionResult
 
@@ -37,6 +38,22 @@ class IExoplanetDetector(ABC):
         """
         pass
 
+    @abstractmethod
+    async def detect_batch(
+        self,
+        inputs: Sequence[Union[LightCurve, Dict[str, float]]]
+    ) -> List[PredictionResult]:
+        """
+        여러 입력에 대한 일괄 외계행성 탐지
+
+        Parameters:
+            inputs: 광도 곡선 엔티티 또는 특징값 딕셔너리 리스트 (혼합 가능)
+
+        Returns:
+            입력 순서와 동일한 예측 결과 리스트
+        """
+        pass
+
     @abstractmethod
     def get_model_info(self) -> dict:
         """
@@ -1,5 +1,8 @@
 """Domain Value Objects"""
 from .prediction_result import PredictionResult
 from .confidence_score import ConfidenceScore
+from .storage_policy import LightCurveStoragePolicy
+from .page_cursor import PageCursor
+from .prediction_filter import PredictionFilter
 
-__all__ = ['PredictionResult', 'ConfidenceScore']
+__all__ = ['PredictionResult', 'ConfidenceScore', 'LightCurveStoragePolicy', 'PageCursor', 'PredictionFilter']
@@ -0,0 +1,58 @@
+"""
+페이지 커서 Value Object
+키셋 페이지네이션에서 마지막으로 읽은 행의 위치를 나타냄
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    페이지 커서 Value Object
+
+    목록은 (created_at, id) 내림차순으로 정렬되며, 다음 페이지는 이 위치보다
+    뒤에 있는 행부터 시작. 클라이언트에는 encode()한 불투명 문자열로 전달
+
+    Attributes:
+        created_at: 마지막 행의 생성 시간
+        id: 마지막 행의 예측 ID (같은 생성 시간 내 순서 결정)
+    """
+
+    created_at: datetime
+    id: str
+
+    def encode(self) -> str:
+        """URL에 그대로 쓸 수 있는 불투명 커서 문자열"""
+        payload = json.dumps(
+            {'c': self.created_at.isoformat(), 'i': self.id},
+            separators=(',', ':')
+        )
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    @classmethod
+    def decode(cls, token: str) -> 'PageCursor':
+        """
+        커서 문자열 해석
+
+        Parameters:
+            token: encode()로 만든 커서 문자열
+
+        Returns:
+            페이지 커서
+
+        Raises:
+            ValueError: 형식이 잘못된 커서
+        """
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            return cls(
+                created_at=datetime.fromisoformat(payload['c']),
+                id=str(payload['i'])
+            )
+        except (ValueError, TypeError, KeyError, UnicodeError):
+            raise ValueError(f"유효하지 않은 페이지 커서입니다: {token}")
@@ -0,0 +1,102 @@
+"""
+예측 조회 필터 Value Object
+목록 조회·개수·삭제에 공통으로 적용되는 조건
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from .prediction_result import PredictionClass
+
+
+# 분류별 (is_exoplanet, planet_probability 하한, 상한) - 상한은 미포함
+# 목록 응답의 분류 결정 규칙(GetPredictionsUseCase._determine_classification)과 동일
+CLASSIFICATION_BOUNDS = {
+    PredictionClass.CONFIRMED: (True, 0.8, None),
+    PredictionClass.LIKELY_CONFIRMED: (True, 0.6, 0.8),
+    PredictionClass.CANDIDATE: (True, None, 0.6),
+    PredictionClass.FALSE_POSITIVE: (False, None, None)
+}
+
+
+@dataclass(frozen=True)
+class PredictionFilter:
+    """
+    예측 조회 필터 Value Object
+
+    모든 조건은 AND로 결합되며 None인 조건은 적용하지 않음
+
+    Attributes:
+        is_exoplanet: 외계행성 여부
+        classification: 분류 (CONFIRMED, LIKELY_CONFIRMED, CANDIDATE, FALSE_POSITIVE)
+        min_confidence: 최소 신뢰도 점수 (포함)
+        max_confidence: 최대 신뢰도 점수 (포함)
+        created_from: 생성 시간 하한 (포함, UTC)
+        created_to: 생성 시간 상한 (미포함, UTC)
+    """
+
+    is_exoplanet: Optional[bool] = None
+    classification: Optional[str] = None
+    min_confidence: Optional[float] = None
+    max_confidence: Optional[float] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+    def __post_init__(self):
+        """Value Object 검증 및 시간대 정규화"""
+        if self.classification is not None and self.classification not in CLASSIFICATION_BOUNDS:
+            raise ValueError(
+                f"지원하지 않는 분류입니다: {self.classification} "
+                f"(지원 분류: {', '.join(CLASSIFICATION_BOUNDS)})"
+            )
+
+        for name in ('min_confidence', 'max_confidence'):
+            value = getattr(self, name)
+            if value is not None and not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name}은(는) 0.0과 1.0 사이여야 합니다: {value}")
+
+        if (
+            self.min_confidence is not None
+            and self.max_confidence is not None
+            and self.min_confidence > self.max_confidence
+        ):
+            raise ValueError("min_confidence는 max_confidence보다 클 수 없습니다")
+
+        # created_at은 시간대 없는 UTC로 저장되므로 시간대가 있는 값은 UTC로 변환
+        for name in ('created_from', 'created_to'):
+            value = getattr(self, name)
+            if value is not None and value.tzinfo is not None:
+                object.__setattr__(self, name, value.astimezone(timezone.utc).replace(tzinfo=None))
+
+        if (
+            self.created_from is not None
+            and self.created_to is not None
+            and self.created_from >= self.created_to
+        ):
+            raise ValueError("created_from은 created_to보다 이전이어야 합니다")
+
+    @property
+    def is_empty(self) -> bool:
+        """적용할 조건이 없는지 여부"""
+        return all(
+            value is None for value in (
+                self.is_exoplanet,
+                self.classification,
+                self.min_confidence,
+                self.max_confidence,
+                self.created_from,
+                self.created_to
+            )
+        )
+
+    def classification_bounds(self) -> Optional[Tuple[bool, Optional[float], Optional[float]]]:
+        """
+        분류 조건을 컬럼 조건으로 변환
+
+        Returns:
+            (is_exoplanet, planet_probability 하한, 상한) 또는 None (분류 조건 없음)
+        """
+        if self.classification is None:
+            return None
+        return CLASSIFICATION_BOUNDS[self.classification]
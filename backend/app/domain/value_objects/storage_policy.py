@@ -0,0 +1,107 @@
+"""
+광도 곡선 저장 정책 Value Object
+예측 결과에 광도 곡선을 어떤 형태로 저장할지 나타냄
+"""
+
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+from ..entities.light_curve import LightCurve
+
+
+StorageMode = Literal["full", "lttb", "minmax", "features"]
+
+STORAGE_MODES = ("full", "lttb", "minmax", "features")
+
+
+@dataclass(frozen=True)
+class LightCurveStoragePolicy:
+    """
+    광도 곡선 저장 정책 Value Object
+
+    mode:
+        full: 원본 광도 곡선 그대로 저장
+        lttb: LTTB로 max_points개 점까지 줄여 저장 (곡선 모양 보존)
+        minmax: 구간별 최소·최대 점으로 max_points개까지 줄여 저장 (트랜짓 바닥 보존)
+        features: 광도 곡선은 저장하지 않음 (예측 결과와 미리보기만 저장)
+
+    모든 방식에서 목록 조회용 미리보기(preview_points개 점, minmax)를 따로 저장
+
+    Attributes:
+        mode: 저장 방식
+        max_points: 다운샘플링 저장 시 최대 점 수
+        preview_points: 미리보기 점 수 (0이면 미리보기 저장 안 함)
+    """
+
+    mode: StorageMode = "full"
+    max_points: int = 2000
+    preview_points: int = 100
+
+    def __post_init__(self):
+        """Value Object 검증"""
+        if self.mode not in STORAGE_MODES:
+            raise ValueError(
+                f"지원하지 않는 광도 곡선 저장 방식입니다: {self.mode} "
+                f"(지원 방식: {', '.join(STORAGE_MODES)})"
+            )
+
+        if self.mode in ("lttb", "minmax") and self.max_points < 4:
+            raise ValueError("다운샘플링 저장 점 수는 4 이상이어야 합니다")
+
+        if self.preview_points != 0 and self.preview_points < 4:
+            raise ValueError("미리보기 점 수는 0(사용 안 함) 또는 4 이상이어야 합니다")
+
+    def stored_data(
+        self,
+        light_curve: LightCurve,
+        original_data: Optional[dict] = None
+    ) -> Optional[dict]:
+        """
+        저장할 광도 곡선 데이터
+
+        Parameters:
+            light_curve: 광도 곡선 엔티티
+            original_data: 요청으로 받은 원본 딕셔너리 (full 방식이면 변환 없이 그대로 저장)
+
+        Returns:
+            time, flux, flux_err 딕셔너리 (다운샘플링 시 original_length 포함) 또는 None
+        """
+        if self.mode == "features":
+            return None
+
+        if self.mode == "full":
+            return original_data if original_data is not None else _to_data(light_curve)
+
+        downsampled = light_curve.downsample(self.max_points, method=self.mode)
+        data = _to_data(downsampled)
+        if downsampled is not light_curve:
+            data['original_length'] = len(light_curve)
+        return data
+
+    def preview(self, light_curve: LightCurve) -> Optional[dict]:
+        """
+        목록 조회용 미리보기 (time, flux만 포함)
+
+        Parameters:
+            light_curve: 광도 곡선 엔티티
+
+        Returns:
+            time, flux 딕셔너리 또는 None (미리보기 사용 안 함)
+        """
+        if self.preview_points == 0:
+            return None
+
+        downsampled = light_curve.downsample(self.preview_points, method="minmax")
+        return {
+            'time': downsampled.time.tolist(),
+            'flux': downsampled.flux.tolist()
+        }
+
+
+def _to_data(light_curve: LightCurve) -> dict:
+    """JSON 직렬화용 time, flux, flux_err 딕셔너리"""
+    return {
+        'time': light_curve.time.tolist(),
+        'flux': light_curve.flux.tolist(),
+        'flux_err': light_curve.flux_err.tolist() if light_curve.flux_err is not None else None
+    }
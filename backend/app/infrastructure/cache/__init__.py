@@ -0,0 +1,10 @@
+"""Cache Infrastructure"""
+from .ttl_cache import TTLCache
+from .prediction_cache import PredictionCache
+from .feature_cache import FeatureCache
+
+__all__ = [
+    'TTLCache',
+    'PredictionCache',
+    'FeatureCache'
+]
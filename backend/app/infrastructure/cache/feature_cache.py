@@ -0,0 +1,217 @@
+"""
+특징값 캐시
+광도 곡선 원본 바이트의 해시를 키로 추출된 특징값 딕셔너리를 캐싱 (메모리 + 선택적 디스크)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from ...domain.entities.light_curve import LightCurve
+from .ttl_cache import TTLCache
+
+
+class FeatureCache:
+    """
+    특징값 캐시
+
+    키는 광도 곡선의 time, flux, flux_err 배열 바이트(자료형·길이 포함)와 특징 추출 설정
+    문자열의 해시이므로, 같은 곡선을 다시 제출하면 save_result 등 다른 요청 옵션과 무관하게
+    특징 추출을 건너뜀. 특징값은 곡선 내용과 추출 설정만으로 정해지므로 모델이 바뀌어도
+    유효하며, 메모리 계층은 LRU로 크기를 제한.
+
+    디스크 계층(directory 지정 시)은 키별 JSON 파일로 저장하여 재시작 후와 다른 워커에서도
+    재사용하고, 메모리에서 밀려난 항목을 디스크에서 다시 올림. 파일 수가 max_disk_entries를
+    넘으면 오래 전에 기록된 파일부터 삭제
+
+    환경변수:
+        FEATURE_CACHE_SIZE: 메모리 최대 항목 수 (기본값 1000, 0이면 비활성화)
+        FEATURE_CACHE_TTL: 메모리 항목 유효 시간 (초, 기본값 0 - 만료 없음)
+        FEATURE_CACHE_DIR: 디스크 계층 디렉터리 (비어있으면 디스크 계층 사용 안 함)
+        FEATURE_CACHE_DISK_MAX_ENTRIES: 디스크 최대 파일 수 (기본값 100000)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: float = 0,
+        directory: Optional[str] = None,
+        max_disk_entries: int = 100_000
+    ):
+        """
+        Parameters:
+            max_size: 메모리 최대 항목 수 (0이면 메모리·디스크 모두 비활성화)
+            ttl_seconds: 메모리 항목 유효 시간 (초, 0이면 만료 없음)
+            directory: 디스크 계층 디렉터리 (None이면 사용 안 함)
+            max_disk_entries: 디스크 최대 파일 수
+        """
+        self._cache = TTLCache("features", max_size=max_size, ttl_seconds=ttl_seconds)
+        self.directory = Path(directory) if directory else None
+        self.max_disk_entries = max_disk_entries
+
+        self._disk_lock = threading.Lock()
+        self._disk_entries = 0
+        self._disk_hits = 0
+        self._disk_misses = 0
+
+        if self.enabled and self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._disk_entries = sum(1 for _ in self.directory.glob('*/*.json'))
+
+    @classmethod
+    def from_env(cls) -> 'FeatureCache':
+        """환경변수 설정으로 캐시 생성"""
+        return cls(
+            max_size=int(os.getenv("FEATURE_CACHE_SIZE", "1000")),
+            ttl_seconds=float(os.getenv("FEATURE_CACHE_TTL", "0")),
+            directory=os.getenv("FEATURE_CACHE_DIR") or None,
+            max_disk_entries=int(os.getenv("FEATURE_CACHE_DISK_MAX_ENTRIES", "100000"))
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 활성화 여부"""
+        return self._cache.enabled
+
+    def make_key(self, light_curve: LightCurve, settings: str = '') -> str:
+        """
+        캐시 키 생성
+
+        연속 배열의 메모리를 그대로 해시하므로 곡선 크기에 비례하는 복사가 없음
+
+        Parameters:
+            light_curve: 광도 곡선 엔티티
+            settings: 특징 추출 설정 문자열 (FeatureExtractor.settings_key())
+
+        Returns:
+            32자리 16진수 해시 키
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(settings.encode('utf-8'))
+        for values in (light_curve.time, light_curve.flux, light_curve.flux_err):
+            if values is None:
+                digest.update(b'|none')
+                continue
+            values = np.ascontiguousarray(values)
+            digest.update(f'|{values.dtype.str}:{values.size}|'.encode('ascii'))
+            digest.update(memoryview(values).cast('B'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, float]]:
+        """
+        캐시된 특징값 조회 (메모리 → 디스크 순)
+
+        Parameters:
+            key: make_key()로 만든 키
+
+        Returns:
+            특징값 딕셔너리 사본 (없으면 None)
+        """
+        if not self.enabled:
+            return None
+
+        features = self._cache.get(key)
+        if features is None and self.directory is not None:
+            features = self._read_disk(key)
+            if features is not None:
+                self._cache.put(key, features)
+
+        return dict(features) if features is not None else None
+
+    def put(self, key: str, features: Dict[str, float]):
+        """
+        특징값 저장
+
+        Parameters:
+            key: make_key()로 만든 키
+            features: 추출된 특징값 딕셔너리
+        """
+        if not self.enabled:
+            return
+
+        # 호출자가 딕셔너리를 변경해도 캐시 항목은 그대로 유지되도록 사본 저장
+        stored = {name: float(value) for name, value in features.items()}
+        self._cache.put(key, stored)
+
+        if self.directory is not None:
+            self._write_disk(key, stored)
+
+    def _path(self, key: str) -> Path:
+        """키별 파일 경로 (앞 2자리로 하위 디렉터리 분산)"""
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, float]]:
+        """디스크 계층 조회 (파일이 없거나 손상되었으면 None)"""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as file:
+                features = json.load(file)
+        except (OSError, ValueError):
+            with self._disk_lock:
+                self._disk_misses += 1
+            return None
+
+        with self._disk_lock:
+            self._disk_hits += 1
+        return features
+
+    def _write_disk(self, key: str, features: Dict[str, float]):
+        """디스크 계층 저장 (임시 파일 작성 후 교체, 실패해도 예측은 계속)"""
+        path = self._path(key)
+        if path.exists():
+            return
+
+        try:
+            path.parent.mkdir(exist_ok=True)
+            temporary = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            with open(temporary, 'w', encoding='utf-8') as file:
+                json.dump(features, file)
+            os.replace(temporary, path)
+        except OSError as e:
+            print(f"[WARN] 특징값 디스크 캐시 저장 실패: {str(e)}")
+            return
+
+        with self._disk_lock:
+            self._disk_entries += 1
+            over_limit = self._disk_entries > self.max_disk_entries
+        if over_limit:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """기록 시각이 오래된 파일부터 삭제하여 max_disk_entries의 90%로 줄임"""
+        with self._disk_lock:
+            files = []
+            for path in self.directory.glob('*/*.json'):
+                try:
+                    files.append((path.stat().st_mtime, path))
+                except OSError:
+                    continue
+
+            files.sort()
+            excess = len(files) - int(self.max_disk_entries * 0.9)
+            for _, path in files[:max(excess, 0)]:
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+            self._disk_entries = len(files) - max(excess, 0)
+
+    def clear(self):
+        """메모리 항목 제거 (디스크 계층은 유지)"""
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        with self._disk_lock:
+            disk = {
+                'directory': str(self.directory) if self.directory is not None else None,
+                'entries': self._disk_entries,
+                'max_entries': self.max_disk_entries,
+                'hits': self._disk_hits,
+                'misses': self._disk_misses
+            }
+        return dict(self._cache.stats(), disk=disk)
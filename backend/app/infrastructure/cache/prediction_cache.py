@@ -0,0 +1,126 @@
+"""
+예측 결과 캐시
+정렬·반올림된 모델 입력 벡터와 모델 버전을 키로 클래스별 확률을 캐싱
+"""
+
+import hashlib
+import os
+import threading
+from typing import Optional
+
+import numpy as np
+
+from .ttl_cache import TTLCache
+
+
+class PredictionCache:
+    """
+    예측 결과 캐시
+
+    키는 전처리된(특징 순서로 정렬·스케일링된) 입력 벡터를 decimals 자리로
+    반올림한 바이트열과 모델 버전의 해시이므로, 딕셔너리 키 순서나
+    부동소수점 표현 차이와 무관하게 같은 특징 세트는 같은 키를 가짐.
+    다른 버전의 모델이 사용되면 기존 항목을 모두 비움
+
+    환경변수:
+        PREDICTION_CACHE_SIZE: 최대 항목 수 (기본값 10000, 0이면 비활성화)
+        PREDICTION_CACHE_TTL: 항목 유효 시간 (초, 기본값 3600, 0이면 만료 없음)
+        PREDICTION_CACHE_DECIMALS: 키 생성 시 반올림 자릿수 (기본값 6)
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 3600, decimals: int = 6):
+        """
+        Parameters:
+            max_size: 최대 항목 수 (0이면 비활성화)
+            ttl_seconds: 항목 유효 시간 (초)
+            decimals: 키 생성 시 반올림 자릿수
+        """
+        self.decimals = decimals
+        self._cache = TTLCache("prediction", max_size=max_size, ttl_seconds=ttl_seconds)
+        self._model_version: Optional[str] = None
+        self._version_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> 'PredictionCache':
+        """환경변수 설정으로 캐시 생성"""
+        return cls(
+            max_size=int(os.getenv("PREDICTION_CACHE_SIZE", "10000")),
+            ttl_seconds=float(os.getenv("PREDICTION_CACHE_TTL", "3600")),
+            decimals=int(os.getenv("PREDICTION_CACHE_DECIMALS", "6"))
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 활성화 여부"""
+        return self._cache.enabled
+
+    def make_key(self, processed_row: np.ndarray, model_version: str) -> bytes:
+        """
+        캐시 키 생성
+
+        Parameters:
+            processed_row: 전처리된 (F,) 입력 벡터
+            model_version: 모델 버전
+
+        Returns:
+            16바이트 해시 키
+        """
+        # -0.0과 0.0을 같은 값으로 맞추기 위해 + 0.0
+        rounded = np.round(np.asarray(processed_row, dtype=np.float64), self.decimals) + 0.0
+        digest = hashlib.blake2b(rounded.tobytes(), digest_size=16)
+        digest.update(model_version.encode('utf-8'))
+        return digest.digest()
+
+    def get(self, processed_row: np.ndarray, model_version: str) -> Optional[np.ndarray]:
+        """
+        캐시된 클래스별 확률 조회
+
+        Parameters:
+            processed_row: 전처리된 (F,) 입력 벡터
+            model_version: 현재 모델 버전
+
+        Returns:
+            (C,) 클래스별 확률 (없으면 None)
+        """
+        if not self.enabled:
+            return None
+
+        self._check_version(model_version)
+        return self._cache.get(self.make_key(processed_row, model_version))
+
+    def put(self, processed_row: np.ndarray, model_version: str, probabilities: np.ndarray):
+        """
+        클래스별 확률 저장
+
+        Parameters:
+            processed_row: 전처리된 (F,) 입력 벡터
+            model_version: 예측에 사용된 모델 버전
+            probabilities: (C,) 클래스별 확률
+        """
+        if not self.enabled:
+            return
+
+        self._check_version(model_version)
+        # 캐시된 배열이 호출자에 의해 변경되지 않도록 읽기 전용 사본 저장
+        stored = np.array(probabilities, dtype=np.float64)
+        stored.setflags(write=False)
+        self._cache.put(self.make_key(processed_row, model_version), stored)
+
+    def _check_version(self, model_version: str):
+        """모델 버전이 바뀌었으면 이전 버전의 항목을 모두 제거"""
+        if model_version == self._model_version:
+            return
+
+        with self._version_lock:
+            if model_version != self._model_version:
+                if self._model_version is not None:
+                    self._cache.clear()
+                self._model_version = model_version
+
+    def clear(self):
+        """모든 항목 제거"""
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        return dict(self._cache.stats(), model_version=self._model_version)
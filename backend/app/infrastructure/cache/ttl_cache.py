@@ -0,0 +1,128 @@
+"""
+LRU + TTL 캐시
+크기 제한과 만료 시간을 가진 스레드 안전 인메모리 캐시
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from ..monitoring.metrics import CACHE_HITS, CACHE_MISSES, CACHE_EVICTIONS, CACHE_ENTRIES
+
+
+class TTLCache:
+    """
+    LRU + TTL 캐시
+
+    항목 수가 max_size를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+    ttl_seconds가 지난 항목은 조회 시점에 만료 처리.
+    적중/미스/제거 횟수와 항목 수는 name 레이블로 Prometheus에 기록
+    """
+
+    def __init__(self, name: str, max_size: int = 10000, ttl_seconds: Optional[float] = 3600):
+        """
+        Parameters:
+            name: 캐시 이름 (메트릭 레이블)
+            max_size: 최대 항목 수 (0이면 캐시 비활성화)
+            ttl_seconds: 항목 유효 시간 (초, None 또는 0이면 만료 없음)
+        """
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds or None
+
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._hit_counter = CACHE_HITS.labels(cache=name)
+        self._miss_counter = CACHE_MISSES.labels(cache=name)
+        self._eviction_counter = CACHE_EVICTIONS.labels(cache=name)
+        self._entries_gauge = CACHE_ENTRIES.labels(cache=name)
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 활성화 여부"""
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        캐시 조회
+
+        Parameters:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 (없거나 만료되었으면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    self._hit_counter.inc()
+                    return value
+
+                # 만료된 항목 제거
+                del self._entries[key]
+                self._eviction_counter.inc()
+                self._entries_gauge.set(len(self._entries))
+
+            self._misses += 1
+            self._miss_counter.inc()
+            return None
+
+    def put(self, key: Hashable, value: Any):
+        """
+        캐시 저장 (크기 초과 시 LRU 항목 제거)
+
+        Parameters:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        if not self.enabled:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            evicted = 0
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                evicted += 1
+
+            if evicted:
+                self._eviction_counter.inc(evicted)
+            self._entries_gauge.set(len(self._entries))
+
+    def clear(self):
+        """모든 항목 제거"""
+        with self._lock:
+            if self._entries:
+                self._eviction_counter.inc(len(self._entries))
+            self._entries.clear()
+            self._entries_gauge.set(0)
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                'name': self.name,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / total if total else 0.0
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
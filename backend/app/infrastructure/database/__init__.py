@@ -1,12 +1,30 @@
 """Database Infrastructure"""
-from .connection import get_db, init_db, engine, SessionLocal, Base
+from .connection import (
+    get_db,
+    get_async_db,
+    init_db,
+    check_database,
+    check_database_async,
+    dispose_engines,
+    engine,
+    async_engine,
+    SessionLocal,
+    AsyncSessionLocal,
+    Base
+)
 from .models import PredictionModel
 
 __all__ = [
     'get_db',
+    'get_async_db',
     'init_db',
+    'check_database',
+    'check_database_async',
+    'dispose_engines',
     'engine',
+    'async_engine',
     'SessionLocal',
+    'AsyncSessionLocal',
     'Base',
     'PredictionModel'
 ]
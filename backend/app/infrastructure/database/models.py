@@ -2,7 +2,7 @@
 SQLAlchemy 데이터베이스 모델
 """
 
-from sqlalchemy import Column, String, Float, Boolean, DateTime, JSON
+from sqlalchemy import Column, String, Float, Boolean, DateTime, JSON, Index
 from datetime import datetime
 from .connection import Base
 
@@ -13,7 +13,8 @@ class PredictionModel(Base):
 
     Attributes:
         id: 예측 고유 ID
-        light_curve_data: 광도 곡선 데이터 (JSON)
+        light_curve_data: 광도 곡선 데이터 (JSON, 저장 정책에 따라 다운샘플링 또는 생략)
+        light_curve_preview: 목록 조회용 광도 곡선 미리보기 (JSON)
         input_features: 입력 특징값 (JSON) - 통계 계산용
         is_exoplanet: 외계행성 여부
         classification: 분류 (CONFIRMED, CANDIDATE, FALSE_POSITIVE)
@@ -25,13 +26,20 @@ class PredictionModel(Base):
     """
 
     __tablename__ = "predictions"
+    __table_args__ = (
+        # 목록 조회 정렬 (created_at DESC, id DESC)과 키셋 페이지네이션 범위 조건용
+        Index("ix_predictions_created_at_id", "created_at", "id"),
+        # is_exoplanet·분류 필터 목록 조회 (필터 후 정렬 없이 커서 위치부터 읽음)
+        Index("ix_predictions_is_exoplanet_created_at_id", "is_exoplanet", "created_at", "id"),
+    )
 
     id = Column(String(36), primary_key=True, index=True)  # UUID 길이
     light_curve_data = Column(JSON, nullable=True)
+    light_curve_preview = Column(JSON, nullable=True)  # 목록 조회 시 light_curve_data 대신 로드
     input_features = Column(JSON, nullable=True)  # 입력 특징값 저장
     is_exoplanet = Column(Boolean, nullable=False)
     classification = Column(String(20), nullable=True, index=True)  # 분류 저장
-    confidence_score = Column(Float, nullable=False)
+    confidence_score = Column(Float, nullable=False, index=True)  # 신뢰도 범위 필터용
     planet_probability = Column(Float, nullable=False)
     candidate_probability = Column(Float, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,12 +1,66 @@
 """Machine Learning Infrastructure"""
 from .model_loader import ModelLoader
+from .flux_statistics import (
+    FluxStatistics,
+    SegmentFluxStatistics,
+    compute_flux_statistics,
+    compute_segment_statistics
+)
+from .transit_search import TransitSearch, TransitSearchResult
+from .detrender import LightCurveDetrender, DetrendResult
+from .phase_folder import PhaseFolder, PhaseBinning, FoldedLightCurve
 from .feature_extractor import FeatureExtractor
+from .streaming_features import (
+    RunningMoments,
+    QuantileSketch,
+    StreamingFeatureAccumulator,
+    StreamingFeatureExtractor
+)
+from .light_curve_reader import (
+    UnsupportedFormatError,
+    detect_format,
+    iter_csv_chunks,
+    read_light_curve
+)
 from .preprocessor import Preprocessor
+from .feature_plan import FeaturePlan
+from .compiled_ensemble import CompiledEnsemble
+from .inference_executor import InferenceExecutor, InferenceQueueFullError
+from .micro_batcher import MicroBatcher
 from .exoplanet_detector_impl import ExoplanetDetectorImpl
+from .model_runtime import ModelRuntime
+from .model_registry import ModelRegistry, ShadowDetector
 
 __all__ = [
     'ModelLoader',
+    'FluxStatistics',
+    'SegmentFluxStatistics',
+    'compute_flux_statistics',
+    'compute_segment_statistics',
+    'TransitSearch',
+    'TransitSearchResult',
+    'LightCurveDetrender',
+    'DetrendResult',
+    'PhaseFolder',
+    'PhaseBinning',
+    'FoldedLightCurve',
     'FeatureExtractor',
+    'RunningMoments',
+    'QuantileSketch',
+    'StreamingFeatureAccumulator',
+    'StreamingFeatureExtractor',
+    'UnsupportedFormatError',
+    'detect_format',
+    'iter_csv_chunks',
+    'read_light_curve',
     'Preprocessor',
-    'ExoplanetDetectorImpl'
+    'FeaturePlan',
+    'CompiledEnsemble',
+    'InferenceExecutor',
+    'InferenceQueueFullError',
+    'MicroBatcher',
+    'ExoplanetDetectorImpl',
+    'ModelRuntime',
+    'ModelRegistry',
+    'ShadowDetector'
 ]
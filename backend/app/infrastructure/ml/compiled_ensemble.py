@@ -0,0 +1,767 @@
+"""
+컴파일된 앙상블 추론 엔진 (Compiled Ensemble)
+학습된 StackingClassifier를 배열 기반 표현으로 변환하여 NumPy만으로 추론
+
+지원 구성:
+- 기반 모델: LightGBM, XGBoost, sklearn GradientBoosting,
+  sklearn RandomForest/ExtraTrees, sklearn MLP
+- 메타 모델: sklearn LogisticRegression
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+# 트리 평가 시 한 번에 처리할 최대 행 수 (중간 배열 메모리 제한)
+_ROW_CHUNK = 2048
+
+
+def _softmax(raw: np.ndarray) -> np.ndarray:
+    """행 단위 softmax"""
+    shifted = raw - raw.max(axis=1, keepdims=True)
+    np.exp(shifted, out=shifted)
+    shifted /= shifted.sum(axis=1, keepdims=True)
+    return shifted
+
+
+def _sigmoid(raw: np.ndarray) -> np.ndarray:
+    """로지스틱 함수"""
+    return 1.0 / (1.0 + np.exp(-raw))
+
+
+def _binary_proba(positive: np.ndarray) -> np.ndarray:
+    """양성 확률 (N,) 또는 (N, 1)을 [음성, 양성] (N, 2)로 변환"""
+    positive = positive.reshape(-1)
+    return np.column_stack([1.0 - positive, positive])
+
+
+class _TreeEnsemble:
+    """
+    평탄화된 트리 앙상블
+
+    모든 트리의 노드를 하나의 배열 집합(feature, threshold, left, right, value)에
+    연속으로 저장. 리프 노드는 자기 자신을 자식으로 가지므로, 모든 트리를
+    max_depth번 동시에 한 단계씩 내려가는 벡터 연산만으로 리프에 도달.
+    부스팅 트리처럼 트리마다 한 출력 열에만 기여하면(tree_column >= 0)
+    리프 값 합을 (N, T) @ (T, K) 행렬 곱 한 번으로 계산
+
+    link:
+        proba: 리프 값 합이 곧 확률 (RandomForest, 트리별 확률 / 트리 수)
+        softmax: bias + 리프 값 합에 softmax (다중 클래스 부스팅)
+        sigmoid: bias + 리프 값 합에 sigmoid (이진 부스팅)
+    """
+
+    ARRAYS = ('feature', 'threshold', 'left', 'right', 'value',
+              'default_left', 'zero_missing', 'roots', 'tree_column', 'bias')
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        value: np.ndarray,
+        default_left: np.ndarray,
+        zero_missing: np.ndarray,
+        roots: np.ndarray,
+        tree_column: np.ndarray,
+        bias: np.ndarray,
+        max_depth: int,
+        link: str,
+        strict: bool = False,
+        float32_input: bool = False
+    ):
+        self.feature = feature.astype(np.int32)
+        self.threshold = threshold.astype(np.float64)
+        self.left = left.astype(np.int32)
+        self.right = right.astype(np.int32)
+        self.value = value.astype(np.float64)
+        self.default_left = default_left.astype(bool)
+        self.zero_missing = zero_missing.astype(bool)
+        self.roots = roots.astype(np.int32)
+        self.tree_column = tree_column.astype(np.int32)
+        self.bias = bias.astype(np.float64)
+        self.max_depth = int(max_depth)
+        self.link = link
+        self.strict = bool(strict)
+        self.float32_input = bool(float32_input)
+        self._has_zero_missing = bool(self.zero_missing.any())
+
+        # 탐색용 사전 계산: 자식 노드를 [왼쪽, 오른쪽] 쌍으로 묶어 한 번의 take로 이동
+        self._feature = self.feature.astype(np.intp)
+        self._children = np.stack([self.left, self.right], axis=1).ravel().astype(np.intp)
+        self._roots = self.roots.astype(np.intp)
+
+        self._columnwise = bool(len(self.tree_column)) and bool((self.tree_column >= 0).all())
+        if self._columnwise:
+            self._leaf_scalar = self.value.sum(axis=1)
+            self._tree_onehot = np.zeros((len(self.roots), self.value.shape[1]))
+            self._tree_onehot[np.arange(len(self.roots)), self.tree_column] = 1.0
+
+    def raw_sum(self, X: np.ndarray) -> np.ndarray:
+        """모든 트리의 리프 값 합 (N, K)"""
+        if self.float32_input:
+            # sklearn/XGBoost는 입력을 float32로 변환한 뒤 비교
+            X = X.astype(np.float32)
+
+        n_rows, n_features = X.shape
+        output = np.empty((n_rows, self.value.shape[1]), dtype=np.float64)
+
+        for start in range(0, n_rows, _ROW_CHUNK):
+            block = np.ascontiguousarray(X[start:start + _ROW_CHUNK]).ravel()
+            n_block = len(block) // n_features
+            row_offset = (np.arange(n_block, dtype=np.intp) * n_features)[:, np.newaxis]
+            nodes = np.broadcast_to(self._roots, (n_block, len(self._roots))).copy()
+
+            for _ in range(self.max_depth):
+                x = block.take(row_offset + self._feature.take(nodes))
+                threshold = self.threshold.take(nodes)
+                go_right = (x >= threshold) if self.strict else (x > threshold)
+
+                if self._has_zero_missing:
+                    # LightGBM missing_type=Zero: 0은 결측으로 보고 기본 방향으로 이동
+                    missing = self.zero_missing.take(nodes) & (np.abs(x) <= 1e-35)
+                    go_right = np.where(missing, ~self.default_left.take(nodes), go_right)
+
+                nodes = self._children.take(2 * nodes + go_right)
+
+            if self._columnwise:
+                output[start:start + n_block] = self._leaf_scalar.take(nodes) @ self._tree_onehot
+            else:
+                output[start:start + n_block] = self.value[nodes].sum(axis=1)
+
+        return output
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """클래스별 확률 (N, C)"""
+        raw = self.raw_sum(X)
+
+        if self.link == 'proba':
+            return raw
+
+        raw += self.bias
+        if self.link == 'softmax':
+            return _softmax(raw)
+        return _binary_proba(_sigmoid(raw))
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], dict]:
+        """직렬화용 (배열, 파라미터) 반환"""
+        arrays = {name: getattr(self, name) for name in self.ARRAYS}
+        params = {
+            'max_depth': self.max_depth,
+            'link': self.link,
+            'strict': self.strict,
+            'float32_input': self.float32_input
+        }
+        return arrays, params
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], params: dict) -> '_TreeEnsemble':
+        """직렬화된 (배열, 파라미터)로부터 복원"""
+        return cls(**{name: arrays[name] for name in cls.ARRAYS}, **params)
+
+
+class _TreeBuilder:
+    """여러 트리의 노드를 하나의 평탄화된 배열로 누적"""
+
+    def __init__(self, n_outputs: int):
+        self.n_outputs = n_outputs
+        self.feature: List[np.ndarray] = []
+        self.threshold: List[np.ndarray] = []
+        self.left: List[np.ndarray] = []
+        self.right: List[np.ndarray] = []
+        self.value: List[np.ndarray] = []
+        self.default_left: List[np.ndarray] = []
+        self.zero_missing: List[np.ndarray] = []
+        self.roots: List[int] = []
+        self.tree_column: List[int] = []
+        self.max_depth = 0
+        self._n_nodes = 0
+
+    def add_tree(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        value: np.ndarray,
+        depth: int,
+        column: int = -1,
+        default_left: Optional[np.ndarray] = None,
+        zero_missing: Optional[np.ndarray] = None
+    ):
+        """
+        트리 하나 추가
+
+        Parameters:
+            feature, threshold: 분기 노드의 특징 인덱스와 임계값
+            left, right: 자식 노드 인덱스 (트리 내부 기준, 리프는 -1)
+            value: 노드별 출력 (n_nodes, n_outputs), 리프 값만 사용
+            depth: 트리 깊이
+            column: 트리가 기여하는 출력 열 (-1이면 모든 열)
+        """
+        n_nodes = len(feature)
+        offset = self._n_nodes
+        local = np.arange(n_nodes)
+        is_leaf = np.asarray(left) < 0
+
+        self.feature.append(np.where(is_leaf, 0, feature))
+        self.threshold.append(np.where(is_leaf, 0.0, threshold))
+        # 리프는 자기 자신을 가리켜 추가 탐색 단계에서도 제자리에 머묾
+        self.left.append(np.where(is_leaf, local, left) + offset)
+        self.right.append(np.where(is_leaf, local, right) + offset)
+        self.value.append(np.where(is_leaf[:, np.newaxis], value, 0.0))
+        self.default_left.append(
+            np.zeros(n_nodes, dtype=bool) if default_left is None else default_left
+        )
+        self.zero_missing.append(
+            np.zeros(n_nodes, dtype=bool) if zero_missing is None else zero_missing
+        )
+        self.roots.append(offset)
+        self.tree_column.append(column)
+        self.max_depth = max(self.max_depth, int(depth))
+        self._n_nodes += n_nodes
+
+    def build(self, link: str, strict: bool, float32_input: bool) -> _TreeEnsemble:
+        """누적된 트리로 앙상블 생성 (bias는 이후 보정)"""
+        return _TreeEnsemble(
+            feature=np.concatenate(self.feature),
+            threshold=np.concatenate(self.threshold),
+            left=np.concatenate(self.left),
+            right=np.concatenate(self.right),
+            value=np.concatenate(self.value),
+            default_left=np.concatenate(self.default_left),
+            zero_missing=np.concatenate(self.zero_missing),
+            roots=np.asarray(self.roots),
+            tree_column=np.asarray(self.tree_column),
+            bias=np.zeros(self.n_outputs),
+            max_depth=self.max_depth,
+            link=link,
+            strict=strict,
+            float32_input=float32_input
+        )
+
+
+class _MLP:
+    """sklearn MLPClassifier의 가중치 행렬 표현"""
+
+    ACTIVATIONS = {
+        'identity': lambda x: x,
+        'relu': lambda x: np.maximum(x, 0.0, out=x),
+        'tanh': lambda x: np.tanh(x, out=x),
+        'logistic': _sigmoid,
+    }
+
+    def __init__(
+        self,
+        coefs: List[np.ndarray],
+        intercepts: List[np.ndarray],
+        activation: str,
+        out_activation: str
+    ):
+        if activation not in self.ACTIVATIONS:
+            raise ValueError(f"지원하지 않는 MLP 활성화 함수입니다: {activation}")
+
+        self.coefs = [np.asarray(c, dtype=np.float64) for c in coefs]
+        self.intercepts = [np.asarray(b, dtype=np.float64) for b in intercepts]
+        self.activation = activation
+        self.out_activation = out_activation
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """클래스별 확률 (N, C)"""
+        hidden = X
+        last = len(self.coefs) - 1
+        for layer, (coef, intercept) in enumerate(zip(self.coefs, self.intercepts)):
+            hidden = hidden @ coef
+            hidden += intercept
+            if layer < last:
+                hidden = self.ACTIVATIONS[self.activation](hidden)
+
+        if self.out_activation == 'softmax':
+            return _softmax(hidden)
+        return _binary_proba(_sigmoid(hidden))
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], dict]:
+        """직렬화용 (배열, 파라미터) 반환"""
+        arrays = {}
+        for layer, (coef, intercept) in enumerate(zip(self.coefs, self.intercepts)):
+            arrays[f'coef{layer}'] = coef
+            arrays[f'intercept{layer}'] = intercept
+        params = {
+            'n_layers': len(self.coefs),
+            'activation': self.activation,
+            'out_activation': self.out_activation
+        }
+        return arrays, params
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], params: dict) -> '_MLP':
+        """직렬화된 (배열, 파라미터)로부터 복원"""
+        n_layers = params['n_layers']
+        return cls(
+            coefs=[arrays[f'coef{layer}'] for layer in range(n_layers)],
+            intercepts=[arrays[f'intercept{layer}'] for layer in range(n_layers)],
+            activation=params['activation'],
+            out_activation=params['out_activation']
+        )
+
+
+class _Logistic:
+    """sklearn LogisticRegression의 가중치 행렬 표현 (메타 모델)"""
+
+    def __init__(self, coef: np.ndarray, intercept: np.ndarray, multinomial: bool):
+        self.coef = np.asarray(coef, dtype=np.float64)
+        self.intercept = np.asarray(intercept, dtype=np.float64)
+        self.multinomial = bool(multinomial)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """클래스별 확률 (N, C)"""
+        decision = X @ self.coef.T
+        decision += self.intercept
+
+        if decision.shape[1] == 1:
+            # 이진 multinomial은 softmax([-d, d]) = sigmoid(2d)
+            return _binary_proba(_sigmoid(2.0 * decision if self.multinomial else decision))
+        if self.multinomial:
+            return _softmax(decision)
+
+        # one-vs-rest: 클래스별 sigmoid를 정규화
+        proba = _sigmoid(decision)
+        proba /= proba.sum(axis=1, keepdims=True)
+        return proba
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], dict]:
+        """직렬화용 (배열, 파라미터) 반환"""
+        return (
+            {'coef': self.coef, 'intercept': self.intercept},
+            {'multinomial': self.multinomial}
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], params: dict) -> '_Logistic':
+        """직렬화된 (배열, 파라미터)로부터 복원"""
+        return cls(arrays['coef'], arrays['intercept'], params['multinomial'])
+
+
+_COMPONENT_TYPES = {
+    'trees': _TreeEnsemble,
+    'mlp': _MLP,
+    'logistic': _Logistic,
+}
+
+
+class CompiledEnsemble:
+    """
+    배열 기반 StackingClassifier 추론 엔진
+
+    각 기반 모델의 트리는 평탄화된 노드 배열로, MLP와 메타 모델은
+    가중치 행렬로 보관하며, sklearn의 추정기별 Python 디스패치 없이
+    NumPy 벡터 연산만으로 predict_proba()를 계산
+    """
+
+    def __init__(
+        self,
+        base_models: List[Tuple[str, Union[_TreeEnsemble, _MLP]]],
+        meta_model: _Logistic,
+        n_features: int,
+        classes: np.ndarray,
+        passthrough: bool = False
+    ):
+        """
+        Parameters:
+            base_models: (이름, 컴파일된 기반 모델) 리스트 (스태킹 순서)
+            meta_model: 컴파일된 메타 모델
+            n_features: 입력 특징 개수
+            classes: 클래스 레이블
+            passthrough: 메타 모델 입력에 원본 특징 포함 여부
+        """
+        self.base_models = base_models
+        self.meta_model = meta_model
+        self.n_features = int(n_features)
+        self.classes_ = np.asarray(classes)
+        self.passthrough = bool(passthrough)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        클래스별 확률 예측 (StackingClassifier.predict_proba와 동일한 의미)
+
+        Parameters:
+            X: 전처리된 (N, F) 특징값 배열
+
+        Returns:
+            (N, C) 클래스별 확률
+        """
+        X = np.asarray(X, dtype=np.float64)
+
+        meta_features = []
+        for _, base_model in self.base_models:
+            proba = base_model.predict_proba(X)
+            # 이진 분류에서는 StackingClassifier와 같이 양성 확률 열만 사용
+            meta_features.append(proba[:, 1:] if len(self.classes_) == 2 else proba)
+
+        if self.passthrough:
+            meta_features.append(X)
+
+        return self.meta_model.predict_proba(np.hstack(meta_features))
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """클래스 예측"""
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    # ------------------------------------------------------------------
+    # 컴파일
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_stacking(cls, model, X_sample: np.ndarray) -> 'CompiledEnsemble':
+        """
+        학습된 StackingClassifier를 컴파일
+
+        Parameters:
+            model: 학습된 sklearn StackingClassifier
+            X_sample: 부스팅 bias 보정 및 검증용 전처리된 샘플 (N, F)
+
+        Returns:
+            컴파일된 앙상블
+
+        Raises:
+            ValueError: 지원하지 않는 모델 구성
+        """
+        if not hasattr(model, 'estimators_') or not hasattr(model, 'final_estimator_'):
+            raise ValueError("학습된 StackingClassifier가 아닙니다")
+
+        X_sample = np.asarray(X_sample, dtype=np.float64)
+
+        base_models = []
+        names = [name for name, est in model.estimators if est != 'drop']
+        for name, estimator, method in zip(names, model.estimators_, model.stack_method_):
+            if method != 'predict_proba':
+                raise ValueError(f"predict_proba 이외의 stack_method는 지원하지 않습니다: {name}={method}")
+            base_models.append((name, _compile_estimator(estimator, X_sample)))
+
+        compiled = cls(
+            base_models=base_models,
+            meta_model=_compile_logistic(model.final_estimator_),
+            n_features=model.n_features_in_,
+            classes=model.classes_,
+            passthrough=getattr(model, 'passthrough', False)
+        )
+        return compiled
+
+    def validate(self, model, X_sample: np.ndarray, atol: float = 1e-5) -> float:
+        """
+        원본 모델의 predict_proba와 비교 검증
+
+        Parameters:
+            model: 원본 모델
+            X_sample: 전처리된 검증 샘플 (N, F)
+            atol: 허용 최대 절대 오차
+
+        Returns:
+            최대 절대 오차
+
+        Raises:
+            ValueError: 오차가 허용 범위를 초과한 경우
+        """
+        expected = model.predict_proba(X_sample)
+        actual = self.predict_proba(X_sample)
+        max_error = float(np.max(np.abs(expected - actual)))
+
+        if max_error > atol:
+            raise ValueError(
+                f"컴파일된 모델이 원본과 일치하지 않습니다 (최대 오차 {max_error:.3g} > {atol:.3g})"
+            )
+        return max_error
+
+    # ------------------------------------------------------------------
+    # 직렬화
+    # ------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]):
+        """배열을 .npz 파일로 저장"""
+        arrays = {}
+        components = []
+
+        for index, (name, component) in enumerate(
+            self.base_models + [('__meta__', self.meta_model)]
+        ):
+            kind = next(k for k, t in _COMPONENT_TYPES.items() if isinstance(component, t))
+            component_arrays, params = component.to_arrays()
+            for key, array in component_arrays.items():
+                arrays[f'c{index}_{key}'] = array
+            components.append({'name': name, 'kind': kind, 'params': params})
+
+        header = {
+            'format': 'compiled-stacking-v1',
+            'n_features': self.n_features,
+            'classes': self.classes_.tolist(),
+            'passthrough': self.passthrough,
+            'components': components
+        }
+        np.savez_compressed(
+            path,
+            __header__=np.frombuffer(json.dumps(header).encode('utf-8'), dtype=np.uint8),
+            **arrays
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'CompiledEnsemble':
+        """저장된 .npz 파일에서 복원"""
+        with np.load(path, allow_pickle=False) as data:
+            header = json.loads(data['__header__'].tobytes().decode('utf-8'))
+            if header.get('format') != 'compiled-stacking-v1':
+                raise ValueError(f"지원하지 않는 컴파일 모델 형식입니다: {header.get('format')}")
+
+            components = []
+            for index, spec in enumerate(header['components']):
+                prefix = f'c{index}_'
+                component_arrays = {
+                    key[len(prefix):]: data[key]
+                    for key in data.files if key.startswith(prefix)
+                }
+                component = _COMPONENT_TYPES[spec['kind']].from_arrays(
+                    component_arrays, spec['params']
+                )
+                components.append((spec['name'], component))
+
+        return cls(
+            base_models=components[:-1],
+            meta_model=components[-1][1],
+            n_features=header['n_features'],
+            classes=np.asarray(header['classes']),
+            passthrough=header['passthrough']
+        )
+
+
+# ----------------------------------------------------------------------
+# 추정기별 컴파일 함수
+# ----------------------------------------------------------------------
+
+def _compile_estimator(estimator, X_sample: np.ndarray):
+    """기반 추정기를 종류에 맞게 컴파일"""
+    module = type(estimator).__module__
+
+    if module.startswith('lightgbm'):
+        return _compile_lightgbm(estimator, X_sample)
+    if module.startswith('xgboost'):
+        return _compile_xgboost(estimator, X_sample)
+    if hasattr(estimator, 'coefs_') and hasattr(estimator, 'out_activation_'):
+        return _MLP(
+            estimator.coefs_,
+            estimator.intercepts_,
+            estimator.activation,
+            estimator.out_activation_
+        )
+    if hasattr(estimator, 'estimators_') and hasattr(estimator, 'init_'):
+        return _compile_sklearn_gradient_boosting(estimator, X_sample)
+    if hasattr(estimator, 'estimators_') and hasattr(estimator.estimators_[0], 'tree_'):
+        return _compile_sklearn_forest(estimator)
+
+    raise ValueError(f"지원하지 않는 기반 모델입니다: {type(estimator).__name__}")
+
+
+def _calibrate_bias(ensemble: _TreeEnsemble, raw_expected: np.ndarray, X_sample: np.ndarray):
+    """
+    부스팅 모델의 초기 점수(base_score, init 추정기 등)를 샘플로부터 보정
+
+    원본 raw score와 트리 합의 차이는 입력과 무관한 상수여야 함
+    """
+    raw_expected = np.asarray(raw_expected, dtype=np.float64).reshape(len(X_sample), -1)
+    difference = raw_expected - ensemble.raw_sum(X_sample)
+
+    if np.max(np.ptp(difference, axis=0)) > 1e-4:
+        raise ValueError("부스팅 모델의 초기 점수를 상수로 보정할 수 없습니다")
+
+    ensemble.bias = difference.mean(axis=0)
+
+
+def _compile_sklearn_forest(forest) -> _TreeEnsemble:
+    """sklearn RandomForest/ExtraTrees 분류기 컴파일 (트리별 확률의 평균)"""
+    n_classes = int(forest.n_classes_)
+    n_trees = len(forest.estimators_)
+    builder = _TreeBuilder(n_outputs=n_classes)
+
+    for tree in forest.estimators_:
+        structure = tree.tree_
+        proba = structure.value[:, 0, :].astype(np.float64)
+        normalizer = proba.sum(axis=1, keepdims=True)
+        normalizer[normalizer == 0.0] = 1.0
+
+        builder.add_tree(
+            feature=structure.feature,
+            threshold=structure.threshold,
+            left=structure.children_left,
+            right=structure.children_right,
+            value=proba / normalizer / n_trees,
+            depth=structure.max_depth
+        )
+
+    return builder.build(link='proba', strict=False, float32_input=True)
+
+
+def _compile_sklearn_gradient_boosting(model, X_sample: np.ndarray) -> _TreeEnsemble:
+    """sklearn GradientBoostingClassifier 컴파일 (클래스별 회귀 트리의 합)"""
+    n_outputs = model.estimators_.shape[1]
+    builder = _TreeBuilder(n_outputs=n_outputs)
+
+    for stage in model.estimators_:
+        for class_index, tree in enumerate(stage):
+            structure = tree.tree_
+            value = np.zeros((structure.node_count, n_outputs))
+            value[:, class_index] = structure.value[:, 0, 0] * model.learning_rate
+
+            builder.add_tree(
+                feature=structure.feature,
+                threshold=structure.threshold,
+                left=structure.children_left,
+                right=structure.children_right,
+                value=value,
+                depth=structure.max_depth,
+                column=class_index
+            )
+
+    ensemble = builder.build(
+        link='softmax' if n_outputs > 1 else 'sigmoid',
+        strict=False,
+        float32_input=True
+    )
+    _calibrate_bias(ensemble, model.decision_function(X_sample), X_sample)
+    return ensemble
+
+
+def _compile_lightgbm(model, X_sample: np.ndarray) -> _TreeEnsemble:
+    """LightGBM 분류기 컴파일 (dump_model()의 트리 구조 사용)"""
+    dump = model.booster_.dump_model()
+    n_outputs = int(dump.get('num_tree_per_iteration', 1))
+    builder = _TreeBuilder(n_outputs=n_outputs)
+
+    for tree_index, tree_info in enumerate(dump['tree_info']):
+        feature, threshold, left, right, leaf_value = [], [], [], [], []
+        default_left, zero_missing, depth = [], [], []
+
+        # 반복적 DFS로 중첩 딕셔너리를 노드 배열로 변환
+        stack = [(tree_info['tree_structure'], -1, False, 0)]
+        while stack:
+            node, parent, is_left, node_depth = stack.pop()
+            index = len(feature)
+            if parent >= 0:
+                (left if is_left else right)[parent] = index
+
+            depth.append(node_depth)
+            left.append(-1)
+            right.append(-1)
+
+            if 'leaf_value' in node:
+                feature.append(0)
+                threshold.append(0.0)
+                leaf_value.append(node['leaf_value'])
+                default_left.append(False)
+                zero_missing.append(False)
+                continue
+
+            if node.get('decision_type', '<=') != '<=':
+                raise ValueError("LightGBM 범주형 분기는 지원하지 않습니다")
+
+            feature.append(node['split_feature'])
+            threshold.append(node['threshold'])
+            leaf_value.append(0.0)
+            default_left.append(bool(node.get('default_left', True)))
+            zero_missing.append(node.get('missing_type') == 'Zero')
+
+            stack.append((node['right_child'], index, False, node_depth + 1))
+            stack.append((node['left_child'], index, True, node_depth + 1))
+
+        value = np.zeros((len(feature), n_outputs))
+        value[:, tree_index % n_outputs] = leaf_value
+
+        builder.add_tree(
+            feature=np.asarray(feature),
+            threshold=np.asarray(threshold, dtype=np.float64),
+            left=np.asarray(left),
+            right=np.asarray(right),
+            value=value,
+            depth=max(depth),
+            column=tree_index % n_outputs,
+            default_left=np.asarray(default_left),
+            zero_missing=np.asarray(zero_missing)
+        )
+
+    ensemble = builder.build(
+        link='softmax' if n_outputs > 1 else 'sigmoid',
+        strict=False,
+        float32_input=False
+    )
+    _calibrate_bias(ensemble, model.predict(X_sample, raw_score=True), X_sample)
+    return ensemble
+
+
+def _compile_xgboost(model, X_sample: np.ndarray) -> _TreeEnsemble:
+    """XGBoost 분류기 컴파일 (JSON 모델의 노드 배열 사용)"""
+    booster = model.get_booster()
+    raw_model = json.loads(booster.save_raw(raw_format='json'))
+    gradient_booster = raw_model['learner']['gradient_booster']
+
+    if gradient_booster.get('name') != 'gbtree':
+        raise ValueError(f"지원하지 않는 XGBoost booster입니다: {gradient_booster.get('name')}")
+
+    trees = gradient_booster['model']['trees']
+    tree_info = gradient_booster['model']['tree_info']
+    n_outputs = max(tree_info) + 1 if tree_info else 1
+    builder = _TreeBuilder(n_outputs=n_outputs)
+
+    for tree, class_index in zip(trees, tree_info):
+        if int(tree['tree_param'].get('size_leaf_vector', '1')) > 1:
+            raise ValueError("XGBoost 다중 출력 트리는 지원하지 않습니다")
+
+        left = np.asarray(tree['left_children'])
+        right = np.asarray(tree['right_children'])
+        # 분기 조건과 리프 값 모두 float32 정밀도
+        conditions = np.asarray(tree['split_conditions'], dtype=np.float32).astype(np.float64)
+
+        value = np.zeros((len(left), n_outputs))
+        value[:, class_index] = conditions
+
+        builder.add_tree(
+            feature=np.asarray(tree['split_indices']),
+            threshold=conditions,
+            left=left,
+            right=right,
+            value=value,
+            depth=_tree_depth(left, right),
+            column=class_index
+        )
+
+    ensemble = builder.build(
+        link='softmax' if n_outputs > 1 else 'sigmoid',
+        strict=True,
+        float32_input=True
+    )
+    _calibrate_bias(ensemble, model.predict(X_sample, output_margin=True), X_sample)
+    return ensemble
+
+
+def _tree_depth(left: np.ndarray, right: np.ndarray) -> int:
+    """자식 배열로부터 트리 깊이 계산 (루트 = 0)"""
+    depth = np.zeros(len(left), dtype=np.int64)
+    for node in range(len(left)):
+        for child in (left[node], right[node]):
+            if child >= 0:
+                depth[child] = depth[node] + 1
+    return int(depth.max())
+
+
+def _compile_logistic(model) -> _Logistic:
+    """sklearn LogisticRegression 메타 모델 컴파일"""
+    if not hasattr(model, 'coef_'):
+        raise ValueError(f"지원하지 않는 메타 모델입니다: {type(model).__name__}")
+
+    # LogisticRegression.predict_proba()의 one-vs-rest 판정 규칙과 동일
+    multi_class = getattr(model, 'multi_class', 'auto')
+    ovr = multi_class in ('ovr', 'warn') or (
+        multi_class in ('auto', 'deprecated')
+        and (len(model.classes_) <= 2 or getattr(model, 'solver', '') == 'liblinear')
+    )
+    return _Logistic(model.coef_, model.intercept_, multinomial=not ovr)
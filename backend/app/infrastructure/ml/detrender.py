@@ -0,0 +1,470 @@
+"""
+광도 곡선 추세 제거 (Light Curve Detrender)
+항성 변광·계통 오차를 이동 창 추세로 나누어 제거하고 이상치를 잘라내는 전처리 단계
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .flux_statistics import validate_offsets
+
+
+# 중앙값 절대 편차 → 정규분포 표준편차 환산 계수
+MAD_TO_SIGMA = 1.4826
+
+# 정규분포의 평균 절대 편차 → 중앙값 절대 편차 환산 계수 (0.6745 / 0.7979)
+MEAN_ABS_TO_MAD = 0.8453
+
+DETREND_METHODS = ('median', 'biweight')
+
+
+@dataclass(frozen=True)
+class DetrendResult:
+    """
+    추세 제거 결과 (제외된 점은 빠져 있음)
+
+    Attributes:
+        time: 시간 배열 (곡선 안에서 오름차순)
+        flux: 추세로 나눈 상대 밝기 (약 1.0)
+        flux_err: 추세로 나눈 밝기 오차 (입력에 없으면 None)
+        trend: 각 점의 추세값 (원래 밝기 단위)
+        offsets: 곡선 경계 (길이 N + 1)
+        segments: 관측 공백으로 나눈 구간 경계 (곡선 경계 포함)
+        clipped: 시그마 클리핑으로 제외된 점 수
+    """
+    time: np.ndarray
+    flux: np.ndarray
+    flux_err: Optional[np.ndarray]
+    trend: np.ndarray
+    offsets: np.ndarray
+    segments: np.ndarray
+    clipped: int
+
+
+class LightCurveDetrender:
+    """
+    광도 곡선 추세 제거기
+
+    1. 공백 구간 분할: 곡선별로 시간순 정렬 후 gap_days보다 긴 관측 공백에서 구간을 나눔
+       (공백 양쪽의 점이 같은 창에 섞이지 않음)
+    2. 추세 추정: 구간별 시간 기준 이동 창(중심 정렬) biweight 또는 중앙값 위치 추정.
+       pandas 이동 창 집계(정렬 스킵 리스트, 누적 합)로 모든 구간을 한 번에 계산하여
+       창마다 Python 반복을 돌지 않음 (O(n log w))
+    3. 시그마 클리핑: 상대 밝기의 곡선별 강건 표준편차(MAD) 기준으로 위쪽 이상치
+       (플레어, 우주선)는 모두, 아래쪽 이상치는 앞뒤 점이 정상인 단발성 점만 제거
+       (여러 점이 이어지는 트랜짓은 보존)
+
+    환경변수:
+        DETREND_ENABLED: 특징 추출 전 추세 제거 적용 여부 (기본값 true)
+        DETREND_METHOD: biweight 또는 median (기본값 biweight, 트랜짓 안쪽 추세 편향이 더 작음)
+        DETREND_WINDOW_DAYS: 이동 창 길이 (일, 기본값 0.75 = 일반적인 트랜짓 지속 시간의 약 3배)
+        DETREND_GAP_DAYS: 구간을 나누는 관측 공백 길이 (일, 기본값 0.5)
+        DETREND_SIGMA_UPPER: 위쪽 클리핑 기준 (표준편차 배수, 기본값 3)
+        DETREND_SIGMA_LOWER: 단발성 아래쪽 클리핑 기준 (표준편차 배수, 기본값 5)
+    """
+
+    # biweight 가중치 조정 상수 (MAD의 배수, 이보다 먼 점은 가중치 0)
+    BIWEIGHT_CUTOFF = 5.0
+    BIWEIGHT_ITERATIONS = 2
+
+    # 이동 창 집계 한 번에 이어 붙이는 최대 시간 축 길이 (일)
+    MAX_BLOCK_DAYS = 50_000.0
+
+    def __init__(
+        self,
+        window_days: float = 0.75,
+        method: str = 'biweight',
+        gap_days: float = 0.5,
+        sigma_upper: Optional[float] = 3.0,
+        sigma_lower: Optional[float] = 5.0,
+        enabled: bool = True
+    ):
+        """
+        Parameters:
+            window_days: 이동 창 길이 (일)
+            method: 추세 추정 방법 (median 또는 biweight)
+            gap_days: 구간을 나누는 관측 공백 길이 (일)
+            sigma_upper: 위쪽 클리핑 기준 (None이면 클리핑하지 않음)
+            sigma_lower: 단발성 아래쪽 클리핑 기준 (None이면 클리핑하지 않음)
+            enabled: 추세 제거 사용 여부
+        """
+        if window_days <= 0:
+            raise ValueError("이동 창 길이는 0보다 커야 합니다")
+        if method not in DETREND_METHODS:
+            raise ValueError(f"추세 추정 방법은 {', '.join(DETREND_METHODS)} 중 하나여야 합니다")
+
+        self.window_days = window_days
+        self.method = method
+        self.gap_days = gap_days
+        self.sigma_upper = sigma_upper
+        self.sigma_lower = sigma_lower
+        self.enabled = enabled
+
+    @property
+    def clips(self) -> bool:
+        """시그마 클리핑 사용 여부"""
+        return self.sigma_upper is not None or self.sigma_lower is not None
+
+    @property
+    def context_days(self) -> float:
+        """
+        스트리밍 추세 제거에서 점을 확정하기 전에 앞뒤로 확보하는 시간 (일)
+
+        이동 중앙값은 창 절반 안의 점에만 의존하지만 biweight는 반복마다 이동 창 집계가
+        두 번 더 겹치므로 (1 + 2 × 반복 횟수) × 창 절반 안의 점에 의존.
+        단발성 이상치 판단에 같은 구간의 앞뒤 점이 필요하므로 관측 공백 길이보다 짧지 않게 함
+        """
+        reach = 1 + (2 * self.BIWEIGHT_ITERATIONS if self.method == 'biweight' else 0)
+        return max(reach * self.window_days / 2.0, self.gap_days)
+
+    @classmethod
+    def from_env(cls) -> 'LightCurveDetrender':
+        """환경변수 설정으로 추세 제거기 생성"""
+        sigma_upper = float(os.getenv("DETREND_SIGMA_UPPER", "3"))
+        sigma_lower = float(os.getenv("DETREND_SIGMA_LOWER", "5"))
+
+        return cls(
+            window_days=float(os.getenv("DETREND_WINDOW_DAYS", "0.75")),
+            method=os.getenv("DETREND_METHOD", "biweight").lower(),
+            gap_days=float(os.getenv("DETREND_GAP_DAYS", "0.5")),
+            sigma_upper=sigma_upper if sigma_upper > 0 else None,
+            sigma_lower=sigma_lower if sigma_lower > 0 else None,
+            enabled=os.getenv("DETREND_ENABLED", "true").lower() == "true"
+        )
+
+    def detrend(
+        self,
+        time: np.ndarray,
+        flux: np.ndarray,
+        flux_err: Optional[np.ndarray] = None
+    ) -> DetrendResult:
+        """
+        광도 곡선 하나의 추세 제거
+
+        Parameters:
+            time: 시간 배열 (일)
+            flux: 밝기 배열
+            flux_err: 밝기 오차 배열 (선택)
+
+        Returns:
+            추세 제거 결과
+        """
+        flux = np.asarray(flux, dtype=np.float64).ravel()
+        return self.detrend_many(time, flux, np.array([0, flux.size]), flux_err)
+
+    def detrend_many(
+        self,
+        time: np.ndarray,
+        flux: np.ndarray,
+        offsets: np.ndarray,
+        flux_err: Optional[np.ndarray] = None
+    ) -> DetrendResult:
+        """
+        이어 붙인 여러 광도 곡선의 추세 제거 (모든 곡선·구간을 한 번의 이동 창 집계로 처리)
+
+        Parameters:
+            time: 이어 붙인 시간 배열 (일)
+            flux: 이어 붙인 밝기 배열
+            offsets: 곡선 경계 (길이 N + 1)
+            flux_err: 이어 붙인 밝기 오차 배열 (선택)
+
+        Returns:
+            추세 제거 결과
+
+        Raises:
+            ValueError: 배열 길이 또는 곡선 경계가 잘못되었거나, 유효한 점이 없는 곡선이 있는 경우
+        """
+        time = np.asarray(time, dtype=np.float64).ravel()
+        flux = np.asarray(flux, dtype=np.float64).ravel()
+        if time.size != flux.size:
+            raise ValueError("시간과 밝기 배열의 길이가 같아야 합니다")
+        offsets = validate_offsets(offsets, flux.size)
+        if flux_err is not None:
+            flux_err = np.asarray(flux_err, dtype=np.float64).ravel()
+            if flux_err.size != flux.size:
+                raise ValueError("밝기 오차 배열의 길이가 밝기 배열과 같아야 합니다")
+
+        # 1. 유한한 점만 남기고 곡선 안에서 시간순 정렬 (이미 정렬되어 있으면 복사만 생략)
+        curve = np.repeat(np.arange(offsets.size - 1), np.diff(offsets))
+        finite = np.isfinite(time) & np.isfinite(flux)
+        order = np.flatnonzero(finite)
+        if order.size > 1 and np.any((np.diff(time[order]) < 0) & (np.diff(curve[order]) == 0)):
+            order = order[np.lexsort((time[order], curve[order]))]
+        time, flux, curve = time[order], flux[order], curve[order]
+        if flux_err is not None:
+            flux_err = flux_err[order]
+
+        # 2. 곡선 경계와 관측 공백에서 구간 분할
+        breaks = (np.diff(curve) != 0) | (np.diff(time) > self.gap_days)
+        segment = np.concatenate([[0], np.cumsum(breaks)])
+
+        # 3. 구간별 이동 창 추세 → 상대 밝기
+        trend = self._trend(time, flux, segment)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative = flux / trend
+        keep = np.isfinite(relative)
+
+        # 4. 곡선별 시그마 클리핑
+        clipped = self._clip(relative, curve, segment, keep)
+
+        # 5. 남은 점으로 결과 구성
+        curve = curve[keep]
+        counts = np.bincount(curve, minlength=offsets.size - 1)
+        if np.any(counts == 0):
+            raise ValueError("추세 제거 후 유효한 데이터 점이 없는 광도 곡선이 있습니다")
+
+        new_offsets = np.zeros(counts.size + 1, dtype=np.intp)
+        np.cumsum(counts, out=new_offsets[1:])
+        segment = segment[keep]
+        segment_starts = np.flatnonzero(np.diff(segment, prepend=-1))
+
+        return DetrendResult(
+            time=time[keep],
+            flux=relative[keep],
+            flux_err=flux_err[keep] / trend[keep] if flux_err is not None else None,
+            trend=trend[keep],
+            offsets=new_offsets,
+            segments=np.append(segment_starts, segment.size).astype(np.intp),
+            clipped=clipped
+        )
+
+    def detrend_stream(
+        self,
+        chunks: Iterable[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]],
+        center: Optional[float] = None,
+        sigma: Optional[float] = None
+    ) -> Iterator[DetrendResult]:
+        """
+        시간순 청크 스트림의 추세 제거 (곡선 하나)
+
+        확정되지 않은 점과 뒤쪽 문맥(context_days)만 버퍼에 남기고, 앞쪽 문맥까지 들어온
+        점만 확정하여 내보내므로 추세값은 곡선 전체로 계산한 detrend()와 반올림 오차 수준에서
+        같고 메모리는 청크 크기와 문맥 길이에만 비례함.
+        곡선 전체의 중앙값·MAD가 필요한 시그마 클리핑은 미리 구한 center, sigma로 적용
+        (둘 중 하나라도 None이면 클리핑하지 않음)
+
+        Parameters:
+            chunks: (time, flux, flux_err) 청크 반복자 (시간 오름차순, flux_err는 None 가능)
+            center: 클리핑 중심 (상대 밝기 중앙값)
+            sigma: 클리핑 기준 강건 표준편차 (MAD 환산)
+
+        Yields:
+            청크마다 새로 확정된 점의 추세 제거 결과
+
+        Raises:
+            ValueError: 시간이 오름차순이 아니거나 배열 길이가 다른 경우
+        """
+        context = self.context_days
+        time_buffer = np.empty(0)
+        flux_buffer = np.empty(0)
+        err_buffer = np.empty(0)
+        has_errors = False
+        emitted = -np.inf
+
+        for time, flux, flux_err in chunks:
+            time = np.asarray(time, dtype=np.float64).ravel()
+            flux = np.asarray(flux, dtype=np.float64).ravel()
+            if time.size != flux.size:
+                raise ValueError("시간과 밝기 배열의 길이가 같아야 합니다")
+            if flux_err is None:
+                flux_err = np.full(flux.size, np.nan)
+            else:
+                has_errors = True
+                flux_err = np.asarray(flux_err, dtype=np.float64).ravel()
+                if flux_err.size != flux.size:
+                    raise ValueError("밝기 오차 배열의 길이가 밝기 배열과 같아야 합니다")
+
+            finite = np.isfinite(time) & np.isfinite(flux)
+            time, flux, flux_err = time[finite], flux[finite], flux_err[finite]
+            if time.size == 0:
+                continue
+            previous = time_buffer[-1] if time_buffer.size else emitted
+            if time[0] < previous or np.any(np.diff(time) < 0):
+                raise ValueError("스트리밍 추세 제거에는 시간 오름차순으로 정렬된 데이터가 필요합니다")
+
+            time_buffer = np.concatenate([time_buffer, time])
+            flux_buffer = np.concatenate([flux_buffer, flux])
+            err_buffer = np.concatenate([err_buffer, flux_err])
+
+            # 앞쪽 문맥이 모두 들어온 점까지 확정하고, 확정된 점은 뒤쪽 문맥만큼만 남김
+            bound = time_buffer[-1] - context
+            if bound <= emitted:
+                continue
+            yield self._detrend_window(
+                time_buffer, flux_buffer, err_buffer if has_errors else None,
+                emitted, bound, center, sigma
+            )
+            emitted = bound
+            start = int(np.searchsorted(time_buffer, bound - context, side='left'))
+            time_buffer, flux_buffer, err_buffer = time_buffer[start:], flux_buffer[start:], err_buffer[start:]
+
+        if time_buffer.size and time_buffer[-1] > emitted:
+            yield self._detrend_window(
+                time_buffer, flux_buffer, err_buffer if has_errors else None,
+                emitted, np.inf, center, sigma
+            )
+
+    def _detrend_window(
+        self,
+        time: np.ndarray,
+        flux: np.ndarray,
+        flux_err: Optional[np.ndarray],
+        start: float,
+        stop: float,
+        center: Optional[float],
+        sigma: Optional[float]
+    ) -> DetrendResult:
+        """스트리밍 버퍼 전체로 추세를 구하고 start < time <= stop인 점만 결과로 반환"""
+        breaks = np.diff(time) > self.gap_days
+        segment = np.concatenate([[0], np.cumsum(breaks)])
+
+        trend = self._trend(time, flux, segment)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative = flux / trend
+        emit = (time > start) & (time <= stop)
+        keep = np.isfinite(relative)
+
+        clipped = 0
+        if self.clips and center is not None and sigma is not None:
+            outlier = self._outliers(relative - center, sigma, segment, keep) & emit
+            clipped = int(np.count_nonzero(outlier))
+            keep &= ~outlier
+        keep &= emit
+
+        segment = segment[keep]
+        segment_starts = np.flatnonzero(np.diff(segment, prepend=-1))
+
+        return DetrendResult(
+            time=time[keep],
+            flux=relative[keep],
+            flux_err=flux_err[keep] / trend[keep] if flux_err is not None else None,
+            trend=trend[keep],
+            offsets=np.array([0, segment.size], dtype=np.intp),
+            segments=np.append(segment_starts, segment.size).astype(np.intp),
+            clipped=clipped
+        )
+
+    def _trend(self, time: np.ndarray, flux: np.ndarray, segment: np.ndarray) -> np.ndarray:
+        """
+        구간별 시간 기준 중심 이동 창 추세 (중앙값 또는 biweight)
+
+        구간마다 시간 축을 이어 붙이되 구간 사이를 창 길이의 2배만큼 띄워, 하나의 이동 창
+        집계로 모든 구간을 계산하면서도 창이 구간 경계를 넘지 않도록 함
+        """
+        # 1. 구간별 시작 시각을 누적 원점으로 옮긴 단조 증가 시간 축
+        starts = np.flatnonzero(np.diff(segment, prepend=-1))
+        ends = np.append(starts[1:], time.size)
+        first = time[starts]
+        spacing = (time[ends - 1] - first) + 2.0 * self.window_days
+        origin = np.concatenate([[0.0], np.cumsum(spacing[:-1])])
+
+        # Timedelta 범위(약 29만 년 ns)를 넘지 않도록 원점이 큰 구간은 묶음을 나눔
+        block = np.floor(origin / self.MAX_BLOCK_DAYS).astype(np.intp)
+        block_starts = np.flatnonzero(np.diff(block, prepend=-1))
+        origin -= np.repeat(origin[block_starts], np.diff(np.append(block_starts, origin.size)))
+        shifted = time - first[segment] + origin[segment]
+        bounds = np.append(starts[block_starts], time.size)
+        blocks = [
+            (begin, end, pd.to_timedelta(shifted[begin:end], unit='D'))
+            for begin, end in zip(bounds[:-1], bounds[1:])
+        ]
+        window = pd.Timedelta(days=self.window_days)
+
+        def rolling(values: np.ndarray, how: str) -> np.ndarray:
+            result = np.empty(values.size)
+            for begin, end, index in blocks:
+                series = pd.Series(values[begin:end], index=index, copy=False)
+                result[begin:end] = getattr(series.rolling(window, center=True, min_periods=1), how)()
+            return result
+
+        # 2. 이동 중앙값
+        location = rolling(flux, 'median')
+        if self.method == 'median':
+            return location
+
+        # 3. biweight: 이동 척도로 점별 가중치를 구하고 가중 이동 평균을 반복
+        #    (창마다 가중치를 다시 구하는 정확한 biweight 대신 점별 가중치를 쓰는 선형 시간 근사,
+        #     척도는 이동 중앙값보다 빠른 이동 평균 절대 편차로 MAD를 근사)
+        for _ in range(self.BIWEIGHT_ITERATIONS):
+            deviation = flux - location
+            scale = rolling(np.abs(deviation), 'mean') * MEAN_ABS_TO_MAD
+            with np.errstate(divide='ignore', invalid='ignore'):
+                u = deviation / (self.BIWEIGHT_CUTOFF * scale)
+            weights = np.where(np.abs(u) < 1.0, (1.0 - u * u) ** 2, 0.0)
+            weights[~np.isfinite(u)] = 1.0
+
+            weight_total = rolling(weights, 'sum')
+            weighted_sum = rolling(weights * flux, 'sum')
+            valid = weight_total > 0
+            location = np.where(valid, weighted_sum / np.where(valid, weight_total, 1.0), location)
+
+        return location
+
+    def _clip(
+        self,
+        relative: np.ndarray,
+        curve: np.ndarray,
+        segment: np.ndarray,
+        keep: np.ndarray
+    ) -> int:
+        """
+        곡선별 강건 시그마 클리핑 (keep 배열을 제자리에서 갱신)
+
+        중심과 표준편차를 이상치에 강건한 중앙값·MAD로 한 번 구하므로 반복하지 않음
+        (평균·표준편차 기반 클리핑처럼 반복할수록 기준이 좁아지지 않음)
+
+        Returns:
+            클리핑으로 제외된 점 수
+        """
+        if not self.clips:
+            return 0
+
+        # 1. 곡선별 중앙값과 MAD (유효한 점 기준)
+        grouped = pd.Series(np.where(keep, relative, np.nan)).groupby(curve)
+        center = grouped.transform('median').to_numpy()
+        deviation = relative - center
+        sigma = MAD_TO_SIGMA * (
+            pd.Series(np.abs(np.where(keep, deviation, np.nan))).groupby(curve).transform('median').to_numpy()
+        )
+
+        # 2. 이상치 제외
+        outlier = self._outliers(deviation, sigma, segment, keep)
+        keep &= ~outlier
+        return int(np.count_nonzero(outlier))
+
+    def _outliers(
+        self,
+        deviation: np.ndarray,
+        sigma,
+        segment: np.ndarray,
+        keep: np.ndarray
+    ) -> np.ndarray:
+        """
+        위쪽은 모두, 아래쪽은 같은 구간의 앞뒤 점이 정상인 단발성 점만 이상치로 표시
+
+        Parameters:
+            deviation: 클리핑 중심으로부터의 편차
+            sigma: 강건 표준편차 (점별 배열 또는 스칼라)
+            segment: 점별 구간 번호
+            keep: 유효한 점 여부
+
+        Returns:
+            이상치 여부 배열
+        """
+        outlier = np.zeros(deviation.size, dtype=bool)
+        with np.errstate(invalid='ignore'):
+            if self.sigma_upper is not None:
+                outlier |= deviation > self.sigma_upper * sigma
+            if self.sigma_lower is not None:
+                low = deviation < -self.sigma_lower * sigma
+                same_as_previous = np.concatenate([[False], segment[1:] == segment[:-1]])
+                same_as_next = np.concatenate([segment[:-1] == segment[1:], [False]])
+                low_previous = np.concatenate([[False], low[:-1]]) & same_as_previous
+                low_next = np.concatenate([low[1:], [False]]) & same_as_next
+                outlier |= low & ~low_previous & ~low_next
+
+        return outlier & keep & (sigma > 0)
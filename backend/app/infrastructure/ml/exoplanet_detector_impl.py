@@ -3,14 +3,20 @@
 도메인 서비스 인터페이스의 실제 구현
 """
 
+import os
+import time
 import numpy as np
-from typing import Dict
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from ...domain.entities.light_curve import LightCurve
 from ...domain.services.exoplanet_detector import IExoplanetDetector
 from ...domain.value_objects.prediction_result import PredictionResult, PredictionClass
 from .model_loader import ModelLoader
 from .feature_extractor import FeatureExtractor
 from .preprocessor import Preprocessor
+from .inference_executor import InferenceExecutor, predict_proba_in_worker
+from .micro_batcher import MicroBatcher
+from ..cache.prediction_cache import PredictionCache
+from ..cache.feature_cache import FeatureCache
 
 
 class ExoplanetDetectorImpl(IExoplanetDetector):
@@ -18,24 +24,45 @@ class ExoplanetDetectorImpl(IExoplanetDetector):
     외계행성 탐지 서비스 구현
 
     ML 모델을 사용하여 광도 곡선 또는 특징값으로부터
-    외계행성을 탐지
+    외계행성을 탐지. 특징 추출과 모델 추론은 InferenceExecutor의
+    풀에서 실행되어 이벤트 루프를 막지 않으며, 동시에 들어온 단건 요청은
+    MicroBatcher가 하나의 predict_proba() 호출로 묶음.
+    같은 특징 세트의 반복 요청은 PredictionCache에서 바로 응답하고,
+    같은 광도 곡선의 재제출은 FeatureCache의 특징값으로 추출을 건너뜀.
+    컴파일 모델이 로드되어 있으면 COMPILED_MODEL_MAX_BATCH 행 이하의
+    추론은 컴파일 모델로 처리 (큰 배치는 sklearn 네이티브 트리가 유리)
     """
 
     def __init__(
         self,
         model_loader: ModelLoader,
         feature_extractor: FeatureExtractor,
-        preprocessor: Preprocessor
+        preprocessor: Preprocessor,
+        executor: Optional[InferenceExecutor] = None,
+        batcher: Optional[MicroBatcher] = None,
+        cache: Optional[PredictionCache] = None,
+        feature_cache: Optional[FeatureCache] = None
     ):
         """
         Parameters:
             model_loader: 모델 로더
             feature_extractor: 특징 추출기
             preprocessor: 전처리기
+            executor: 추론 실행기 (None이면 환경변수 설정으로 생성)
+            batcher: 단건 요청 마이크로 배처 (None이면 환경변수 설정으로 생성)
+            cache: 예측 결과 캐시 (None이면 환경변수 설정으로 생성)
+            feature_cache: 특징값 캐시 (None이면 환경변수 설정으로 생성,
+                모델 교체 후에도 유지하려면 공유 인스턴스 전달)
         """
         self.model_loader = model_loader
         self.feature_extractor = feature_extractor
         self.preprocessor = preprocessor
+        self.executor = executor or InferenceExecutor.from_env()
+        self.batcher = batcher or MicroBatcher.from_env(self._predict_proba)
+        self.cache = cache or PredictionCache.from_env()
+        self.feature_cache = feature_cache or FeatureCache.from_env()
+        self.feature_settings = feature_extractor.settings_key()
+        self.compiled_max_batch = int(os.getenv("COMPILED_MODEL_MAX_BATCH", "256"))
 
         # 모델과 스케일러가 로드되지 않았다면 로드
         if not self.model_loader.is_loaded():
@@ -55,10 +82,23 @@ class ExoplanetDetectorImpl(IExoplanetDetector):
         Returns:
             예측 결과
         """
-        # 1. 특징 추출
-        features = self.feature_extractor.extract_features(light_curve)
+        # 1. 특징값 캐시 조회 (같은 곡선의 재제출)
+        key = None
+        features = None
+        if self.feature_cache.enabled:
+            key = self.feature_cache.make_key(light_curve, self.feature_settings)
+            features = self.feature_cache.get(key)
 
-        # 2. 특징값으로 예측
+        # 2. 특징 추출 (캐시에 없을 때만, 실행기 풀에서 수행)
+        if features is None:
+            features = await self.executor.run(
+                self.feature_extractor.extract_features,
+                light_curve
+            )
+            if key is not None:
+                self.feature_cache.put(key, features)
+
+        # 3. 특징값으로 예측
         return await self.detect_from_features(features)
 
     async def detect_from_features(self, features: Dict[str, float]) -> PredictionResult:
@@ -78,11 +118,227 @@ class ExoplanetDetectorImpl(IExoplanetDetector):
         # 2. 전처리
         processed_features = self.preprocessor.preprocess_features(features)
 
-        # 3. 모델 예측
-        model = self.model_loader.get_model()
-        probabilities = model.predict_proba(processed_features)[0]
+        # 3. 캐시 조회
+        model_version = self.model_loader.get_model_version()
+        probabilities = self.cache.get(processed_features[0], model_version)
+
+        # 4. 모델 예측 (동시 요청과 묶어서 한 번에 추론)
+        if probabilities is None:
+            if self.batcher.enabled:
+                probabilities = await self.batcher.submit(processed_features[0])
+            else:
+                probabilities = (await self._predict_proba(processed_features))[0]
+            self.cache.put(processed_features[0], model_version, probabilities)
+
+        # 5. 결과 해석
+        return self._to_prediction_result(probabilities)
+
+    async def detect_batch(
+        self,
+        inputs: Sequence[Union[LightCurve, Dict[str, float]]]
+    ) -> List[PredictionResult]:
+        """
+        여러 입력에 대한 일괄 외계행성 탐지
+
+        광도 곡선은 특징값으로 변환한 뒤, 전체 입력을 (N, F) 행렬로
+        한 번에 전처리하고 모델의 predict_proba()를 한 번만 호출
+
+        Parameters:
+            inputs: 광도 곡선 엔티티 또는 특징값 딕셔너리 리스트 (혼합 가능)
+
+        Returns:
+            입력 순서와 동일한 예측 결과 리스트
+        """
+        if not inputs:
+            return []
+
+        light_curves = [item for item in inputs if isinstance(item, LightCurve)]
+
+        if len(light_curves) == len(inputs):
+            # 1~3. 광도 곡선만으로 이루어진 배치: 특징 행렬을 딕셔너리 변환 없이 바로 전처리
+            processed_features = await self._preprocess_light_curves(light_curves)
+        else:
+            # 1. 특징 추출 (광도 곡선 입력만, 실행기 풀에서 한 번에 수행)
+            #    flux_err가 없는 곡선은 NaN 밝기 오차 열을 빼서 단건 추출과 같은 키 구성으로 맞춤
+            extracted = iter([])
+            if light_curves:
+                matrix, column_names = await self._extract_light_curves(light_curves)
+                extracted = iter([
+                    self.feature_extractor.row_features(column_names, row, light_curve.flux_err is not None)
+                    for light_curve, row in zip(light_curves, matrix.tolist())
+                ])
+            features_list = [
+                next(extracted) if isinstance(item, LightCurve) else item
+                for item in inputs
+            ]
+
+            # 2. 특징값 검증
+            for index, features in enumerate(features_list):
+                if not self.preprocessor.validate_features(features):
+                    raise ValueError(f"유효하지 않은 특징값입니다 (index={index})")
+
+            # 3. 배치 전처리
+            if self.executor.uses_processes:
+                processed_features = self.preprocessor.preprocess_batch(features_list)
+            else:
+                processed_features = await self.executor.run(
+                    self.preprocessor.preprocess_batch,
+                    features_list
+                )
+
+        # 4. 캐시 조회
+        model_version = self.model_loader.get_model_version()
+        probabilities = [self.cache.get(row, model_version) for row in processed_features]
+        missing = [index for index, row in enumerate(probabilities) if row is None]
+
+        # 5. 캐시에 없는 행만 모델 예측 (한 번의 벡터화 호출)
+        if missing:
+            predicted = await self._predict_proba(processed_features[missing])
+            for index, row in zip(missing, predicted):
+                probabilities[index] = row
+                self.cache.put(processed_features[index], model_version, row)
+
+        # 6. 결과 해석
+        return [self._to_prediction_result(row) for row in probabilities]
+
+    async def _preprocess_light_curves(self, light_curves: List[LightCurve]) -> np.ndarray:
+        """
+        광도 곡선 배치를 특징 행렬로 추출한 뒤 전처리
+
+        Parameters:
+            light_curves: 광도 곡선 엔티티 리스트
+
+        Returns:
+            전처리된 (N, F) 특징값 배열
+
+        Raises:
+            ValueError: NaN/Inf 특징값이 있는 경우
+        """
+        # 1. 구간별 벡터 연산으로 (N, K) 특징 행렬 추출 (특징값 캐시 적중분 제외)
+        matrix, column_names = await self._extract_light_curves(light_curves)
+
+        # 2. 특징값 검증 (validate_features()와 동일하게 NaN/Inf 거부)
+        #    flux_err가 없는 곡선의 밝기 오차 열(NaN)은 단건 추출에서 빠지는 특징이므로 제외
+        finite = np.isfinite(matrix)
+        error_columns = [
+            index for index, name in enumerate(column_names)
+            if name in self.feature_extractor.ERROR_FEATURE_NAMES
+        ]
+        if error_columns:
+            without_errors = np.array([light_curve.flux_err is None for light_curve in light_curves])
+            finite[np.ix_(without_errors, error_columns)] = True
+        invalid = np.flatnonzero(~finite.all(axis=1))
+        if invalid.size:
+            raise ValueError(f"유효하지 않은 특징값입니다 (index={int(invalid[0])})")
+
+        # 3. 행렬 전처리
+        if self.executor.uses_processes:
+            return self.preprocessor.preprocess_matrix(matrix, column_names)
+        return await self.executor.run(
+            self.preprocessor.preprocess_matrix,
+            matrix,
+            column_names
+        )
+
+    async def _extract_light_curves(
+        self,
+        light_curves: List[LightCurve]
+    ) -> Tuple[np.ndarray, List[str]]:
+        """
+        광도 곡선 배치의 특징 행렬 (특징값 캐시에 없는 곡선만 실행기 풀에서 추출)
+
+        Parameters:
+            light_curves: 광도 곡선 엔티티 리스트
+
+        Returns:
+            ((N, F) 특징 행렬, 열 이름 리스트) - extract_many()와 같은 열 구성
+        """
+        if not self.feature_cache.enabled:
+            return await self.executor.run(
+                self.feature_extractor.extract_many,
+                light_curves
+            )
+
+        # 1. 캐시 조회 (곡선별로 필요한 특징이 모두 있는 항목만 적중)
+        include_errors = any(light_curve.flux_err is not None for light_curve in light_curves)
+        column_names = self.feature_extractor.feature_names(include_errors)
+        required_names = [
+            self.feature_extractor.feature_names(light_curve.flux_err is not None)
+            for light_curve in light_curves
+        ]
+        keys = [
+            self.feature_cache.make_key(light_curve, self.feature_settings)
+            for light_curve in light_curves
+        ]
+        cached = [self.feature_cache.get(key) for key in keys]
+        missing = [
+            index for index, features in enumerate(cached)
+            if features is None or any(name not in features for name in required_names[index])
+        ]
+
+        # 2. 캐시에 없는 곡선만 한 번에 추출
+        if missing:
+            matrix, names = await self.executor.run(
+                self.feature_extractor.extract_many,
+                [light_curves[index] for index in missing]
+            )
+            for index, row in zip(missing, matrix.tolist()):
+                features = self.feature_extractor.row_features(
+                    names, row, light_curves[index].flux_err is not None
+                )
+                cached[index] = features
+                self.feature_cache.put(keys[index], features)
 
-        # 4. 결과 해석
+        # flux_err가 없는 곡선의 밝기 오차 열은 NaN (extract_many()와 같은 열 구성)
+        matrix = np.array(
+            [[features.get(name, np.nan) for name in column_names] for features in cached],
+            dtype=np.float64
+        )
+        return matrix, column_names
+
+    async def _predict_proba(self, processed_features: np.ndarray) -> np.ndarray:
+        """
+        실행기 풀에서 모델 추론
+
+        프로세스 풀에서는 모델 객체 대신 모델 경로를 전달하고,
+        워커가 경로별로 캐시한 모델을 사용.
+        작은 배치는 컴파일 모델(있는 경우)로 추론
+
+        Parameters:
+            processed_features: 전처리된 (N, F) 특징값 배열
+
+        Returns:
+            (N, C) 클래스별 확률
+        """
+        compiled_model = self.model_loader.get_compiled_model()
+        use_compiled = (
+            compiled_model is not None
+            and len(processed_features) <= self.compiled_max_batch
+        )
+
+        if self.executor.uses_processes:
+            model_info = self.model_loader.get_model_info()
+            prefix = 'compiled_' if use_compiled else ''
+            return await self.executor.run(
+                predict_proba_in_worker,
+                model_info[prefix + 'path'],
+                model_info.get(prefix + 'mtime'),
+                processed_features
+            )
+
+        model = compiled_model if use_compiled else self.model_loader.get_model()
+        return await self.executor.run(model.predict_proba, processed_features)
+
+    def _to_prediction_result(self, probabilities: np.ndarray) -> PredictionResult:
+        """
+        모델 출력 확률을 예측 결과로 변환
+
+        Parameters:
+            probabilities: 한 샘플의 클래스별 확률
+
+        Returns:
+            예측 결과
+        """
         # 모델 출력: [false_positive_prob, candidate_prob, confirmed_prob]
         # 또는 [not_exoplanet_prob, exoplanet_prob] (이진 분류인 경우)
 
@@ -103,16 +359,16 @@ class ExoplanetDetectorImpl(IExoplanetDetector):
             candidate_probability = candidate_prob
             is_exoplanet = (confirmed_prob + candidate_prob) > false_positive_prob
 
-        # 5. 분류 결정
+        # 분류 결정
         classification = self._determine_classification(
             is_exoplanet,
             planet_probability,
             candidate_probability
         )
 
-        # 6. PredictionResult 생성
+        # PredictionResult 생성
         return PredictionResult(
-            is_exoplanet=is_exoplanet,
+            is_exoplanet=bool(is_exoplanet),
             classification=classification,
             planet_probability=float(planet_probability),
             candidate_probability=float(candidate_probability)
@@ -149,6 +405,54 @@ class ExoplanetDetectorImpl(IExoplanetDetector):
         # 낮은 확률 -> 후보
         return PredictionClass.CANDIDATE
 
+    async def warm_up(self, iterations: int = 3) -> float:
+        """
+        합성 입력으로 전처리와 추론 경로를 미리 실행
+
+        첫 요청이 실행기 풀 생성, 모델 내부 버퍼 할당 등의 초기 비용을
+        부담하지 않도록 단건(1행)과 배치(마이크로 배치 최대 크기) 추론을
+        iterations번 실행. 캐시와 배처는 거치지 않음
+
+        Parameters:
+            iterations: 반복 횟수
+
+        Returns:
+            소요 시간 (초)
+        """
+        start = time.perf_counter()
+        features = self.synthetic_features()
+        batch_size = max(1, min(self.batcher.max_batch_size, self.compiled_max_batch))
+
+        for _ in range(iterations):
+            await self._predict_proba(self.preprocessor.preprocess_features(features))
+            await self.predict_probabilities([features] * batch_size)
+
+        return time.perf_counter() - start
+
+    async def predict_probabilities(self, features_list: Sequence[Dict[str, float]]) -> np.ndarray:
+        """
+        특징값 리스트의 클래스별 확률 (캐시와 배처를 거치지 않음, 워밍업·검증용)
+
+        Parameters:
+            features_list: 특징값 딕셔너리 리스트
+
+        Returns:
+            (N, C) 클래스별 확률
+        """
+        processed_features = self.preprocessor.preprocess_batch(list(features_list))
+        return np.asarray(await self._predict_proba(processed_features))
+
+    def synthetic_features(self) -> Dict[str, float]:
+        """워밍업용 특징값 (스케일러 평균, 평균이 없으면 1.0)"""
+        scaler = self.model_loader.get_scaler()
+        names = getattr(scaler, 'feature_names_in_', None)
+        names = list(names) if names is not None else self.preprocessor.get_feature_names()
+        means = getattr(scaler, 'mean_', None)
+
+        if means is None or len(means) != len(names):
+            return {name: 1.0 for name in names}
+        return {name: float(mean) for name, mean in zip(names, means)}
+
     def get_model_info(self) -> dict:
         """
         모델 정보 반환
@@ -156,10 +460,13 @@ class ExoplanetDetectorImpl(IExoplanetDetector):
         Returns:
             모델 메타데이터
         """
-        model_info = self.model_loader.get_model_info()
+        model_info = dict(self.model_loader.get_model_info())
 
         # 추가 정보
+        model_info['prediction_cache'] = self.cache.stats()
+        model_info['feature_cache'] = self.feature_cache.stats()
         model_info['feature_count'] = len(self.preprocessor.get_feature_names())
         model_info['features'] = self.preprocessor.get_feature_names()
 
         return model_info
+
@@ -4,9 +4,12 @@
 """
 
 import numpy as np
-from typing import Dict, List
-from scipy.stats import skew, kurtosis
+from typing import Dict, List, Optional, Sequence, Tuple
 from ...domain.entities.light_curve import LightCurve
+from .flux_statistics import compute_flux_statistics, compute_segment_statistics, validate_offsets
+from .transit_search import HOURS_PER_DAY, PPM, TransitSearch, TransitSearchResult
+from .detrender import LightCurveDetrender
+from .phase_folder import FoldedLightCurve, PhaseFolder
 
 
 class FeatureExtractor:
@@ -14,9 +17,87 @@ class FeatureExtractor:
     광도 곡선 특징 추출기
 
     시계열 데이터로부터 통계적 특징을 추출하여
-    머신러닝 모델의 입력으로 사용
+    머신러닝 모델의 입력으로 사용.
+    추세 제거기가 설정되어 있으면 추세로 나눈 상대 밝기(약 1.0)에서 이상치를 제외한 뒤 추출.
+    트랜짓 탐색기가 설정되어 있으면 BLS 탐색으로 궤도 주기, 트랜짓 시각, SNR을
+    추가하고 transit_depth (ppm), transit_duration (시간)을 학습 데이터와 같은 단위로 대체
     """
 
+    # 추출 특징 이름 (extract_features 딕셔너리 키, extract_batch 행렬 열 순서)
+    FEATURE_NAMES = (
+        'mean_flux', 'median_flux', 'std_flux', 'var_flux', 'min_flux', 'max_flux',
+        'flux_range', 'flux_ratio', 'skewness', 'kurtosis',
+        'flux_25percentile', 'flux_75percentile', 'flux_90percentile',
+        'coefficient_of_variation', 'transit_depth', 'transit_duration'
+    )
+    ERROR_FEATURE_NAMES = ('mean_flux_err', 'max_flux_err')
+    TRANSIT_FEATURE_NAMES = ('orbital_period', 'transit_epoch', 'signal_to_noise')
+
+    # 특징 계산 방식 버전 (settings_key()에 포함)
+    SETTINGS_VERSION = 2
+
+    def __init__(
+        self,
+        transit_search: Optional[TransitSearch] = None,
+        detrender: Optional[LightCurveDetrender] = None,
+        phase_folder: Optional[PhaseFolder] = None
+    ):
+        """
+        Parameters:
+            transit_search: 트랜짓 탐색기 (None이거나 비활성화되어 있으면 탐색하지 않음)
+            detrender: 추세 제거기 (None이거나 비활성화되어 있으면 원본 밝기 사용)
+            phase_folder: 위상 접기 계산기 (None이면 기본 설정)
+        """
+        self.transit_search = transit_search
+        self.detrender = detrender
+        self.phase_folder = phase_folder or PhaseFolder()
+
+    @property
+    def detrends(self) -> bool:
+        """추세 제거 사용 여부"""
+        return self.detrender is not None and self.detrender.enabled
+
+    @property
+    def searches_transits(self) -> bool:
+        """트랜짓 탐색 사용 여부"""
+        return self.transit_search is not None and self.transit_search.enabled
+
+    def settings_key(self) -> str:
+        """
+        특징값에 영향을 주는 설정 문자열 (특징 캐시 키에 포함)
+
+        특징 계산 방식을 바꾸면 SETTINGS_VERSION을 올려 디스크 캐시의 이전 항목을 무효화
+        """
+        parts = [f"v{self.SETTINGS_VERSION}", ','.join(self.feature_names(include_errors=True))]
+        if self.detrends:
+            detrender = self.detrender
+            parts.append(
+                f"detrend={detrender.method},{detrender.window_days},{detrender.gap_days},"
+                f"{detrender.sigma_upper},{detrender.sigma_lower}"
+            )
+        if self.searches_transits:
+            search = self.transit_search
+            parts.append(
+                f"search={search.min_period},{search.max_period},{search.durations.tolist()},"
+                f"{search.oversample},{search.top_peaks},{search.min_points_in_transit},"
+                f"{search.max_periods},{search.max_bins},{search.max_cells}"
+            )
+        return ';'.join(parts)
+
+    def feature_names(self, include_errors: bool = False) -> List[str]:
+        """
+        extract_batch 행렬의 열 이름
+
+        Parameters:
+            include_errors: 밝기 오차 특징 포함 여부 (flux_err를 전달한 경우)
+        """
+        names = list(self.FEATURE_NAMES)
+        if include_errors:
+            names.extend(self.ERROR_FEATURE_NAMES)
+        if self.searches_transits:
+            names.extend(self.TRANSIT_FEATURE_NAMES)
+        return names
+
     def extract_features(self, light_curve: LightCurve) -> Dict[str, float]:
         """
         광도 곡선으로부터 특징 추출
@@ -27,31 +108,44 @@ class FeatureExtractor:
         Returns:
             추출된 특징값 딕셔너리
         """
-        flux = np.array(light_curve.flux)
-        time = np.array(light_curve.time)
+        # float64 엔티티 배열은 복사 없이 그대로 사용 (float32는 계산용으로 한 번 변환)
+        flux = np.asarray(light_curve.flux, dtype=np.float64)
+        time = np.asarray(light_curve.time, dtype=np.float64)
+        flux_err = (
+            np.asarray(light_curve.flux_err, dtype=np.float64)
+            if light_curve.flux_err is not None else None
+        )
+
+        # 추세 제거 및 이상치 제외
+        if self.detrends:
+            cleaned = self.detrender.detrend(time, flux, flux_err)
+            time, flux, flux_err = cleaned.time, cleaned.flux, cleaned.flux_err
+
+        # 모멘트와 순서 통계량을 한 번에 계산 (분할 1회 + 편차 버퍼 1개)
+        stats = compute_flux_statistics(flux)
 
         features = {}
 
         # 기본 통계량
-        features['mean_flux'] = np.mean(flux)
-        features['median_flux'] = np.median(flux)
-        features['std_flux'] = np.std(flux)
-        features['var_flux'] = np.var(flux)
-        features['min_flux'] = np.min(flux)
-        features['max_flux'] = np.max(flux)
+        features['mean_flux'] = stats.mean
+        features['median_flux'] = stats.median
+        features['std_flux'] = stats.std
+        features['var_flux'] = stats.var
+        features['min_flux'] = stats.min
+        features['max_flux'] = stats.max
 
         # 범위 및 변동성
         features['flux_range'] = features['max_flux'] - features['min_flux']
         features['flux_ratio'] = features['max_flux'] / features['min_flux'] if features['min_flux'] != 0 else 0
 
         # 고차 모멘트
-        features['skewness'] = skew(flux)
-        features['kurtosis'] = kurtosis(flux)
+        features['skewness'] = stats.skewness
+        features['kurtosis'] = stats.kurtosis
 
         # 백분위수
-        features['flux_25percentile'] = np.percentile(flux, 25)
-        features['flux_75percentile'] = np.percentile(flux, 75)
-        features['flux_90percentile'] = np.percentile(flux, 90)
+        features['flux_25percentile'] = stats.percentile_25
+        features['flux_75percentile'] = stats.percentile_75
+        features['flux_90percentile'] = stats.percentile_90
 
         # 변동 계수
         features['coefficient_of_variation'] = (
@@ -59,31 +153,110 @@ class FeatureExtractor:
             if features['mean_flux'] != 0 else 0
         )
 
-        # Transit 특징
-        features['transit_depth'] = self._calculate_transit_depth(flux)
-        features['transit_duration'] = self._estimate_transit_duration(flux, time)
+        # Transit 특징 (중앙값·최소값 재계산 없이 위 통계량 사용)
+        features['transit_depth'] = self._calculate_transit_depth(stats.median, stats.min)
+        features['transit_duration'] = self._estimate_transit_duration(flux, time, stats.median)
 
         # 에러 관련 (있는 경우)
-        if light_curve.flux_err is not None:
-            flux_err = np.array(light_curve.flux_err)
+        if flux_err is not None:
             features['mean_flux_err'] = np.mean(flux_err)
             features['max_flux_err'] = np.max(flux_err)
 
+        # BLS 트랜짓 탐색
+        if self.searches_transits:
+            features.update(self._transit_features(
+                self.transit_search.search(time, flux),
+                features['transit_depth'],
+                features['transit_duration']
+            ))
+
         return features
 
-    def _calculate_transit_depth(self, flux: np.ndarray) -> float:
+    def fold_light_curve(
+        self,
+        light_curve: LightCurve,
+        period: Optional[float] = None,
+        epoch: Optional[float] = None,
+        duration: Optional[float] = None,
+        n_bins: Optional[int] = None
+    ) -> Tuple[FoldedLightCurve, Optional[TransitSearchResult]]:
+        """
+        광도 곡선 위상 접기 (특징 추출과 같은 추세 제거 적용)
+
+        주기를 지정하지 않으면 BLS 탐색으로 찾은 주기, 트랜짓 시각, 지속 시간을 사용
+
+        Parameters:
+            light_curve: 광도 곡선 엔티티
+            period: 궤도 주기 (일, None이면 탐색)
+            epoch: 트랜짓 중심 시각 (주기를 지정한 경우 필수)
+            duration: 트랜짓 지속 시간 (일, 주기를 지정한 경우 필수)
+            n_bins: bin 수 (None이면 기본값)
+
+        Returns:
+            (위상 접기 결과, 트랜짓 탐색 결과 - 주기를 지정한 경우 None)
+
+        Raises:
+            ValueError: 주기 정보가 부족하거나 트랜짓 신호를 찾지 못한 경우
+        """
+        time = np.asarray(light_curve.time, dtype=np.float64)
+        flux = np.asarray(light_curve.flux, dtype=np.float64)
+        if self.detrends:
+            cleaned = self.detrender.detrend(time, flux)
+            time, flux = cleaned.time, cleaned.flux
+
+        search_result = None
+        if period is None:
+            if self.transit_search is None:
+                raise ValueError("트랜짓 탐색기가 없으므로 주기를 지정해야 합니다")
+            search_result = self.transit_search.search(time, flux)
+            if search_result is None:
+                raise ValueError("주기적인 트랜짓 신호를 찾지 못했습니다")
+            period, epoch, duration = search_result.period, search_result.epoch, search_result.duration
+        elif epoch is None or duration is None:
+            raise ValueError("주기를 지정한 경우 트랜짓 시각과 지속 시간도 필요합니다")
+
+        folded = self.phase_folder.fold(time, flux, period, epoch, duration, n_bins)
+        return folded, search_result
+
+    def _transit_features(
+        self,
+        result: Optional[TransitSearchResult],
+        depth: float,
+        duration: float
+    ) -> Dict[str, float]:
+        """
+        트랜짓 탐색 결과 → 특징값 (transit_depth는 ppm, transit_duration은 시간)
+
+        신호를 찾지 못하면 궤도 주기, 트랜짓 시각, SNR은 0이고 transit_depth,
+        transit_duration은 기존 추정값을 같은 단위로 환산하여 탐지 여부에 따라 단위가 바뀌지 않게 함
+
+        Parameters:
+            result: 트랜짓 탐색 결과 (신호가 없으면 None)
+            depth: 기존 transit_depth 추정값 (중앙값 대비 상대 밝기 감소)
+            duration: 기존 transit_duration 추정값 (일)
+
+        Returns:
+            트랜짓 특징값 딕셔너리
+        """
+        if result is not None:
+            return result.to_features()
+
+        features = {name: 0.0 for name in self.TRANSIT_FEATURE_NAMES}
+        features['transit_depth'] = depth * PPM
+        features['transit_duration'] = duration * HOURS_PER_DAY
+        return features
+
+    def _calculate_transit_depth(self, median_flux: float, min_flux: float) -> float:
         """
         Transit depth 계산
 
         Parameters:
-            flux: 플럭스 배열
+            median_flux: 플럭스 중앙값
+            min_flux: 플럭스 최소값
 
         Returns:
             Transit depth (정규화된 밝기 감소)
         """
-        median_flux = np.median(flux)
-        min_flux = np.min(flux)
-
         if median_flux == 0:
             return 0.0
 
@@ -93,7 +266,8 @@ class FeatureExtractor:
     def _estimate_transit_duration(
         self,
         flux: np.ndarray,
-        time: np.ndarray
+        time: np.ndarray,
+        median_flux: float
     ) -> float:
         """
         Transit duration 추정
@@ -101,12 +275,12 @@ class FeatureExtractor:
         Parameters:
             flux: 플럭스 배열
             time: 시간 배열
+            median_flux: 플럭스 중앙값
 
         Returns:
             Transit 지속 시간
         """
         # Transit threshold (median보다 1% 이상 어두운 지점)
-        median_flux = np.median(flux)
         threshold = median_flux * 0.99
 
         # Threshold 이하인 지점 찾기
@@ -124,6 +298,165 @@ class FeatureExtractor:
         duration = np.max(transit_times) - np.min(transit_times)
         return duration
 
+    def extract_batch(
+        self,
+        flux: np.ndarray,
+        time: np.ndarray,
+        offsets: np.ndarray,
+        flux_err: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        여러 광도 곡선의 특징을 한 번에 추출
+
+        곡선들을 하나로 이어 붙인 버퍼와 구간 경계를 받아 구간별 벡터 연산으로
+        모든 특징을 계산하므로, 곡선 수가 늘어도 Python 반복이 늘지 않음.
+        각 행은 extract_features()와 같은 값 (열 순서는 feature_names())
+
+        Parameters:
+            flux: 이어 붙인 플럭스 배열
+            time: 이어 붙인 시간 배열 (flux와 같은 길이)
+            offsets: 구간 경계 (길이 N + 1, offsets[i]:offsets[i + 1]이 i번째 곡선)
+            flux_err: 이어 붙인 밝기 오차 배열 (선택)
+
+        Returns:
+            (N, F) 특징 행렬
+
+        Raises:
+            ValueError: 배열 길이 또는 구간 경계가 잘못된 경우
+        """
+        flux = np.asarray(flux, dtype=np.float64).ravel()
+        time = np.asarray(time, dtype=np.float64).ravel()
+        if time.size != flux.size:
+            raise ValueError("시간과 밝기 배열의 길이가 같아야 합니다")
+
+        offsets = validate_offsets(offsets, flux.size)
+
+        # 추세 제거 및 이상치 제외 (모든 곡선을 한 번의 이동 창 집계로 처리)
+        if self.detrends:
+            cleaned = self.detrender.detrend_many(time, flux, offsets, flux_err)
+            time, flux, flux_err, offsets = cleaned.time, cleaned.flux, cleaned.flux_err, cleaned.offsets
+
+        starts = offsets[:-1]
+        counts = np.diff(offsets)
+
+        # 1. 구간별 모멘트와 순서 통계량
+        stats = compute_segment_statistics(flux, offsets)
+
+        include_errors = flux_err is not None
+        matrix = np.empty((counts.size, len(self.feature_names(include_errors))), dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # 2. 기본 통계량, 범위, 고차 모멘트, 백분위수, 변동 계수
+            matrix[:, 0] = stats.mean
+            matrix[:, 1] = stats.median
+            matrix[:, 2] = stats.std
+            matrix[:, 3] = stats.var
+            matrix[:, 4] = stats.min
+            matrix[:, 5] = stats.max
+            matrix[:, 6] = stats.max - stats.min
+            matrix[:, 7] = np.where(stats.min != 0, stats.max / stats.min, 0.0)
+            matrix[:, 8] = stats.skewness
+            matrix[:, 9] = stats.kurtosis
+            matrix[:, 10] = stats.percentile_25
+            matrix[:, 11] = stats.percentile_75
+            matrix[:, 12] = stats.percentile_90
+            matrix[:, 13] = np.where(stats.mean != 0, stats.std / stats.mean, 0.0)
+
+            # 3. Transit depth
+            matrix[:, 14] = np.where(
+                stats.median != 0,
+                (stats.median - stats.min) / stats.median,
+                0.0
+            )
+
+        # 4. Transit duration: 구간별 임계값 이하 지점의 시간 범위
+        in_transit = flux < np.repeat(stats.median * 0.99, counts)
+        first_time = np.minimum.reduceat(np.where(in_transit, time, np.inf), starts)
+        last_time = np.maximum.reduceat(np.where(in_transit, time, -np.inf), starts)
+        has_transit = np.logical_or.reduceat(in_transit, starts)
+        matrix[:, 15] = np.where(has_transit, last_time - first_time, 0.0)
+
+        # 5. 에러 관련 (있는 경우)
+        if include_errors:
+            flux_err = np.asarray(flux_err, dtype=np.float64).ravel()
+            if flux_err.size != flux.size:
+                raise ValueError("밝기 오차 배열의 길이가 밝기 배열과 같아야 합니다")
+            matrix[:, 16] = np.add.reduceat(flux_err, starts) / counts
+            matrix[:, 17] = np.maximum.reduceat(flux_err, starts)
+
+        # 6. BLS 트랜짓 탐색 (곡선 단위로 스레드 풀에서 병렬 실행)
+        if self.searches_transits:
+            columns = {name: index for index, name in enumerate(self.feature_names(include_errors))}
+            results = self.transit_search.search_many(time, flux, offsets)
+            for row, result in enumerate(results):
+                transit = self._transit_features(result, matrix[row, 14], matrix[row, 15])
+                for name, value in transit.items():
+                    matrix[row, columns[name]] = value
+
+        return matrix
+
+    def extract_many(self, light_curves: Sequence[LightCurve]) -> Tuple[np.ndarray, List[str]]:
+        """
+        광도 곡선 엔티티 목록의 특징 행렬 추출
+
+        곡선들을 하나의 버퍼로 이어 붙인 뒤 extract_batch()로 계산.
+        밝기 오차 특징은 flux_err가 있는 곡선이 하나라도 있으면 포함하며,
+        flux_err가 없는 곡선의 행은 NaN (extract_features()에서 해당 특징이 빠지는 것과 같음)
+
+        Parameters:
+            light_curves: 광도 곡선 엔티티 리스트
+
+        Returns:
+            ((N, F) 특징 행렬, 열 이름 리스트)
+        """
+        if not light_curves:
+            raise ValueError("배치가 비어있습니다")
+
+        lengths = [light_curve.get_length() for light_curve in light_curves]
+        offsets = np.zeros(len(lengths) + 1, dtype=np.intp)
+        np.cumsum(lengths, out=offsets[1:])
+
+        include_errors = any(light_curve.flux_err is not None for light_curve in light_curves)
+        matrix = self.extract_batch(
+            flux=np.concatenate([np.asarray(lc.flux, dtype=np.float64) for lc in light_curves]),
+            time=np.concatenate([np.asarray(lc.time, dtype=np.float64) for lc in light_curves]),
+            offsets=offsets,
+            flux_err=(
+                np.concatenate([
+                    np.asarray(lc.flux_err, dtype=np.float64)
+                    if lc.flux_err is not None else np.full(length, np.nan)
+                    for lc, length in zip(light_curves, lengths)
+                ])
+                if include_errors else None
+            )
+        )
+        return matrix, self.feature_names(include_errors)
+
+    def row_features(
+        self,
+        names: Sequence[str],
+        row: Sequence[float],
+        has_errors: bool
+    ) -> Dict[str, float]:
+        """
+        extract_many() 행렬의 한 행을 특징값 딕셔너리로 변환
+
+        flux_err가 없는 곡선은 밝기 오차 특징을 빼서 extract_features()와 같은 키 구성으로 맞춤
+
+        Parameters:
+            names: 열 이름 리스트
+            row: 특징 행
+            has_errors: 해당 곡선에 flux_err가 있는지 여부
+
+        Returns:
+            특징값 딕셔너리
+        """
+        features = dict(zip(names, row))
+        if not has_errors:
+            for name in self.ERROR_FEATURE_NAMES:
+                features.pop(name, None)
+        return features
+
     def extract_from_dict(self, light_curve_data: dict) -> Dict[str, float]:
         """
         딕셔너리 데이터로부터 특징 추출
@@ -0,0 +1,217 @@
+"""
+컴파일된 특징 변환 계획 (Feature Plan)
+pandas 없이 NumPy만으로 특징값 딕셔너리를 모델 입력 벡터로 변환
+"""
+
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+
+# 파생 특징 정의: (파생 특징 이름, 입력 특징 A, 입력 특징 B, 계산 함수)
+# pandas Series와 NumPy 배열 모두에 적용 가능한 연산만 사용
+ENGINEERED_FEATURES = (
+    # 1. depth_per_radius_sq: 깊이 / 반지름^2
+    ('depth_per_radius_sq', 'transit_depth', 'planet_radius',
+     lambda depth, radius: depth / (radius ** 2 + 1e-6)),
+    # 2. orbit_transit_product: 궤도주기 × 통과시간
+    ('orbit_transit_product', 'orbital_period', 'transit_duration',
+     lambda period, duration: period * duration),
+    # 3. signal_strength: 신호강도 / 깊이
+    ('signal_strength', 'signal_to_noise', 'transit_depth',
+     lambda snr, depth: snr / (depth + 1e-6)),
+    # 4. temp_ratio: 행성온도 / 별온도
+    ('temp_ratio', 'equilibrium_temp', 'stellar_temp',
+     lambda teq, teff: teq / (teff + 1e-6)),
+    # 5. planet_star_radius_ratio: 행성반지름 / 별반지름
+    ('planet_star_radius_ratio', 'planet_radius', 'stellar_radius',
+     lambda planet_radius, stellar_radius: planet_radius / (stellar_radius + 1e-6)),
+)
+
+
+class FeaturePlan:
+    """
+    특징 변환 계획
+
+    스케일러의 feature_names_in_으로부터 한 번만 컴파일되며,
+    특징 이름 → 벡터 위치 매핑과 StandardScaler의 mean_/scale_을 보관.
+    DataFrame 생성, 컬럼 추가/재정렬 없이 미리 할당된 float64 벡터에
+    값을 직접 기록한 뒤 (x - mean) / scale을 제자리(in-place) 연산으로 적용.
+
+    Preprocessor의 pandas 경로와 동일한 규칙을 따름:
+    - 파생 특징은 두 입력이 모두 주어졌을 때만 계산 (아니면 입력값 또는 0)
+    - 누락된 특징은 0
+    - NaN, ±Inf는 0
+    """
+
+    def __init__(
+        self,
+        feature_names: Sequence[str],
+        mean: Optional[np.ndarray] = None,
+        scale: Optional[np.ndarray] = None
+    ):
+        """
+        Parameters:
+            feature_names: 모델 입력 특징 이름 (훈련 시 순서)
+            mean: 스케일링 평균 (None이면 평행이동 생략)
+            scale: 스케일링 표준편차 (None이면 나눗셈 생략)
+        """
+        self.feature_names: List[str] = list(feature_names)
+        self.n_outputs = len(self.feature_names)
+
+        # 입력 슬롯: 출력 특징(앞부분, 출력 순서와 동일) + 출력에 없는 파생 특징 입력
+        input_names = list(self.feature_names)
+        for _, source_a, source_b, _ in ENGINEERED_FEATURES:
+            for source in (source_a, source_b):
+                if source not in input_names:
+                    input_names.append(source)
+
+        self.input_index: Dict[str, int] = {
+            name: index for index, name in enumerate(input_names)
+        }
+        self.n_inputs = len(input_names)
+
+        # 출력에 포함된 파생 특징만 (출력 위치, 입력 A 위치, 입력 B 위치, 함수)로 컴파일
+        self._engineered = [
+            (
+                self.input_index[name],
+                self.input_index[source_a],
+                self.input_index[source_b],
+                func
+            )
+            for name, source_a, source_b, func in ENGINEERED_FEATURES
+            if name in self.input_index and self.input_index[name] < self.n_outputs
+        ]
+
+        self._mean = None if mean is None else np.asarray(mean, dtype=np.float64)
+        self._scale = None if scale is None else np.asarray(scale, dtype=np.float64)
+
+    @classmethod
+    def compile(cls, scaler) -> Optional['FeaturePlan']:
+        """
+        스케일러로부터 변환 계획 컴파일
+
+        Parameters:
+            scaler: 학습된 sklearn 스케일러
+
+        Returns:
+            변환 계획 (StandardScaler 형태가 아니면 None)
+        """
+        if scaler is None or not hasattr(scaler, 'feature_names_in_'):
+            return None
+
+        # StandardScaler와 같은 (x - mean_) / scale_ 형태만 지원
+        if not all(
+            hasattr(scaler, attr)
+            for attr in ('mean_', 'scale_', 'with_mean', 'with_std')
+        ):
+            return None
+
+        return cls(
+            feature_names=scaler.feature_names_in_.tolist(),
+            mean=scaler.mean_ if scaler.with_mean else None,
+            scale=scaler.scale_ if scaler.with_std else None
+        )
+
+    def transform(self, features: Dict[str, float]) -> np.ndarray:
+        """
+        단일 샘플 변환
+
+        Parameters:
+            features: 특징값 딕셔너리
+
+        Returns:
+            (1, F) 모델 입력 배열
+        """
+        values = np.zeros(self.n_inputs, dtype=np.float64)
+        present = [False] * self.n_inputs
+
+        # 1. 이름 → 위치 매핑으로 미리 할당된 벡터에 직접 기록
+        input_index = self.input_index
+        for name, value in features.items():
+            index = input_index.get(name)
+            if index is not None:
+                values[index] = value
+                present[index] = True
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # 2. 파생 특징 계산
+            for output, source_a, source_b, func in self._engineered:
+                if present[source_a] and present[source_b]:
+                    values[output] = func(values[source_a], values[source_b])
+
+            # 3. 결측치/무한값 처리 및 스케일링
+            return self._finalize(values[np.newaxis, :self.n_outputs])
+
+    def transform_many(self, features_list: Sequence[Dict[str, float]]) -> np.ndarray:
+        """
+        여러 샘플 변환 (파생 특징과 스케일링은 컬럼 단위 벡터 연산)
+
+        Parameters:
+            features_list: 특징값 딕셔너리 리스트
+
+        Returns:
+            (N, F) 모델 입력 배열
+        """
+        values = np.zeros((len(features_list), self.n_inputs), dtype=np.float64)
+        present = np.zeros((len(features_list), self.n_inputs), dtype=bool)
+
+        input_index = self.input_index
+        for row, features in enumerate(features_list):
+            for name, value in features.items():
+                index = input_index.get(name)
+                if index is not None:
+                    values[row, index] = value
+                    present[row, index] = True
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for output, source_a, source_b, func in self._engineered:
+                computed = present[:, source_a] & present[:, source_b]
+                values[:, output] = np.where(
+                    computed,
+                    func(values[:, source_a], values[:, source_b]),
+                    values[:, output]
+                )
+
+            return self._finalize(values[:, :self.n_outputs])
+
+    def transform_matrix(self, matrix: np.ndarray, column_names: Sequence[str]) -> np.ndarray:
+        """
+        특징 행렬 변환 (딕셔너리 없이 열 단위 복사)
+
+        Parameters:
+            matrix: (N, K) 특징 행렬
+            column_names: 행렬의 열 이름 (길이 K)
+
+        Returns:
+            (N, F) 모델 입력 배열
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        values = np.zeros((matrix.shape[0], self.n_inputs), dtype=np.float64)
+        present = [False] * self.n_inputs
+
+        # 1. 이름 → 위치 매핑으로 열 전체를 복사 (같은 이름이 반복되면 마지막 열 사용)
+        for column, name in enumerate(column_names):
+            index = self.input_index.get(name)
+            if index is not None:
+                values[:, index] = matrix[:, column]
+                present[index] = True
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # 2. 파생 특징 계산 (입력 열이 모두 있을 때만)
+            for output, source_a, source_b, func in self._engineered:
+                if present[source_a] and present[source_b]:
+                    values[:, output] = func(values[:, source_a], values[:, source_b])
+
+            # 3. 결측치/무한값 처리 및 스케일링
+            return self._finalize(values[:, :self.n_outputs])
+
+    def _finalize(self, matrix: np.ndarray) -> np.ndarray:
+        """NaN/Inf 제거 후 스케일링을 제자리 연산으로 적용"""
+        matrix[~np.isfinite(matrix)] = 0.0
+
+        if self._mean is not None:
+            matrix -= self._mean
+        if self._scale is not None:
+            matrix /= self._scale
+
+        return np.ascontiguousarray(matrix)
@@ -0,0 +1,304 @@
+"""
+플럭스 통계 커널 (Flux Statistics Kernel)
+광도 곡선 플럭스 배열의 모멘트와 순서 통계량을 한 번에 계산
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.stats import skew, kurtosis
+
+
+# 순서 통계량으로 계산하는 백분위수 (np.percentile의 linear 보간과 동일)
+PERCENTILES = (25.0, 50.0, 75.0, 90.0)
+
+
+@dataclass(frozen=True)
+class FluxStatistics:
+    """
+    플럭스 통계량
+
+    skewness, kurtosis는 scipy.stats.skew / kurtosis 기본값(편향 추정, Fisher 정의)과 동일
+    """
+    count: int
+    mean: float
+    median: float
+    std: float
+    var: float
+    min: float
+    max: float
+    skewness: float
+    kurtosis: float
+    percentile_25: float
+    percentile_75: float
+    percentile_90: float
+
+
+def compute_flux_statistics(flux: np.ndarray) -> FluxStatistics:
+    """
+    플럭스 통계량 계산
+
+    순서 통계량(최소, 최대, 중앙값, 백분위수)은 하나의 작업 버퍼를 순위별로
+    부분 분할하여 구하고, 모멘트(분산, 왜도, 첨도)는 같은 버퍼에 평균을 뺀
+    편차에서 내적으로 구함. 전체 정렬 없이 O(n)이며 배열을 몇 번만 읽음.
+    NaN/inf가 섞여 있으면 기존 NumPy/SciPy 함수와 동일한 결과를 내도록 개별 계산으로 대체
+
+    Parameters:
+        flux: 플럭스 배열 (1차원)
+
+    Returns:
+        플럭스 통계량
+
+    Raises:
+        ValueError: 빈 배열
+    """
+    flux = np.asarray(flux, dtype=np.float64).ravel()
+    n = flux.size
+    if n == 0:
+        raise ValueError("플럭스 배열이 비어있을 수 없습니다")
+
+    # 1. 평균 (NaN/inf는 합에 그대로 전파되므로 추가 검사 없이 감지)
+    mean = float(np.sum(flux)) / n
+    if not np.isfinite(mean):
+        return _compute_reference(flux)
+
+    # 2. 순서 통계량: 보간에 필요한 하위 순위마다 남은 꼬리 구간만 분할
+    #    (여러 kth를 한 번에 넘기는 np.partition은 전체 정렬보다 느려 순차 분할 사용)
+    positions = np.asarray(PERCENTILES) / 100.0 * (n - 1)
+    lower = np.floor(positions).astype(np.intp)
+    fraction = positions - lower
+
+    work = flux.copy()
+    ranks = np.unique(lower)
+    start = 0
+    for rank in ranks:
+        work[start:].partition(rank - start)
+        start = rank + 1
+
+    # 분할 지점 사이 구간은 경계값 사이에 있으므로, 바로 다음 순위는 다음 구간의 최소값
+    bounds = np.append(ranks[1:] + 1, n)
+    next_values = {
+        int(rank): float(np.min(work[rank + 1:bound])) if rank + 1 < n else float(work[rank])
+        for rank, bound in zip(ranks, bounds)
+    }
+    percentiles = [
+        float(work[rank]) + (next_values[int(rank)] - float(work[rank])) * frac
+        for rank, frac in zip(lower, fraction)
+    ]
+    percentile_25, median, percentile_75, percentile_90 = percentiles
+    min_value = float(np.min(work[:ranks[0] + 1]))
+    max_value = float(np.max(work[ranks[-1]:]))
+
+    # 3. 중심 모멘트: 분할이 끝난 작업 버퍼를 편차 버퍼로 재사용하여 m2, m3, m4 계산
+    deviation = np.subtract(flux, mean, out=work)
+    squared = deviation * deviation
+    m2 = float(np.sum(squared)) / n
+    m3 = float(np.dot(squared, deviation)) / n
+    m4 = float(np.dot(squared, squared)) / n
+
+    # 거의 상수인 배열은 scipy와 동일하게 왜도·첨도를 정의하지 않음
+    if m2 <= (np.finfo(np.float64).eps * mean) ** 2:
+        skewness = kurt = float('nan')
+    else:
+        skewness = m3 / m2 ** 1.5
+        kurt = m4 / (m2 * m2) - 3.0
+
+    return FluxStatistics(
+        count=n,
+        mean=mean,
+        median=median,
+        std=float(np.sqrt(m2)),
+        var=m2,
+        min=min_value,
+        max=max_value,
+        skewness=skewness,
+        kurtosis=kurt,
+        percentile_25=percentile_25,
+        percentile_75=percentile_75,
+        percentile_90=percentile_90
+    )
+
+
+def _compute_reference(flux: np.ndarray) -> FluxStatistics:
+    """개별 NumPy/SciPy 함수로 계산 (NaN/inf가 포함된 배열용)"""
+    percentile_25, median, percentile_75, percentile_90 = np.percentile(flux, PERCENTILES)
+
+    return FluxStatistics(
+        count=flux.size,
+        mean=float(np.mean(flux)),
+        median=float(median),
+        std=float(np.std(flux)),
+        var=float(np.var(flux)),
+        min=float(np.min(flux)),
+        max=float(np.max(flux)),
+        skewness=float(skew(flux)),
+        kurtosis=float(kurtosis(flux)),
+        percentile_25=float(percentile_25),
+        percentile_75=float(percentile_75),
+        percentile_90=float(percentile_90)
+    )
+
+
+@dataclass(frozen=True)
+class SegmentFluxStatistics:
+    """
+    구간별 플럭스 통계량
+
+    각 필드는 구간 수(N) 길이의 배열이며, 정의는 FluxStatistics와 동일
+    """
+    counts: np.ndarray
+    mean: np.ndarray
+    median: np.ndarray
+    std: np.ndarray
+    var: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    skewness: np.ndarray
+    kurtosis: np.ndarray
+    percentile_25: np.ndarray
+    percentile_75: np.ndarray
+    percentile_90: np.ndarray
+
+
+def validate_offsets(offsets: np.ndarray, size: int) -> np.ndarray:
+    """
+    구간 경계 배열 검증
+
+    Parameters:
+        offsets: 구간 경계 (길이 N + 1, offsets[i]:offsets[i + 1]이 i번째 구간)
+        size: 이어 붙인 데이터 배열 길이
+
+    Returns:
+        정수형 구간 경계 배열
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 빈 구간이 있는 경우
+    """
+    offsets = np.asarray(offsets)
+    if offsets.ndim != 1 or offsets.size < 2:
+        raise ValueError("offsets는 길이 N + 1 이상의 1차원 배열이어야 합니다 (N >= 1)")
+    if not np.issubdtype(offsets.dtype, np.integer):
+        raise ValueError("offsets는 정수 배열이어야 합니다")
+
+    offsets = offsets.astype(np.intp)
+    if offsets[0] != 0 or offsets[-1] != size:
+        raise ValueError(f"offsets는 0으로 시작하고 데이터 길이({size})로 끝나야 합니다")
+    if np.any(np.diff(offsets) <= 0):
+        raise ValueError("광도 곡선 데이터가 비어있을 수 없습니다 (offsets는 순증가해야 합니다)")
+
+    return offsets
+
+
+def compute_segment_statistics(flux: np.ndarray, offsets: np.ndarray) -> SegmentFluxStatistics:
+    """
+    여러 광도 곡선의 플럭스 통계량을 한 번에 계산
+
+    이어 붙인 플럭스 버퍼와 구간 경계로 곡선을 구분하여, 모멘트는 ufunc.reduceat,
+    순서 통계량은 길이 등급별 2차원 행 정렬로 구함. 반복 횟수는 곡선 수가 아니라
+    길이 등급 수(2의 거듭제곱 단위)에 비례하며, NaN/inf가 포함된 구간만 개별 계산으로 대체
+
+    Parameters:
+        flux: 이어 붙인 플럭스 배열
+        offsets: 구간 경계 (길이 N + 1)
+
+    Returns:
+        구간별 플럭스 통계량
+
+    Raises:
+        ValueError: 구간 경계가 잘못된 경우
+    """
+    flux = np.asarray(flux, dtype=np.float64).ravel()
+    offsets = validate_offsets(offsets, flux.size)
+    starts = offsets[:-1]
+    counts = np.diff(offsets)
+
+    # 1. 중심 모멘트: 구간별 평균을 뺀 편차 버퍼 하나에서 m2, m3, m4 계산
+    sums = np.add.reduceat(flux, starts)
+    mean = sums / counts
+    deviation = flux - np.repeat(mean, counts)
+    squared = deviation * deviation
+    m2 = np.add.reduceat(squared, starts) / counts
+    m3 = np.add.reduceat(squared * deviation, starts) / counts
+    m4 = np.add.reduceat(squared * squared, starts) / counts
+
+    # 2. 순서 통계량: 길이가 비슷한 구간끼리 패딩한 2차원 배열로 행 단위 정렬
+    minimum = np.empty(counts.size)
+    maximum = np.empty(counts.size)
+    percentiles = np.empty((counts.size, len(PERCENTILES)))
+    for rows, sorted_rows in _sorted_segment_groups(flux, starts, counts):
+        row_counts = counts[rows]
+        positions = (row_counts - 1)[:, np.newaxis] * (np.asarray(PERCENTILES) / 100.0)
+        lower = np.floor(positions).astype(np.intp)
+        upper = np.minimum(lower + 1, (row_counts - 1)[:, np.newaxis])
+        low_values = np.take_along_axis(sorted_rows, lower, axis=1)
+        high_values = np.take_along_axis(sorted_rows, upper, axis=1)
+
+        percentiles[rows] = low_values + (high_values - low_values) * (positions - lower)
+        minimum[rows] = sorted_rows[:, 0]
+        maximum[rows] = sorted_rows[np.arange(rows.size), row_counts - 1]
+
+    # 3. 왜도·첨도 (거의 상수인 구간은 scipy와 동일하게 NaN)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        degenerate = m2 <= (np.finfo(np.float64).eps * mean) ** 2
+        skewness = np.where(degenerate, np.nan, m3 / m2 ** 1.5)
+        kurt = np.where(degenerate, np.nan, m4 / (m2 * m2) - 3.0)
+
+    stats = SegmentFluxStatistics(
+        counts=counts,
+        mean=mean,
+        median=percentiles[:, 1],
+        std=np.sqrt(m2),
+        var=m2,
+        min=minimum,
+        max=maximum,
+        skewness=skewness,
+        kurtosis=kurt,
+        percentile_25=percentiles[:, 0],
+        percentile_75=percentiles[:, 2],
+        percentile_90=percentiles[:, 3]
+    )
+
+    # 4. NaN/inf가 포함된 구간은 기존 함수와 동일한 결과로 대체
+    for index in np.flatnonzero(~np.isfinite(sums)):
+        reference = _compute_reference(flux[offsets[index]:offsets[index + 1]])
+        for name in ('mean', 'median', 'std', 'var', 'min', 'max', 'skewness',
+                     'kurtosis', 'percentile_25', 'percentile_75', 'percentile_90'):
+            getattr(stats, name)[index] = getattr(reference, name)
+
+    return stats
+
+
+def _sorted_segment_groups(flux: np.ndarray, starts: np.ndarray, counts: np.ndarray):
+    """
+    구간을 길이 등급(2의 거듭제곱)별로 묶어 행 단위로 정렬한 2차원 배열 생성
+
+    같은 등급 안에서는 가장 긴 구간 길이로 +inf 패딩하므로 패딩이 구간 길이의
+    2배를 넘지 않으며, np.sort(axis=1)은 (구간, 값) 복합 키 정렬보다 훨씬 빠름
+
+    Yields:
+        (구간 번호 배열, (구간 수, 최대 길이) 정렬 배열)
+    """
+    length_class = np.ceil(np.log2(counts)).astype(np.intp)
+
+    for value in np.unique(length_class):
+        rows = np.flatnonzero(length_class == value)
+        row_counts = counts[rows]
+        width = int(row_counts.max())
+
+        # 길이가 모두 같으면 패딩 없이 (행 시작 + 열) 인덱스로 한 번에 모음
+        if np.all(row_counts == width):
+            gathered = flux[starts[rows][:, np.newaxis] + np.arange(width)]
+            gathered.sort(axis=1)
+            yield rows, gathered
+            continue
+
+        # 패딩 배열의 (행, 열) 위치에 각 구간 값을 흩뿌림
+        total = int(row_counts.sum())
+        row_index = np.repeat(np.arange(rows.size), row_counts)
+        column_index = np.arange(total) - np.repeat(np.cumsum(row_counts) - row_counts, row_counts)
+
+        padded = np.full((rows.size, width), np.inf)
+        padded[row_index, column_index] = flux[np.repeat(starts[rows], row_counts) + column_index]
+        padded.sort(axis=1)
+
+        yield rows, padded
@@ -0,0 +1,163 @@
+"""
+추론 실행기 (Inference Executor)
+CPU 집약적인 특징 추출과 모델 추론을 이벤트 루프 밖의 풀에서 실행
+"""
+
+import asyncio
+import os
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, Optional
+
+import numpy as np
+
+from .compiled_ensemble import CompiledEnsemble
+
+
+class InferenceQueueFullError(RuntimeError):
+    """추론 대기열이 가득 찬 경우 발생 (HTTP 503 + Retry-After로 변환)"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("추론 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.")
+        self.retry_after = retry_after
+
+
+class InferenceExecutor:
+    """
+    제한된 크기의 스레드/프로세스 풀 기반 추론 실행기
+
+    실행 중 + 대기 중인 작업 수가 max_queue_size에 도달하면
+    새 작업을 즉시 거절하여(InferenceQueueFullError) 요청이 무한정 쌓이지 않도록 함
+
+    환경변수:
+        INFERENCE_EXECUTOR: 풀 종류 (thread | process, 기본값 thread)
+        INFERENCE_WORKERS: 워커 수 (기본값 min(4, CPU 수))
+        INFERENCE_MAX_QUEUE: 최대 동시 작업 수 (실행 + 대기, 기본값 64)
+        INFERENCE_RETRY_AFTER: 거절 시 Retry-After 초 (기본값 1)
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+    def __init__(
+        self,
+        kind: str = THREAD,
+        max_workers: Optional[int] = None,
+        max_queue_size: int = 64,
+        retry_after: int = 1
+    ):
+        """
+        Parameters:
+            kind: 풀 종류 (thread 또는 process)
+            max_workers: 워커 수 (None이면 min(4, CPU 수))
+            max_queue_size: 최대 동시 작업 수 (실행 + 대기)
+            retry_after: 거절 시 클라이언트에 안내할 재시도 대기 시간 (초)
+        """
+        if kind not in (self.THREAD, self.PROCESS):
+            raise ValueError(f"지원하지 않는 실행기 종류입니다: {kind}")
+
+        self.kind = kind
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_queue_size = max_queue_size
+        self.retry_after = retry_after
+        self._pending = 0
+        self._pool: Optional[Executor] = None
+
+    @classmethod
+    def from_env(cls) -> 'InferenceExecutor':
+        """환경변수 설정으로 실행기 생성"""
+        max_workers = os.getenv("INFERENCE_WORKERS")
+        return cls(
+            kind=os.getenv("INFERENCE_EXECUTOR", cls.THREAD).lower(),
+            max_workers=int(max_workers) if max_workers else None,
+            max_queue_size=int(os.getenv("INFERENCE_MAX_QUEUE", "64")),
+            retry_after=int(os.getenv("INFERENCE_RETRY_AFTER", "1"))
+        )
+
+    @property
+    def uses_processes(self) -> bool:
+        """프로세스 풀 사용 여부 (작업과 인자는 pickle 가능해야 함)"""
+        return self.kind == self.PROCESS
+
+    @property
+    def pending(self) -> int:
+        """실행 중이거나 대기 중인 작업 수"""
+        return self._pending
+
+    def _get_pool(self) -> Executor:
+        """풀 지연 생성"""
+        if self._pool is None:
+            if self.uses_processes:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="inference"
+                )
+        return self._pool
+
+    async def run(self, func: Callable, *args):
+        """
+        작업을 풀에서 실행하고 결과를 기다림
+
+        Parameters:
+            func: 실행할 함수
+            *args: 함수 인자
+
+        Returns:
+            함수 실행 결과
+
+        Raises:
+            InferenceQueueFullError: 동시 작업 수가 한도에 도달한 경우
+        """
+        if self._pending >= self.max_queue_size:
+            raise InferenceQueueFullError(self.retry_after)
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_pool(), partial(func, *args))
+        finally:
+            self._pending -= 1
+
+    def shutdown(self, wait: bool = True):
+        """풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+
+@lru_cache(maxsize=4)
+def _load_worker_model(model_path: str, model_mtime: Optional[float]):
+    """
+    프로세스 워커 내 모델 캐시
+
+    (경로, 수정 시각)을 키로 워커마다 한 번만 로드하므로
+    매 요청마다 모델을 프로세스 간에 전송하지 않음
+    """
+    if model_path.endswith('.npz'):
+        return CompiledEnsemble.load(model_path)
+
+    with open(model_path, 'rb') as f:
+        return pickle.load(f)
+
+
+def predict_proba_in_worker(
+    model_path: str,
+    model_mtime: Optional[float],
+    processed_features: np.ndarray
+) -> np.ndarray:
+    """
+    프로세스 풀 워커에서 실행되는 모델 추론
+
+    Parameters:
+        model_path: 모델 파일 경로 (.pkl 또는 컴파일 모델 .npz)
+        model_mtime: 모델 파일 수정 시각 (캐시 무효화 키)
+        processed_features: 전처리된 (N, F) 특징값 배열
+
+    Returns:
+        (N, C) 클래스별 확률
+    """
+    model = _load_worker_model(model_path, model_mtime)
+    return model.predict_proba(processed_features)
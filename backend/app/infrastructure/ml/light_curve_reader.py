@@ -0,0 +1,299 @@
+"""
+광도 곡선 파일 리더 (Light Curve Reader)
+업로드된 광도 곡선 파일(CSV, FITS, NumPy, Arrow IPC)을 NumPy 배열로 변환
+"""
+
+import io
+import math
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ...domain.entities.light_curve import LightCurve
+
+
+# 청크: (time, flux, flux_err) - flux_err 열이 없으면 None
+LightCurveChunk = Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]
+
+TIME_COLUMN = 'time'
+FLUX_COLUMN = 'flux'
+FLUX_ERR_COLUMN = 'flux_err'
+
+# 바이너리 업로드 형식 (read_light_curve의 format 값)
+BINARY_FORMATS = ('fits', 'npy', 'npz', 'arrow')
+
+# Kepler/TESS 광도 곡선 FITS의 밝기 열 우선순위 (PDC 보정 → 단순 조리개 측광)
+FITS_FLUX_COLUMNS = ('PDCSAP_FLUX', 'SAP_FLUX', 'FLUX')
+
+_EXTENSIONS = {
+    '.fits': 'fits', '.fit': 'fits', '.fits.gz': 'fits',
+    '.npy': 'npy', '.npz': 'npz',
+    '.arrow': 'arrow', '.feather': 'arrow', '.ipc': 'arrow', '.arrows': 'arrow'
+}
+
+
+class UnsupportedFormatError(ValueError):
+    """지원하지 않거나 필요한 패키지가 설치되지 않은 파일 형식 (HTTP 415로 변환)"""
+
+
+def iter_csv_chunks(source: BinaryIO, chunk_rows: int = 262_144) -> Iterator[LightCurveChunk]:
+    """
+    CSV 광도 곡선을 청크 단위로 읽기
+
+    첫 줄은 열 이름이어야 하며 time, flux 열은 필수, flux_err 열은 선택
+    (대소문자 무시, 그 밖의 열은 읽지 않음). 빈 값은 NaN으로 읽힘
+
+    Parameters:
+        source: CSV 파일 객체
+        chunk_rows: 청크당 행 수
+
+    Yields:
+        (time, flux, flux_err) float64 배열 청크
+
+    Raises:
+        ValueError: 필수 열이 없거나 숫자가 아닌 값이 있는 경우
+    """
+    wanted = {TIME_COLUMN, FLUX_COLUMN, FLUX_ERR_COLUMN}
+    try:
+        reader = pd.read_csv(
+            source,
+            usecols=lambda name: name.strip().lower() in wanted,
+            dtype=np.float64,
+            chunksize=chunk_rows
+        )
+    except pd.errors.EmptyDataError:
+        raise ValueError("CSV 파일이 비어있습니다")
+
+    with reader:
+        try:
+            for frame in reader:
+                frame.columns = [name.strip().lower() for name in frame.columns]
+                missing = {TIME_COLUMN, FLUX_COLUMN} - set(frame.columns)
+                if missing:
+                    raise ValueError(f"CSV에 필수 열이 없습니다: {', '.join(sorted(missing))}")
+
+                yield (
+                    frame[TIME_COLUMN].to_numpy(),
+                    frame[FLUX_COLUMN].to_numpy(),
+                    frame[FLUX_ERR_COLUMN].to_numpy() if FLUX_ERR_COLUMN in frame.columns else None
+                )
+        except (pd.errors.ParserError, TypeError) as e:
+            raise ValueError(f"CSV 형식이 올바르지 않습니다: {str(e)}")
+
+
+def detect_format(data: bytes, filename: Optional[str] = None) -> str:
+    """
+    바이너리 광도 곡선 파일 형식 판별 (매직 바이트 우선, 없으면 확장자)
+
+    Parameters:
+        data: 파일 내용
+        filename: 파일 이름 (선택)
+
+    Returns:
+        BINARY_FORMATS 중 하나
+
+    Raises:
+        UnsupportedFormatError: 판별할 수 없는 형식
+    """
+    head = bytes(data[:8])
+    if head.startswith(b'SIMPLE'):
+        return 'fits'
+    if head.startswith(b'\x93NUMPY'):
+        return 'npy'
+    if head.startswith(b'PK'):
+        return 'npz'
+    if head.startswith(b'ARROW1') or head.startswith(b'\xff\xff\xff\xff'):
+        return 'arrow'
+
+    name = (filename or '').lower()
+    for extension, file_format in _EXTENSIONS.items():
+        if name.endswith(extension):
+            return file_format
+
+    raise UnsupportedFormatError(
+        f"광도 곡선 파일 형식을 판별할 수 없습니다 (지원 형식: {', '.join(BINARY_FORMATS)})"
+    )
+
+
+def read_light_curve(
+    data: bytes,
+    filename: Optional[str] = None,
+    file_format: Optional[str] = None
+) -> LightCurve:
+    """
+    바이너리 광도 곡선 파일 → 광도 곡선 엔티티
+
+    npy와 비압축 Arrow IPC는 업로드 버퍼를 복사하지 않고 열을 뷰로 읽으며,
+    시간 또는 밝기가 NaN인 행(관측 공백)이 있으면 그 행만 제외
+
+    Parameters:
+        data: 파일 내용
+        filename: 파일 이름 (형식 판별용, 선택)
+        file_format: 파일 형식 (None이면 자동 판별)
+
+    Returns:
+        광도 곡선 엔티티
+
+    Raises:
+        UnsupportedFormatError: 지원하지 않는 형식이거나 필요한 패키지가 없는 경우
+        ValueError: 필수 열이 없거나 데이터가 잘못된 경우
+    """
+    file_format = (file_format or detect_format(data, filename)).lower()
+    readers = {
+        'fits': _read_fits,
+        'npy': _read_npy,
+        'npz': _read_npz,
+        'arrow': _read_arrow
+    }
+    if file_format not in readers:
+        raise UnsupportedFormatError(
+            f"지원하지 않는 형식입니다: {file_format} (지원 형식: {', '.join(BINARY_FORMATS)})"
+        )
+
+    time, flux, flux_err = readers[file_format](memoryview(data))
+    time, flux, flux_err = _drop_gaps(time, flux, flux_err)
+
+    # 읽으면서 새로 만든 배열은 다른 곳에서 참조하지 않으므로 읽기 전용으로 넘겨
+    # 엔티티가 다시 복사하지 않도록 함 (쓸 수 있는 버퍼의 뷰는 엔티티가 복사)
+    for array in (time, flux, flux_err):
+        if isinstance(array, np.ndarray):
+            array.flags.writeable = False
+    return LightCurve(time=time, flux=flux, flux_err=flux_err)
+
+
+def _read_fits(data: memoryview) -> LightCurveChunk:
+    """Kepler/TESS 광도 곡선 FITS (LIGHTCURVE 확장의 TIME, PDCSAP_FLUX 등 열)"""
+    try:
+        from astropy.io import fits
+    except ImportError:
+        raise UnsupportedFormatError("FITS 파일을 읽으려면 astropy 패키지가 필요합니다")
+
+    with fits.open(io.BytesIO(data), memmap=False) as hdul:
+        table = next((hdu for hdu in hdul if isinstance(hdu, fits.BinTableHDU)), None)
+        if table is None:
+            raise ValueError("FITS 파일에 광도 곡선 테이블이 없습니다")
+
+        names = {name.upper(): name for name in table.columns.names}
+        flux_name = next((names[name] for name in FITS_FLUX_COLUMNS if name in names), None)
+        if 'TIME' not in names or flux_name is None:
+            raise ValueError(
+                f"FITS 테이블에 TIME 또는 밝기 열({', '.join(FITS_FLUX_COLUMNS)})이 없습니다"
+            )
+        err_name = names.get(flux_name.upper() + '_ERR')
+
+        # FITS는 빅엔디언이므로 네이티브 float64로 한 번 변환
+        return (
+            np.asarray(table.data[names['TIME']], dtype=np.float64),
+            np.asarray(table.data[flux_name], dtype=np.float64),
+            np.asarray(table.data[err_name], dtype=np.float64) if err_name else None
+        )
+
+
+def _read_npy(data: memoryview) -> LightCurveChunk:
+    """
+    .npy 배열 (헤더만 해석하고 본문은 업로드 버퍼의 뷰로 읽음)
+
+    구조화 배열(time, flux[, flux_err] 필드) 또는 (2|3, N) / (N, 2|3) 2차원 배열
+    """
+    stream = io.BytesIO(data)
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    if dtype.hasobject:
+        raise ValueError("객체 배열(pickle)은 허용하지 않습니다")
+
+    array = np.frombuffer(
+        data, dtype=dtype, count=math.prod(shape), offset=stream.tell()
+    ).reshape(shape, order='F' if fortran_order else 'C')
+    return _columns_from_array(array)
+
+
+def _read_npz(data: memoryview) -> LightCurveChunk:
+    """.npz 묶음 (time, flux[, flux_err] 키 또는 단일 배열)"""
+    with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+        arrays = {name.lower(): archive[name] for name in archive.files}
+
+    if TIME_COLUMN in arrays and FLUX_COLUMN in arrays:
+        return arrays[TIME_COLUMN], arrays[FLUX_COLUMN], arrays.get(FLUX_ERR_COLUMN)
+    if len(arrays) == 1:
+        return _columns_from_array(next(iter(arrays.values())))
+    raise ValueError("npz 파일에 time, flux 배열이 없습니다")
+
+
+def _read_arrow(data: memoryview) -> LightCurveChunk:
+    """Arrow IPC 파일/스트림 (time, flux[, flux_err] 열, 단일 청크·결측 없음이면 복사 없음)"""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise UnsupportedFormatError("Arrow IPC 파일을 읽으려면 pyarrow 패키지가 필요합니다")
+
+    buffer = pa.py_buffer(data)
+    try:
+        if bytes(data[:6]) == b'ARROW1':
+            table = pa.ipc.open_file(buffer).read_all()
+        else:
+            table = pa.ipc.open_stream(buffer).read_all()
+    except pa.ArrowInvalid as e:
+        raise ValueError(f"Arrow IPC 형식이 올바르지 않습니다: {str(e)}")
+
+    columns: Dict[str, object] = {
+        name.lower(): table.column(index) for index, name in enumerate(table.column_names)
+    }
+    if TIME_COLUMN not in columns or FLUX_COLUMN not in columns:
+        raise ValueError("Arrow 테이블에 time, flux 열이 없습니다")
+
+    def to_numpy(column) -> np.ndarray:
+        # 결측값은 NaN으로 변환 (이후 관측 공백으로 제외)
+        if column.null_count:
+            column = column.cast(pa.float64()).fill_null(float('nan'))
+        return column.to_numpy()
+
+    return (
+        to_numpy(columns[TIME_COLUMN]),
+        to_numpy(columns[FLUX_COLUMN]),
+        to_numpy(columns[FLUX_ERR_COLUMN]) if FLUX_ERR_COLUMN in columns else None
+    )
+
+
+def _columns_from_array(array: np.ndarray) -> LightCurveChunk:
+    """구조화 배열 또는 2차원 배열 → (time, flux, flux_err) 열 뷰"""
+    if array.dtype.names:
+        fields = {name.lower(): name for name in array.dtype.names}
+        if TIME_COLUMN not in fields or FLUX_COLUMN not in fields:
+            raise ValueError("배열에 time, flux 필드가 없습니다")
+        return (
+            array[fields[TIME_COLUMN]],
+            array[fields[FLUX_COLUMN]],
+            array[fields[FLUX_ERR_COLUMN]] if FLUX_ERR_COLUMN in fields else None
+        )
+
+    if array.ndim == 2 and array.shape[0] in (2, 3):
+        rows = array
+    elif array.ndim == 2 and array.shape[1] in (2, 3):
+        rows = array.T
+    else:
+        raise ValueError("배열은 (2|3, N) 또는 (N, 2|3) 모양이어야 합니다 (time, flux[, flux_err])")
+
+    return rows[0], rows[1], rows[2] if rows.shape[0] == 3 else None
+
+
+def _drop_gaps(
+    time: np.ndarray,
+    flux: np.ndarray,
+    flux_err: Optional[np.ndarray]
+) -> LightCurveChunk:
+    """시간 또는 밝기가 유한하지 않은 행 제외 (모두 유한하면 복사하지 않음)"""
+    time = np.asarray(time, dtype=np.float64)
+    flux = np.asarray(flux, dtype=np.float64)
+    if time.shape != flux.shape:
+        raise ValueError("시간과 밝기 배열의 길이가 같아야 합니다")
+
+    finite = np.isfinite(time) & np.isfinite(flux)
+    if finite.all():
+        return time, flux, flux_err
+
+    flux_err = np.asarray(flux_err)[finite] if flux_err is not None else None
+    return time[finite], flux[finite], flux_err
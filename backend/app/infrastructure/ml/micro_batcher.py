@@ -0,0 +1,125 @@
+"""
+마이크로 배칭 스케줄러 (Micro Batcher)
+동시에 들어온 단건 예측 요청을 모아 한 번의 벡터화된 추론으로 처리
+"""
+
+import asyncio
+import os
+from typing import Awaitable, Callable, List, Optional, Set
+
+import numpy as np
+
+
+class MicroBatcher:
+    """
+    동적 마이크로 배처
+
+    첫 요청이 도착하면 max_wait_ms 동안(또는 max_batch_size개가 모일 때까지)
+    이후 요청을 모은 뒤, (N, F) 행렬로 묶어 score_fn을 한 번만 호출하고
+    결과 행을 각 요청의 코루틴에 되돌려줌.
+    StackingClassifier의 호출당 고정 비용(5개 기반 모델 + 메타 모델)을
+    여러 요청이 나눠 부담하므로 동시성이 높을수록 처리량이 증가
+
+    환경변수:
+        INFERENCE_BATCH_WINDOW_MS: 배치 수집 대기 시간 (ms, 기본값 2, 0이면 비활성화)
+        INFERENCE_BATCH_MAX_SIZE: 최대 배치 크기 (기본값 64)
+    """
+
+    def __init__(
+        self,
+        score_fn: Callable[[np.ndarray], Awaitable[np.ndarray]],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0
+    ):
+        """
+        Parameters:
+            score_fn: (N, F) 전처리된 특징값을 받아 (N, C) 확률을 반환하는 코루틴 함수
+            max_batch_size: 최대 배치 크기
+            max_wait_ms: 첫 요청 이후 배치 수집 대기 시간 (ms)
+        """
+        self.score_fn = score_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self._rows: List[np.ndarray] = []
+        self._futures: List[asyncio.Future] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    @classmethod
+    def from_env(
+        cls,
+        score_fn: Callable[[np.ndarray], Awaitable[np.ndarray]]
+    ) -> 'MicroBatcher':
+        """환경변수 설정으로 배처 생성"""
+        return cls(
+            score_fn=score_fn,
+            max_batch_size=int(os.getenv("INFERENCE_BATCH_MAX_SIZE", "64")),
+            max_wait_ms=float(os.getenv("INFERENCE_BATCH_WINDOW_MS", "2"))
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """배칭 활성화 여부"""
+        return self.max_wait_ms > 0 and self.max_batch_size > 1
+
+    @property
+    def pending(self) -> int:
+        """수집 중인(아직 추론이 시작되지 않은) 요청 수"""
+        return len(self._rows)
+
+    async def submit(self, row: np.ndarray) -> np.ndarray:
+        """
+        단건 요청을 배치에 추가하고 결과를 기다림
+
+        Parameters:
+            row: 전처리된 (F,) 또는 (1, F) 특징값
+
+        Returns:
+            (C,) 클래스별 확률
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        self._rows.append(row)
+        self._futures.append(future)
+
+        if len(self._rows) >= self.max_batch_size:
+            # 배치가 가득 차면 즉시 실행
+            self._flush()
+        elif self._timer is None:
+            # 배치의 첫 요청이면 수집 타이머 시작
+            self._timer = loop.call_later(self.max_wait_ms / 1000.0, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """수집된 요청을 하나의 배치로 실행"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        rows, futures = self._rows, self._futures
+        self._rows, self._futures = [], []
+
+        if not rows:
+            return
+
+        task = asyncio.ensure_future(self._run_batch(rows, futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, rows: List[np.ndarray], futures: List[asyncio.Future]):
+        """배치 추론 후 결과를 각 요청에 분배 (실패 시 모든 요청에 예외 전달)"""
+        try:
+            probabilities = await self.score_fn(np.vstack(rows))
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, row_probabilities in zip(futures, probabilities):
+            # 대기 중 취소된 요청은 건너뜀
+            if not future.done():
+                future.set_result(row_probabilities)
@@ -5,17 +5,29 @@ ML 모델 로더
 
 import os
 import pickle
+import warnings
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
+from .compiled_ensemble import CompiledEnsemble
+
 
 class ModelLoader:
     """
     머신러닝 모델 로더
 
-    학습된 모델과 스케일러를 로드하여 관리
+    학습된 모델과 스케일러를 로드하여 관리.
+    compile_model.py로 생성한 컴파일 모델(<모델 이름>.compiled.npz)이 있으면
+    원본과 일치하는지 검증한 뒤 함께 로드
+
+    환경변수:
+        USE_COMPILED_MODEL: 컴파일 모델 사용 여부 (기본값 true)
     """
 
+    COMPILED_SUFFIX = ".compiled.npz"
+
     def __init__(self, model_dir: str = "models"):
         """
         Parameters:
@@ -24,6 +36,7 @@ class ModelLoader:
         self.model_dir = Path(model_dir)
         self.model = None
         self.scaler = None
+        self.compiled_model: Optional[CompiledEnsemble] = None
         self.model_info = {}
 
     def load_model(self, model_name: str = "exoplanet_model.pkl") -> bool:
@@ -45,18 +58,65 @@ class ModelLoader:
             with open(model_path, 'rb') as f:
                 self.model = pickle.load(f)
 
-            # 모델 정보 추출
+            # 모델 정보 추출 (버전: 파일 이름 + 수정 시각 + 크기, 재학습 시 변경됨)
+            stat = model_path.stat()
             self.model_info = {
                 'name': model_name,
                 'type': type(self.model).__name__,
-                'path': str(model_path)
+                'path': str(model_path),
+                'mtime': stat.st_mtime,
+                'version': f"{model_path.stem}-{stat.st_mtime_ns}-{stat.st_size}",
+                'compiled': False
             }
+            self.compiled_model = None
 
             return True
 
         except Exception as e:
             raise RuntimeError(f"모델 로드 중 오류 발생: {str(e)}")
 
+    @classmethod
+    def compiled_model_name(cls, model_name: str) -> str:
+        """모델 파일 이름에 대응하는 컴파일 모델 파일 이름"""
+        return Path(model_name).stem + cls.COMPILED_SUFFIX
+
+    def load_compiled_model(self, model_name: Optional[str] = None) -> bool:
+        """
+        컴파일 모델 로드
+
+        원본 모델이 로드되어 있으면 무작위 표준화 입력으로 predict_proba()를
+        비교하여, 모델을 재학습한 뒤 다시 컴파일하지 않은 경우를 걸러냄
+
+        Parameters:
+            model_name: 원본 모델 파일 이름 (None이면 로드된 모델 기준)
+
+        Returns:
+            로드 성공 여부 (컴파일 모델 파일이 없으면 False)
+
+        Raises:
+            ValueError: 컴파일 모델이 원본 모델과 일치하지 않는 경우
+        """
+        model_name = model_name or self.model_info.get('name', "exoplanet_model.pkl")
+        compiled_path = self.model_dir / self.compiled_model_name(model_name)
+
+        if not compiled_path.exists():
+            return False
+
+        compiled_model = CompiledEnsemble.load(compiled_path)
+
+        if self.model is not None:
+            rng = np.random.default_rng(0)
+            sample = rng.standard_normal((64, compiled_model.n_features))
+            compiled_model.validate(self.model, sample)
+
+        self.compiled_model = compiled_model
+        self.model_info.update({
+            'compiled': True,
+            'compiled_path': str(compiled_path),
+            'compiled_mtime': compiled_path.stat().st_mtime
+        })
+        return True
+
     def load_scaler(self, scaler_name: str = "scaler.pkl") -> bool:
         """
         스케일러 로드
@@ -98,6 +158,14 @@ class ModelLoader:
         """
         self.load_model(model_name)
         self.load_scaler(scaler_name)
+
+        # 컴파일 모델은 선택 사항: 없거나 불일치하면 원본 모델로 추론
+        if os.getenv("USE_COMPILED_MODEL", "true").lower() == "true":
+            try:
+                self.load_compiled_model(model_name)
+            except Exception as e:
+                warnings.warn(f"컴파일 모델을 사용하지 않습니다: {str(e)}")
+
         return True
 
     def get_model(self):
@@ -106,12 +174,22 @@ class ModelLoader:
             raise RuntimeError("모델이 로드되지 않았습니다. load_model()을 먼저 호출하세요.")
         return self.model
 
+    def get_compiled_model(self) -> Optional[CompiledEnsemble]:
+        """로드된 컴파일 모델 반환 (없으면 None)"""
+        return self.compiled_model
+
     def get_scaler(self):
         """로드된 스케일러 반환"""
         if self.scaler is None:
             raise RuntimeError("스케일러가 로드되지 않았습니다. load_scaler()를 먼저 호출하세요.")
         return self.scaler
 
+    def get_model_version(self) -> str:
+        """로드된 모델 버전 반환 (캐시 무효화 키)"""
+        if self.model is None:
+            raise RuntimeError("모델이 로드되지 않았습니다. load_model()을 먼저 호출하세요.")
+        return self.model_info['version']
+
     def get_model_info(self) -> dict:
         """모델 정보 반환"""
         return self.model_info
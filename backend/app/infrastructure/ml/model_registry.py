@@ -0,0 +1,431 @@
+"""
+모델 레지스트리 (Model Registry)
+버전별 모델 번들을 관리하고 요청별 버전 선택, 카나리, 섀도 스코어링을 지원
+"""
+
+import asyncio
+import os
+import pickle
+import random
+import re
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from ...domain.entities.light_curve import LightCurve
+from ...domain.services.exoplanet_detector import IExoplanetDetector
+from ...domain.value_objects.prediction_result import PredictionResult
+from ..monitoring.metrics import (
+    MODEL_REQUESTS,
+    MODEL_REGISTRY_RESIDENT_MB,
+    SHADOW_PREDICTIONS,
+    SHADOW_PROBABILITY_DIFF
+)
+from .exoplanet_detector_impl import ExoplanetDetectorImpl
+from .model_runtime import ModelRuntime
+
+
+class ModelRegistry:
+    """
+    모델 레지스트리
+
+    models/registry/<version>/ 디렉터리마다 하나의 번들(모델, 스케일러,
+    특징 이름, 메타데이터, 메트릭)을 두고, 요청된 버전을 처음 사용할 때 로드.
+    상주 번들의 추정 크기(아티팩트 파일 크기 합) 합계가 메모리 예산을
+    넘으면 가장 오래 사용되지 않은 버전부터 제거.
+    models/ 루트의 모델은 "default" 버전으로 ModelRuntime이 관리하며
+    (핫 리로드 대상) 제거되지 않음
+
+    환경변수:
+        MODEL_REGISTRY_MEMORY_MB: 레지스트리 버전 상주 메모리 예산 (MB, 기본값 2048)
+        MODEL_CANARY_VERSION: 카나리 버전 (버전 미지정 요청 일부를 라우팅)
+        MODEL_CANARY_PERCENT: 카나리 라우팅 비율 (%, 기본값 0)
+        MODEL_SHADOW_VERSION: 섀도 버전 (응답에 영향 없이 백그라운드로 비교 예측)
+        MODEL_SHADOW_PERCENT: 섀도 비교 샘플링 비율 (%, 기본값 100)
+    """
+
+    DEFAULT_VERSION = "default"
+    # 카나리 버전 로드 실패 후 다시 시도하기까지 기본 버전으로만 라우팅하는 시간 (초)
+    CANARY_RETRY_SECONDS = 60.0
+    MODEL_FILE_NAMES = ("exoplanet_model.pkl", "exoplanet_multiclass_model.pkl")
+    ARTIFACT_SUFFIXES = (".pkl", ".npz")
+    _VERSION_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+    def __init__(
+        self,
+        runtime: ModelRuntime,
+        registry_dir: str,
+        detector_factory: Callable[[str, str], ExoplanetDetectorImpl],
+        memory_budget_mb: float = 2048,
+        canary_version: Optional[str] = None,
+        canary_percent: float = 0.0,
+        shadow_version: Optional[str] = None,
+        shadow_percent: float = 100.0
+    ):
+        """
+        Parameters:
+            runtime: 기본 버전 모델 런타임
+            registry_dir: 버전별 번들 디렉터리 (models/registry)
+            detector_factory: (모델 디렉터리, 모델 파일 이름)으로 탐지기를 생성하는 함수 (블로킹)
+            memory_budget_mb: 레지스트리 버전 상주 메모리 예산 (MB)
+            canary_version: 카나리 버전
+            canary_percent: 카나리 라우팅 비율 (%)
+            shadow_version: 섀도 버전
+            shadow_percent: 섀도 비교 샘플링 비율 (%)
+        """
+        self.runtime = runtime
+        self.registry_dir = Path(registry_dir)
+        self.detector_factory = detector_factory
+        self.memory_budget_mb = memory_budget_mb
+        self.canary_version = canary_version or None
+        self.canary_percent = canary_percent
+        self.shadow_version = shadow_version or None
+        self.shadow_percent = shadow_percent
+
+        self._resident: 'OrderedDict[str, Tuple[ExoplanetDetectorImpl, float]]' = OrderedDict()
+        self._load_locks: Dict[str, asyncio.Lock] = {}
+        self._canary_retry_at = 0.0
+
+    @classmethod
+    def from_env(
+        cls,
+        runtime: ModelRuntime,
+        registry_dir: str,
+        detector_factory: Callable[[str, str], ExoplanetDetectorImpl]
+    ) -> 'ModelRegistry':
+        """환경변수 설정으로 레지스트리 생성"""
+        return cls(
+            runtime=runtime,
+            registry_dir=registry_dir,
+            detector_factory=detector_factory,
+            memory_budget_mb=float(os.getenv("MODEL_REGISTRY_MEMORY_MB", "2048")),
+            canary_version=os.getenv("MODEL_CANARY_VERSION"),
+            canary_percent=float(os.getenv("MODEL_CANARY_PERCENT", "0")),
+            shadow_version=os.getenv("MODEL_SHADOW_VERSION"),
+            shadow_percent=float(os.getenv("MODEL_SHADOW_PERCENT", "100"))
+        )
+
+    # ------------------------------------------------------------------
+    # 버전 조회
+    # ------------------------------------------------------------------
+
+    def list_versions(self) -> List[dict]:
+        """
+        사용 가능한 버전 목록
+
+        Returns:
+            버전별 정보 (이름, 상주 여부, 추정 크기, 메타데이터)
+        """
+        default_detector = self.runtime.current
+        versions = [{
+            'version': self.DEFAULT_VERSION,
+            'resident': default_detector is not None,
+            'model_version': (
+                default_detector.model_loader.get_model_version()
+                if default_detector is not None and default_detector.model_loader.is_loaded()
+                else None
+            )
+        }]
+
+        if self.registry_dir.is_dir():
+            for version_dir in sorted(self.registry_dir.iterdir()):
+                if not version_dir.is_dir() or self._model_file(version_dir) is None:
+                    continue
+                versions.append({
+                    'version': version_dir.name,
+                    'resident': version_dir.name in self._resident,
+                    'size_mb': round(self._estimate_size_mb(version_dir), 2),
+                    'metadata': self._load_metadata(version_dir)
+                })
+
+        return versions
+
+    def _version_dir(self, version: str) -> Path:
+        """
+        버전 디렉터리 경로
+
+        Raises:
+            ValueError: 잘못된 버전 이름이거나 존재하지 않는 버전
+        """
+        if not self._VERSION_PATTERN.match(version):
+            raise ValueError(f"잘못된 모델 버전 이름입니다: {version}")
+
+        version_dir = self.registry_dir / version
+        if not version_dir.is_dir() or self._model_file(version_dir) is None:
+            raise ValueError(f"존재하지 않는 모델 버전입니다: {version}")
+        return version_dir
+
+    def _model_file(self, version_dir: Path) -> Optional[str]:
+        """번들 디렉터리의 모델 파일 이름 (없으면 None)"""
+        for name in self.MODEL_FILE_NAMES:
+            if (version_dir / name).exists():
+                return name
+        return None
+
+    def _estimate_size_mb(self, version_dir: Path) -> float:
+        """번들 상주 크기 추정 (아티팩트 파일 크기 합, MB)"""
+        total = sum(
+            path.stat().st_size
+            for path in version_dir.iterdir()
+            if path.suffix in self.ARTIFACT_SUFFIXES
+        )
+        return total / (1024 * 1024)
+
+    def _load_metadata(self, version_dir: Path) -> Optional[dict]:
+        """번들 메타데이터 (model_metadata.pkl, 없으면 None)"""
+        metadata_path = version_dir / "model_metadata.pkl"
+        if not metadata_path.exists():
+            return None
+
+        try:
+            with open(metadata_path, 'rb') as f:
+                metadata = pickle.load(f)
+            return {key: value for key, value in metadata.items() if key != 'features'}
+        except Exception:
+            return None
+
+    # ------------------------------------------------------------------
+    # 탐지기 로드 및 제거
+    # ------------------------------------------------------------------
+
+    async def get_detector(self, version: Optional[str] = None) -> ExoplanetDetectorImpl:
+        """
+        버전별 탐지기 반환 (상주하지 않으면 로드)
+
+        Parameters:
+            version: 모델 버전 (None 또는 "default"이면 기본 모델)
+
+        Returns:
+            탐지기
+
+        Raises:
+            ValueError: 존재하지 않는 버전
+        """
+        if version in (None, self.DEFAULT_VERSION):
+            detector = self.runtime.current
+            if detector is None:
+                detector = await asyncio.to_thread(self.runtime.get_detector)
+            return detector
+
+        resident = self._resident.get(version)
+        if resident is not None:
+            self._resident.move_to_end(version)
+            return resident[0]
+
+        version_dir = self._version_dir(version)
+        lock = self._load_locks.setdefault(version, asyncio.Lock())
+
+        async with lock:
+            # 대기하는 동안 다른 요청이 로드를 마쳤으면 그 결과 사용
+            resident = self._resident.get(version)
+            if resident is not None:
+                self._resident.move_to_end(version)
+                return resident[0]
+
+            detector = await asyncio.to_thread(
+                self.detector_factory,
+                str(version_dir),
+                self._model_file(version_dir)
+            )
+            self._resident[version] = (detector, self._estimate_size_mb(version_dir))
+            self._evict(keep=version)
+            return detector
+
+    def _evict(self, keep: str):
+        """메모리 예산을 넘으면 가장 오래 사용되지 않은 버전부터 제거 (진행 중인 요청은 참조로 완료)"""
+        while self._resident_mb() > self.memory_budget_mb and len(self._resident) > 1:
+            version = next(iter(self._resident))
+            if version == keep:
+                break
+            self._resident.pop(version)
+            print(f"Model version evicted: {version}")
+
+        MODEL_REGISTRY_RESIDENT_MB.set(self._resident_mb())
+
+    def _resident_mb(self) -> float:
+        """상주 번들 추정 크기 합 (MB)"""
+        return sum(size for _, size in self._resident.values())
+
+    # ------------------------------------------------------------------
+    # 라우팅
+    # ------------------------------------------------------------------
+
+    def route(self, requested_version: Optional[str] = None) -> Tuple[str, str]:
+        """
+        요청에 사용할 버전 결정
+
+        Parameters:
+            requested_version: 요청에서 지정한 버전
+
+        Returns:
+            (버전, 라우팅 사유: explicit | canary | default)
+        """
+        if requested_version:
+            return requested_version, "explicit"
+
+        if (
+            self.canary_version
+            and time.monotonic() >= self._canary_retry_at
+            and random.random() * 100 < self.canary_percent
+        ):
+            return self.canary_version, "canary"
+
+        return self.DEFAULT_VERSION, "default"
+
+    async def select(self, requested_version: Optional[str] = None) -> Tuple[IExoplanetDetector, str]:
+        """
+        요청용 탐지기 선택 (섀도 버전이 설정되어 있으면 섀도 비교 래퍼 적용)
+
+        Parameters:
+            requested_version: 요청에서 지정한 버전
+
+        카나리 버전이 없거나 로드에 실패하면 기본 버전으로 대체하고
+        CANARY_RETRY_SECONDS 동안 카나리 라우팅을 멈춤 (버전을 지정하지 않은 요청은 실패하지 않음)
+
+        Returns:
+            (탐지기, 사용된 버전)
+
+        Raises:
+            ValueError: 요청에서 지정한 버전이 존재하지 않음
+        """
+        version, route = self.route(requested_version)
+        try:
+            detector = await self.get_detector(version)
+        except Exception as e:
+            if route != "canary":
+                raise
+            print(f"[WARN] 카나리 버전 {version} 사용 불가, 기본 버전으로 대체합니다: {str(e)}")
+            self._canary_retry_at = time.monotonic() + self.CANARY_RETRY_SECONDS
+            version, route = self.DEFAULT_VERSION, "canary_fallback"
+            detector = await self.get_detector(version)
+        MODEL_REQUESTS.labels(version=version, route=route).inc()
+
+        if (
+            self.shadow_version
+            and self.shadow_version != version
+            and random.random() * 100 < self.shadow_percent
+        ):
+            return ShadowDetector(detector, version, self, self.shadow_version), version
+
+        return detector, version
+
+    def status(self) -> dict:
+        """레지스트리 상태"""
+        return {
+            'resident': list(self._resident.keys()),
+            'resident_mb': round(self._resident_mb(), 2),
+            'memory_budget_mb': self.memory_budget_mb,
+            'canary_version': self.canary_version,
+            'canary_percent': self.canary_percent,
+            'shadow_version': self.shadow_version,
+            'shadow_percent': self.shadow_percent
+        }
+
+
+class ShadowDetector(IExoplanetDetector):
+    """
+    섀도 비교 탐지기
+
+    응답은 기본 탐지기의 결과를 그대로 반환하고, 같은 입력을 섀도 버전으로
+    백그라운드에서 예측하여 분류 일치 여부와 행성 확률 차이를 메트릭으로 기록
+    """
+
+    def __init__(
+        self,
+        primary: IExoplanetDetector,
+        primary_version: str,
+        registry: ModelRegistry,
+        shadow_version: str
+    ):
+        """
+        Parameters:
+            primary: 응답에 사용할 탐지기
+            primary_version: 기본 탐지기 버전
+            registry: 섀도 탐지기를 가져올 레지스트리
+            shadow_version: 섀도 버전
+        """
+        self.primary = primary
+        self.primary_version = primary_version
+        self.registry = registry
+        self.shadow_version = shadow_version
+
+    # 백그라운드 비교 작업 참조 (완료 전 가비지 컬렉션 방지)
+    _tasks: Set[asyncio.Task] = set()
+
+    async def detect(self, light_curve: LightCurve) -> PredictionResult:
+        """
+        광도 곡선 예측 (기본 탐지기 결과 반환, 섀도 비교 예약)
+
+        Parameters:
+            light_curve: 광도 곡선 엔티티
+
+        Returns:
+            기본 탐지기 예측 결과
+        """
+        result = await self.primary.detect(light_curve)
+        self._schedule('detect', light_curve, [result])
+        return result
+
+    async def detect_from_features(self, features: dict) -> PredictionResult:
+        """
+        특징값 예측 (기본 탐지기 결과 반환, 섀도 비교 예약)
+
+        Parameters:
+            features: 특징값 딕셔너리
+
+        Returns:
+            기본 탐지기 예측 결과
+        """
+        result = await self.primary.detect_from_features(features)
+        self._schedule('detect_from_features', features, [result])
+        return result
+
+    async def detect_batch(
+        self,
+        inputs: Sequence[Union[LightCurve, Dict[str, float]]]
+    ) -> List[PredictionResult]:
+        """
+        일괄 예측 (기본 탐지기 결과 반환, 배치 전체를 한 번에 섀도 비교 예약)
+
+        Parameters:
+            inputs: 광도 곡선 엔티티 또는 특징값 딕셔너리 리스트
+
+        Returns:
+            입력 순서대로 기본 탐지기 예측 결과
+        """
+        results = await self.primary.detect_batch(inputs)
+        self._schedule('detect_batch', inputs, results)
+        return results
+
+    def get_model_info(self) -> dict:
+        """기본 탐지기 모델 정보"""
+        return self.primary.get_model_info()
+
+    def _schedule(self, method: str, payload, primary_results: List[PredictionResult]):
+        """섀도 비교 작업 예약"""
+        task = asyncio.ensure_future(self._compare(method, payload, primary_results))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _compare(self, method: str, payload, primary_results: List[PredictionResult]):
+        """섀도 예측 후 기본 결과와 비교하여 메트릭 기록"""
+        labels = {'primary_version': self.primary_version, 'shadow_version': self.shadow_version}
+
+        try:
+            shadow = await self.registry.get_detector(self.shadow_version)
+            shadow_results = await getattr(shadow, method)(payload)
+            if not isinstance(shadow_results, list):
+                shadow_results = [shadow_results]
+        except Exception:
+            SHADOW_PREDICTIONS.labels(agreement='error', **labels).inc()
+            return
+
+        histogram = SHADOW_PROBABILITY_DIFF.labels(shadow_version=self.shadow_version)
+        for primary_result, shadow_result in zip(primary_results, shadow_results):
+            agreement = (
+                'match' if primary_result.classification == shadow_result.classification
+                else 'mismatch'
+            )
+            SHADOW_PREDICTIONS.labels(agreement=agreement, **labels).inc()
+            histogram.observe(abs(primary_result.planet_probability - shadow_result.planet_probability))
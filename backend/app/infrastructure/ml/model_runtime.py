@@ -0,0 +1,291 @@
+"""
+모델 런타임 (Model Runtime)
+현재 서비스 중인 탐지기를 보관하고, 새 모델을 백그라운드에서 로드·워밍업·검증한 뒤
+참조를 원자적으로 교체 (무중단 핫 리로드)
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .exoplanet_detector_impl import ExoplanetDetectorImpl
+
+
+class ModelRuntime:
+    """
+    모델 런타임
+
+    요청은 시작 시점의 탐지기 참조를 잡고 끝까지 사용하므로, 교체 중에도
+    진행 중인 요청은 이전 모델(및 이전 스케일러, 배처, 캐시)로 완료됨.
+    새 탐지기는 로드 → 워밍업 → 검증을 모두 통과한 경우에만 교체되며,
+    실패하면 기존 탐지기가 그대로 유지됨
+
+    환경변수:
+        MODEL_WATCH_INTERVAL: 모델 디렉터리 감시 주기 (초, 기본값 0 = 감시 안 함)
+        MODEL_GOLDEN_SAMPLES: 골든 샘플 JSON 경로 (기본값 <모델 디렉터리>/golden_samples.json)
+        MODEL_GOLDEN_TOLERANCE: 골든 샘플 기대 확률과의 허용 오차 (기본값 0.05)
+        MODEL_WARMUP_ITERATIONS: 교체 전 워밍업 반복 횟수 (기본값 3)
+    """
+
+    def __init__(
+        self,
+        detector_factory: Callable[[], ExoplanetDetectorImpl],
+        model_dir: str = "models",
+        watched_files: Tuple[str, ...] = ("exoplanet_model.pkl", "scaler.pkl"),
+        golden_samples_path: Optional[str] = None,
+        golden_tolerance: float = 0.05,
+        warmup_iterations: int = 3
+    ):
+        """
+        Parameters:
+            detector_factory: 새 모델을 로드한 탐지기를 생성하는 함수 (블로킹, 스레드에서 실행)
+            model_dir: 모델 디렉터리
+            watched_files: 변경 감시 대상 파일 이름
+            golden_samples_path: 골든 샘플 JSON 경로
+            golden_tolerance: 골든 샘플 기대 확률과의 허용 최대 절대 오차
+            warmup_iterations: 교체 전 워밍업 반복 횟수
+        """
+        self.detector_factory = detector_factory
+        self.model_dir = Path(model_dir)
+        self.watched_files = watched_files
+        self.golden_samples_path = Path(golden_samples_path or self.model_dir / "golden_samples.json")
+        self.golden_tolerance = golden_tolerance
+        self.warmup_iterations = warmup_iterations
+
+        self._detector: Optional[ExoplanetDetectorImpl] = None
+        self._create_lock = threading.Lock()
+        self._reload_lock = asyncio.Lock()
+        self._signature: Optional[tuple] = None
+        self.generation = 0
+        self.last_reload: Optional[dict] = None
+
+    @classmethod
+    def from_env(
+        cls,
+        detector_factory: Callable[[], ExoplanetDetectorImpl],
+        model_dir: str,
+        watched_files: Tuple[str, ...]
+    ) -> 'ModelRuntime':
+        """환경변수 설정으로 런타임 생성"""
+        return cls(
+            detector_factory=detector_factory,
+            model_dir=model_dir,
+            watched_files=watched_files,
+            golden_samples_path=os.getenv("MODEL_GOLDEN_SAMPLES"),
+            golden_tolerance=float(os.getenv("MODEL_GOLDEN_TOLERANCE", "0.05")),
+            warmup_iterations=int(os.getenv("MODEL_WARMUP_ITERATIONS", "3"))
+        )
+
+    def get_detector(self) -> ExoplanetDetectorImpl:
+        """
+        현재 탐지기 반환 (최초 호출 시 생성)
+
+        여러 스레드가 동시에 호출해도 모델은 한 번만 로드됨
+        """
+        detector = self._detector
+        if detector is not None:
+            return detector
+
+        with self._create_lock:
+            if self._detector is None:
+                signature = self._file_signature()
+                self._detector = self.detector_factory()
+                self._signature = signature
+                self.generation = 1
+            return self._detector
+
+    @property
+    def current(self) -> Optional[ExoplanetDetectorImpl]:
+        """현재 탐지기 (아직 생성되지 않았으면 None, 생성을 유발하지 않음)"""
+        return self._detector
+
+    def is_loaded(self) -> bool:
+        """서비스 가능한 모델 로드 여부"""
+        detector = self._detector
+        return detector is not None and detector.model_loader.is_loaded()
+
+    async def reload(self, reason: str = "manual") -> dict:
+        """
+        새 모델 로드 → 워밍업 → 검증 → 원자적 교체
+
+        Parameters:
+            reason: 리로드 사유 (manual, watch 등)
+
+        Returns:
+            리로드 결과 정보
+
+        Raises:
+            RuntimeError: 이미 리로드가 진행 중인 경우
+            ValueError: 새 모델이 검증을 통과하지 못한 경우
+        """
+        if self._reload_lock.locked():
+            raise RuntimeError("모델 리로드가 이미 진행 중입니다")
+
+        async with self._reload_lock:
+            previous = self._detector
+            signature = self._file_signature()
+            result = {
+                'reason': reason,
+                'status': 'failed',
+                'previous_version': _model_version(previous),
+                'started_at': time.time()
+            }
+
+            try:
+                # 1. 새 모델 로드 (언피클링은 스레드에서 실행하여 이벤트 루프를 막지 않음)
+                start = time.perf_counter()
+                candidate = await asyncio.to_thread(self.detector_factory)
+                result['load_seconds'] = time.perf_counter() - start
+                result['version'] = _model_version(candidate)
+
+                # 2. 워밍업 (교체 직후 첫 요청의 지연 방지)
+                result['warmup_seconds'] = await candidate.warm_up(self.warmup_iterations)
+
+                # 3. 골든 샘플 검증
+                result['validation'] = await self._validate(candidate)
+
+                # 4. 원자적 교체 (이후 요청부터 새 탐지기 사용)
+                with self._create_lock:
+                    self._detector = candidate
+                    self._signature = signature
+                    self.generation += 1
+
+                result['status'] = 'reloaded'
+                result['generation'] = self.generation
+                return result
+
+            except Exception as e:
+                result['error'] = str(e)
+                raise
+
+            finally:
+                # 실패한 변경은 같은 파일로 반복 시도하지 않도록 서명 기록
+                self._signature = signature
+                result['finished_at'] = time.time()
+                self.last_reload = result
+
+    async def _validate(self, candidate: ExoplanetDetectorImpl) -> dict:
+        """
+        새 탐지기 검증
+
+        모든 확률이 유한하고 [0, 1] 범위이며 행 합이 1인지 확인하고,
+        골든 샘플 파일이 있으면 기대 확률과의 최대 절대 오차를 확인
+
+        Raises:
+            ValueError: 검증 실패
+        """
+        samples = self._load_golden_samples()
+        features_list = [sample['features'] for sample in samples] or [candidate.synthetic_features()]
+        probabilities = await candidate.predict_probabilities(features_list)
+
+        if not np.all(np.isfinite(probabilities)):
+            raise ValueError("새 모델이 유한하지 않은 확률을 반환했습니다")
+        if np.any(probabilities < 0) or np.any(probabilities > 1):
+            raise ValueError("새 모델의 확률이 [0, 1] 범위를 벗어났습니다")
+        if not np.allclose(probabilities.sum(axis=1), 1.0, atol=1e-4):
+            raise ValueError("새 모델의 클래스별 확률 합이 1이 아닙니다")
+
+        validation = {'samples': len(features_list), 'golden': bool(samples)}
+
+        expected_rows = [
+            (index, sample['expected_probabilities'])
+            for index, sample in enumerate(samples)
+            if sample.get('expected_probabilities') is not None
+        ]
+        if expected_rows:
+            indices = [index for index, _ in expected_rows]
+            expected = np.asarray([row for _, row in expected_rows], dtype=np.float64)
+            if expected.shape != probabilities[indices].shape:
+                raise ValueError(
+                    f"골든 샘플 확률 형태가 다릅니다: {expected.shape} != {probabilities[indices].shape}"
+                )
+
+            max_error = float(np.max(np.abs(probabilities[indices] - expected)))
+            validation['max_abs_error'] = max_error
+            if max_error > self.golden_tolerance:
+                raise ValueError(
+                    f"골든 샘플 검증 실패 (최대 오차 {max_error:.4f} > {self.golden_tolerance})"
+                )
+
+        return validation
+
+    def _load_golden_samples(self) -> List[Dict]:
+        """
+        골든 샘플 로드
+
+        형식: [{"features": {...}, "expected_probabilities": [...]}, ...]
+        (expected_probabilities는 선택 사항)
+        """
+        if not self.golden_samples_path.exists():
+            return []
+
+        with open(self.golden_samples_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _file_signature(self) -> tuple:
+        """감시 대상 파일의 (이름, 수정 시각, 크기) 서명"""
+        signature = []
+        for name in self.watched_files:
+            path = self.model_dir / name
+            if path.exists():
+                stat = path.stat()
+                signature.append((name, stat.st_mtime_ns, stat.st_size))
+            else:
+                signature.append((name, None, None))
+        return tuple(signature)
+
+    async def watch(self, interval: float):
+        """
+        모델 디렉터리 감시 (파일이 바뀌면 리로드)
+
+        파일 복사가 끝나기 전에 읽지 않도록, 변경된 서명이 연속 두 번의
+        주기 동안 동일할 때 리로드
+
+        Parameters:
+            interval: 감시 주기 (초)
+        """
+        pending_signature = None
+
+        while True:
+            await asyncio.sleep(interval)
+
+            if self._detector is None or self._reload_lock.locked():
+                continue
+
+            signature = self._file_signature()
+            if signature == self._signature:
+                pending_signature = None
+                continue
+
+            if signature != pending_signature:
+                pending_signature = signature
+                continue
+
+            pending_signature = None
+            try:
+                result = await self.reload(reason="watch")
+                print(f"Model reloaded: {result['previous_version']} -> {result['version']}")
+            except Exception as e:
+                print(f"Model reload failed: {str(e)}")
+
+    def status(self) -> dict:
+        """런타임 상태"""
+        return {
+            'generation': self.generation,
+            'version': _model_version(self._detector),
+            'reloading': self._reload_lock.locked(),
+            'last_reload': self.last_reload
+        }
+
+
+def _model_version(detector: Optional[ExoplanetDetectorImpl]) -> Optional[str]:
+    """탐지기의 모델 버전 (없으면 None)"""
+    if detector is None or not detector.model_loader.is_loaded():
+        return None
+    return detector.model_loader.get_model_version()
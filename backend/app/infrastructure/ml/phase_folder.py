@@ -0,0 +1,245 @@
+"""
+위상 접기 (Phase Folder)
+트랜짓 주기로 광도 곡선을 접어 고정 크기 bin 곡선과 2차 특징(홀짝 깊이 차이,
+2차 식 깊이, 트랜짓 모양)을 계산
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class PhaseBinning:
+    """
+    미리 계산한 위상 bin 색인
+
+    같은 (시간, 주기, 시각, bin 수)에 대해 한 번만 계산하고, 밝기·오차·마스크별
+    bin 합은 색인을 재사용한 bincount 한 번으로 구함
+
+    Attributes:
+        phase: 위상 (-0.5 ~ 0.5, 0이 트랜짓 중심)
+        cycle: 트랜짓 번호 (epoch 기준 정수, 홀짝 구분용)
+        bin_index: 각 점의 bin 번호 (0 ~ n_bins - 1)
+        n_bins: bin 수
+    """
+    phase: np.ndarray
+    cycle: np.ndarray
+    bin_index: np.ndarray
+    n_bins: int
+
+    @classmethod
+    def build(cls, time: np.ndarray, period: float, epoch: float, n_bins: int) -> 'PhaseBinning':
+        """
+        위상 bin 색인 계산
+
+        Parameters:
+            time: 시간 배열 (일)
+            period: 궤도 주기 (일)
+            epoch: 트랜짓 중심 시각
+            n_bins: bin 수
+
+        Returns:
+            위상 bin 색인
+        """
+        if period <= 0:
+            raise ValueError("주기는 0보다 커야 합니다")
+        if n_bins < 1:
+            raise ValueError("bin 수는 1 이상이어야 합니다")
+
+        cycles = (np.asarray(time, dtype=np.float64) - epoch) / period + 0.5
+        cycle = np.floor(cycles)
+        phase = cycles - cycle - 0.5
+        bin_index = np.minimum(((phase + 0.5) * n_bins).astype(np.intp), n_bins - 1)
+        return cls(phase=phase, cycle=cycle.astype(np.int64), bin_index=bin_index, n_bins=n_bins)
+
+    def bin_sums(self, values: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """bin별 합 (mask가 있으면 해당 점만)"""
+        index = self.bin_index if mask is None else self.bin_index[mask]
+        values = values if mask is None else values[mask]
+        return np.bincount(index, weights=values, minlength=self.n_bins)
+
+    def bin_counts(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """bin별 점 수 (mask가 있으면 해당 점만)"""
+        index = self.bin_index if mask is None else self.bin_index[mask]
+        return np.bincount(index, minlength=self.n_bins)
+
+
+@dataclass(frozen=True)
+class FoldedLightCurve:
+    """
+    위상 접기 결과
+
+    Attributes:
+        period: 궤도 주기 (일)
+        epoch: 트랜짓 중심 시각
+        duration: 트랜짓 지속 시간 (일)
+        phase: bin 중심 위상 (-0.5 ~ 0.5)
+        flux: bin 평균 밝기 (빈 bin은 NaN)
+        flux_err: bin 평균의 표준 오차 (점이 2개 미만이면 NaN)
+        counts: bin별 점 수
+        features: 2차 특징 (PhaseFolder.FEATURE_NAMES)
+    """
+    period: float
+    epoch: float
+    duration: float
+    phase: np.ndarray
+    flux: np.ndarray
+    flux_err: np.ndarray
+    counts: np.ndarray
+    features: Dict[str, float]
+
+
+class PhaseFolder:
+    """
+    위상 접기 및 2차 특징 계산기
+
+    2차 특징 (깊이는 트랜짓 밖 평균 대비 상대 밝기 감소):
+        depth: 접은 곡선의 트랜짓 깊이
+        odd_depth, even_depth: 홀수/짝수 번째 트랜짓 깊이
+        odd_even_significance: 홀짝 깊이 차이 / 결합 표준 오차
+            (크면 주기의 2배인 식쌍성일 가능성)
+        secondary_depth: 위상 0.5의 2차 식 깊이 (양수이면 식쌍성 또는 뜨거운 행성의 열복사)
+        transit_shape: 트랜짓 바깥쪽 절반 깊이 / 안쪽 절반 깊이
+            (상자·U자형 ≈ 1, V자형 ≈ 1/3, 스치는 식쌍성일수록 작음)
+    """
+
+    FEATURE_NAMES = (
+        'depth', 'odd_depth', 'even_depth', 'odd_even_significance',
+        'secondary_depth', 'transit_shape'
+    )
+
+    def __init__(self, n_bins: int = 200, max_bins: int = 2000):
+        """
+        Parameters:
+            n_bins: 기본 bin 수
+            max_bins: 허용하는 최대 bin 수
+        """
+        self.n_bins = n_bins
+        self.max_bins = max_bins
+
+    def fold(
+        self,
+        time: np.ndarray,
+        flux: np.ndarray,
+        period: float,
+        epoch: float,
+        duration: float,
+        n_bins: Optional[int] = None
+    ) -> FoldedLightCurve:
+        """
+        광도 곡선 위상 접기
+
+        Parameters:
+            time: 시간 배열 (일)
+            flux: 밝기 배열 (추세 제거된 상대 밝기 권장)
+            period: 궤도 주기 (일)
+            epoch: 트랜짓 중심 시각
+            duration: 트랜짓 지속 시간 (일)
+            n_bins: bin 수 (None이면 기본값)
+
+        Returns:
+            위상 접기 결과
+
+        Raises:
+            ValueError: 입력이 잘못된 경우
+        """
+        n_bins = self.n_bins if n_bins is None else int(n_bins)
+        if not 1 <= n_bins <= self.max_bins:
+            raise ValueError(f"bin 수는 1 이상 {self.max_bins} 이하여야 합니다")
+        if duration <= 0 or duration >= period:
+            raise ValueError("트랜짓 지속 시간은 0보다 크고 주기보다 작아야 합니다")
+
+        time = np.asarray(time, dtype=np.float64).ravel()
+        flux = np.asarray(flux, dtype=np.float64).ravel()
+        if time.size != flux.size:
+            raise ValueError("시간과 밝기 배열의 길이가 같아야 합니다")
+        finite = np.isfinite(time) & np.isfinite(flux)
+        time, flux = time[finite], flux[finite]
+        if time.size == 0:
+            raise ValueError("광도 곡선 데이터가 비어있을 수 없습니다")
+
+        # 1. 위상 bin 색인 (한 번 계산하여 bin 곡선과 2차 특징에 재사용)
+        binning = PhaseBinning.build(time, period, epoch, n_bins)
+
+        # 2. bin 평균과 표준 오차
+        counts = binning.bin_counts()
+        sums = binning.bin_sums(flux)
+        squares = binning.bin_sums(flux * flux)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = sums / counts
+            variance = np.maximum(squares / counts - mean * mean, 0.0)
+            error = np.where(counts > 1, np.sqrt(variance / (counts - 1)), np.nan)
+
+        return FoldedLightCurve(
+            period=float(period),
+            epoch=float(epoch),
+            duration=float(duration),
+            phase=(np.arange(n_bins) + 0.5) / n_bins - 0.5,
+            flux=mean,
+            flux_err=error,
+            counts=counts,
+            features=self._secondary_features(binning, flux, duration / period)
+        )
+
+    def _secondary_features(
+        self,
+        binning: PhaseBinning,
+        flux: np.ndarray,
+        width: float
+    ) -> Dict[str, float]:
+        """
+        2차 특징 계산 (위상 단위 트랜짓 폭 width 기준 마스크)
+
+        점이 없어 계산할 수 없는 특징은 NaN
+        """
+        distance = np.abs(binning.phase)
+        in_transit = distance < width / 2.0
+        secondary = np.abs(distance - 0.5) < width / 2.0
+        # 트랜짓·2차 식 양쪽으로 지속 시간만큼 떨어진 구간을 기준 밝기로 사용
+        out_of_transit = (distance > width) & (np.abs(distance - 0.5) > width)
+        if not out_of_transit.any():
+            out_of_transit = ~in_transit
+
+        baseline = _mean(flux[out_of_transit])
+        odd = (binning.cycle % 2).astype(bool)
+
+        depth, _ = _depth(flux[in_transit], baseline)
+        odd_depth, odd_error = _depth(flux[in_transit & odd], baseline)
+        even_depth, even_error = _depth(flux[in_transit & ~odd], baseline)
+        secondary_depth, _ = _depth(flux[secondary], baseline)
+
+        combined_error = np.hypot(odd_error, even_error)
+        significance = (
+            abs(odd_depth - even_depth) / combined_error
+            if combined_error > 0 else float('nan')
+        )
+
+        # 트랜짓 안쪽 절반(|위상| < 폭/4)과 바깥쪽 절반의 깊이 비
+        inner_depth, _ = _depth(flux[distance < width / 4.0], baseline)
+        outer_depth, _ = _depth(flux[in_transit & (distance >= width / 4.0)], baseline)
+        shape = outer_depth / inner_depth if inner_depth > 0 else float('nan')
+
+        return {
+            'depth': depth,
+            'odd_depth': odd_depth,
+            'even_depth': even_depth,
+            'odd_even_significance': float(significance),
+            'secondary_depth': secondary_depth,
+            'transit_shape': float(shape)
+        }
+
+
+def _mean(values: np.ndarray) -> float:
+    return float(np.mean(values)) if values.size else float('nan')
+
+
+def _depth(values: np.ndarray, baseline: float):
+    """기준 밝기 대비 상대 깊이와 표준 오차 (점이 없으면 NaN)"""
+    if values.size == 0 or not baseline:
+        return float('nan'), float('nan')
+
+    depth = (baseline - float(np.mean(values))) / baseline
+    error = float(np.std(values)) / np.sqrt(values.size) / abs(baseline) if values.size > 1 else float('nan')
+    return float(depth), float(error)
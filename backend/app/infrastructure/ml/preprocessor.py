@@ -3,9 +3,11 @@
 특징값을 모델 입력에 맞게 변환
 """
 
+import warnings
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
+from .feature_plan import ENGINEERED_FEATURES, FeaturePlan
 
 
 class Preprocessor:
@@ -23,10 +25,37 @@ class Preprocessor:
         """
         self.scaler = scaler
         self.feature_names = None
+        self.feature_plan: Optional[FeaturePlan] = None
+        self._compile_feature_plan()
 
     def set_scaler(self, scaler):
-        """스케일러 설정"""
+        """스케일러 설정 (NumPy 변환 계획도 함께 컴파일)"""
         self.scaler = scaler
+        self._compile_feature_plan()
+
+    def _compile_feature_plan(self):
+        """
+        스케일러로부터 NumPy 변환 계획 컴파일
+
+        컴파일 직후 pandas 경로와 결과를 비교하여,
+        일치하지 않으면 계획을 사용하지 않고 pandas 경로로 동작
+        """
+        self.feature_plan = FeaturePlan.compile(self.scaler)
+        if self.feature_plan is None:
+            return
+
+        # 검증용 샘플: 임의의 값 + 일부 누락/추가 특징
+        probe = {
+            name: 1.0 + index
+            for index, name in enumerate(self.feature_plan.feature_names)
+        }
+        probe.pop(self.feature_plan.feature_names[0], None)
+        probe['__unused_feature__'] = 1.0
+
+        expected = self._transform_frame(pd.DataFrame([probe]))
+        if not np.allclose(self.feature_plan.transform(probe), expected, rtol=1e-12, atol=1e-12):
+            warnings.warn("Feature plan이 pandas 전처리 결과와 일치하지 않아 pandas 경로를 사용합니다")
+            self.feature_plan = None
 
     def preprocess_features(
         self,
@@ -41,79 +70,99 @@ class Preprocessor:
         Returns:
             전처리된 특징값 배열
         """
+        # 컴파일된 NumPy 경로 (pandas 오버헤드 없음)
+        if self.feature_plan is not None:
+            if self.feature_names is None:
+                self.feature_names = list(self.feature_plan.feature_names)
+            return self.feature_plan.transform(features)
+
         # 딕셔너리를 DataFrame으로 변환
         df = pd.DataFrame([features])
 
-        # Feature Engineering: 5개의 추가 특징 생성
-        # (train_multiclass_model.py의 engineer_features()와 동일)
+        return self._transform_frame(df)
 
-        # 1. depth_per_radius_sq: 깊이 / 반지름^2
-        if 'transit_depth' in df.columns and 'planet_radius' in df.columns:
-            df['depth_per_radius_sq'] = df['transit_depth'] / (df['planet_radius'] ** 2 + 1e-6)
+    def preprocess_batch(
+        self,
+        features_list: List[Dict[str, float]]
+    ) -> np.ndarray:
+        """
+        배치 전처리 (Feature Engineering 및 컬럼 정렬 포함)
 
-        # 2. orbit_transit_product: 궤도주기 × 통과시간
-        if 'orbital_period' in df.columns and 'transit_duration' in df.columns:
-            df['orbit_transit_product'] = df['orbital_period'] * df['transit_duration']
+        preprocess_features()와 동일한 변환을 N개 샘플에 대해
+        한 번의 DataFrame 연산과 한 번의 scaler.transform()으로 수행
 
-        # 3. signal_strength: 신호강도 / 깊이
-        if 'signal_to_noise' in df.columns and 'transit_depth' in df.columns:
-            df['signal_strength'] = df['signal_to_noise'] / (df['transit_depth'] + 1e-6)
+        Parameters:
+            features_list: 특징값 딕셔너리 리스트
 
-        # 4. temp_ratio: 행성온도 / 별온도
-        if 'equilibrium_temp' in df.columns and 'stellar_temp' in df.columns:
-            df['temp_ratio'] = df['equilibrium_temp'] / (df['stellar_temp'] + 1e-6)
+        Returns:
+            전처리된 (N, F) 특징값 배열
+        """
+        if not features_list:
+            raise ValueError("배치가 비어있습니다")
 
-        # 5. planet_star_radius_ratio: 행성반지름 / 별반지름
-        if 'planet_radius' in df.columns and 'stellar_radius' in df.columns:
-            df['planet_star_radius_ratio'] = df['planet_radius'] / (df['stellar_radius'] + 1e-6)
+        # 컴파일된 NumPy 경로
+        if self.feature_plan is not None:
+            if self.feature_names is None:
+                self.feature_names = list(self.feature_plan.feature_names)
+            return self.feature_plan.transform_many(features_list)
 
-        # 스케일러가 있으면 훈련 시 사용된 feature 순서대로 재정렬
-        if self.scaler is not None and hasattr(self.scaler, 'feature_names_in_'):
-            expected_features = self.scaler.feature_names_in_.tolist()
+        # DataFrame으로 변환 (N행을 한 번에 처리)
+        df = pd.DataFrame(features_list)
 
-            # 누락된 특징은 0으로 채우고, 순서대로 재정렬
-            for feature_name in expected_features:
-                if feature_name not in df.columns:
-                    df[feature_name] = 0.0
+        return self._transform_frame(df)
 
-            # 훈련 시와 동일한 순서로 컬럼 재정렬
-            df = df[expected_features]
+    def preprocess_matrix(
+        self,
+        matrix: np.ndarray,
+        column_names: List[str]
+    ) -> np.ndarray:
+        """
+        특징 행렬 전처리 (FeatureExtractor.extract_batch 결과용)
 
-        # 특징 이름 저장 (첫 번째 호출 시)
-        if self.feature_names is None:
-            self.feature_names = df.columns.tolist()
+        preprocess_batch()와 동일한 변환을 딕셔너리 변환 없이 수행
 
-        # 결측치 처리
-        df = df.fillna(0)
+        Parameters:
+            matrix: (N, K) 특징 행렬
+            column_names: 행렬의 열 이름
 
-        # 무한값 처리
-        df = df.replace([np.inf, -np.inf], 0)
+        Returns:
+            전처리된 (N, F) 특징값 배열
+        """
+        if len(matrix) == 0:
+            raise ValueError("배치가 비어있습니다")
 
-        # 스케일링
-        if self.scaler is not None:
-            scaled_features = self.scaler.transform(df)
-        else:
-            scaled_features = df.values
+        # 컴파일된 NumPy 경로
+        if self.feature_plan is not None:
+            if self.feature_names is None:
+                self.feature_names = list(self.feature_plan.feature_names)
+            return self.feature_plan.transform_matrix(matrix, column_names)
 
-        return scaled_features
+        df = pd.DataFrame(np.asarray(matrix, dtype=np.float64), columns=list(column_names))
 
-    def preprocess_batch(
-        self,
-        features_list: List[Dict[str, float]]
-    ) -> np.ndarray:
+        return self._transform_frame(df)
+
+    def _transform_frame(self, df: pd.DataFrame) -> np.ndarray:
         """
-        배치 전처리
+        DataFrame 전체에 Feature Engineering, 컬럼 정렬, 스케일링 적용
 
         Parameters:
-            features_list: 특징값 딕셔너리 리스트
+            df: 특징값 DataFrame (행 = 샘플)
 
         Returns:
-            전처리된 특징값 배열
+            전처리된 (N, F) 특징값 배열
         """
-        # DataFrame으로 변환
-        df = pd.DataFrame(features_list)
+        # Feature Engineering: 5개의 추가 특징 생성
+        # (train_multiclass_model.py의 engineer_features()와 동일)
+        df = self._engineer_features(df)
+
+        # 스케일러가 있으면 훈련 시 사용된 feature 순서대로 재정렬
+        if self.scaler is not None and hasattr(self.scaler, 'feature_names_in_'):
+            expected_features = self.scaler.feature_names_in_.tolist()
+
+            # 누락된 특징은 0으로 채우고, 훈련 시와 동일한 순서로 컬럼 재정렬
+            df = df.reindex(columns=expected_features, fill_value=0.0)
 
-        # 특징 이름 저장
+        # 특징 이름 저장 (첫 번째 호출 시)
         if self.feature_names is None:
             self.feature_names = df.columns.tolist()
 
@@ -131,6 +180,23 @@ class Preprocessor:
 
         return scaled_features
 
+    def _engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        파생 특징 생성 (컬럼 단위 벡터 연산)
+
+        Parameters:
+            df: 특징값 DataFrame
+
+        Returns:
+            파생 특징이 추가된 DataFrame
+        """
+        # (feature_plan.py의 ENGINEERED_FEATURES 정의를 공유)
+        for name, source_a, source_b, func in ENGINEERED_FEATURES:
+            if source_a in df.columns and source_b in df.columns:
+                df[name] = func(df[source_a], df[source_b])
+
+        return df
+
     def validate_features(self, features: Dict[str, float]) -> bool:
         """
         특징값 검증
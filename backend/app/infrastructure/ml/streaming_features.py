@@ -0,0 +1,666 @@
+"""
+스트리밍 특징 추출 (Streaming Feature Extraction)
+광도 곡선을 청크 단위로 누적하여 전체 배열을 메모리에 올리지 않고 특징 추출
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .detrender import MAD_TO_SIGMA, LightCurveDetrender
+from .feature_extractor import FeatureExtractor
+
+
+# 청크: (time, flux, flux_err) - flux_err가 없으면 None
+Chunk = Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]
+
+
+class RunningMoments:
+    """
+    병합 가능한 누적 모멘트 (개수, 평균, 2~4차 중심 모멘트 합, 최소, 최대)
+
+    청크마다 중심 모멘트를 구한 뒤 Chan/Pébay 병합 공식으로 합치므로
+    한 번에 계산한 결과와 반올림 오차 수준에서 같고, 청크 순서와 무관함
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+
+    def update(self, values: np.ndarray) -> 'RunningMoments':
+        """
+        청크 값 누적
+
+        Parameters:
+            values: 값 배열 (유한한 값만)
+
+        Returns:
+            self
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return self
+
+        chunk = RunningMoments()
+        chunk.count = values.size
+        chunk.mean = float(np.sum(values)) / values.size
+        deviation = values - chunk.mean
+        squared = deviation * deviation
+        chunk.m2 = float(np.sum(squared))
+        chunk.m3 = float(np.dot(squared, deviation))
+        chunk.m4 = float(np.dot(squared, squared))
+        chunk.min = float(np.min(values))
+        chunk.max = float(np.max(values))
+
+        return self.merge(chunk)
+
+    def merge(self, other: 'RunningMoments') -> 'RunningMoments':
+        """
+        다른 누적 모멘트 병합
+
+        Parameters:
+            other: 병합할 누적 모멘트
+
+        Returns:
+            self
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+
+        n_a, n_b = float(self.count), float(other.count)
+        n = n_a + n_b
+        delta = other.mean - self.mean
+        delta2 = delta * delta
+
+        m4 = (
+            self.m4 + other.m4
+            + delta2 * delta2 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b) / (n * n * n)
+            + 6.0 * delta2 * (n_a * n_a * other.m2 + n_b * n_b * self.m2) / (n * n)
+            + 4.0 * delta * (n_a * other.m3 - n_b * self.m3) / n
+        )
+        m3 = (
+            self.m3 + other.m3
+            + delta2 * delta * n_a * n_b * (n_a - n_b) / (n * n)
+            + 3.0 * delta * (n_a * other.m2 - n_b * self.m2) / n
+        )
+        m2 = self.m2 + other.m2 + delta2 * n_a * n_b / n
+
+        self.count += other.count
+        self.mean += delta * n_b / n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """모분산 (np.var 기본값과 동일)"""
+        return self.m2 / self.count if self.count else float('nan')
+
+    @property
+    def skewness(self) -> float:
+        """왜도 (scipy.stats.skew 기본값과 동일, 거의 상수이면 NaN)"""
+        variance = self.variance
+        if self._is_degenerate(variance):
+            return float('nan')
+        return (self.m3 / self.count) / variance ** 1.5
+
+    @property
+    def kurtosis(self) -> float:
+        """첨도 (scipy.stats.kurtosis 기본값과 동일, 거의 상수이면 NaN)"""
+        variance = self.variance
+        if self._is_degenerate(variance):
+            return float('nan')
+        return (self.m4 / self.count) / (variance * variance) - 3.0
+
+    def _is_degenerate(self, variance: float) -> bool:
+        return not variance > (np.finfo(np.float64).eps * self.mean) ** 2
+
+
+class QuantileSketch:
+    """
+    병합 가능한 근사 분위수 스케치 (KLL)
+
+    레벨 h의 버퍼 원소는 원본 2^h개를 대표하며, 버퍼가 용량을 넘으면 정렬 후
+    한 칸씩 건너 뽑아 다음 레벨로 올림(compaction). 상위 레벨일수록 용량이 크고
+    하위 레벨은 2/3씩 줄어 전체 크기는 약 3k로 고정되고, 순위 오차는 약 1.7/k
+    """
+
+    def __init__(self, k: int = 400, seed: Optional[int] = None):
+        """
+        Parameters:
+            k: 최상위 레벨 용량 (클수록 정확하고 메모리 증가)
+            seed: compaction 오프셋 난수 시드
+        """
+        if k < 8:
+            raise ValueError("스케치 크기는 8 이상이어야 합니다")
+
+        self.k = int(k)
+        self.count = 0
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray) -> 'QuantileSketch':
+        """
+        청크 값 누적
+
+        Parameters:
+            values: 값 배열 (유한한 값만)
+
+        Returns:
+            self
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return self
+
+        self.count += values.size
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        다른 스케치 병합 (같은 레벨끼리 이어 붙인 뒤 압축)
+
+        Parameters:
+            other: 병합할 스케치
+
+        Returns:
+            self
+        """
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, buffer in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], buffer])
+
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantiles(self, q: Iterable[float]) -> np.ndarray:
+        """
+        근사 분위수 (np.percentile의 linear 보간과 같은 순위 정의)
+
+        Parameters:
+            q: 분위 (0~1)
+
+        Returns:
+            분위수 배열
+
+        Raises:
+            ValueError: 누적된 값이 없는 경우
+        """
+        values, weights = self._sorted()
+        return _interpolate(values, weights, np.asarray(list(q), dtype=np.float64))
+
+    def median_absolute_deviation(self, center: float) -> float:
+        """
+        근사 중앙값 절대 편차 (center로부터의 |편차|의 가중 중앙값, 순위 오차는 quantiles와 같음)
+
+        Parameters:
+            center: 편차 기준값 (보통 중앙값)
+
+        Returns:
+            중앙값 절대 편차
+
+        Raises:
+            ValueError: 누적된 값이 없는 경우
+        """
+        values, weights = self._sorted()
+        deviation = np.abs(values - center)
+        order = np.argsort(deviation, kind='stable')
+        return float(_interpolate(deviation[order], weights[order], np.array([0.5]))[0])
+
+    def _sorted(self) -> Tuple[np.ndarray, np.ndarray]:
+        """정렬된 (원소, 가중치) - 가중치는 원소가 대표하는 원본 값 개수"""
+        if self.count == 0:
+            raise ValueError("스케치가 비어있습니다")
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(buffer.size, float(2 ** level)) for level, buffer in enumerate(self._levels)
+        ])
+        order = np.argsort(values, kind='stable')
+        return values[order], weights[order]
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - 1 - level
+        return max(int(np.ceil(self.k * (2.0 / 3.0) ** depth)), 2)
+
+    def _compress(self):
+        """용량을 넘은 가장 낮은 레벨부터 압축 (모든 레벨이 용량 이하가 될 때까지)"""
+        level = 0
+        while level < len(self._levels):
+            buffer = self._levels[level]
+            if buffer.size <= self._capacity(level):
+                level += 1
+                continue
+
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+
+            buffer = np.sort(buffer)
+            # 홀수 개이면 하나는 현재 레벨에 남기고 나머지 짝수 개를 압축
+            keep = buffer[-1:] if buffer.size % 2 else buffer[:0]
+            paired = buffer[:buffer.size - keep.size]
+            promoted = paired[int(self._rng.integers(2))::2]
+
+            self._levels[level] = keep.copy()
+            self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            # 레벨이 추가되면 하위 레벨 용량이 줄어드므로 처음부터 다시 확인
+            level = 0
+
+
+class StreamingFeatureAccumulator:
+    """
+    광도 곡선 청크 누적기
+
+    플럭스는 누적 모멘트와 분위수 스케치로, 시간 축은 고정 폭 시간 bin
+    (점 수, 밝기 합, 시간 합, 최소 밝기, 첫/마지막 시각)으로 요약.
+    메모리는 데이터 점 수와 무관하며 관측 기간 / bin 폭에만 비례
+    """
+
+    # 시간 bin 최대 개수 (10분 bin 기준 약 38년, bin당 48바이트)
+    MAX_BINS = 2_000_000
+
+    def __init__(self, sketch_size: int = 400, bin_width: float = 10.0 / 1440.0):
+        """
+        Parameters:
+            sketch_size: 분위수 스케치 크기
+            bin_width: 시간 bin 폭 (일)
+        """
+        if bin_width <= 0:
+            raise ValueError("시간 bin 폭은 0보다 커야 합니다")
+
+        self.bin_width = bin_width
+        self.flux = RunningMoments()
+        self.sketch = QuantileSketch(k=sketch_size)
+        self.error_count = 0
+        self.error_sum = 0.0
+        self.error_max = float('-inf')
+        self.dropped = 0
+
+        self._base = 0
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._flux_sum = np.zeros(0)
+        self._time_sum = np.zeros(0)
+        self._flux_min = np.zeros(0)
+        self._time_first = np.zeros(0)
+        self._time_last = np.zeros(0)
+
+    @property
+    def count(self) -> int:
+        """누적된 데이터 점 수"""
+        return self.flux.count
+
+    def update(
+        self,
+        time: np.ndarray,
+        flux: np.ndarray,
+        flux_err: Optional[np.ndarray] = None
+    ) -> 'StreamingFeatureAccumulator':
+        """
+        청크 누적 (시간 또는 밝기가 유한하지 않은 점은 관측 공백으로 보고 제외)
+
+        Parameters:
+            time: 시간 배열 (일)
+            flux: 밝기 배열
+            flux_err: 밝기 오차 배열 (선택)
+
+        Returns:
+            self
+
+        Raises:
+            ValueError: 배열 길이가 다른 경우
+        """
+        time = np.asarray(time, dtype=np.float64).ravel()
+        flux = np.asarray(flux, dtype=np.float64).ravel()
+        if time.size != flux.size:
+            raise ValueError("시간과 밝기 배열의 길이가 같아야 합니다")
+
+        finite = np.isfinite(time) & np.isfinite(flux)
+        if not finite.all():
+            self.dropped += int(finite.size - np.count_nonzero(finite))
+            time, flux = time[finite], flux[finite]
+        if flux.size == 0:
+            return self
+
+        # 1. 플럭스 모멘트와 분위수
+        self.flux.update(flux)
+        self.sketch.update(flux)
+
+        # 2. 밝기 오차 (유한한 값만)
+        if flux_err is not None:
+            flux_err = np.asarray(flux_err, dtype=np.float64).ravel()
+            if flux_err.size != finite.size:
+                raise ValueError("밝기 오차 배열의 길이가 밝기 배열과 같아야 합니다")
+            flux_err = flux_err[finite]
+            flux_err = flux_err[np.isfinite(flux_err)]
+            if flux_err.size:
+                self.error_count += flux_err.size
+                self.error_sum += float(np.sum(flux_err))
+                self.error_max = max(self.error_max, float(np.max(flux_err)))
+
+        # 3. 시간 bin 요약
+        index = np.floor(time / self.bin_width).astype(np.int64)
+        self._ensure_bins(int(index.min()), int(index.max()))
+        index -= self._base
+        size = self._counts.size
+
+        self._counts += np.bincount(index, minlength=size)
+        self._flux_sum += np.bincount(index, weights=flux, minlength=size)
+        self._time_sum += np.bincount(index, weights=time, minlength=size)
+        np.minimum.at(self._flux_min, index, flux)
+        np.minimum.at(self._time_first, index, time)
+        np.maximum.at(self._time_last, index, time)
+        return self
+
+    def merge(self, other: 'StreamingFeatureAccumulator') -> 'StreamingFeatureAccumulator':
+        """
+        다른 누적기 병합 (같은 bin 폭이어야 함)
+
+        Parameters:
+            other: 병합할 누적기
+
+        Returns:
+            self
+        """
+        if other.bin_width != self.bin_width:
+            raise ValueError("시간 bin 폭이 같은 누적기만 병합할 수 있습니다")
+
+        self.flux.merge(other.flux)
+        self.sketch.merge(other.sketch)
+        self.error_count += other.error_count
+        self.error_sum += other.error_sum
+        self.error_max = max(self.error_max, other.error_max)
+        self.dropped += other.dropped
+
+        occupied = np.flatnonzero(other._counts)
+        if occupied.size:
+            # 상대 누적기의 할당 여유분은 제외하고 점이 있는 bin 범위만 병합
+            source = slice(int(occupied[0]), int(occupied[-1]) + 1)
+            first = other._base + source.start
+            self._ensure_bins(first, other._base + source.stop - 1)
+            window = slice(first - self._base, first - self._base + source.stop - source.start)
+            self._counts[window] += other._counts[source]
+            self._flux_sum[window] += other._flux_sum[source]
+            self._time_sum[window] += other._time_sum[source]
+            np.minimum(self._flux_min[window], other._flux_min[source], out=self._flux_min[window])
+            np.minimum(self._time_first[window], other._time_first[source], out=self._time_first[window])
+            np.maximum(self._time_last[window], other._time_last[source], out=self._time_last[window])
+        return self
+
+    def binned(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        시간 bin 요약 광도 곡선
+
+        Returns:
+            (bin 평균 시각, bin 평균 밝기) - 빈 bin 제외
+        """
+        occupied = self._counts > 0
+        counts = self._counts[occupied]
+        return self._time_sum[occupied] / counts, self._flux_sum[occupied] / counts
+
+    def transit_duration(self, median_flux: float) -> float:
+        """
+        Transit duration 추정 (FeatureExtractor와 같은 중앙값 1% 임계값)
+
+        임계값 아래 점이 있는 첫 bin의 첫 시각부터 마지막 bin의 마지막 시각까지이므로
+        원본 배열로 계산한 값보다 최대 bin 폭 2개만큼 길 수 있음
+
+        Parameters:
+            median_flux: 플럭스 중앙값
+
+        Returns:
+            Transit 지속 시간
+        """
+        in_transit = (self._counts > 0) & (self._flux_min < median_flux * 0.99)
+        if not in_transit.any():
+            return 0.0
+        return float(self._time_last[in_transit].max() - self._time_first[in_transit].min())
+
+    def _ensure_bins(self, first: int, last: int):
+        """
+        [first, last] bin 인덱스를 담도록 bin 배열 확장
+
+        재할당 횟수를 줄이려고 자라는 방향으로 2배씩 늘리되 MAX_BINS를 넘기지 않음.
+        관측 기간은 할당 여유분이 아니라 점이 있는 bin 범위로 판단
+        """
+        size = self._counts.size
+        if size and first >= self._base and last < self._base + size:
+            return
+
+        grows_backward = bool(size) and first < self._base
+        occupied = np.flatnonzero(self._counts)
+        if occupied.size:
+            first = min(first, self._base + int(occupied[0]))
+            last = max(last, self._base + int(occupied[-1]))
+
+        needed = last - first + 1
+        if needed > self.MAX_BINS:
+            raise ValueError(
+                f"관측 기간이 너무 깁니다 (시간 bin {needed}개 > 최대 {self.MAX_BINS}개)"
+            )
+
+        new_size = min(max(needed, 2 * size), self.MAX_BINS)
+        # 여유분은 자라는 방향에 둠
+        new_base = last + 1 - new_size if grows_backward else first
+
+        offset = self._base - new_base
+        self._counts = _regrow(self._counts, new_size, offset, 0)
+        self._flux_sum = _regrow(self._flux_sum, new_size, offset, 0.0)
+        self._time_sum = _regrow(self._time_sum, new_size, offset, 0.0)
+        self._flux_min = _regrow(self._flux_min, new_size, offset, np.inf)
+        self._time_first = _regrow(self._time_first, new_size, offset, np.inf)
+        self._time_last = _regrow(self._time_last, new_size, offset, -np.inf)
+        self._base = new_base
+
+
+@contextmanager
+def _opened(open_chunks: Callable[[], Iterable[Chunk]]) -> Iterator[Iterator[Chunk]]:
+    """청크 반복자를 열고, 중간에 예외로 빠져나와도 파일을 읽는 생성기를 바로 닫음"""
+    chunks = iter(open_chunks())
+    try:
+        yield chunks
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+
+
+def _interpolate(values: np.ndarray, weights: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """정렬된 가중 원소의 분위수 (각 원소가 대표하는 순위 구간의 중심에 놓고 선형 보간)"""
+    centers = np.cumsum(weights) - weights / 2.0
+    targets = q * (weights.sum() - 1.0) + 0.5
+    return np.interp(targets, centers, values)
+
+
+def _regrow(values: np.ndarray, size: int, offset: int, fill) -> np.ndarray:
+    """size 길이의 새 배열에 기존 값을 offset 위치로 복사 (새 배열 밖으로 나가는 부분은 버림)"""
+    grown = np.full(size, fill, dtype=values.dtype)
+    source = max(0, -offset)
+    target = max(0, offset)
+    length = min(values.size - source, size - target)
+    if length > 0:
+        grown[target:target + length] = values[source:source + length]
+    return grown
+
+
+class StreamingFeatureExtractor:
+    """
+    스트리밍 특징 추출기
+
+    (time, flux, flux_err) 청크 반복자를 누적기에 흘려 넣고 마지막에
+    FeatureExtractor.extract_features()와 같은 키의 특징값을 계산.
+    추세 제거가 켜져 있으면 같은 추세 제거기로 청크를 겹치는 문맥과 함께 처리한
+    상대 밝기를 누적하고, 시그마 클리핑 기준(곡선 전체 중앙값·MAD)은 첫 번째 읽기에서
+    분위수 스케치로 추정하므로 청크를 두 번 읽음 (시간 오름차순 입력 필요).
+    평균, 분산, 왜도, 첨도, 최소, 최대는 정확한 값(클리핑 기준이 근사이면 그 기준에 대해)이고
+    중앙값과 백분위수는 분위수 스케치 근사값, transit_duration은 시간 bin 단위 근사값.
+    트랜짓 탐색은 시간 bin 평균 광도 곡선으로 수행
+
+    환경변수:
+        STREAMING_SKETCH_SIZE: 분위수 스케치 크기 (기본값 400, 순위 오차 약 0.5%)
+        STREAMING_TIME_BIN_MINUTES: 시간 bin 폭 (분, 기본값 10)
+        STREAMING_CHUNK_ROWS: 업로드 파일을 읽는 청크 행 수 (기본값 262144)
+    """
+
+    def __init__(
+        self,
+        feature_extractor: FeatureExtractor,
+        sketch_size: int = 400,
+        bin_minutes: float = 10.0,
+        chunk_rows: int = 262_144
+    ):
+        """
+        Parameters:
+            feature_extractor: 특징 추출기 (추세 제거·트랜짓 탐색 설정 공유)
+            sketch_size: 분위수 스케치 크기
+            bin_minutes: 시간 bin 폭 (분)
+            chunk_rows: 청크 행 수
+        """
+        if chunk_rows <= 0:
+            raise ValueError("청크 행 수는 0보다 커야 합니다")
+
+        self.feature_extractor = feature_extractor
+        self.sketch_size = sketch_size
+        self.bin_width = bin_minutes / 1440.0
+        self.chunk_rows = chunk_rows
+
+    @classmethod
+    def from_env(cls, feature_extractor: FeatureExtractor) -> 'StreamingFeatureExtractor':
+        """환경변수 설정으로 추출기 생성"""
+        return cls(
+            feature_extractor=feature_extractor,
+            sketch_size=int(os.getenv("STREAMING_SKETCH_SIZE", "400")),
+            bin_minutes=float(os.getenv("STREAMING_TIME_BIN_MINUTES", "10")),
+            chunk_rows=int(os.getenv("STREAMING_CHUNK_ROWS", "262144"))
+        )
+
+    def accumulator(self) -> StreamingFeatureAccumulator:
+        """설정이 적용된 빈 누적기"""
+        return StreamingFeatureAccumulator(sketch_size=self.sketch_size, bin_width=self.bin_width)
+
+    def extract(self, open_chunks: Callable[[], Iterable[Chunk]]) -> Dict[str, float]:
+        """
+        청크 반복자로부터 특징 추출
+
+        Parameters:
+            open_chunks: (time, flux, flux_err) 청크 반복자를 처음부터 새로 여는 함수
+                         (flux_err는 None 가능, 추세 제거와 클리핑을 함께 쓰면 두 번 호출)
+
+        Returns:
+            추출된 특징값 딕셔너리
+
+        Raises:
+            ValueError: 유효한 데이터 점이 없거나, 추세 제거 시 시간이 오름차순이 아닌 경우
+        """
+        accumulator = self.accumulator()
+        if not self.feature_extractor.detrends:
+            with _opened(open_chunks) as chunks:
+                for time, flux, flux_err in chunks:
+                    accumulator.update(time, flux, flux_err)
+            return self.features(accumulator)
+
+        detrender = self.feature_extractor.detrender
+        center = sigma = None
+        if detrender.clips:
+            with _opened(open_chunks) as chunks:
+                center, sigma = self._clip_reference(detrender, chunks)
+
+        with _opened(open_chunks) as chunks:
+            for cleaned in detrender.detrend_stream(chunks, center, sigma):
+                accumulator.update(cleaned.time, cleaned.flux, cleaned.flux_err)
+
+        return self.features(accumulator)
+
+    def _clip_reference(
+        self,
+        detrender: LightCurveDetrender,
+        chunks: Iterable[Chunk]
+    ) -> Tuple[float, float]:
+        """
+        첫 번째 읽기: 추세 제거한 상대 밝기의 곡선 전체 중앙값과 강건 표준편차 추정
+
+        Returns:
+            (중앙값, MAD 환산 표준편차) - 분위수 스케치 근사값
+
+        Raises:
+            ValueError: 유효한 데이터 점이 없는 경우
+        """
+        sketch = QuantileSketch(k=self.sketch_size)
+        for cleaned in detrender.detrend_stream(chunks):
+            sketch.update(cleaned.flux)
+
+        if sketch.count == 0:
+            raise ValueError("광도 곡선 데이터가 비어있을 수 없습니다")
+
+        center = float(sketch.quantiles((0.5,))[0])
+        return center, MAD_TO_SIGMA * sketch.median_absolute_deviation(center)
+
+    def features(self, accumulator: StreamingFeatureAccumulator) -> Dict[str, float]:
+        """
+        누적기 → 특징값 딕셔너리
+
+        Parameters:
+            accumulator: 청크를 누적한 누적기
+
+        Returns:
+            추출된 특징값 딕셔너리
+
+        Raises:
+            ValueError: 유효한 데이터 점이 없는 경우
+        """
+        if accumulator.count == 0:
+            raise ValueError("광도 곡선 데이터가 비어있을 수 없습니다")
+
+        moments = accumulator.flux
+        percentile_25, median, percentile_75, percentile_90 = (
+            float(value) for value in accumulator.sketch.quantiles((0.25, 0.5, 0.75, 0.9))
+        )
+        std = float(np.sqrt(moments.variance))
+
+        features = {
+            'mean_flux': moments.mean,
+            'median_flux': median,
+            'std_flux': std,
+            'var_flux': moments.variance,
+            'min_flux': moments.min,
+            'max_flux': moments.max,
+            'flux_range': moments.max - moments.min,
+            'flux_ratio': moments.max / moments.min if moments.min != 0 else 0,
+            'skewness': moments.skewness,
+            'kurtosis': moments.kurtosis,
+            'flux_25percentile': percentile_25,
+            'flux_75percentile': percentile_75,
+            'flux_90percentile': percentile_90,
+            'coefficient_of_variation': std / moments.mean if moments.mean != 0 else 0,
+            'transit_depth': self.feature_extractor._calculate_transit_depth(median, moments.min),
+            'transit_duration': accumulator.transit_duration(median)
+        }
+
+        # 에러 관련 (있는 경우)
+        if accumulator.error_count:
+            features['mean_flux_err'] = accumulator.error_sum / accumulator.error_count
+            features['max_flux_err'] = accumulator.error_max
+
+        # BLS 트랜짓 탐색 (시간 bin 평균 광도 곡선)
+        if self.feature_extractor.searches_transits:
+            time, flux = accumulator.binned()
+            result = self.feature_extractor.transit_search.search(time, flux)
+            features.update(self.feature_extractor._transit_features(
+                result, features['transit_depth'], features['transit_duration']
+            ))
+
+        return features
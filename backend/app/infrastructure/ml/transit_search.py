@@ -0,0 +1,523 @@
+"""
+트랜짓 탐색 엔진 (Transit Search)
+Box Least Squares(BLS) 주기 탐색으로 광도 곡선에서 궤도 주기, 트랜짓 시각,
+지속 시간, 깊이, 신호 대 잡음비를 추정
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# 학습 데이터(Kepler KOI) 단위 환산 계수: 상대 밝기 감소 → ppm, 일 → 시간
+PPM = 1e6
+HOURS_PER_DAY = 24.0
+
+
+@dataclass(frozen=True)
+class TransitSearchResult:
+    """
+    트랜짓 탐색 결과
+
+    Attributes:
+        period: 궤도 주기 (일)
+        epoch: 첫 트랜짓 중심 시각 (입력 시간 단위)
+        duration: 트랜짓 지속 시간 (일)
+        depth: 트랜짓 깊이 (중앙값 대비 상대 밝기 감소)
+        signal_to_noise: 신호 대 잡음비
+        transit_count: 관측 구간 안의 트랜짓 횟수
+    """
+    period: float
+    epoch: float
+    duration: float
+    depth: float
+    signal_to_noise: float
+    transit_count: int
+
+    def to_features(self) -> Dict[str, float]:
+        """
+        모델 학습 데이터(Kepler KOI)와 같은 단위의 특징값
+
+        Returns:
+            orbital_period (일), transit_epoch, transit_duration (시간),
+            transit_depth (ppm), signal_to_noise
+        """
+        return {
+            'orbital_period': self.period,
+            'transit_epoch': self.epoch,
+            'transit_duration': self.duration * HOURS_PER_DAY,
+            'transit_depth': self.depth * PPM,
+            'signal_to_noise': self.signal_to_noise
+        }
+
+
+class TransitSearch:
+    """
+    BLS 트랜짓 탐색기
+
+    1. 거친 탐색: 최소 지속 시간의 절반 간격으로 시간 binning한 데이터를
+       로그 주파수 격자(간격 = 최소 지속 시간 / 관측 기간)에서 탐색
+       (주기가 길수록 허용 주파수 오차가 커지므로 균일 격자보다 훨씬 적은 주기로 충분)
+    2. 정밀 탐색: 상위 후보 주기 주변을 oversample배 촘촘한 격자와 원본 데이터로 재탐색
+
+    각 단계는 주기 묶음 단위로 (주기 × 데이터 점) 위상 행렬을 만들어 bincount로
+    위상 bin 합을 구하고, 누적합으로 모든 시작 위치·지속 시간의 박스 통계를 한 번에 계산.
+    주기 묶음은 탐색기가 공유하는 하나의 스레드 풀에서 병렬 처리
+
+    작업량 상한:
+    - 최대 주기는 정밀 탐색 위상 bin 수가 max_bins 이하가 되도록 제한
+    - 거친 탐색 주기 수가 max_periods를 넘으면 격자 간격을 넓혀 max_periods개로 맞춤
+    - 예상 작업량(주기 × (데이터 점 + 위상 bin × 지속 시간 수)의 합)이 max_cells를 넘으면 탐색을 건너뜀
+      (긴 관측 기간의 조밀한 곡선이 실행기 워커를 오래 점유하지 않도록)
+
+    환경변수:
+        TRANSIT_SEARCH_ENABLED: 광도 곡선 입력에 트랜짓 탐색 적용 여부 (기본값 true)
+        TRANSIT_SEARCH_MIN_PERIOD: 최소 탐색 주기 (일, 기본값 0.5)
+        TRANSIT_SEARCH_MAX_PERIOD: 최대 탐색 주기 (일, 기본값 0 = 관측 기간의 절반)
+        TRANSIT_SEARCH_DURATIONS: 탐색할 지속 시간 (시간, 쉼표 구분, 기본값 1,2,3,4,6,8,12)
+        TRANSIT_SEARCH_OVERSAMPLE: 정밀 탐색 격자 배율 (기본값 5)
+        TRANSIT_SEARCH_MAX_PERIODS: 거친 탐색 최대 주기 수 (기본값 20000)
+        TRANSIT_SEARCH_MAX_BINS: 주기당 최대 위상 bin 수 (기본값 20000, 기본 설정에서 최대 주기 약 208일)
+        TRANSIT_SEARCH_MAX_CELLS: 곡선당 최대 작업량 (기본값 300000000, 단일 코어 약 5초)
+        TRANSIT_SEARCH_WORKERS: 병렬 스레드 수 (기본값 CPU 코어 수)
+    """
+
+    # 주기 대비 최대 지속 시간 비율 (이보다 긴 박스는 트랜짓으로 보지 않음)
+    MAX_DUTY_CYCLE = 0.25
+
+    def __init__(
+        self,
+        min_period: float = 0.5,
+        max_period: Optional[float] = None,
+        durations_hours: Sequence[float] = (1, 2, 3, 4, 6, 8, 12),
+        oversample: int = 5,
+        top_peaks: int = 5,
+        min_points_in_transit: int = 3,
+        max_periods: int = 20_000,
+        max_bins: int = 20_000,
+        max_cells: float = 3e8,
+        chunk_size: int = 500_000,
+        workers: Optional[int] = None,
+        enabled: bool = True
+    ):
+        """
+        Parameters:
+            min_period: 최소 탐색 주기 (일)
+            max_period: 최대 탐색 주기 (일, None이면 관측 기간의 절반 = 최소 2회 트랜짓)
+            durations_hours: 탐색할 트랜짓 지속 시간 (시간)
+            oversample: 정밀 탐색 격자 배율
+            top_peaks: 정밀 탐색할 거친 탐색 후보 수
+            min_points_in_transit: 트랜짓 구간 안팎의 최소 데이터 점 수
+            max_periods: 거친 탐색 최대 주기 수 (넘으면 격자 간격을 넓힘)
+            max_bins: 주기당 최대 위상 bin 수 (최대 탐색 주기를 제한)
+            max_cells: 곡선당 최대 작업량 (넘으면 탐색 생략)
+            chunk_size: 주기 묶음당 (주기 수 × (데이터 점 수 + 위상 bin 수)) 최대 원소 수
+                        (메모리 상한, 작을수록 묶음 안의 위상 bin 수 차이가 줄어 패딩 낭비 감소)
+            workers: 병렬 스레드 수 (None이면 CPU 코어 수)
+            enabled: 탐색 사용 여부
+        """
+        if min_period <= 0:
+            raise ValueError("최소 탐색 주기는 0보다 커야 합니다")
+        if not durations_hours:
+            raise ValueError("탐색할 지속 시간이 하나 이상 필요합니다")
+
+        self.min_period = min_period
+        self.max_period = max_period
+        self.durations = np.sort(np.asarray(durations_hours, dtype=np.float64)) / 24.0
+        self.oversample = max(1, int(oversample))
+        self.top_peaks = max(1, int(top_peaks))
+        self.min_points_in_transit = max(1, int(min_points_in_transit))
+        self.max_periods = max(1, int(max_periods))
+        self.max_bins = max(1, int(max_bins))
+        self.max_cells = max_cells
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        self.enabled = enabled
+
+        # 모든 탐색이 공유하는 스레드 풀 (처음 사용할 때 생성, 전체 스레드 수 = workers)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """프로세스 풀 워커로 전달할 때 스레드 풀과 잠금은 제외 (워커에서 다시 생성)"""
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        state['_pool_lock'] = None
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """공유 스레드 풀 (지연 생성)"""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.workers,
+                        thread_name_prefix="transit-search"
+                    )
+        return self._pool
+
+    @classmethod
+    def from_env(cls) -> 'TransitSearch':
+        """환경변수 설정으로 탐색기 생성"""
+        max_period = float(os.getenv("TRANSIT_SEARCH_MAX_PERIOD", "0"))
+        durations = os.getenv("TRANSIT_SEARCH_DURATIONS", "1,2,3,4,6,8,12")
+        workers = int(os.getenv("TRANSIT_SEARCH_WORKERS", "0"))
+
+        return cls(
+            min_period=float(os.getenv("TRANSIT_SEARCH_MIN_PERIOD", "0.5")),
+            max_period=max_period if max_period > 0 else None,
+            durations_hours=[float(value) for value in durations.split(",") if value.strip()],
+            oversample=int(os.getenv("TRANSIT_SEARCH_OVERSAMPLE", "5")),
+            max_periods=int(os.getenv("TRANSIT_SEARCH_MAX_PERIODS", "20000")),
+            max_bins=int(os.getenv("TRANSIT_SEARCH_MAX_BINS", "20000")),
+            max_cells=float(os.getenv("TRANSIT_SEARCH_MAX_CELLS", "300000000")),
+            workers=workers if workers > 0 else None,
+            enabled=os.getenv("TRANSIT_SEARCH_ENABLED", "true").lower() == "true"
+        )
+
+    def search(
+        self,
+        time: np.ndarray,
+        flux: np.ndarray
+    ) -> Optional[TransitSearchResult]:
+        """
+        광도 곡선에서 가장 강한 주기적 트랜짓 신호 탐색
+
+        Parameters:
+            time: 시간 배열 (일)
+            flux: 밝기 배열
+
+        Returns:
+            탐색 결과 (데이터가 부족하거나, 탐색 가능한 주기 범위가 없거나,
+            작업량 상한을 넘으면 None)
+        """
+        return self._search(time, flux, parallel=True)
+
+    def _search(
+        self,
+        time: np.ndarray,
+        flux: np.ndarray,
+        parallel: bool
+    ) -> Optional[TransitSearchResult]:
+        """search() 본체 (parallel이면 주기 묶음을 공유 스레드 풀에서 병렬 처리)"""
+        # 1. 유한한 점만 사용하고 중앙값으로 정규화 (평균 0으로 이동)
+        time = np.asarray(time, dtype=np.float64)
+        flux = np.asarray(flux, dtype=np.float64)
+        finite = np.isfinite(time) & np.isfinite(flux)
+        time, flux = time[finite], flux[finite]
+
+        if time.size < 4 * self.min_points_in_transit:
+            return None
+
+        median = np.median(flux)
+        if median == 0:
+            return None
+
+        y = flux / median - 1.0
+        y -= y.mean()
+        t0 = float(time.min())
+        t = time - t0
+        baseline = float(t.max())
+
+        min_duration = float(self.durations[0])
+        coarse_width = min_duration / 2.0
+        fine_width = min_duration / 4.0
+
+        # 최대 주기: 관측 기간의 절반, 설정값, 정밀 탐색 위상 bin 수 상한 중 가장 작은 값
+        max_period = min(baseline / 2.0, self.max_bins * fine_width)
+        if self.max_period is not None:
+            max_period = min(max_period, self.max_period)
+        if max_period <= self.min_period:
+            return None
+
+        # 2. 거친 탐색: 시간 binning한 데이터 + 로그 주파수 격자 (최대 max_periods개)
+        coarse_t, coarse_y, coarse_w = _bin_in_time(t, y, coarse_width)
+        log_span = np.log(max_period / self.min_period)
+        log_step = max(min_duration / baseline, log_span / self.max_periods)
+        frequencies = np.exp(np.arange(np.log(1.0 / max_period), np.log(1.0 / self.min_period), log_step))
+        if frequencies.size == 0:
+            return None
+
+        # 작업량 상한: 거친 탐색 + 정밀 탐색(후보마다 주기 4 × oversample + 1개) 예상 원소 수
+        #    (위상 bin 버퍼는 지속 시간마다 한 번씩 다시 훑으므로 지속 시간 수를 곱함)
+        periods = 1.0 / frequencies
+        coarse_widths = np.unique(np.maximum(np.round(self.durations / coarse_width), 1).astype(np.intp))
+        fine_periods = self.top_peaks * (4 * self.oversample + 1)
+        cells = (
+            periods.size * coarse_t.size
+            + float(np.ceil(periods / coarse_width).sum()) * coarse_widths.size
+            + fine_periods * (t.size + np.ceil(max_period / fine_width) * coarse_widths.size)
+        )
+        if cells > self.max_cells:
+            print(
+                f"[WARN] 트랜짓 탐색 생략: 예상 작업량 {cells:.3g}이(가) 상한 {self.max_cells:.3g}을(를) 넘습니다 "
+                f"(데이터 점 {t.size}, 관측 기간 {baseline:.1f}일)"
+            )
+            return None
+
+        coarse = self._evaluate(coarse_t, coarse_y, coarse_w, periods, coarse_width, coarse_widths, parallel)
+
+        # 3. 정밀 탐색: 상위 후보마다 주변 주기를 촘촘한 격자 + 원본 데이터로 재탐색
+        #    (지속 시간도 후보의 거친 지속 시간 주변을 촘촘한 bin 단위로 탐색)
+        fine_step = log_step / self.oversample
+        offsets = np.arange(-2 * self.oversample, 2 * self.oversample + 1) * fine_step
+        ones = np.ones_like(y)
+
+        best = None
+        for candidate in _top_peaks(coarse[0], self.top_peaks, separation=2):
+            periods = np.exp(np.log(1.0 / frequencies[candidate]) - offsets)
+            periods = periods[(periods >= self.min_period) & (periods <= max_period)]
+
+            coarse_duration = coarse[2][candidate] * _effective_bin_width(1.0 / frequencies[candidate], coarse_width)
+            widths = np.arange(
+                max(1, int(np.floor((coarse_duration - coarse_width) / fine_width))),
+                int(np.ceil((coarse_duration + coarse_width) / fine_width)) + 1
+            )
+
+            statistic, start, width, in_sum, in_count = self._evaluate(
+                t, y, ones, periods, fine_width, widths, parallel
+            )
+            index = int(np.argmax(statistic))
+            if statistic[index] > 0 and (best is None or statistic[index] > best[0]):
+                best = (statistic[index], periods[index], start[index], width[index], in_sum[index], in_count[index])
+
+        if best is None:
+            return None
+        _, period, start, width, in_sum, in_count = best
+
+        # 4. 박스 통계 → 주기, 시각, 지속 시간, 깊이, SNR
+        total = float(y.size)
+        n_in = float(in_count)
+        n_out = total - n_in
+        depth = -float(in_sum) * total / (n_in * n_out)
+        sigma = 1.4826 * float(np.median(np.abs(y - np.median(y))))
+        if sigma == 0:
+            sigma = float(np.std(y))
+        noise = sigma * np.sqrt(1.0 / n_in + 1.0 / n_out)
+
+        period = float(period)
+        bin_width = float(_effective_bin_width(period, fine_width))
+        duration = float(width) * bin_width
+        epoch = t0 + (float(start) * bin_width + duration / 2.0) % period
+
+        return TransitSearchResult(
+            period=period,
+            epoch=epoch,
+            duration=duration,
+            depth=depth,
+            signal_to_noise=float(depth / noise) if noise > 0 else 0.0,
+            transit_count=int(np.floor((time.max() - epoch) / period)) + 1
+        )
+
+    def search_many(
+        self,
+        time: np.ndarray,
+        flux: np.ndarray,
+        offsets: np.ndarray
+    ) -> List[Optional[TransitSearchResult]]:
+        """
+        이어 붙인 여러 광도 곡선을 곡선 단위로 병렬 탐색
+
+        곡선 단위로 공유 스레드 풀에 나누어 실행하고, 각 곡선 안의 주기 묶음은
+        순차 처리 (풀 작업이 다시 풀 작업을 기다리지 않도록)
+
+        Parameters:
+            time: 이어 붙인 시간 배열
+            flux: 이어 붙인 밝기 배열
+            offsets: 구간 경계 (길이 N + 1)
+
+        Returns:
+            곡선 순서와 동일한 탐색 결과 리스트
+        """
+        segments = [
+            (time[start:end], flux[start:end])
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+        if len(segments) > 1 and self.workers > 1:
+            return list(self._get_pool().map(
+                lambda segment: self._search(*segment, parallel=False),
+                segments
+            ))
+
+        return [self.search(*segment) for segment in segments]
+
+    def _evaluate(
+        self,
+        t: np.ndarray,
+        y: np.ndarray,
+        w: np.ndarray,
+        periods: np.ndarray,
+        bin_width: float,
+        widths: np.ndarray,
+        parallel: bool = True
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        주기별 최적 박스 탐색 (parallel이면 주기 묶음을 공유 스레드 풀에서 병렬 처리)
+
+        Parameters:
+            t: 시간 (첫 관측 기준)
+            y: 평균 0 상대 밝기 합 (binning된 데이터는 bin 합)
+            w: 데이터 점 수 (원본 데이터는 1, binning된 데이터는 bin 크기)
+            periods: 탐색 주기 배열
+            bin_width: 위상 bin 폭 (일)
+            widths: 탐색할 박스 폭 (bin 수, 오름차순)
+            parallel: 공유 스레드 풀 사용 여부
+
+        Returns:
+            주기별 (통계량, 시작 bin, 지속 bin 수, 구간 밝기 합, 구간 점 수)
+        """
+        chunks = self._chunk_periods(periods, t.size, bin_width)
+
+        def run(chunk: np.ndarray) -> Tuple[np.ndarray, ...]:
+            return _box_search(t, y, w, chunk, bin_width, widths, self.min_points_in_transit)
+
+        if parallel and len(chunks) > 1 and self.workers > 1:
+            results = list(self._get_pool().map(run, chunks))
+        else:
+            results = [run(chunk) for chunk in chunks]
+
+        return tuple(np.concatenate(parts) for parts in zip(*results))
+
+    def _chunk_periods(self, periods: np.ndarray, points: int, bin_width: float) -> List[np.ndarray]:
+        """
+        주기 묶음 분할
+
+        묶음마다 위상 행렬(주기 × 데이터 점)과 최대 위상 bin 수로 패딩한 bin 버퍼
+        (주기 × 최대 bin 수)의 원소 수 합이 chunk_size 이하가 되도록 나눔
+        """
+        n_bins = np.ceil(periods / bin_width)
+        chunks = []
+        start = 0
+        while start < periods.size:
+            rows = max(1, int(self.chunk_size // (points + n_bins[start])))
+            end = min(periods.size, start + rows)
+            # 묶음 안의 가장 긴 주기 기준으로 다시 줄임 (격자는 오름차순·내림차순 모두 가능)
+            rows = max(1, int(self.chunk_size // (points + n_bins[start:end].max())))
+            end = min(periods.size, start + rows)
+            chunks.append(periods[start:end])
+            start = end
+        return chunks
+
+
+def _box_search(
+    t: np.ndarray,
+    y: np.ndarray,
+    w: np.ndarray,
+    periods: np.ndarray,
+    bin_width: float,
+    widths: np.ndarray,
+    min_points: int
+) -> Tuple[np.ndarray, ...]:
+    """
+    주기 묶음의 최적 박스 (모든 시작 위치 × 지속 시간을 누적합으로 한 번에 평가)
+
+    통계량 s² / (n_in × n_out)는 평균 0 데이터에서 박스 깊이의 SNR² 에 비례
+    (s: 구간 밝기 합, n_in/n_out: 구간 안/밖 점 수)
+    """
+    count = periods.size
+    rows = np.arange(count)
+    n_bins = np.ceil(periods / bin_width).astype(np.intp)
+    max_bins = int(n_bins.max())
+    max_width = min(int(widths.max()), max_bins)
+    total = float(w.sum())
+
+    # 1. 위상 bin별 밝기 합·점 수 (주기마다 bin 수가 달라 최대 bin 수로 패딩)
+    #    실제 bin 폭은 주기 / ceil(주기 / bin_width)로 bin_width 이하
+    #    (floor_divide는 곱셈 후 정수 변환보다 수 배 느려 위상 비율 × bin 수 사용)
+    cycles = np.multiply.outer(1.0 / periods, t)
+    cycles -= np.floor(cycles)
+    phase = (cycles * n_bins[:, np.newaxis]).astype(np.intp)
+    np.minimum(phase, (n_bins - 1)[:, np.newaxis], out=phase)
+    flat = (phase + (rows * max_bins)[:, np.newaxis]).ravel()
+    size = count * max_bins
+    bin_y = np.bincount(flat, weights=np.broadcast_to(y, phase.shape).ravel(), minlength=size)
+    bin_w = np.bincount(flat, weights=np.broadcast_to(w, phase.shape).ravel(), minlength=size)
+
+    # 2. 위상이 한 바퀴 도는 박스를 위해 각 주기의 마지막 bin 뒤에 앞부분을 이어 붙인 누적합
+    cumulative = []
+    for values in (bin_y.reshape(count, max_bins), bin_w.reshape(count, max_bins)):
+        extended = np.zeros((count, max_bins + max_width + 1))
+        extended[:, 1:max_bins + 1] = values
+        wrap_columns = n_bins[:, np.newaxis] + 1 + np.arange(max_width)
+        extended[rows[:, np.newaxis], wrap_columns] = values[:, :max_width]
+        cumulative.append(np.cumsum(extended, axis=1))
+    cum_y, cum_w = cumulative
+
+    # 3. 지속 시간별로 모든 시작 위치의 박스 통계 계산 후 최댓값 갱신
+    best = np.zeros(count)
+    best_start = np.zeros(count, dtype=np.intp)
+    best_width = np.zeros(count, dtype=np.intp)
+    best_sum = np.zeros(count)
+    best_count = np.zeros(count)
+    out_of_range = np.arange(max_bins)[np.newaxis, :] >= n_bins[:, np.newaxis]
+
+    for width in widths:
+        if width > max_width:
+            break
+
+        in_sum = cum_y[:, width:width + max_bins] - cum_y[:, :max_bins]
+        in_count = cum_w[:, width:width + max_bins] - cum_w[:, :max_bins]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            statistic = in_sum * in_sum / (in_count * (total - in_count))
+
+        # 밝아지는 박스, 점이 부족한 박스, 패딩 위치, 주기 대비 너무 긴 박스 제외
+        invalid = (in_sum >= 0) | (in_count < min_points) | (in_count > total - min_points) | out_of_range
+        statistic[invalid] = 0.0
+        statistic[width > TransitSearch.MAX_DUTY_CYCLE * n_bins] = 0.0
+
+        start = np.argmax(statistic, axis=1)
+        value = statistic[rows, start]
+        better = value > best
+        best = np.where(better, value, best)
+        best_start = np.where(better, start, best_start)
+        best_width = np.where(better, width, best_width)
+        best_sum = np.where(better, in_sum[rows, start], best_sum)
+        best_count = np.where(better, in_count[rows, start], best_count)
+
+    return best, best_start, best_width, best_sum, best_count
+
+
+def _effective_bin_width(period: float, bin_width: float) -> float:
+    """주기를 정수 개의 위상 bin으로 나눈 실제 bin 폭 (bin_width 이하)"""
+    return period / np.ceil(period / bin_width)
+
+
+def _bin_in_time(t: np.ndarray, y: np.ndarray, width: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    시간 binning (거친 탐색용)
+
+    Returns:
+        (bin 중심 시각, bin 밝기 합, bin 점 수) - 빈 bin 제외
+    """
+    index = np.floor(t / width).astype(np.intp)
+    sums = np.bincount(index, weights=y)
+    counts = np.bincount(index).astype(np.float64)
+    occupied = np.flatnonzero(counts)
+    return (occupied + 0.5) * width, sums[occupied], counts[occupied]
+
+
+def _top_peaks(values: np.ndarray, count: int, separation: int) -> List[int]:
+    """
+    서로 separation 격자 간격보다 멀리 떨어진 상위 값 위치
+
+    Parameters:
+        values: 주기별 통계량
+        count: 최대 후보 수
+        separation: 후보 간 최소 간격 (격자 수)
+    """
+    peaks: List[int] = []
+    for index in np.argsort(values)[::-1]:
+        if values[index] <= 0 or len(peaks) >= count:
+            break
+        if all(abs(int(index) - peak) > separation for peak in peaks):
+            peaks.append(int(index))
+    return peaks or [int(np.argmax(values))]
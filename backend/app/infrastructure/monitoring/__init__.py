@@ -0,0 +1,30 @@
+"""Monitoring Infrastructure"""
+from .metrics import (
+    CACHE_HITS,
+    CACHE_MISSES,
+    CACHE_EVICTIONS,
+    CACHE_ENTRIES,
+    MODEL_REQUESTS,
+    MODEL_REGISTRY_RESIDENT_MB,
+    SHADOW_PREDICTIONS,
+    SHADOW_PROBABILITY_DIFF,
+    WRITE_BEHIND_QUEUE_DEPTH,
+    WRITE_BEHIND_FLUSH_SECONDS,
+    WRITE_BEHIND_ROWS,
+    WRITE_BEHIND_FLUSH_ERRORS
+)
+
+__all__ = [
+    'CACHE_HITS',
+    'CACHE_MISSES',
+    'CACHE_EVICTIONS',
+    'CACHE_ENTRIES',
+    'MODEL_REQUESTS',
+    'MODEL_REGISTRY_RESIDENT_MB',
+    'SHADOW_PREDICTIONS',
+    'SHADOW_PROBABILITY_DIFF',
+    'WRITE_BEHIND_QUEUE_DEPTH',
+    'WRITE_BEHIND_FLUSH_SECONDS',
+    'WRITE_BEHIND_ROWS',
+    'WRITE_BEHIND_FLUSH_ERRORS'
+]
@@ -0,0 +1,73 @@
+"""
+애플리케이션 Prometheus 메트릭
+prometheus_client 기본 레지스트리에 등록되어 Instrumentator의 /metrics로 함께 노출
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+
+# 캐시 메트릭 (cache 레이블: 캐시 이름)
+CACHE_HITS = Counter(
+    "exoplanet_cache_hits_total",
+    "캐시 적중 횟수",
+    ["cache"]
+)
+CACHE_MISSES = Counter(
+    "exoplanet_cache_misses_total",
+    "캐시 미스 횟수",
+    ["cache"]
+)
+CACHE_EVICTIONS = Counter(
+    "exoplanet_cache_evictions_total",
+    "크기 제한, 만료 또는 무효화로 제거된 캐시 항목 수",
+    ["cache"]
+)
+CACHE_ENTRIES = Gauge(
+    "exoplanet_cache_entries",
+    "현재 캐시 항목 수",
+    ["cache"]
+)
+
+
+# 모델 레지스트리 메트릭
+MODEL_REQUESTS = Counter(
+    "exoplanet_model_requests_total",
+    "모델 버전별 예측 요청 수 (route: explicit, canary, canary_fallback, default)",
+    ["version", "route"]
+)
+MODEL_REGISTRY_RESIDENT_MB = Gauge(
+    "exoplanet_model_registry_resident_mb",
+    "메모리에 상주 중인 레지스트리 모델 번들의 추정 크기 (MB)"
+)
+SHADOW_PREDICTIONS = Counter(
+    "exoplanet_shadow_predictions_total",
+    "섀도 모델 비교 횟수 (agreement: match, mismatch, error)",
+    ["primary_version", "shadow_version", "agreement"]
+)
+SHADOW_PROBABILITY_DIFF = Histogram(
+    "exoplanet_shadow_probability_abs_diff",
+    "기본 모델과 섀도 모델의 행성 확률 절대 차이",
+    ["shadow_version"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.2, 0.5, 1.0)
+)
+
+
+# 예측 write-behind 저장 메트릭
+WRITE_BEHIND_QUEUE_DEPTH = Gauge(
+    "exoplanet_write_behind_queue_depth",
+    "저장 대기 중인 예측 수"
+)
+WRITE_BEHIND_FLUSH_SECONDS = Histogram(
+    "exoplanet_write_behind_flush_seconds",
+    "예측 일괄 INSERT + 커밋 소요 시간 (초)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+WRITE_BEHIND_ROWS = Counter(
+    "exoplanet_write_behind_rows_total",
+    "write-behind 경로의 예측 수 (outcome: flushed, overflow, dropped)",
+    ["outcome"]
+)
+WRITE_BEHIND_FLUSH_ERRORS = Counter(
+    "exoplanet_write_behind_flush_errors_total",
+    "예측 일괄 저장 실패 횟수"
+)
@@ -1,4 +1,5 @@
 """Repository Implementations"""
 from .prediction_repository_impl import PredictionRepositoryImpl
+from .prediction_write_buffer import PredictionWriteBuffer
 
-__all__ = ['PredictionRepositoryImpl']
+__all__ = ['PredictionRepositoryImpl', 'PredictionWriteBuffer']
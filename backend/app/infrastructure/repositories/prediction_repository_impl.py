@@ -4,10 +4,14 @@
 """
 
 from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import and_, delete, desc, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from ...domain.entities.prediction import Prediction
 from ...domain.repositories.prediction_repository import IPredictionRepository
+from ...domain.value_objects.page_cursor import PageCursor
+from ...domain.value_objects.prediction_filter import PredictionFilter
+from ..cache.ttl_cache import TTLCache
 from ..database.models import PredictionModel
 
 
@@ -16,15 +20,19 @@ class PredictionRepositoryImpl(IPredictionRepository):
     예측 리포지토리 SQLAlchemy 구현
 
     도메인 엔티티와 데이터베이스 모델 간 변환 및
-    CRUD 작업 수행
+    CRUD 작업 수행. 비동기 세션을 사용하므로 DB 왕복 중에도
+    이벤트 루프가 다른 요청을 처리
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, count_cache: Optional[TTLCache] = None):
         """
         Parameters:
-            db: SQLAlchemy 세션
+            db: SQLAlchemy 비동기 세션
+            count_cache: 조건별 개수 캐시 (None이면 매번 COUNT 실행,
+                         이 리포지토리로 저장·삭제하면 비움)
         """
         self.db = db
+        self.count_cache = count_cache
 
     async def save(self, prediction: Prediction) -> Prediction:
         """
@@ -37,26 +45,42 @@ class PredictionRepositoryImpl(IPredictionRepository):
             저장된 예측 엔티티
         """
         # 도메인 엔티티를 DB 모델로 변환
-        db_prediction = PredictionModel(
-            id=prediction.id,
-            light_curve_data=prediction.light_curve_data,
-            input_features=prediction.input_features,  # 입력 특징값 저장
-            is_exoplanet=prediction.is_exoplanet,
-            classification=prediction.get_classification(),  # 분류 저장
-            confidence_score=prediction.confidence_score,
-            planet_probability=prediction.planet_probability,
-            candidate_probability=prediction.candidate_probability,
-            created_at=prediction.created_at
-        )
+        db_prediction = PredictionModel(**self.to_row(prediction))
 
         # 저장
         self.db.add(db_prediction)
-        self.db.commit()
-        self.db.refresh(db_prediction)
+        await self.db.commit()
+        await self.db.refresh(db_prediction)
+        self._invalidate_counts()
 
         # DB 모델을 도메인 엔티티로 변환하여 반환
         return self._to_domain(db_prediction)
 
+    async def save_many(self, predictions: List[Prediction]) -> List[Prediction]:
+        """
+        여러 예측을 다중 행 INSERT 한 번과 커밋 한 번으로 저장
+
+        ID와 생성 시간은 엔티티가 이미 갖고 있으므로 행마다 refresh하지 않고
+        입력 엔티티를 그대로 반환
+
+        Parameters:
+            predictions: 예측 도메인 엔티티 리스트
+
+        Returns:
+            저장된 예측 엔티티 리스트 (입력 순서 유지)
+        """
+        if not predictions:
+            return []
+
+        await self.db.execute(
+            insert(PredictionModel),
+            [self.to_row(prediction) for prediction in predictions]
+        )
+        await self.db.commit()
+        self._invalidate_counts()
+
+        return list(predictions)
+
     async def find_by_id(self, prediction_id: str) -> Optional[Prediction]:
         """
         ID로 예측 결과 조회
@@ -67,9 +91,7 @@ class PredictionRepositoryImpl(IPredictionRepository):
         Returns:
             예측 엔티티 또는 None
         """
-        db_prediction = self.db.query(PredictionModel).filter(
-            PredictionModel.id == prediction_id
-        ).first()
+        db_prediction = await self.db.get(PredictionModel, prediction_id)
 
         if db_prediction is None:
             return None
@@ -79,25 +101,74 @@ class PredictionRepositoryImpl(IPredictionRepository):
     async def find_all(
         self,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        filters: Optional[PredictionFilter] = None
     ) -> List[Prediction]:
         """
-        모든 예측 결과 조회
+        모든 예측 결과 조회 (광도 곡선은 읽지 않고 미리보기만 로드)
 
         Parameters:
             skip: 건너뛸 개수
             limit: 최대 조회 개수
+            filters: 조회 조건 (None이면 전체)
 
         Returns:
             예측 엔티티 리스트
         """
-        db_predictions = self.db.query(PredictionModel)\
-            .order_by(desc(PredictionModel.created_at))\
-            .offset(skip)\
-            .limit(limit)\
-            .all()
+        query = select(PredictionModel).options(defer(PredictionModel.light_curve_data))
+        result = await self.db.scalars(
+            self._apply_filters(query, filters)
+            .order_by(desc(PredictionModel.created_at), desc(PredictionModel.id))
+            .offset(skip)
+            .limit(limit)
+        )
+        db_predictions = result.all()
+
+        return [self._to_domain(db_pred, include_light_curve=False) for db_pred in db_predictions]
+
+    async def find_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[PageCursor] = None,
+        filters: Optional[PredictionFilter] = None
+    ) -> List[Prediction]:
+        """
+        키셋 페이지네이션 조회 (광도 곡선은 읽지 않고 미리보기만 로드)
 
-        return [self._to_domain(db_pred) for db_pred in db_predictions]
+        OFFSET 대신 (created_at, id) 인덱스에서 커서 위치부터 limit개만 읽으므로
+        깊은 페이지도 첫 페이지와 비용이 같음
+
+        Parameters:
+            limit: 최대 개수
+            cursor: 이전 페이지 마지막 행의 위치 (None이면 첫 페이지)
+            filters: 조회 조건 (None이면 전체)
+
+        Returns:
+            cursor 이후의 예측 엔티티 리스트 ((created_at, id) 내림차순)
+        """
+        query = select(PredictionModel).options(defer(PredictionModel.light_curve_data))
+
+        if cursor is not None:
+            # (created_at, id) < (cursor.created_at, cursor.id)
+            # created_at 상한을 따로 두어 모든 DB에서 인덱스 범위 검색이 되도록 작성
+            query = query.where(
+                PredictionModel.created_at <= cursor.created_at,
+                or_(
+                    PredictionModel.created_at < cursor.created_at,
+                    and_(
+                        PredictionModel.created_at == cursor.created_at,
+                        PredictionModel.id < cursor.id
+                    )
+                )
+            )
+
+        result = await self.db.scalars(
+            self._apply_filters(query, filters)
+            .order_by(desc(PredictionModel.created_at), desc(PredictionModel.id))
+            .limit(limit)
+        )
+
+        return [self._to_domain(db_pred, include_light_curve=False) for db_pred in result.all()]
 
     async def delete(self, prediction_id: str) -> bool:
         """
@@ -109,16 +180,15 @@ class PredictionRepositoryImpl(IPredictionRepository):
         Returns:
             삭제 성공 여부
         """
-        db_prediction = self.db.query(PredictionModel).filter(
-            PredictionModel.id == prediction_id
-        ).first()
+        result = await self.db.execute(
+            delete(PredictionModel).where(PredictionModel.id == prediction_id)
+        )
+        await self.db.commit()
+        self._invalidate_counts()
 
-        if db_prediction is None:
+        if result.rowcount == 0:
             return False
 
-        self.db.delete(db_prediction)
-        self.db.commit()
-
         return True
 
     async def delete_all(self) -> int:
@@ -128,20 +198,50 @@ class PredictionRepositoryImpl(IPredictionRepository):
         Returns:
             삭제된 예측 개수
         """
-        count = self.db.query(PredictionModel).count()
-        self.db.query(PredictionModel).delete()
-        self.db.commit()
+        result = await self.db.execute(delete(PredictionModel))
+        await self.db.commit()
+        self._invalidate_counts()
 
-        return count
+        return result.rowcount
 
-    async def count(self) -> int:
+    async def delete_matching(self, filters: PredictionFilter) -> int:
         """
-        전체 예측 개수 조회
+        조건에 맞는 예측 결과를 DELETE 한 번으로 삭제
+
+        Parameters:
+            filters: 삭제 조건
+
+        Returns:
+            삭제된 예측 개수
+        """
+        result = await self.db.execute(self._apply_filters(delete(PredictionModel), filters))
+        await self.db.commit()
+        self._invalidate_counts()
+
+        return result.rowcount
+
+    async def count(self, filters: Optional[PredictionFilter] = None) -> int:
+        """
+        예측 개수 조회 (count_cache가 있으면 조건별로 캐싱)
+
+        Parameters:
+            filters: 조회 조건 (None이면 전체)
 
         Returns:
             예측 개수
         """
-        return self.db.query(PredictionModel).count()
+        key = filters if filters is not None and not filters.is_empty else None
+        if self.count_cache is not None:
+            cached = self.count_cache.get(key)
+            if cached is not None:
+                return cached
+
+        query = select(func.count()).select_from(PredictionModel)
+        total = await self.db.scalar(self._apply_filters(query, key))
+
+        if self.count_cache is not None:
+            self.count_cache.put(key, total)
+        return total
 
     async def find_by_classification(
         self,
@@ -150,7 +250,7 @@ class PredictionRepositoryImpl(IPredictionRepository):
         limit: int = 100
     ) -> List[Prediction]:
         """
-        분류별 예측 조회
+        분류별 예측 조회 (광도 곡선은 읽지 않고 미리보기만 로드)
 
         Parameters:
             is_exoplanet: 외계행성 여부
@@ -160,14 +260,17 @@ class PredictionRepositoryImpl(IPredictionRepository):
         Returns:
             예측 엔티티 리스트
         """
-        db_predictions = self.db.query(PredictionModel)\
-            .filter(PredictionModel.is_exoplanet == is_exoplanet)\
-            .order_by(desc(PredictionModel.created_at))\
-            .offset(skip)\
-            .limit(limit)\
-            .all()
+        result = await self.db.scalars(
+            select(PredictionModel)
+            .options(defer(PredictionModel.light_curve_data))
+            .where(PredictionModel.is_exoplanet == is_exoplanet)
+            .order_by(desc(PredictionModel.created_at), desc(PredictionModel.id))
+            .offset(skip)
+            .limit(limit)
+        )
+        db_predictions = result.all()
 
-        return [self._to_domain(db_pred) for db_pred in db_predictions]
+        return [self._to_domain(db_pred, include_light_curve=False) for db_pred in db_predictions]
 
     async def count_by_classification(self, is_exoplanet: bool) -> int:
         """
@@ -179,23 +282,102 @@ class PredictionRepositoryImpl(IPredictionRepository):
         Returns:
             예측 개수
         """
-        return self.db.query(PredictionModel)\
-            .filter(PredictionModel.is_exoplanet == is_exoplanet)\
-            .count()
+        return await self.db.scalar(
+            select(func.count(PredictionModel.id))
+            .where(PredictionModel.is_exoplanet == is_exoplanet)
+        )
+
+    @staticmethod
+    def _apply_filters(query, filters: Optional[PredictionFilter]):
+        """
+        SELECT·DELETE 문에 조회 조건 추가
+
+        분류 조건은 목록 응답과 같은 규칙으로 판정되도록 저장된 classification 열 대신
+        is_exoplanet과 planet_probability 범위로 변환
+
+        Parameters:
+            query: select() 또는 delete() 문
+            filters: 조회 조건 (None이면 그대로 반환)
 
-    def _to_domain(self, db_prediction: PredictionModel) -> Prediction:
+        Returns:
+            WHERE 조건이 추가된 문
+        """
+        if filters is None:
+            return query
+
+        if filters.is_exoplanet is not None:
+            query = query.where(PredictionModel.is_exoplanet == filters.is_exoplanet)
+
+        bounds = filters.classification_bounds()
+        if bounds is not None:
+            is_exoplanet, min_probability, max_probability = bounds
+            query = query.where(PredictionModel.is_exoplanet == is_exoplanet)
+            if min_probability is not None:
+                query = query.where(PredictionModel.planet_probability >= min_probability)
+            if max_probability is not None:
+                query = query.where(PredictionModel.planet_probability < max_probability)
+
+        if filters.min_confidence is not None:
+            query = query.where(PredictionModel.confidence_score >= filters.min_confidence)
+        if filters.max_confidence is not None:
+            query = query.where(PredictionModel.confidence_score <= filters.max_confidence)
+
+        if filters.created_from is not None:
+            query = query.where(PredictionModel.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            query = query.where(PredictionModel.created_at < filters.created_to)
+
+        return query
+
+    def _invalidate_counts(self):
+        """저장·삭제 후 개수 캐시 비움"""
+        if self.count_cache is not None:
+            self.count_cache.clear()
+
+    @staticmethod
+    def to_row(prediction: Prediction) -> dict:
+        """
+        도메인 엔티티를 predictions 테이블 행 딕셔너리로 변환
+        (save의 ORM 모델 생성과 save_many의 다중 행 INSERT에 공용)
+
+        Parameters:
+            prediction: 예측 도메인 엔티티
+
+        Returns:
+            열 이름 → 값 딕셔너리
+        """
+        return {
+            'id': prediction.id,
+            'light_curve_data': prediction.light_curve_data,
+            'light_curve_preview': prediction.light_curve_preview,
+            'input_features': prediction.input_features,  # 입력 특징값 저장
+            'is_exoplanet': prediction.is_exoplanet,
+            'classification': prediction.get_classification(),  # 분류 저장
+            'confidence_score': prediction.confidence_score,
+            'planet_probability': prediction.planet_probability,
+            'candidate_probability': prediction.candidate_probability,
+            'created_at': prediction.created_at
+        }
+
+    def _to_domain(
+        self,
+        db_prediction: PredictionModel,
+        include_light_curve: bool = True
+    ) -> Prediction:
         """
         DB 모델을 도메인 엔티티로 변환
 
         Parameters:
             db_prediction: 데이터베이스 모델
+            include_light_curve: 광도 곡선 포함 여부 (False면 지연 로드 열을 읽지 않음)
 
         Returns:
             도메인 엔티티
         """
         return Prediction(
             id=db_prediction.id,
-            light_curve_data=db_prediction.light_curve_data,
+            light_curve_data=db_prediction.light_curve_data if include_light_curve else None,
+            light_curve_preview=db_prediction.light_curve_preview,
             input_features=db_prediction.input_features,  # 입력 특징값 로드
             is_exoplanet=db_prediction.is_exoplanet,
             confidence_score=db_prediction.confidence_score,
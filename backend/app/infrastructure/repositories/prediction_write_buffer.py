@@ -0,0 +1,270 @@
+"""
+예측 write-behind 버퍼
+요청은 저장할 예측을 큐에 넣고 바로 응답하며, 백그라운드 작업이 다중 행 INSERT로 묶어 저장
+"""
+
+import asyncio
+import os
+import time
+from itertools import islice
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...domain.entities.prediction import Prediction
+from ...domain.repositories.prediction_writer import IPredictionWriter
+from ..monitoring.metrics import (
+    WRITE_BEHIND_QUEUE_DEPTH,
+    WRITE_BEHIND_FLUSH_SECONDS,
+    WRITE_BEHIND_ROWS,
+    WRITE_BEHIND_FLUSH_ERRORS
+)
+from .prediction_repository_impl import PredictionRepositoryImpl
+
+
+class PredictionWriteBuffer(IPredictionWriter):
+    """
+    예측 write-behind 버퍼
+
+    첫 예측이 큐에 들어오면 flush_interval_ms 동안(또는 max_batch_size개가 모일 때까지)
+    더 모은 뒤, 한 세션에서 다중 행 INSERT 한 번과 커밋 한 번으로 저장.
+    요청마다 치르던 INSERT·커밋(fsync)·refresh 왕복이 배치당 한 번으로 줄어듦
+
+    - 큐는 max_queue_size개로 제한되며, 가득 차면 enqueue()가 False를 반환하여
+      해당 요청은 리포지토리로 직접 저장 (메모리 상한 + 자연스러운 역압력)
+    - 저장 전인 예측은 find_pending()으로 ID 조회 가능
+    - 연결 오류 등으로 저장에 실패한 배치는 큐에 남겨 다음 주기에 재시도하고,
+      행 자체가 거부된 경우(IntegrityError, DataError)에만 행 단위로 나눠 저장한 뒤
+      거부된 행을 버림
+    - 종료 시 close()가 남은 예측을 모두 저장
+
+    환경변수:
+        PREDICTION_WRITE_BEHIND_MS: 배치 수집 대기 시간 (ms, 기본값 0 - 비활성화, 요청마다 즉시 저장)
+        PREDICTION_WRITE_BEHIND_BATCH: 한 번에 INSERT할 최대 행 수 (기본값 500)
+        PREDICTION_WRITE_BEHIND_QUEUE: 최대 대기 예측 수 (기본값 10000)
+    """
+
+    # 저장 실패 후 재시도까지 최소 대기 시간 (초)
+    RETRY_DELAY_SECONDS = 1.0
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        flush_interval_ms: float = 0,
+        max_batch_size: int = 500,
+        max_queue_size: int = 10000
+    ):
+        """
+        Parameters:
+            session_factory: 비동기 세션 팩토리 (AsyncSessionLocal)
+            flush_interval_ms: 첫 예측 이후 배치 수집 대기 시간 (ms, 0이면 비활성화)
+            max_batch_size: 한 번에 INSERT할 최대 행 수
+            max_queue_size: 최대 대기 예측 수
+        """
+        self.session_factory = session_factory
+        self.flush_interval_ms = flush_interval_ms
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_queue_size = max_queue_size
+
+        # 삽입 순서를 유지하는 딕셔너리를 큐 겸 ID 조회용으로 사용
+        self._pending: Dict[str, Prediction] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._batch_full: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._last_flush_failed = False
+
+    @classmethod
+    def from_env(cls, session_factory: Callable[[], AsyncSession]) -> 'PredictionWriteBuffer':
+        """환경변수 설정으로 버퍼 생성"""
+        return cls(
+            session_factory=session_factory,
+            flush_interval_ms=float(os.getenv("PREDICTION_WRITE_BEHIND_MS", "0")),
+            max_batch_size=int(os.getenv("PREDICTION_WRITE_BEHIND_BATCH", "500")),
+            max_queue_size=int(os.getenv("PREDICTION_WRITE_BEHIND_QUEUE", "10000"))
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """write-behind 활성화 여부"""
+        return self.flush_interval_ms > 0 and self.max_queue_size > 0
+
+    @property
+    def pending(self) -> int:
+        """저장 대기 중인 예측 수"""
+        return len(self._pending)
+
+    def start(self):
+        """백그라운드 저장 작업 시작 (실행 중인 이벤트 루프에서 호출, 비활성화 시 무시)"""
+        if not self.enabled or self._task is not None:
+            return
+
+        self._wakeup = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._closed = False
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """새 예약을 받지 않고 남은 예측을 모두 저장한 뒤 백그라운드 작업 종료"""
+        if self._task is None:
+            return
+
+        self._closed = True
+        self._wakeup.set()
+        self._batch_full.set()
+        await self._task
+        self._task = None
+
+        await self.flush()
+        if self._pending:
+            print(f"[ERROR] 종료 시 저장하지 못한 예측 {len(self._pending)}건을 버립니다")
+            WRITE_BEHIND_ROWS.labels(outcome="dropped").inc(len(self._pending))
+            self._pending.clear()
+            WRITE_BEHIND_QUEUE_DEPTH.set(0)
+
+    def enqueue(self, prediction: Prediction) -> bool:
+        """
+        예측 저장 예약
+
+        Parameters:
+            prediction: 저장할 예측 엔티티
+
+        Returns:
+            예약 성공 여부 (비활성화, 종료 중, 큐가 가득 찬 경우 False)
+        """
+        if self._task is None or self._closed:
+            return False
+
+        if len(self._pending) >= self.max_queue_size:
+            WRITE_BEHIND_ROWS.labels(outcome="overflow").inc()
+            return False
+
+        self._pending[prediction.id] = prediction
+        WRITE_BEHIND_QUEUE_DEPTH.set(len(self._pending))
+
+        self._wakeup.set()
+        if len(self._pending) >= self.max_batch_size:
+            # 배치가 가득 차면 수집 대기 없이 즉시 저장
+            self._batch_full.set()
+        return True
+
+    def find_pending(self, prediction_id: str) -> Optional[Prediction]:
+        """
+        아직 저장되지 않은 예측 조회
+
+        Parameters:
+            prediction_id: 예측 ID
+
+        Returns:
+            대기 중인 예측 엔티티 또는 None
+        """
+        return self._pending.get(prediction_id)
+
+    async def flush(self) -> int:
+        """
+        대기 중인 예측을 모두 저장 (삭제 전 호출하여 저장 순서 보장)
+
+        Returns:
+            저장된 개수 (실패한 배치는 큐에 남음)
+        """
+        if self._flush_lock is None:
+            return 0
+        return await self._drain(len(self._pending))
+
+    async def _run(self):
+        """flush_interval_ms마다(또는 배치가 가득 차면) 대기 중인 예측 저장"""
+        while not self._closed:
+            await self._wakeup.wait()
+
+            # 첫 예측 이후 수집 대기 (배치가 가득 차거나 종료 시 즉시 진행)
+            try:
+                await asyncio.wait_for(
+                    self._batch_full.wait(),
+                    timeout=self.flush_interval_ms / 1000.0
+                )
+            except asyncio.TimeoutError:
+                pass
+
+            self._wakeup.clear()
+            self._batch_full.clear()
+
+            await self._drain(len(self._pending))
+            if self._last_flush_failed and not self._closed:
+                # 저장 실패: 남은 예측은 잠시 후 재시도
+                await asyncio.sleep(max(self.RETRY_DELAY_SECONDS, self.flush_interval_ms / 1000.0))
+                self._wakeup.set()
+
+    async def _drain(self, target: int) -> int:
+        """대기 중인 예측을 앞에서부터 target개까지 배치 단위로 저장"""
+        flushed = 0
+        async with self._flush_lock:
+            while flushed < target and self._pending:
+                count = await self._flush_batch(min(self.max_batch_size, target - flushed))
+                if count == 0:
+                    break
+                flushed += count
+        return flushed
+
+    async def _flush_batch(self, size: int) -> int:
+        """
+        큐 앞쪽 size개를 다중 행 INSERT로 저장
+
+        Returns:
+            큐에서 제거된 개수 (저장 실패 시 0)
+        """
+        ids = list(islice(self._pending, size))
+        predictions = [self._pending[id_] for id_ in ids]
+
+        start = time.perf_counter()
+        try:
+            await self._insert(predictions)
+        except (IntegrityError, DataError) as e:
+            # 배치 중 일부 행이 거부됨: 행 단위로 나눠 저장하고 거부된 행만 버림
+            WRITE_BEHIND_FLUSH_ERRORS.inc()
+            print(f"[WARN] 예측 일괄 저장 중 거부된 행이 있어 행 단위로 저장합니다: {str(e)}")
+            ids = await self._insert_individually(predictions)
+        except Exception as e:
+            WRITE_BEHIND_FLUSH_ERRORS.inc()
+            print(f"[WARN] 예측 일괄 저장 실패 ({len(predictions)}건, 재시도 예정): {str(e)}")
+            self._last_flush_failed = True
+            return 0
+        else:
+            WRITE_BEHIND_FLUSH_SECONDS.observe(time.perf_counter() - start)
+            WRITE_BEHIND_ROWS.labels(outcome="flushed").inc(len(predictions))
+
+        self._last_flush_failed = len(ids) < len(predictions)
+        for id_ in ids:
+            self._pending.pop(id_, None)
+        WRITE_BEHIND_QUEUE_DEPTH.set(len(self._pending))
+        return len(ids)
+
+    async def _insert(self, predictions: List[Prediction]):
+        """새 세션에서 리포지토리 save_many로 저장 (다중 행 INSERT + 커밋 한 번)"""
+        async with self.session_factory() as db:
+            await PredictionRepositoryImpl(db=db).save_many(predictions)
+
+    async def _insert_individually(self, predictions: List[Prediction]) -> List[str]:
+        """
+        행 단위 저장 (거부된 행은 로그를 남기고 버림)
+
+        Returns:
+            처리가 끝난(저장 또는 버린) 행의 ID 리스트
+            (연결 오류 등이 나면 그 이전 행까지만 포함하여 나머지는 재시도)
+        """
+        handled = []
+        for prediction in predictions:
+            try:
+                await self._insert([prediction])
+            except (IntegrityError, DataError) as e:
+                print(f"[ERROR] 예측 {prediction.id} 저장이 거부되어 버립니다: {str(e)}")
+                WRITE_BEHIND_ROWS.labels(outcome="dropped").inc()
+            except Exception as e:
+                print(f"[WARN] 예측 행 단위 저장 중단 (재시도 예정): {str(e)}")
+                break
+            else:
+                WRITE_BEHIND_ROWS.labels(outcome="flushed").inc()
+            handled.append(prediction.id)
+        return handled
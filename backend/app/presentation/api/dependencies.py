@@ -3,19 +3,32 @@
 FastAPI 엔드포인트에서 사용할 의존성
 """
 
+import os
 from functools import lru_cache
-from fastapi import Depends
-from sqlalchemy.orm import Session
-from ...infrastructure.database import get_db
+from pathlib import Path
+from typing import Optional
+from fastapi import Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...domain.services import IExoplanetDetector
+from ...domain.value_objects import LightCurveStoragePolicy
+from ...infrastructure.cache import FeatureCache, TTLCache
+from ...infrastructure.database import AsyncSessionLocal, get_async_db
 from ...infrastructure.ml import (
     ModelLoader,
     FeatureExtractor,
     Preprocessor,
-    ExoplanetDetectorImpl
+    InferenceExecutor,
+    ExoplanetDetectorImpl,
+    ModelRuntime,
+    ModelRegistry,
+    TransitSearch,
+    LightCurveDetrender,
+    StreamingFeatureExtractor
 )
-from ...infrastructure.repositories import PredictionRepositoryImpl
+from ...infrastructure.repositories import PredictionRepositoryImpl, PredictionWriteBuffer
 from ...application.use_cases import (
     PredictExoplanetUseCase,
+    PredictExoplanetBatchUseCase,
     GetPredictionsUseCase,
     GetPredictionByIdUseCase,
     DeletePredictionUseCase,
@@ -23,81 +36,226 @@ from ...application.use_cases import (
 )
 
 
+# 모델 파일 설정
+MODEL_DIR = "models"
+MODEL_NAME = os.getenv("MODEL_NAME", "exoplanet_model.pkl")
+SCALER_NAME = "scaler.pkl"
+
+
 # 싱글톤 인스턴스를 위한 캐시
 @lru_cache()
-def get_model_loader() -> ModelLoader:
-    """모델 로더 싱글톤"""
-    return ModelLoader(model_dir="models")
+def get_feature_extractor() -> FeatureExtractor:
+    """특징 추출기 싱글톤 (DETREND_* 환경변수로 추세 제거, TRANSIT_SEARCH_*로 BLS 트랜짓 탐색 설정)"""
+    return FeatureExtractor(
+        transit_search=TransitSearch.from_env(),
+        detrender=LightCurveDetrender.from_env()
+    )
 
 
 @lru_cache()
-def get_feature_extractor() -> FeatureExtractor:
-    """특징 추출기 싱글톤"""
-    return FeatureExtractor()
+def get_streaming_feature_extractor() -> StreamingFeatureExtractor:
+    """스트리밍 특징 추출기 싱글톤 (STREAMING_* 환경변수로 설정)"""
+    return StreamingFeatureExtractor.from_env(get_feature_extractor())
+
+
+@lru_cache()
+def get_light_curve_storage_policy() -> LightCurveStoragePolicy:
+    """
+    광도 곡선 저장 정책 싱글톤
+
+    LIGHT_CURVE_STORAGE (full, lttb, minmax, features), LIGHT_CURVE_STORAGE_POINTS,
+    LIGHT_CURVE_PREVIEW_POINTS 환경변수로 설정
+    """
+    return LightCurveStoragePolicy(
+        mode=os.getenv("LIGHT_CURVE_STORAGE", "full").lower(),
+        max_points=int(os.getenv("LIGHT_CURVE_STORAGE_POINTS", "2000")),
+        preview_points=int(os.getenv("LIGHT_CURVE_PREVIEW_POINTS", "100"))
+    )
 
 
 @lru_cache()
-def get_preprocessor() -> Preprocessor:
-    """전처리기 싱글톤"""
-    return Preprocessor()
+def get_feature_cache() -> FeatureCache:
+    """특징값 캐시 싱글톤 (모델 교체·버전 간 공유, FEATURE_CACHE_* 환경변수로 설정)"""
+    return FeatureCache.from_env()
 
 
 @lru_cache()
-def get_exoplanet_detector() -> ExoplanetDetectorImpl:
-    """외계행성 탐지기 싱글톤"""
-    model_loader = get_model_loader()
-    feature_extractor = get_feature_extractor()
-    preprocessor = get_preprocessor()
+def get_inference_executor() -> InferenceExecutor:
+    """추론 실행기 싱글톤 (INFERENCE_* 환경변수로 설정)"""
+    return InferenceExecutor.from_env()
+
+
+def _build_exoplanet_detector(
+    model_dir: str = MODEL_DIR,
+    model_name: str = MODEL_NAME
+) -> ExoplanetDetectorImpl:
+    """
+    새 모델 로더·전처리기로 탐지기 생성
+    최초 로드, 핫 리로드, 레지스트리 버전 로드에 사용 (블로킹)
+
+    Parameters:
+        model_dir: 모델 번들 디렉터리
+        model_name: 모델 파일 이름
+    """
+    model_loader = ModelLoader(model_dir=model_dir)
+    model_loader.load_all(model_name=model_name, scaler_name=SCALER_NAME)
+
+    preprocessor = Preprocessor()
+    preprocessor.set_scaler(model_loader.get_scaler())
 
     return ExoplanetDetectorImpl(
         model_loader=model_loader,
-        feature_extractor=feature_extractor,
-        preprocessor=preprocessor
+        feature_extractor=get_feature_extractor(),
+        preprocessor=preprocessor,
+        executor=get_inference_executor(),
+        feature_cache=get_feature_cache()
+    )
+
+
+@lru_cache()
+def get_model_runtime() -> ModelRuntime:
+    """모델 런타임 싱글톤 (현재 탐지기 보관 및 핫 리로드)"""
+    return ModelRuntime.from_env(
+        detector_factory=_build_exoplanet_detector,
+        model_dir=MODEL_DIR,
+        watched_files=(MODEL_NAME, ModelLoader.compiled_model_name(MODEL_NAME), SCALER_NAME)
+    )
+
+
+@lru_cache()
+def get_model_registry() -> ModelRegistry:
+    """모델 레지스트리 싱글톤 (models/registry/<version>/ 번들, MODEL_REGISTRY_* 등 환경변수로 설정)"""
+    return ModelRegistry.from_env(
+        runtime=get_model_runtime(),
+        registry_dir=str(Path(MODEL_DIR) / "registry"),
+        detector_factory=_build_exoplanet_detector
     )
 
 
+def get_exoplanet_detector() -> ExoplanetDetectorImpl:
+    """
+    현재 외계행성 탐지기
+
+    최초 호출 시 모델을 로드하며, 핫 리로드 후에는 새 탐지기를 반환.
+    요청은 받은 탐지기를 끝까지 사용하므로 교체 중에도 이전 모델로 완료됨
+    """
+    return get_model_runtime().get_detector()
+
+
+@lru_cache()
+def get_prediction_count_cache() -> TTLCache:
+    """
+    조건별 예측 개수 캐시 싱글톤
+
+    PREDICTION_COUNT_CACHE_TTL초(기본값 5, 0이면 비활성화) 동안 목록 total을 재사용.
+    API로 저장·삭제하면 비우며, write-behind 저장이나 다른 워커의 변경은 TTL 이내에 반영
+    """
+    ttl_seconds = float(os.getenv("PREDICTION_COUNT_CACHE_TTL", "5"))
+    return TTLCache(
+        "prediction_count",
+        max_size=256 if ttl_seconds > 0 else 0,
+        ttl_seconds=ttl_seconds
+    )
+
+
+@lru_cache()
+def get_prediction_writer() -> PredictionWriteBuffer:
+    """
+    예측 write-behind 버퍼 싱글톤 (PREDICTION_WRITE_BEHIND_* 환경변수로 설정)
+
+    lifespan에서 start()로 시작하고 종료 시 close()로 남은 예측을 저장
+    """
+    return PredictionWriteBuffer.from_env(session_factory=AsyncSessionLocal)
+
+
 # Use Case 의존성
-def get_prediction_repository(db: Session = Depends(get_db)) -> PredictionRepositoryImpl:
+def get_prediction_repository(db: AsyncSession = Depends(get_async_db)) -> PredictionRepositoryImpl:
     """예측 리포지토리"""
-    return PredictionRepositoryImpl(db=db)
+    return PredictionRepositoryImpl(db=db, count_cache=get_prediction_count_cache())
+
+
+async def get_selected_detector(
+    response: Response,
+    model_version: Optional[str] = Query(
+        None,
+        description="사용할 모델 버전 (미지정 시 기본 모델, 카나리 설정 시 일부 요청은 카나리 버전)"
+    )
+) -> IExoplanetDetector:
+    """
+    요청별 모델 버전 선택
+
+    사용된 버전은 X-Model-Version 응답 헤더로 반환
+
+    Raises:
+        HTTPException: 존재하지 않는 버전 (404)
+    """
+    try:
+        detector, version = await get_model_registry().select(model_version)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+    response.headers["X-Model-Version"] = version
+    return detector
 
 
 def get_predict_exoplanet_use_case(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    detector: IExoplanetDetector = Depends(get_selected_detector)
 ) -> PredictExoplanetUseCase:
     """예측 Use Case"""
-    detector = get_exoplanet_detector()
-    repository = PredictionRepositoryImpl(db=db)
-    return PredictExoplanetUseCase(detector=detector, repository=repository)
+    repository = PredictionRepositoryImpl(db=db, count_cache=get_prediction_count_cache())
+    return PredictExoplanetUseCase(
+        detector=detector,
+        repository=repository,
+        storage_policy=get_light_curve_storage_policy(),
+        writer=get_prediction_writer()
+    )
+
+
+def get_predict_exoplanet_batch_use_case(
+    db: AsyncSession = Depends(get_async_db),
+    detector: IExoplanetDetector = Depends(get_selected_detector)
+) -> PredictExoplanetBatchUseCase:
+    """일괄 예측 Use Case"""
+    repository = PredictionRepositoryImpl(db=db, count_cache=get_prediction_count_cache())
+    return PredictExoplanetBatchUseCase(
+        detector=detector,
+        repository=repository,
+        storage_policy=get_light_curve_storage_policy(),
+        writer=get_prediction_writer()
+    )
 
 
 def get_get_predictions_use_case(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> GetPredictionsUseCase:
     """예측 목록 조회 Use Case"""
-    repository = PredictionRepositoryImpl(db=db)
+    repository = PredictionRepositoryImpl(db=db, count_cache=get_prediction_count_cache())
     return GetPredictionsUseCase(repository=repository)
 
 
 def get_get_prediction_by_id_use_case(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> GetPredictionByIdUseCase:
     """예측 단건 조회 Use Case"""
-    repository = PredictionRepositoryImpl(db=db)
-    return GetPredictionByIdUseCase(repository=repository)
+    repository = PredictionRepositoryImpl(db=db, count_cache=get_prediction_count_cache())
+    return GetPredictionByIdUseCase(repository=repository, writer=get_prediction_writer())
 
 
 def get_delete_prediction_use_case(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> DeletePredictionUseCase:
     """예측 삭제 Use Case"""
-    repository = PredictionRepositoryImpl(db=db)
-    return DeletePredictionUseCase(repository=repository)
+    repository = PredictionRepositoryImpl(db=db, count_cache=get_prediction_count_cache())
+    return DeletePredictionUseCase(repository=repository, writer=get_prediction_writer())
 
 
 def get_delete_all_predictions_use_case(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> DeleteAllPredictionsUseCase:
     """전체 예측 삭제 Use Case"""
-    repository = PredictionRepositoryImpl(db=db)
-    return DeleteAllPredictionsUseCase(repository=repository)
+    repository = PredictionRepositoryImpl(db=db, count_cache=get_prediction_count_cache())
+    return DeleteAllPredictionsUseCase(repository=repository, writer=get_prediction_writer())
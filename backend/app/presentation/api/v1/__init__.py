@@ -1,6 +1,6 @@
 """API v1"""
 from fastapi import APIRouter
-from .endpoints import predictions, health, statistics
+from .endpoints import predictions, health, statistics, light_curves
 
 # v1 라우터 생성
 api_router = APIRouter()
@@ -9,5 +9,6 @@ api_router = APIRouter()
 api_router.include_router(health.router)
 api_router.include_router(predictions.router)
 api_router.include_router(statistics.router)
+api_router.include_router(light_curves.router)
 
 __all__ = ['api_router']
@@ -1,4 +1,4 @@
 """API Endpoints"""
-from . import predictions, health
+from . import predictions, health, light_curves
 
-__all__ = ['predictions', 'health']
+__all__ = ['predictions', 'health', 'light_curves']
@@ -2,9 +2,12 @@
 헬스 체크 및 모델 정보 API
 """
 
-from fastapi import APIRouter, Depends
-from ...dependencies import get_exoplanet_detector
-from .....infrastructure.ml import ExoplanetDetectorImpl
+import os
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from ...dependencies import get_exoplanet_detector, get_model_runtime, get_model_registry
+from .....infrastructure.ml import ExoplanetDetectorImpl, ModelRuntime, ModelRegistry
 
 
 router = APIRouter(tags=["health"])
@@ -15,20 +18,64 @@ router = APIRouter(tags=["health"])
     summary="헬스 체크",
     description="서버 상태를 확인합니다."
 )
-async def health_check():
+async def health_check(request: Request):
     """
     헬스 체크 API
 
     **Returns:**
     - 서버 상태 정보
+    - 모델 로드/워밍업 상태 (ready가 false이면 아직 예측 요청을 받을 준비가 안 됨)
     """
+    model_startup = getattr(request.app.state, "model_startup", None)
+
     return {
         "status": "healthy",
         "service": "Exoplanet Detection API",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "model": model_startup.to_dict() if model_startup else None
     }
 
 
+@router.get(
+    "/health/live",
+    summary="Liveness 프로브",
+    description="프로세스가 요청에 응답할 수 있는지 확인합니다. (외부 의존성은 점검하지 않음)"
+)
+async def liveness():
+    """
+    Liveness 프로브 API
+
+    **Returns:**
+    - 항상 alive (이벤트 루프가 멈추면 응답하지 못하므로 재시작 대상이 됨)
+    """
+    return {"status": "alive"}
+
+
+@router.get(
+    "/health/ready",
+    summary="Readiness 프로브",
+    description="모델 로드·워밍업, DB 연결, 추론 대기열 상태를 점검합니다. 준비되지 않았으면 503을 반환합니다.",
+    responses={503: {"description": "트래픽을 받을 준비가 되지 않음"}}
+)
+async def readiness(request: Request, response: Response):
+    """
+    Readiness 프로브 API
+
+    **Returns:**
+    - ready: 준비 여부
+    - checks: 항목별 점검 결과 (model, warmup, database, inference_queue)
+    """
+    probe = getattr(request.app.state, "readiness_probe", None)
+    if probe is None:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"ready": False, "status": "starting", "checks": {}}
+
+    result = await probe.check(getattr(request.app.state, "model_startup", None))
+    if not result['ready']:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return result
+
+
 @router.get(
     "/model/info",
     summary="모델 정보 조회",
@@ -45,6 +92,8 @@ async def get_model_info(
     """
     try:
         model_info = detector.get_model_info()
+        model_info['runtime'] = get_model_runtime().status()
+        model_info['registry'] = get_model_registry().status()
         return {
             "status": "success",
             "model_info": model_info
@@ -54,3 +103,93 @@ async def get_model_info(
             "status": "error",
             "message": str(e)
         }
+
+
+@router.get(
+    "/model/versions",
+    summary="모델 버전 목록 조회",
+    description=(
+        "모델 레지스트리(models/registry/<version>/)의 버전 목록을 조회합니다. "
+        "예측 API에 ?model_version=<version>을 지정하여 버전을 선택할 수 있습니다."
+    )
+)
+async def list_model_versions(
+    registry: ModelRegistry = Depends(get_model_registry)
+):
+    """
+    모델 버전 목록 조회 API
+
+    **Returns:**
+    - versions: 버전별 정보 (상주 여부, 추정 크기, 학습 메타데이터)
+    - registry: 상주 버전, 메모리 예산, 카나리/섀도 설정
+    """
+    try:
+        return {
+            "status": "success",
+            "versions": registry.list_versions(),
+            "registry": registry.status()
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"모델 버전 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post(
+    "/model/reload",
+    summary="모델 핫 리로드",
+    description=(
+        "모델 디렉터리의 모델을 다시 로드합니다. 새 모델은 백그라운드에서 로드·워밍업·골든 샘플 검증을 거친 뒤 "
+        "원자적으로 교체되며, 진행 중인 요청은 이전 모델로 완료됩니다. "
+        "MODEL_ADMIN_TOKEN이 설정되어 있으면 X-Admin-Token 헤더가 필요합니다."
+    ),
+    responses={
+        400: {"description": "새 모델 검증 실패 (기존 모델 유지)"},
+        403: {"description": "관리자 토큰 불일치"},
+        409: {"description": "이미 리로드 진행 중"}
+    }
+)
+async def reload_model(
+    x_admin_token: Optional[str] = Header(None),
+    runtime: ModelRuntime = Depends(get_model_runtime)
+):
+    """
+    모델 핫 리로드 API
+
+    **Returns:**
+    - 리로드 결과 (이전/새 버전, 로드·워밍업 시간, 검증 결과)
+    """
+    admin_token = os.getenv("MODEL_ADMIN_TOKEN")
+    if admin_token and not secrets.compare_digest(x_admin_token or "", admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 토큰이 올바르지 않습니다"
+        )
+
+    try:
+        result = await runtime.reload(reason="manual")
+        return {
+            "status": "success",
+            "reload": result
+        }
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except RuntimeError as e:
+        if runtime.status()['reloading']:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=str(e)
+            )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"모델 리로드 중 오류가 발생했습니다: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"모델 리로드 중 오류가 발생했습니다: {str(e)}"
+        )
@@ -0,0 +1,122 @@
+"""
+광도 곡선 분석 API 엔드포인트
+"""
+
+import math
+from typing import List, Optional
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException
+
+from .....application.use_cases import GetPredictionByIdUseCase
+from .....domain.entities.light_curve import LightCurve
+from .....infrastructure.ml import FeatureExtractor, InferenceExecutor, InferenceQueueFullError
+from ...dependencies import (
+    get_feature_extractor,
+    get_inference_executor,
+    get_get_prediction_by_id_use_case
+)
+from ..schemas import FoldRequestSchema, FoldedLightCurveSchema
+
+
+router = APIRouter(prefix="/light-curves", tags=["light-curves"])
+
+
+@router.post(
+    "/fold",
+    response_model=FoldedLightCurveSchema,
+    summary="광도 곡선 위상 접기",
+    description="광도 곡선을 트랜짓 주기로 접어 고정 길이 bin 곡선과 "
+                "2차 특징(홀짝 깊이 차이, 2차 식 깊이, 트랜짓 모양)을 반환합니다."
+)
+async def fold_light_curve(
+    request: FoldRequestSchema,
+    feature_extractor: FeatureExtractor = Depends(get_feature_extractor),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+    prediction_use_case: GetPredictionByIdUseCase = Depends(get_get_prediction_by_id_use_case)
+):
+    """
+    광도 곡선 위상 접기 API
+
+    **Parameters:**
+    - light_curve_data: 광도 곡선 데이터 (time, flux, flux_err)
+    - prediction_id: 광도 곡선이 저장된 예측 ID (light_curve_data 대신 사용)
+    - period, epoch, duration_hours: 트랜짓 주기 정보 (생략 시 BLS 탐색)
+    - bins: 위상 bin 수 (기본값: 200)
+
+    **Returns:**
+    - bin 곡선 (phase, flux, flux_err, counts)과 2차 특징
+    """
+    try:
+        # 1. 광도 곡선 데이터 (요청 본문 또는 저장된 예측)
+        light_curve_data = request.light_curve_data
+        if light_curve_data is None:
+            if request.prediction_id is None:
+                raise ValueError("light_curve_data 또는 prediction_id 중 하나는 필수입니다")
+
+            prediction = await prediction_use_case.execute(request.prediction_id)
+            if prediction is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"예측 ID {request.prediction_id}를 찾을 수 없습니다"
+                )
+            light_curve_data = prediction.light_curve_data
+            if not light_curve_data:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"예측 ID {request.prediction_id}에 저장된 광도 곡선이 없습니다"
+                )
+
+        if 'time' not in light_curve_data or 'flux' not in light_curve_data:
+            raise ValueError("광도 곡선 데이터에 time, flux가 필요합니다")
+
+        light_curve = LightCurve(
+            time=light_curve_data['time'],
+            flux=light_curve_data['flux'],
+            flux_err=light_curve_data.get('flux_err')
+        )
+
+        # 2. 위상 접기 (추세 제거·BLS 탐색 포함, 실행기 풀에서 계산)
+        duration = request.duration_hours / 24.0 if request.duration_hours is not None else None
+        folded, search_result = await executor.run(
+            feature_extractor.fold_light_curve,
+            light_curve,
+            request.period,
+            request.epoch,
+            duration,
+            request.bins
+        )
+
+        return FoldedLightCurveSchema(
+            period=folded.period,
+            epoch=folded.epoch,
+            duration_hours=folded.duration * 24.0,
+            searched=search_result is not None,
+            signal_to_noise=search_result.signal_to_noise if search_result else None,
+            phase=folded.phase.tolist(),
+            flux=_finite_or_none(folded.flux),
+            flux_err=_finite_or_none(folded.flux_err),
+            counts=folded.counts.tolist(),
+            features={
+                name: value if math.isfinite(value) else None
+                for name, value in folded.features.items()
+            }
+        )
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except InferenceQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"위상 접기 중 오류 발생: {str(e)}")
+
+
+def _finite_or_none(values: np.ndarray) -> List[Optional[float]]:
+    """NaN을 None(JSON null)으로 바꾼 리스트"""
+    return [value if math.isfinite(value) else None for value in values.tolist()]
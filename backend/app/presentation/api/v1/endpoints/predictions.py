@@ -2,18 +2,33 @@
 예측 API 엔드포인트
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+from datetime import datetime
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from typing import Optional
 from .....application.dto import PredictionRequest
 from .....application.use_cases import (
     PredictExoplanetUseCase,
+    PredictExoplanetBatchUseCase,
     GetPredictionsUseCase,
     GetPredictionByIdUseCase,
     DeletePredictionUseCase,
     DeleteAllPredictionsUseCase
 )
+from .....domain.value_objects import PredictionFilter
+from .....infrastructure.ml import (
+    InferenceExecutor,
+    InferenceQueueFullError,
+    StreamingFeatureExtractor,
+    UnsupportedFormatError,
+    iter_csv_chunks,
+    read_light_curve
+)
 from ...dependencies import (
+    get_inference_executor,
+    get_streaming_feature_extractor,
     get_predict_exoplanet_use_case,
+    get_predict_exoplanet_batch_use_case,
     get_get_predictions_use_case,
     get_get_prediction_by_id_use_case,
     get_delete_prediction_use_case,
@@ -23,6 +38,8 @@ from ..schemas import (
     PredictionRequestSchema,
     PredictionResponseSchema,
     PredictionsListResponseSchema,
+    BatchPredictionRequestSchema,
+    BatchPredictionResponseSchema,
     DeleteResponseSchema
 )
 
@@ -69,47 +86,253 @@ async def predict_exoplanet(
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except InferenceQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"예측 중 오류 발생: {str(e)}")
 
 
+@router.post(
+    "/batch",
+    response_model=BatchPredictionResponseSchema,
+    status_code=201,
+    summary="외계행성 일괄 예측",
+    description="여러 개의 광도 곡선 또는 특징값을 한 번의 모델 호출로 예측합니다."
+)
+async def predict_exoplanet_batch(
+    request: BatchPredictionRequestSchema,
+    use_case: PredictExoplanetBatchUseCase = Depends(get_predict_exoplanet_batch_use_case)
+):
+    """
+    외계행성 일괄 예측 API
+
+    **Parameters:**
+    - items: 예측할 항목 목록 (각 항목은 light_curve_data 또는 features)
+    - save_result: 결과 저장 여부 (기본값: True)
+
+    **Returns:**
+    - 요청 순서와 동일한 예측 결과 리스트
+    """
+    try:
+        # DTO 생성
+        prediction_requests = [
+            PredictionRequest(
+                light_curve_data=item.light_curve_data,
+                features=item.features
+            )
+            for item in request.items
+        ]
+
+        # Use Case 실행
+        results = await use_case.execute(
+            requests=prediction_requests,
+            save_result=request.save_result
+        )
+
+        return BatchPredictionResponseSchema(
+            predictions=results,
+            total=len(results)
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except InferenceQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"일괄 예측 중 오류 발생: {str(e)}")
+
+
+@router.post(
+    "/stream",
+    response_model=PredictionResponseSchema,
+    status_code=201,
+    summary="대용량 광도 곡선 스트리밍 예측",
+    description="CSV 광도 곡선 파일을 청크 단위로 읽어 특징을 누적 계산한 뒤 예측합니다. "
+                "다른 예측 API와 같은 추세 제거·시그마 클리핑을 적용하며(시간 오름차순 파일 필요), "
+                "곡선 길이와 무관하게 메모리 사용량이 일정합니다."
+)
+async def predict_exoplanet_stream(
+    file: UploadFile = File(..., description="time, flux[, flux_err] 열을 가진 CSV 파일"),
+    save_result: bool = Query(True, description="결과 저장 여부"),
+    streaming_extractor: StreamingFeatureExtractor = Depends(get_streaming_feature_extractor),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+    use_case: PredictExoplanetUseCase = Depends(get_predict_exoplanet_use_case)
+):
+    """
+    대용량 광도 곡선 스트리밍 예측 API
+
+    **Parameters:**
+    - file: CSV 광도 곡선 파일 (첫 줄 열 이름, time/flux 필수, flux_err 선택, 추세 제거 시 시간 오름차순)
+    - save_result: 결과 저장 여부 (기본값: True)
+
+    **Returns:**
+    - 예측 결과 (추출된 특징값이 input_features로 저장됨, 원본 광도 곡선은 저장하지 않음)
+    """
+    try:
+        # 1. 청크 단위 특징 추출 (실행기 풀에서 파일을 읽으며 누적)
+        #    추세 제거 클리핑 기준을 구하려고 업로드 파일을 처음부터 다시 읽을 수 있음.
+        #    프로세스 풀에는 업로드 파일을 읽는 반복자를 전달할 수 없으므로 스레드에서 실행
+        def open_chunks():
+            file.file.seek(0)
+            return iter_csv_chunks(file.file, streaming_extractor.chunk_rows)
+
+        if executor.uses_processes:
+            features = await asyncio.to_thread(streaming_extractor.extract, open_chunks)
+        else:
+            features = await executor.run(streaming_extractor.extract, open_chunks)
+
+        # 2. 특징값으로 예측
+        result = await use_case.execute(
+            request=PredictionRequest(features=features),
+            save_result=save_result
+        )
+
+        return result
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except InferenceQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스트리밍 예측 중 오류 발생: {str(e)}")
+    finally:
+        await file.close()
+
+
+@router.post(
+    "/upload",
+    response_model=PredictionResponseSchema,
+    status_code=201,
+    summary="광도 곡선 파일 업로드 예측",
+    description="Kepler/TESS FITS, .npy/.npz, Arrow IPC 광도 곡선 파일을 업로드하여 예측합니다. "
+                "JSON 리스트 대신 바이너리 열을 그대로 읽으므로 요청 크기와 파싱 시간이 작습니다."
+)
+async def predict_exoplanet_upload(
+    file: UploadFile = File(..., description="광도 곡선 파일 (fits, npy, npz, arrow)"),
+    file_format: Optional[str] = Query(
+        None, alias="format", description="파일 형식 (생략 시 내용과 확장자로 자동 판별)"
+    ),
+    save_result: bool = Query(True, description="결과 저장 여부"),
+    executor: InferenceExecutor = Depends(get_inference_executor),
+    use_case: PredictExoplanetUseCase = Depends(get_predict_exoplanet_use_case)
+):
+    """
+    광도 곡선 파일 업로드 예측 API
+
+    **Parameters:**
+    - file: 광도 곡선 파일 (FITS는 TIME + PDCSAP_FLUX/SAP_FLUX 열, 나머지는 time, flux[, flux_err])
+    - format: 파일 형식 (fits, npy, npz, arrow)
+    - save_result: 결과 저장 여부 (기본값: True)
+
+    **Returns:**
+    - 예측 결과 (`/predictions/`와 동일)
+    """
+    try:
+        # 1. 파일 → 광도 곡선 엔티티 (실행기 풀에서 디코딩)
+        data = await file.read()
+        light_curve = await executor.run(read_light_curve, data, file.filename, file_format)
+
+        # 2. Use Case 실행
+        result = await use_case.execute_light_curve(
+            light_curve=light_curve,
+            save_result=save_result
+        )
+
+        return result
+
+    except UnsupportedFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except InferenceQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"파일 예측 중 오류 발생: {str(e)}")
+    finally:
+        await file.close()
+
+
 @router.get(
     "/",
     response_model=PredictionsListResponseSchema,
     summary="예측 목록 조회",
-    description="저장된 모든 예측 결과를 조회합니다."
+    description="저장된 예측 결과를 최신순으로 조회합니다. 필터는 DB 쿼리에서 적용되며 "
+                "total은 조건에 맞는 전체 개수입니다. "
+                "다음 페이지는 응답의 next_cursor를 cursor로 전달하여 조회합니다."
 )
 async def get_predictions(
-    skip: int = Query(0, ge=0, description="건너뛸 개수"),
+    skip: int = Query(0, ge=0, description="건너뛸 개수 (cursor 지정 시 무시)"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 개수"),
     is_exoplanet: Optional[bool] = Query(None, description="외계행성 여부 필터"),
+    classification: Optional[str] = Query(
+        None,
+        description="분류 필터 (CONFIRMED, LIKELY_CONFIRMED, CANDIDATE, FALSE_POSITIVE)"
+    ),
+    min_confidence: Optional[float] = Query(None, ge=0.0, le=1.0, description="최소 신뢰도 점수 (포함)"),
+    max_confidence: Optional[float] = Query(None, ge=0.0, le=1.0, description="최대 신뢰도 점수 (포함)"),
+    created_from: Optional[datetime] = Query(None, description="생성 시간 하한 (포함, ISO 8601, 시간대 없으면 UTC)"),
+    created_to: Optional[datetime] = Query(None, description="생성 시간 상한 (미포함, ISO 8601, 시간대 없으면 UTC)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (키셋 페이지네이션)"),
     use_case: GetPredictionsUseCase = Depends(get_get_predictions_use_case)
 ):
     """
     예측 목록 조회 API
 
     **Parameters:**
-    - skip: 건너뛸 개수 (페이지네이션)
+    - skip: 건너뛸 개수 (OFFSET 페이지네이션, cursor 지정 시 무시)
     - limit: 조회할 개수 (최대 1000)
     - is_exoplanet: 외계행성 여부 필터 (True/False/None)
+    - classification: 분류 필터
+    - min_confidence, max_confidence: 신뢰도 점수 범위
+    - created_from, created_to: 생성 시간 범위
+    - cursor: 이전 응답의 next_cursor (깊은 페이지도 첫 페이지와 같은 비용)
 
     **Returns:**
-    - 예측 결과 리스트
+    - 예측 결과 리스트, 조건에 맞는 전체 개수, 다음 페이지 커서
     """
     try:
-        predictions = await use_case.execute(
-            skip=skip,
-            limit=limit,
-            is_exoplanet=is_exoplanet
+        filters = PredictionFilter(
+            is_exoplanet=is_exoplanet,
+            classification=classification.upper() if classification else None,
+            min_confidence=min_confidence,
+            max_confidence=max_confidence,
+            created_from=created_from,
+            created_to=created_to
         )
 
+        # 첫 페이지와 커서 지정 시 키셋 페이지네이션, skip 지정 시 기존 OFFSET 조회
+        if cursor is not None or skip == 0:
+            page = await use_case.execute_page(limit=limit, cursor=cursor, filters=filters)
+            skip = 0
+        else:
+            page = await use_case.execute(skip=skip, limit=limit, filters=filters)
+
         return PredictionsListResponseSchema(
-            predictions=predictions,
-            total=len(predictions),
+            predictions=page.predictions,
+            total=page.total,
             skip=skip,
-            limit=limit
+            limit=limit,
+            next_cursor=page.next_cursor
         )
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"조회 중 오류 발생: {str(e)}")
 
@@ -10,7 +10,7 @@ import numpy as np
 import joblib
 from pathlib import Path
 from .....infrastructure.database.models import PredictionModel
-from ...dependencies import get_db
+from .....infrastructure.database import get_db
 
 
 router = APIRouter(prefix="/statistics", tags=["statistics"])
@@ -3,12 +3,21 @@ from .prediction_schemas import (
     PredictionRequestSchema,
     PredictionResponseSchema,
     PredictionsListResponseSchema,
+    BatchPredictionItemSchema,
+    BatchPredictionRequestSchema,
+    BatchPredictionResponseSchema,
     DeleteResponseSchema
 )
+from .light_curve_schemas import FoldRequestSchema, FoldedLightCurveSchema
 
 __all__ = [
     'PredictionRequestSchema',
     'PredictionResponseSchema',
     'PredictionsListResponseSchema',
-    'DeleteResponseSchema'
+    'BatchPredictionItemSchema',
+    'BatchPredictionRequestSchema',
+    'BatchPredictionResponseSchema',
+    'DeleteResponseSchema',
+    'FoldRequestSchema',
+    'FoldedLightCurveSchema'
 ]
@@ -0,0 +1,78 @@
+"""
+광도 곡선 분석 스키마
+위상 접기 요청/응답 검증 및 직렬화
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
+
+
+class FoldRequestSchema(BaseModel):
+    """
+    위상 접기 요청 스키마
+
+    광도 곡선 데이터 또는 저장된 예측 ID 중 하나는 필수.
+    주기를 생략하면 BLS 탐색으로 주기, 트랜짓 시각, 지속 시간을 찾음
+    """
+    light_curve_data: Optional[Dict] = Field(
+        None,
+        description="광도 곡선 데이터 (time, flux, flux_err)"
+    )
+    prediction_id: Optional[str] = Field(
+        None,
+        description="광도 곡선이 저장된 예측 ID"
+    )
+    period: Optional[float] = Field(
+        None,
+        gt=0,
+        description="궤도 주기 (일, 생략 시 BLS 탐색)"
+    )
+    epoch: Optional[float] = Field(
+        None,
+        description="트랜짓 중심 시각 (주기를 지정한 경우 필수)"
+    )
+    duration_hours: Optional[float] = Field(
+        None,
+        gt=0,
+        description="트랜짓 지속 시간 (시간, 주기를 지정한 경우 필수)"
+    )
+    bins: int = Field(
+        200,
+        ge=1,
+        le=2000,
+        description="위상 bin 수 (응답 배열 길이)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "prediction_id": "550e8400-e29b-41d4-a716-446655440000",
+                "period": 3.52,
+                "epoch": 1.25,
+                "duration_hours": 2.4,
+                "bins": 200
+            }
+        }
+
+
+class FoldedLightCurveSchema(BaseModel):
+    """
+    위상 접기 응답 스키마
+
+    phase, flux, flux_err, counts는 길이가 bins인 배열이며
+    점이 없는 bin의 flux, 점이 2개 미만인 bin의 flux_err는 null
+    """
+    period: float = Field(..., description="궤도 주기 (일)")
+    epoch: float = Field(..., description="트랜짓 중심 시각")
+    duration_hours: float = Field(..., description="트랜짓 지속 시간 (시간)")
+    searched: bool = Field(..., description="BLS 탐색으로 주기를 찾았는지 여부")
+    signal_to_noise: Optional[float] = Field(None, description="BLS 신호 대 잡음비 (탐색한 경우)")
+    phase: List[float] = Field(..., description="bin 중심 위상 (-0.5 ~ 0.5, 0이 트랜짓 중심)")
+    flux: List[Optional[float]] = Field(..., description="bin 평균 상대 밝기")
+    flux_err: List[Optional[float]] = Field(..., description="bin 평균의 표준 오차")
+    counts: List[int] = Field(..., description="bin별 점 수")
+    features: Dict[str, Optional[float]] = Field(
+        ...,
+        description="2차 특징 (depth, odd_depth, even_depth, odd_even_significance, "
+                    "secondary_depth, transit_shape)"
+    )
@@ -3,11 +3,16 @@ Pydantic 스키마
 API 요청/응답 검증 및 직렬화
 """
 
+import os
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 from datetime import datetime
 
 
+# 일괄 예측 요청당 최대 항목 수
+MAX_BATCH_SIZE = int(os.getenv("BATCH_PREDICTION_MAX_SIZE", "10000"))
+
+
 class PredictionRequestSchema(BaseModel):
     """
     예측 요청 스키마
@@ -49,6 +54,59 @@ class PredictionRequestSchema(BaseModel):
         }
 
 
+class BatchPredictionItemSchema(BaseModel):
+    """
+    일괄 예측 항목 스키마
+
+    광도 곡선 데이터 또는 특징값 중 하나는 필수
+    """
+    light_curve_data: Optional[Dict] = Field(
+        None,
+        description="광도 곡선 데이터 (time, flux, flux_err)"
+    )
+    features: Optional[Dict[str, float]] = Field(
+        None,
+        description="추출된 특징값"
+    )
+
+
+class BatchPredictionRequestSchema(BaseModel):
+    """일괄 예측 요청 스키마"""
+    items: List[BatchPredictionItemSchema] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description=f"예측할 항목 목록 (최대 {MAX_BATCH_SIZE}개)"
+    )
+    save_result: bool = Field(
+        True,
+        description="예측 결과를 데이터베이스에 저장할지 여부"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {
+                        "features": {
+                            "orbital_period": 3.5,
+                            "transit_duration": 2.5,
+                            "transit_depth": 500,
+                            "planet_radius": 2.0
+                        }
+                    },
+                    {
+                        "light_curve_data": {
+                            "time": [0.0, 0.1, 0.2, 0.3, 0.4],
+                            "flux": [1.0, 0.95, 0.98, 1.0, 0.99]
+                        }
+                    }
+                ],
+                "save_result": False
+            }
+        }
+
+
 class PredictionResponseSchema(BaseModel):
     """예측 응답 스키마"""
     id: str = Field(..., description="예측 ID")
@@ -65,8 +123,15 @@ class PredictionResponseSchema(BaseModel):
         description="신뢰도 레벨 (VERY_HIGH, HIGH, MEDIUM, LOW, VERY_LOW)"
     )
     created_at: datetime = Field(..., description="생성 시간")
-    light_curve_data: Optional[Dict] = Field(None, description="광도 곡선 데이터")
+    light_curve_data: Optional[Dict] = Field(
+        None,
+        description="광도 곡선 데이터 (LIGHT_CURVE_STORAGE 정책에 따라 다운샘플링, 목록 조회에서는 생략)"
+    )
     input_features: Optional[Dict[str, float]] = Field(None, description="입력 특징값")
+    light_curve_preview: Optional[Dict] = Field(
+        None,
+        description="광도 곡선 미리보기 (time, flux, 최대 LIGHT_CURVE_PREVIEW_POINTS개 점)"
+    )
 
     class Config:
         from_attributes = True
@@ -91,6 +156,10 @@ class PredictionsListResponseSchema(BaseModel):
     total: int = Field(..., description="전체 예측 개수")
     skip: int = Field(..., description="건너뛴 개수")
     limit: int = Field(..., description="조회 개수")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="다음 페이지 커서 (cursor 파라미터로 전달, 마지막 페이지면 null)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -109,11 +178,18 @@ class PredictionsListResponseSchema(BaseModel):
                 ],
                 "total": 1,
                 "skip": 0,
-                "limit": 100
+                "limit": 100,
+                "next_cursor": None
             }
         }
 
 
+class BatchPredictionResponseSchema(BaseModel):
+    """일괄 예측 응답 스키마"""
+    predictions: List[PredictionResponseSchema] = Field(..., description="요청 순서와 동일한 예측 목록")
+    total: int = Field(..., description="예측 개수")
+
+
 class DeleteResponseSchema(BaseModel):
     """삭제 응답 스키마"""
     message: str = Field(..., description="응답 메시지")
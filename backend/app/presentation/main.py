@@ -3,30 +3,60 @@ FastAPI 메인 애플리케이션
 외계행성 탐지 API 서버
 """
 
+import asyncio
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from prometheus_fastapi_instrumentator import Instrumentator
-from ..infrastructure.database import init_db
+from ..infrastructure.database import dispose_engines, init_db
 from .api import api_router
+from .api.dependencies import get_inference_executor, get_model_runtime, get_prediction_writer
+from .model_startup import ModelStartupState, load_and_warm_up_model
+from .readiness import ReadinessProbe
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     애플리케이션 라이프사이클 관리
-    시작 시 데이터베이스 초기화
+    시작 시 데이터베이스 초기화 후 모델 로드·워밍업을 백그라운드로 시작
+    (완료 전까지 app.state.model_startup이 준비되지 않은 상태로 보고됨)
     """
     # 시작 시 실행
     print("Initializing database...")
     init_db()
     print("Database initialized successfully!")
 
+    app.state.model_startup = ModelStartupState()
+    app.state.readiness_probe = ReadinessProbe.from_env(
+        model_runtime=get_model_runtime(),
+        executor=get_inference_executor()
+    )
+    model_startup_task = asyncio.create_task(load_and_warm_up_model(app.state.model_startup))
+
+    # 예측 write-behind 저장 (PREDICTION_WRITE_BEHIND_MS가 0이면 비활성화)
+    get_prediction_writer().start()
+
+    # 모델 디렉터리 감시 (MODEL_WATCH_INTERVAL초마다, 0이면 비활성화)
+    watch_interval = float(os.getenv("MODEL_WATCH_INTERVAL", "0"))
+    model_watch_task = (
+        asyncio.create_task(get_model_runtime().watch(watch_interval))
+        if watch_interval > 0 else None
+    )
+
     yield
 
     # 종료 시 실행
     print("Shutting down...")
+    for task in (model_startup_task, model_watch_task):
+        if task is not None and not task.done():
+            task.cancel()
+    if get_inference_executor.cache_info().currsize:
+        get_inference_executor().shutdown()
+    # 커넥션 풀을 닫기 전에 대기 중인 예측을 모두 저장
+    await get_prediction_writer().close()
+    await dispose_engines()
 
 
 # FastAPI 앱 생성
@@ -0,0 +1,83 @@
+"""
+모델 시작 로딩
+애플리케이션 시작 시 모델을 미리 로드하고 워밍업하여 상태를 기록
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+from .api.dependencies import get_exoplanet_detector
+
+
+@dataclass
+class ModelStartupState:
+    """
+    모델 시작 상태
+
+    status:
+        pending: 로딩 시작 전
+        loading: 모델/스케일러 로드 중
+        warming_up: 워밍업 추론 중
+        ready: 요청 처리 가능
+        failed: 로드 또는 워밍업 실패 (error에 원인 기록)
+    """
+    status: str = "pending"
+    load_seconds: Optional[float] = None
+    warmup_seconds: Optional[float] = None
+    warmup_iterations: int = 0
+    error: Optional[str] = None
+    started_at: Optional[float] = None
+    ready_at: Optional[float] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """요청 처리 가능 여부"""
+        return self.status == "ready"
+
+    def to_dict(self) -> dict:
+        """API 응답용 딕셔너리"""
+        return dict(asdict(self), ready=self.is_ready)
+
+
+async def load_and_warm_up_model(state: ModelStartupState, iterations: Optional[int] = None):
+    """
+    모델 로드 및 워밍업
+
+    모델 언피클링은 스레드에서 실행하여 로딩 중에도 이벤트 루프가
+    헬스 체크 요청에 응답할 수 있도록 함
+
+    Parameters:
+        state: 진행 상태를 기록할 객체
+        iterations: 워밍업 반복 횟수 (None이면 MODEL_WARMUP_ITERATIONS, 기본값 3)
+    """
+    if iterations is None:
+        iterations = int(os.getenv("MODEL_WARMUP_ITERATIONS", "3"))
+
+    state.started_at = time.time()
+
+    try:
+        # 1. 모델 및 스케일러 로드
+        state.status = "loading"
+        start = time.perf_counter()
+        detector = await asyncio.to_thread(get_exoplanet_detector)
+        state.load_seconds = time.perf_counter() - start
+
+        # 2. 워밍업 추론
+        state.status = "warming_up"
+        state.warmup_iterations = iterations
+        state.warmup_seconds = await detector.warm_up(iterations)
+
+        state.status = "ready"
+        state.ready_at = time.time()
+        print(
+            f"Model ready (load {state.load_seconds:.2f}s, "
+            f"warm-up {state.warmup_seconds:.2f}s x{iterations})"
+        )
+
+    except Exception as e:
+        state.status = "failed"
+        state.error = str(e)
+        print(f"Model startup failed: {state.error}")
@@ -0,0 +1,157 @@
+"""
+준비 상태 점검 (Readiness Probe)
+모델, 워밍업, 데이터베이스, 추론 대기열 상태를 점검하고 결과를 짧게 캐싱
+"""
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+from ..infrastructure.database import check_database_async
+from ..infrastructure.ml import ModelRuntime, InferenceExecutor
+from .model_startup import ModelStartupState
+
+
+class ReadinessProbe:
+    """
+    준비 상태 점검기
+
+    점검 항목:
+        model: 현재 탐지기의 ModelLoader.is_loaded()
+        warmup: 시작 시 워밍업 완료 여부
+        database: 커넥션 풀 연결 획득 + SELECT 1 지연 시간
+        inference_queue: 실행기의 실행/대기 작업 수
+
+    프로브가 짧은 주기로 호출되어도 DB에 부하를 주지 않도록
+    결과를 cache_ttl초 동안 재사용하며, 동시 호출은 하나의 점검을 공유
+
+    환경변수:
+        READINESS_CACHE_TTL: 결과 캐시 시간 (초, 기본값 2)
+        READINESS_DB_TIMEOUT: DB 점검 제한 시간 (초, 기본값 2)
+        READINESS_DB_MAX_LATENCY_MS: 허용 DB 지연 시간 (ms, 기본값 500)
+        READINESS_MAX_QUEUE_RATIO: 허용 대기열 사용률 (기본값 0.9)
+    """
+
+    def __init__(
+        self,
+        model_runtime: ModelRuntime,
+        executor: InferenceExecutor,
+        cache_ttl: float = 2.0,
+        db_timeout: float = 2.0,
+        db_max_latency_ms: float = 500.0,
+        max_queue_ratio: float = 0.9
+    ):
+        """
+        Parameters:
+            model_runtime: 모델 런타임
+            executor: 추론 실행기
+            cache_ttl: 결과 캐시 시간 (초)
+            db_timeout: DB 점검 제한 시간 (초)
+            db_max_latency_ms: 허용 DB 지연 시간 (ms)
+            max_queue_ratio: 허용 대기열 사용률 (실행 + 대기 작업 수 / 최대 작업 수)
+        """
+        self.model_runtime = model_runtime
+        self.executor = executor
+        self.cache_ttl = cache_ttl
+        self.db_timeout = db_timeout
+        self.db_max_latency_ms = db_max_latency_ms
+        self.max_queue_ratio = max_queue_ratio
+
+        self._result: Optional[dict] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_env(cls, model_runtime: ModelRuntime, executor: InferenceExecutor) -> 'ReadinessProbe':
+        """환경변수 설정으로 점검기 생성"""
+        return cls(
+            model_runtime=model_runtime,
+            executor=executor,
+            cache_ttl=float(os.getenv("READINESS_CACHE_TTL", "2")),
+            db_timeout=float(os.getenv("READINESS_DB_TIMEOUT", "2")),
+            db_max_latency_ms=float(os.getenv("READINESS_DB_MAX_LATENCY_MS", "500")),
+            max_queue_ratio=float(os.getenv("READINESS_MAX_QUEUE_RATIO", "0.9"))
+        )
+
+    async def check(self, model_startup: Optional[ModelStartupState]) -> dict:
+        """
+        준비 상태 점검 (캐시된 결과가 유효하면 재사용)
+
+        Parameters:
+            model_startup: 시작 시 모델 로딩 상태
+
+        Returns:
+            {"ready": bool, "status": str, "checks": {...}, "checked_at": float}
+        """
+        if self._is_fresh():
+            return self._result
+
+        async with self._lock:
+            # 대기하는 동안 다른 호출이 점검을 마쳤으면 그 결과 사용
+            if self._is_fresh():
+                return self._result
+
+            self._result = await self._run_checks(model_startup)
+            self._checked_at = time.monotonic()
+            return self._result
+
+    def _is_fresh(self) -> bool:
+        """캐시된 결과 유효 여부"""
+        return self._result is not None and time.monotonic() - self._checked_at < self.cache_ttl
+
+    async def _run_checks(self, model_startup: Optional[ModelStartupState]) -> dict:
+        """모든 항목 점검"""
+        checks = {
+            'model': {'ok': self.model_runtime.is_loaded()},
+            'warmup': self._check_warmup(model_startup),
+            'database': await self._check_database(),
+            'inference_queue': self._check_inference_queue()
+        }
+        ready = all(check['ok'] for check in checks.values())
+
+        return {
+            'ready': ready,
+            'status': 'ready' if ready else 'not_ready',
+            'checks': checks,
+            'checked_at': time.time()
+        }
+
+    def _check_warmup(self, model_startup: Optional[ModelStartupState]) -> dict:
+        """워밍업 완료 여부"""
+        if model_startup is None:
+            return {'ok': False, 'status': 'unknown'}
+
+        result = {'ok': model_startup.is_ready, 'status': model_startup.status}
+        if model_startup.error:
+            result['error'] = model_startup.error
+        return result
+
+    async def _check_database(self) -> dict:
+        """요청 처리에 쓰는 비동기 커넥션 풀의 연결 획득 + SELECT 1 지연 시간"""
+        try:
+            latency = await asyncio.wait_for(
+                check_database_async(),
+                timeout=self.db_timeout
+            )
+        except asyncio.TimeoutError:
+            return {'ok': False, 'error': f"timeout after {self.db_timeout}s"}
+        except Exception as e:
+            return {'ok': False, 'error': str(e)}
+
+        latency_ms = latency * 1000
+        return {
+            'ok': latency_ms <= self.db_max_latency_ms,
+            'latency_ms': round(latency_ms, 2)
+        }
+
+    def _check_inference_queue(self) -> dict:
+        """추론 대기열 사용률"""
+        pending = self.executor.pending
+        max_size = self.executor.max_queue_size
+
+        return {
+            'ok': pending < max_size * self.max_queue_ratio,
+            'pending': pending,
+            'max_queue_size': max_size
+        }
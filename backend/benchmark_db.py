@@ -0,0 +1,196 @@
+"""
+예측 리포지토리 동시 처리량 벤치마크
+이벤트 루프에서 동기 Session을 호출하던 이전 방식과 비동기 엔진(AsyncSession) 방식의
+동시 요청 처리량과 이벤트 루프 지연 비교
+
+사용법:
+    python benchmark_db.py [--database-url sqlite:///./benchmark.db] [--requests 2000] [--concurrency 50]
+                           [--bulk-rows 5000]
+
+각 요청은 예측 저장(save) 후 단건 조회(find_by_id)를 수행.
+이어서 --bulk-rows개 예측을 save() 반복과 save_many() 한 번으로 저장하는 시간을 비교.
+--database-url을 생략하면 임시 SQLite 파일을 사용하며, MySQL/PostgreSQL URL을 주면
+DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT 설정으로 풀을 만듦
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.entities.prediction import Prediction
+from app.infrastructure.database.connection import Base, pool_options, to_async_url
+from app.infrastructure.database.models import PredictionModel
+from app.infrastructure.repositories import PredictionRepositoryImpl
+
+
+def make_prediction() -> Prediction:
+    """특징값 요청과 같은 크기의 예측 엔티티"""
+    return Prediction(
+        is_exoplanet=True,
+        confidence_score=0.9,
+        planet_probability=0.9,
+        candidate_probability=0.05,
+        input_features={'orbital_period': 3.5, 'transit_duration': 2.5, 'transit_depth': 500.0}
+    )
+
+
+async def sync_request(session_factory) -> None:
+    """이전 방식: 이벤트 루프에서 동기 Session으로 add → commit → refresh → 조회"""
+    with session_factory() as db:
+        prediction = make_prediction()
+        db_prediction = PredictionModel(
+            id=prediction.id,
+            input_features=prediction.input_features,
+            is_exoplanet=prediction.is_exoplanet,
+            classification=prediction.get_classification(),
+            confidence_score=prediction.confidence_score,
+            planet_probability=prediction.planet_probability,
+            candidate_probability=prediction.candidate_probability,
+            created_at=prediction.created_at
+        )
+        db.add(db_prediction)
+        db.commit()
+        db.refresh(db_prediction)
+        db.query(PredictionModel).filter(PredictionModel.id == prediction.id).first()
+
+
+async def async_request(session_factory) -> None:
+    """비동기 방식: PredictionRepositoryImpl + AsyncSession"""
+    async with session_factory() as db:
+        repository = PredictionRepositoryImpl(db=db)
+        prediction = await repository.save(make_prediction())
+        await repository.find_by_id(prediction.id)
+
+
+async def run_load(
+    request: Callable[[], Awaitable[None]],
+    total: int,
+    concurrency: int
+) -> dict:
+    """
+    동시 요청 부하 실행
+
+    Returns:
+        처리량(req/s), 요청 지연 p50/p95 (ms), 이벤트 루프 최대 지연 (ms)
+    """
+    latencies: List[float] = []
+    loop_lag: List[float] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            start = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - start)
+
+    async def ticker():
+        # 1ms마다 깨어나야 하는 작업이 실제로 얼마나 늦게 깨는지 (다른 요청이 겪는 대기)
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            loop_lag.append(time.perf_counter() - start - 0.001)
+
+    ticker_task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    # 루프를 계속 막았다면 ticker는 여기서야 깨어나므로 그 지연까지 기록
+    await asyncio.sleep(0.002)
+    ticker_task.cancel()
+
+    latencies.sort()
+    return {
+        'throughput': total / elapsed,
+        'p50': statistics.median(latencies) * 1000,
+        'p95': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        'max_loop_lag': max(loop_lag) * 1000 if loop_lag else 0.0
+    }
+
+
+async def run_bulk(session_factory, rows: int) -> dict:
+    """
+    일괄 저장 비교: save() 반복 vs save_many() (각 rows개)
+
+    Returns:
+        방식별 초당 저장 행 수
+    """
+    results = {}
+
+    async with session_factory() as db:
+        repository = PredictionRepositoryImpl(db=db)
+        predictions = [make_prediction() for _ in range(rows)]
+        start = time.perf_counter()
+        for prediction in predictions:
+            await repository.save(prediction)
+        results['save() loop'] = rows / (time.perf_counter() - start)
+
+    async with session_factory() as db:
+        repository = PredictionRepositoryImpl(db=db)
+        predictions = [make_prediction() for _ in range(rows)]
+        start = time.perf_counter()
+        await repository.save_many(predictions)
+        results['save_many()'] = rows / (time.perf_counter() - start)
+
+    return results
+
+
+async def run_benchmark(database_url: str, total: int, concurrency: int, bulk_rows: int) -> None:
+    """이전 방식과 비동기 방식의 결과 출력"""
+    print("\n" + "=" * 60)
+    print(f"Prediction Repository Benchmark ({total:,} requests, concurrency {concurrency})")
+    print(f"  database: {database_url.split('@')[-1]}")
+    print("=" * 60)
+
+    sync_engine = create_engine(database_url, **pool_options(database_url))
+    Base.metadata.create_all(bind=sync_engine)
+    sync_sessions = sessionmaker(bind=sync_engine, autoflush=False)
+
+    async_url = to_async_url(database_url)
+    async_engine = create_async_engine(async_url, **pool_options(async_url))
+    async_sessions = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    results = {
+        'sync Session': await run_load(lambda: sync_request(sync_sessions), total, concurrency),
+        'AsyncSession': await run_load(lambda: async_request(async_sessions), total, concurrency)
+    }
+
+    print(f"  {'mode':<14s} {'req/s':>8s} {'p50 (ms)':>9s} {'p95 (ms)':>9s} {'loop lag (ms)':>14s}")
+    for name, result in results.items():
+        print(
+            f"  {name:<14s} {result['throughput']:8.0f} {result['p50']:9.1f} "
+            f"{result['p95']:9.1f} {result['max_loop_lag']:14.1f}"
+        )
+
+    if bulk_rows > 0:
+        print(f"\n  Bulk insert ({bulk_rows:,} rows)")
+        for name, rows_per_second in (await run_bulk(async_sessions, bulk_rows)).items():
+            print(f"  {name:<14s} {rows_per_second:10,.0f} rows/s")
+
+    await async_engine.dispose()
+    sync_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="예측 리포지토리 동시 처리량 벤치마크")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--bulk-rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'benchmark.db')}"
+
+    asyncio.run(run_benchmark(database_url, args.requests, args.concurrency, args.bulk_rows))
@@ -0,0 +1,124 @@
+"""
+광도 곡선 업로드 형식 벤치마크
+JSON light_curve_data 경로와 바이너리 업로드(/predictions/upload) 경로의
+요청 본문 크기와 파싱 시간(본문 → LightCurve 엔티티) 비교
+
+사용법:
+    python benchmark_upload.py [--points 100000] [--repeat 5]
+
+FITS, Arrow 형식은 astropy, pyarrow가 설치된 경우에만 측정
+"""
+
+import argparse
+import io
+import json
+import time
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from app.domain.entities.light_curve import LightCurve
+from app.infrastructure.ml.light_curve_reader import read_light_curve
+from app.presentation.api.v1.schemas import PredictionRequestSchema
+
+
+def make_light_curve(points: int) -> Dict[str, np.ndarray]:
+    """2분 간격 합성 광도 곡선 (주기 3.5일, 깊이 1% 트랜짓)"""
+    rng = np.random.default_rng(0)
+    time_values = np.arange(points) * (2.0 / 1440.0)
+    flux = 1.0 + 1e-3 * rng.standard_normal(points)
+    flux[(time_values % 3.5) < 0.1] -= 0.01
+    return {'time': time_values, 'flux': flux, 'flux_err': np.full(points, 1e-3)}
+
+
+def encode_bodies(curve: Dict[str, np.ndarray]) -> Dict[str, bytes]:
+    """형식별 요청 본문 생성"""
+    bodies = {
+        'json': json.dumps({
+            'light_curve_data': {name: values.tolist() for name, values in curve.items()},
+            'save_result': False
+        }).encode()
+    }
+
+    buffer = io.BytesIO()
+    np.save(buffer, np.stack([curve['time'], curve['flux'], curve['flux_err']]))
+    bodies['npy'] = buffer.getvalue()
+
+    buffer = io.BytesIO()
+    np.savez(buffer, **curve)
+    bodies['npz'] = buffer.getvalue()
+
+    try:
+        import pyarrow as pa
+        table = pa.table(curve)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        bodies['arrow'] = sink.getvalue().to_pybytes()
+    except ImportError:
+        print("[SKIP] pyarrow가 없어 Arrow 형식 제외")
+
+    try:
+        from astropy.io import fits
+        columns = [
+            fits.Column(name='TIME', format='D', array=curve['time']),
+            fits.Column(name='PDCSAP_FLUX', format='E', array=curve['flux']),
+            fits.Column(name='PDCSAP_FLUX_ERR', format='E', array=curve['flux_err'])
+        ]
+        buffer = io.BytesIO()
+        fits.HDUList([
+            fits.PrimaryHDU(),
+            fits.BinTableHDU.from_columns(columns, name='LIGHTCURVE')
+        ]).writeto(buffer)
+        bodies['fits'] = buffer.getvalue()
+    except ImportError:
+        print("[SKIP] astropy가 없어 FITS 형식 제외")
+
+    return bodies
+
+
+def parse_json(body: bytes) -> LightCurve:
+    """JSON 경로: 본문 파싱 → Pydantic 검증 → 엔티티 생성"""
+    request = PredictionRequestSchema.model_validate_json(body)
+    data = request.light_curve_data
+    return LightCurve(time=data['time'], flux=data['flux'], flux_err=data.get('flux_err'))
+
+
+def measure(parse: Callable[[], LightCurve], repeat: int) -> float:
+    """최소 파싱 시간 (ms)"""
+    parse()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def run_benchmark(points: int, repeat: int) -> None:
+    """형식별 본문 크기와 파싱 시간 출력"""
+    print("\n" + "=" * 60)
+    print(f"Light Curve Upload Benchmark ({points:,} points)")
+    print("=" * 60)
+
+    bodies = encode_bodies(make_light_curve(points))
+    baseline: Optional[float] = None
+
+    print(f"  {'format':<8s} {'size (MB)':>10s} {'parse (ms)':>11s} {'speedup':>8s}")
+    for name, body in bodies.items():
+        if name == 'json':
+            elapsed = measure(lambda: parse_json(body), repeat)
+            baseline = elapsed
+        else:
+            elapsed = measure(lambda: read_light_curve(body, file_format=name), repeat)
+        speedup = baseline / elapsed if baseline and elapsed > 0 else 1.0
+        print(f"  {name:<8s} {len(body) / 1e6:10.2f} {elapsed:11.2f} {speedup:7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="광도 곡선 업로드 형식 벤치마크")
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run_benchmark(args.points, args.repeat)
@@ -0,0 +1,84 @@
+"""
+외계행성 탐지 모델 컴파일 스크립트
+학습된 StackingClassifier를 배열 기반 추론 엔진(.compiled.npz)으로 변환
+
+사용법:
+    python compile_model.py [모델 파일 이름] [--model-dir models]
+
+생성된 파일은 ModelLoader가 원본 모델과 함께 자동으로 로드하며,
+모델을 재학습한 경우 이 스크립트를 다시 실행해야 함
+"""
+
+import argparse
+import pickle
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.infrastructure.ml.compiled_ensemble import CompiledEnsemble
+from app.infrastructure.ml.model_loader import ModelLoader
+
+
+def compile_model(model_dir: str, model_name: str, n_samples: int = 2048) -> Path:
+    """
+    모델 컴파일 및 검증
+
+    Parameters:
+        model_dir: 모델 디렉터리
+        model_name: 모델 파일 이름
+        n_samples: 검증용 표준화 샘플 수
+
+    Returns:
+        컴파일된 모델 파일 경로
+    """
+    model_path = Path(model_dir) / model_name
+    if not model_path.exists():
+        raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {model_path}")
+
+    print("\n" + "=" * 60)
+    print("Compiling Model...")
+    print("=" * 60)
+
+    with open(model_path, 'rb') as f:
+        model = pickle.load(f)
+    print(f"[OK] Model loaded: {model_path}")
+
+    # 모델 입력은 StandardScaler 출력이므로 표준정규분포 샘플 + 0 벡터로 검증
+    rng = np.random.default_rng(42)
+    sample = rng.standard_normal((n_samples, model.n_features_in_))
+    sample[0] = 0.0
+
+    compiled = CompiledEnsemble.from_stacking(model, sample[:256])
+    max_error = compiled.validate(model, sample)
+    print(f"[OK] Validated on {n_samples} samples (max abs error: {max_error:.3g})")
+
+    output_path = Path(model_dir) / ModelLoader.compiled_model_name(model_name)
+    compiled.save(output_path)
+    print(f"[OK] Compiled model saved: {output_path}")
+
+    # 추론 시간 비교
+    print("\n" + "-" * 60)
+    print("Latency (ms):")
+    print("-" * 60)
+    for batch_size in (1, 64, 512):
+        batch = sample[:batch_size]
+        timings = []
+        for predictor in (model, compiled):
+            predictor.predict_proba(batch)
+            start = time.perf_counter()
+            for _ in range(10):
+                predictor.predict_proba(batch)
+            timings.append((time.perf_counter() - start) / 10 * 1000)
+        print(f"  batch={batch_size:<4d} sklearn={timings[0]:8.2f}  compiled={timings[1]:8.2f}")
+
+    return output_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="StackingClassifier 컴파일")
+    parser.add_argument("model_name", nargs="?", default="exoplanet_model.pkl")
+    parser.add_argument("--model-dir", default="models")
+    args = parser.parse_args()
+
+    compile_model(args.model_dir, args.model_name)
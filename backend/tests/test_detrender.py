@@ -0,0 +1,61 @@
+"""
+추세 제거기 테스트
+청크 스트림으로 처리한 추세·클리핑 결과가 곡선 전체로 계산한 결과와 같은지 검증
+"""
+
+import numpy as np
+import pytest
+
+from app.infrastructure.ml.detrender import MAD_TO_SIGMA, LightCurveDetrender
+
+
+@pytest.fixture
+def curve():
+    rng = np.random.default_rng(20240502)
+    time = np.sort(rng.uniform(0.0, 20.0, 20_000))
+    # 관측 공백 하나
+    time = time[(time < 8.0) | (time > 9.0)]
+    flux = (1.0 + 0.01 * np.sin(time / 2.0)) * (1.0 + rng.normal(0.0, 1e-3, time.size))
+    flux[(time % 3.5) < 0.1] *= 0.99
+    flux[rng.choice(time.size, 30, replace=False)] += 0.02
+    flux[rng.choice(time.size, 10, replace=False)] -= 0.02
+    flux_err = rng.uniform(1e-3, 2e-3, time.size)
+
+    cuts = np.sort(rng.choice(np.arange(1, time.size), size=40, replace=False))
+    chunks = list(zip(np.split(time, cuts), np.split(flux, cuts), np.split(flux_err, cuts)))
+    return time, flux, flux_err, chunks
+
+
+def concatenate(results, name):
+    return np.concatenate([getattr(result, name) for result in results])
+
+
+@pytest.mark.parametrize("method", ["biweight", "median"])
+def test_detrend_stream_matches_full_curve(curve, method):
+    time, flux, flux_err, chunks = curve
+    detrender = LightCurveDetrender(method=method)
+
+    unclipped = LightCurveDetrender(method=method, sigma_upper=None, sigma_lower=None).detrend(
+        time, flux, flux_err
+    )
+    streamed = list(detrender.detrend_stream(chunks))
+    np.testing.assert_array_equal(concatenate(streamed, 'time'), unclipped.time)
+    np.testing.assert_allclose(concatenate(streamed, 'trend'), unclipped.trend, rtol=1e-12)
+    np.testing.assert_allclose(concatenate(streamed, 'flux_err'), unclipped.flux_err, rtol=1e-12)
+
+    # 곡선 전체의 중앙값·MAD를 주면 클리핑 결과도 같음
+    full = detrender.detrend(time, flux, flux_err)
+    center = np.median(unclipped.flux)
+    sigma = MAD_TO_SIGMA * np.median(np.abs(unclipped.flux - center))
+    clipped = list(detrender.detrend_stream(chunks, center, sigma))
+    np.testing.assert_array_equal(concatenate(clipped, 'time'), full.time)
+    np.testing.assert_allclose(concatenate(clipped, 'flux'), full.flux, rtol=1e-12)
+    assert sum(result.clipped for result in clipped) == full.clipped > 0
+
+
+def test_detrend_stream_rejects_unsorted_time(curve):
+    _, _, _, chunks = curve
+    detrender = LightCurveDetrender()
+
+    with pytest.raises(ValueError):
+        list(detrender.detrend_stream([chunks[1], chunks[0]]))
@@ -0,0 +1,73 @@
+"""
+외계행성 탐지 서비스 테스트
+일괄 탐지가 입력 구성(특징값·광도 곡선 혼합, flux_err 유무)과 무관하게 건별 탐지와 같은 결과를 내는지 검증
+"""
+
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from app.domain.entities.light_curve import LightCurve
+from app.infrastructure.cache.feature_cache import FeatureCache
+from app.infrastructure.cache.prediction_cache import PredictionCache
+from app.infrastructure.ml.exoplanet_detector_impl import ExoplanetDetectorImpl
+from app.infrastructure.ml.feature_extractor import FeatureExtractor
+from app.infrastructure.ml.inference_executor import InferenceExecutor
+from app.infrastructure.ml.model_loader import ModelLoader
+from app.infrastructure.ml.preprocessor import Preprocessor
+
+
+MODEL_DIR = Path(__file__).resolve().parent.parent / "models"
+
+
+def make_detector(feature_cache_size: int) -> ExoplanetDetectorImpl:
+    """저장소의 스케일러와 특징에 따라 확률이 달라지는 작은 3클래스 모델로 탐지기 구성"""
+    model_loader = ModelLoader(model_dir=str(MODEL_DIR))
+    model_loader.load_scaler("scaler.pkl")
+    scaler = model_loader.get_scaler()
+
+    rng = np.random.default_rng(0)
+    samples = rng.normal(size=(60, scaler.n_features_in_))
+    model_loader.model = LogisticRegression(max_iter=500).fit(samples, np.arange(60) % 3)
+    model_loader.model_info = {'version': 'test'}
+
+    preprocessor = Preprocessor()
+    preprocessor.set_scaler(scaler)
+
+    return ExoplanetDetectorImpl(
+        model_loader=model_loader,
+        feature_extractor=FeatureExtractor(),
+        preprocessor=preprocessor,
+        executor=InferenceExecutor(max_workers=1),
+        cache=PredictionCache(max_size=0),
+        feature_cache=FeatureCache(max_size=feature_cache_size)
+    )
+
+
+@pytest.mark.parametrize("feature_cache_size", [0, 100])
+def test_detect_batch_mixes_features_and_curves_with_and_without_errors(feature_cache_size):
+    detector = make_detector(feature_cache_size)
+    rng = np.random.default_rng(1)
+    time = np.linspace(0.0, 27.0, 1500)
+    flux = 1.0 + rng.normal(0.0, 1e-3, time.size)
+    flux[700:720] -= 0.01
+
+    with_errors = LightCurve(time, flux, rng.uniform(1e-3, 2e-3, time.size))
+    without_errors = LightCurve(time, flux * 1.001)
+    features = detector.feature_extractor.extract_features(LightCurve(time, flux * 0.999))
+    inputs = [features, with_errors, without_errors]
+
+    async def run():
+        mixed = await detector.detect_batch(inputs)
+        single = [(await detector.detect_batch([item]))[0] for item in inputs]
+        return mixed, single
+
+    mixed, single = asyncio.run(run())
+
+    assert len(mixed) == 3
+    for batch_result, single_result in zip(mixed, single):
+        assert batch_result.planet_probability == pytest.approx(single_result.planet_probability)
+        assert batch_result.candidate_probability == pytest.approx(single_result.candidate_probability)
@@ -0,0 +1,44 @@
+"""
+특징 추출기 테스트
+트랜짓 탐색 사용 시 transit_depth/transit_duration 단위가 신호 탐지 여부와 무관하게 같은지 검증
+"""
+
+import numpy as np
+import pytest
+
+from app.domain.entities.light_curve import LightCurve
+from app.infrastructure.ml.feature_extractor import FeatureExtractor
+from app.infrastructure.ml.transit_search import TransitSearch
+
+
+@pytest.fixture
+def light_curve():
+    rng = np.random.default_rng(3)
+    time = np.linspace(0.0, 27.0, 4000)
+    flux = 1.0 + rng.normal(0.0, 1e-3, time.size)
+    flux[(time % 3.1) < 0.12] -= 0.01
+    return LightCurve(time, flux)
+
+
+def test_transit_features_without_signal_use_training_units(light_curve):
+    heuristic = FeatureExtractor().extract_features(light_curve)
+    # 작업량 상한으로 탐색을 건너뛰면 신호를 찾지 못한 경우와 같은 경로
+    extractor = FeatureExtractor(transit_search=TransitSearch(max_cells=1))
+
+    features = extractor.extract_features(light_curve)
+    matrix, names = extractor.extract_many([light_curve])
+
+    for result in (features, dict(zip(names, matrix[0]))):
+        assert result['orbital_period'] == 0.0
+        assert result['signal_to_noise'] == 0.0
+        assert result['transit_depth'] == pytest.approx(heuristic['transit_depth'] * 1e6)
+        assert result['transit_duration'] == pytest.approx(heuristic['transit_duration'] * 24.0)
+
+
+def test_transit_features_with_signal_use_training_units(light_curve):
+    features = FeatureExtractor(transit_search=TransitSearch()).extract_features(light_curve)
+
+    assert features['orbital_period'] == pytest.approx(3.1, rel=1e-2)
+    # 1% 깊이 → 약 10000 ppm, 0.12일 → 약 2.9시간
+    assert features['transit_depth'] == pytest.approx(1e4, rel=0.2)
+    assert features['transit_duration'] == pytest.approx(0.12 * 24.0, rel=0.2)
@@ -0,0 +1,43 @@
+"""
+광도 곡선 엔티티 테스트
+입력 배열을 나중에 바꿔도 엔티티 데이터와 캐시된 통계가 어긋나지 않는지 검증
+"""
+
+import numpy as np
+
+from app.domain.entities.light_curve import LightCurve
+
+
+def test_writable_input_is_copied():
+    time = np.arange(5.0)
+    flux = np.ones(5)
+    light_curve = LightCurve(time, flux)
+    assert light_curve.min_flux == 1.0
+
+    flux[0] = 0.5
+    time[0] = -1.0
+
+    assert light_curve.flux[0] == 1.0
+    assert light_curve.time[0] == 0.0
+    assert light_curve.min_flux == 1.0
+    assert not light_curve.flux.flags.writeable
+    assert flux.flags.writeable
+
+
+def test_readonly_view_of_writable_buffer_is_copied():
+    flux = np.ones(5)
+    view = flux.view()
+    view.flags.writeable = False
+
+    light_curve = LightCurve(np.arange(5.0), view)
+
+    assert not np.shares_memory(light_curve.flux, flux)
+
+
+def test_frozen_buffer_is_wrapped_without_copy():
+    flux = np.frombuffer(np.ones(5).tobytes())
+
+    light_curve = LightCurve(np.arange(5.0), flux)
+
+    assert np.shares_memory(light_curve.flux, flux)
+    assert not light_curve[1:3].flux.flags.writeable
@@ -0,0 +1,319 @@
+"""
+스트리밍 특징 누적기 테스트
+청크 단위·병합 결과가 한 번에 계산한 결과(NumPy/SciPy)와 같은지 검증
+"""
+
+import numpy as np
+import pytest
+from scipy.stats import kurtosis, skew
+
+from app.domain.entities.light_curve import LightCurve
+from app.infrastructure.ml.detrender import LightCurveDetrender
+from app.infrastructure.ml.feature_extractor import FeatureExtractor
+from app.infrastructure.ml.streaming_features import (
+    QuantileSketch,
+    RunningMoments,
+    StreamingFeatureAccumulator,
+    StreamingFeatureExtractor
+)
+
+
+def split(values: np.ndarray, rng: np.random.Generator, pieces: int):
+    """값 배열을 길이가 다른 pieces개 청크로 분할"""
+    cuts = np.sort(rng.choice(np.arange(1, values.size), size=pieces - 1, replace=False))
+    return np.split(values, cuts)
+
+
+def rank_error(values: np.ndarray, estimate: float, q: float) -> float:
+    """추정값의 정규화 순위와 목표 분위의 차이"""
+    low = np.searchsorted(values, estimate, side='left')
+    high = np.searchsorted(values, estimate, side='right')
+    target = q * (values.size - 1)
+    return max(0.0, low - target, target - high) / values.size
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(20240501)
+
+
+# ----------------------------------------------------------------------
+# RunningMoments
+# ----------------------------------------------------------------------
+
+@pytest.mark.parametrize("offset", [0.0, 1e4])
+def test_running_moments_chunked_matches_single_pass(rng, offset):
+    values = offset + rng.gamma(2.0, 1e-3, 50_000)
+
+    moments = RunningMoments()
+    for chunk in split(values, rng, 37):
+        moments.update(chunk)
+
+    assert moments.count == values.size
+    assert moments.mean == pytest.approx(np.mean(values), rel=1e-12)
+    assert moments.variance == pytest.approx(np.var(values), rel=1e-9)
+    assert moments.skewness == pytest.approx(skew(values), rel=1e-6)
+    assert moments.kurtosis == pytest.approx(kurtosis(values), rel=1e-6)
+    assert moments.min == np.min(values)
+    assert moments.max == np.max(values)
+
+
+def test_running_moments_merge_is_order_independent(rng):
+    values = rng.normal(1.0, 0.01, 30_000)
+    chunks = split(values, rng, 12)
+
+    parts = [RunningMoments().update(chunk) for chunk in chunks]
+    forward = RunningMoments()
+    for part in parts:
+        forward.merge(part)
+
+    # 역순 + 트리 형태 병합
+    reverse = [RunningMoments().update(chunk) for chunk in reversed(chunks)]
+    while len(reverse) > 1:
+        reverse = [
+            reverse[i].merge(reverse[i + 1]) if i + 1 < len(reverse) else reverse[i]
+            for i in range(0, len(reverse), 2)
+        ]
+    tree = reverse[0]
+
+    for moments in (forward, tree):
+        assert moments.count == values.size
+        assert moments.mean == pytest.approx(np.mean(values), rel=1e-12)
+        assert moments.variance == pytest.approx(np.var(values), rel=1e-9)
+        assert moments.skewness == pytest.approx(skew(values), rel=1e-6, abs=1e-9)
+        assert moments.kurtosis == pytest.approx(kurtosis(values), rel=1e-6, abs=1e-9)
+
+
+def test_running_moments_merge_with_empty():
+    values = np.array([1.0, 2.0, 4.0])
+    moments = RunningMoments().merge(RunningMoments().update(values)).merge(RunningMoments())
+
+    assert moments.count == 3
+    assert moments.mean == pytest.approx(np.mean(values))
+    assert moments.variance == pytest.approx(np.var(values))
+
+
+def test_running_moments_constant_values_have_undefined_shape():
+    moments = RunningMoments().update(np.full(1000, 1.0)).update(np.full(10, 1.0))
+
+    assert moments.variance == 0.0
+    assert np.isnan(moments.skewness)
+    assert np.isnan(moments.kurtosis)
+
+
+# ----------------------------------------------------------------------
+# QuantileSketch
+# ----------------------------------------------------------------------
+
+QUANTILES = (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99)
+
+
+@pytest.mark.parametrize("order", ["random", "sorted", "reversed"])
+def test_quantile_sketch_rank_error_is_bounded(rng, order):
+    k = 400
+    values = rng.normal(1.0, 0.01, 200_000)
+    if order == "sorted":
+        values = np.sort(values)
+    elif order == "reversed":
+        values = np.sort(values)[::-1]
+
+    sketch = QuantileSketch(k=k, seed=7)
+    for chunk in split(values, rng, 50):
+        sketch.update(chunk)
+
+    assert sketch.count == values.size
+    # 메모리는 데이터 점 수와 무관하게 약 3k
+    assert sum(level.size for level in sketch._levels) <= 4 * k
+
+    ordered = np.sort(values)
+    for q, estimate in zip(QUANTILES, sketch.quantiles(QUANTILES)):
+        assert rank_error(ordered, estimate, q) <= 3 * 1.7 / k
+
+
+def test_quantile_sketch_merge_rank_error_is_bounded(rng):
+    k = 400
+    values = rng.lognormal(0.0, 1.0, 150_000)
+
+    sketches = [QuantileSketch(k=k, seed=index).update(chunk) for index, chunk in enumerate(split(values, rng, 9))]
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+
+    assert merged.count == values.size
+    ordered = np.sort(values)
+    for q, estimate in zip(QUANTILES, merged.quantiles(QUANTILES)):
+        assert rank_error(ordered, estimate, q) <= 3 * 1.7 / k
+
+
+def test_quantile_sketch_is_exact_below_capacity(rng):
+    values = rng.normal(size=300)
+    sketch = QuantileSketch(k=400).update(values[:100]).update(values[100:])
+
+    np.testing.assert_allclose(
+        sketch.quantiles(QUANTILES),
+        np.percentile(values, [q * 100 for q in QUANTILES])
+    )
+
+
+def test_quantile_sketch_rejects_empty_and_small_k():
+    with pytest.raises(ValueError):
+        QuantileSketch(k=4)
+    with pytest.raises(ValueError):
+        QuantileSketch().quantiles((0.5,))
+
+
+# ----------------------------------------------------------------------
+# StreamingFeatureAccumulator
+# ----------------------------------------------------------------------
+
+def make_curve(rng, days=30.0, points=40_000):
+    time = np.sort(rng.uniform(0.0, days, points))
+    flux = 1.0 + rng.normal(0.0, 1e-3, points)
+    flux[(time % 3.5) < 0.1] -= 0.01
+    flux_err = rng.uniform(1e-3, 2e-3, points)
+    return time, flux, flux_err
+
+
+def assert_same_bins(a: StreamingFeatureAccumulator, b: StreamingFeatureAccumulator):
+    for left, right in zip(a.binned(), b.binned()):
+        np.testing.assert_allclose(left, right, rtol=1e-12)
+    assert a.transit_duration(1.0) == b.transit_duration(1.0)
+
+
+def test_accumulator_chunked_and_merged_match_single_update(rng):
+    time, flux, flux_err = make_curve(rng)
+    flux[100] = np.nan
+    time[200] = np.inf
+
+    single = StreamingFeatureAccumulator().update(time, flux, flux_err)
+
+    chunked = StreamingFeatureAccumulator()
+    merged = StreamingFeatureAccumulator()
+    indices = np.arange(time.size)
+    for chunk in split(indices, rng, 17):
+        chunked.update(time[chunk], flux[chunk], flux_err[chunk])
+    # 시간 순서가 뒤섞인 청크를 각자 누적한 뒤 역순으로 병합
+    for chunk in reversed(split(rng.permutation(indices), rng, 5)):
+        merged.merge(StreamingFeatureAccumulator().update(time[chunk], flux[chunk], flux_err[chunk]))
+
+    finite = np.isfinite(time) & np.isfinite(flux)
+    for accumulator in (chunked, merged):
+        assert accumulator.count == single.count == np.count_nonzero(finite)
+        assert accumulator.dropped == single.dropped == 2
+        assert accumulator.flux.mean == pytest.approx(single.flux.mean, rel=1e-12)
+        assert accumulator.flux.variance == pytest.approx(single.flux.variance, rel=1e-9)
+        assert accumulator.error_sum == pytest.approx(single.error_sum, rel=1e-12)
+        assert accumulator.error_max == single.error_max
+        assert_same_bins(accumulator, single)
+
+
+def test_accumulator_rejects_mismatched_bin_width():
+    with pytest.raises(ValueError):
+        StreamingFeatureAccumulator(bin_width=0.01).merge(StreamingFeatureAccumulator(bin_width=0.02))
+
+
+class SmallAccumulator(StreamingFeatureAccumulator):
+    MAX_BINS = 100
+
+
+@pytest.mark.parametrize("first_span", [1, 30, 60, 99])
+def test_accumulator_grows_up_to_max_bins(first_span):
+    # 앞쪽 일부 bin을 먼저 누적한 뒤 나머지를 채워 정확히 MAX_BINS개 bin을 사용
+    width = 1.0
+    accumulator = SmallAccumulator(bin_width=width)
+    accumulator.update(np.arange(first_span) + 0.5, np.ones(first_span))
+    accumulator.update(np.array([SmallAccumulator.MAX_BINS - 0.5]), np.array([1.0]))
+
+    # 뒤쪽에서 앞쪽으로 자라는 경우
+    backward = SmallAccumulator(bin_width=width)
+    backward.update(SmallAccumulator.MAX_BINS - 0.5 - np.arange(first_span), np.ones(first_span))
+    backward.update(np.array([0.5]), np.array([1.0]))
+
+    for grown in (accumulator, backward):
+        assert grown._counts.size <= SmallAccumulator.MAX_BINS
+        assert grown.binned()[0].size == min(first_span + 1, SmallAccumulator.MAX_BINS)
+
+
+def test_accumulator_rejects_span_beyond_max_bins():
+    accumulator = SmallAccumulator(bin_width=1.0)
+    accumulator.update(np.array([0.5]), np.array([1.0]))
+
+    with pytest.raises(ValueError):
+        accumulator.update(np.array([SmallAccumulator.MAX_BINS + 0.5]), np.array([1.0]))
+    with pytest.raises(ValueError):
+        SmallAccumulator(bin_width=1.0).update(
+            np.array([0.5, SmallAccumulator.MAX_BINS + 0.5]),
+            np.array([1.0, 1.0])
+        )
+
+
+# ----------------------------------------------------------------------
+# StreamingFeatureExtractor
+# ----------------------------------------------------------------------
+
+def test_streaming_features_match_feature_extractor(rng):
+    time, flux, flux_err = make_curve(rng)
+    extractor = FeatureExtractor()
+    streaming = StreamingFeatureExtractor(extractor, sketch_size=400)
+
+    chunks = [
+        (time[chunk], flux[chunk], flux_err[chunk])
+        for chunk in split(np.arange(time.size), rng, 9)
+    ]
+    features = streaming.extract(lambda: chunks)
+
+    expected = extractor.extract_features(LightCurve(time, flux, flux_err))
+
+    assert set(features) == set(expected)
+    exact = (
+        'mean_flux', 'std_flux', 'var_flux', 'min_flux', 'max_flux', 'flux_range',
+        'flux_ratio', 'skewness', 'kurtosis', 'coefficient_of_variation',
+        'mean_flux_err', 'max_flux_err'
+    )
+    for name in exact:
+        assert features[name] == pytest.approx(expected[name], rel=1e-9), name
+
+    ordered = np.sort(flux)
+    for name, q in (('flux_25percentile', 0.25), ('median_flux', 0.5),
+                    ('flux_75percentile', 0.75), ('flux_90percentile', 0.9)):
+        assert rank_error(ordered, features[name], q) <= 3 * 1.7 / 400, name
+
+    assert abs(features['transit_duration'] - expected['transit_duration']) <= 2 * streaming.bin_width
+
+
+def test_accumulator_span_ignores_allocation_slack():
+    # 뒤쪽으로 자라며 앞에 남긴 여유분 때문에 실제 관측 기간이 MAX_BINS 이하인데 거부되지 않아야 함
+    accumulator = SmallAccumulator(bin_width=1.0)
+    accumulator.update(np.arange(90, 100) + 0.5, np.ones(10))
+    accumulator.update(np.array([85.5]), np.array([1.0]))
+    accumulator.update(np.array([184.5]), np.array([1.0]))
+
+    assert accumulator.binned()[0].size == 12
+    np.testing.assert_allclose(accumulator.binned()[0][[0, -1]], [85.5, 184.5])
+
+    merged = SmallAccumulator(bin_width=1.0).update(np.array([184.5]), np.array([1.0]))
+    merged.merge(SmallAccumulator(bin_width=1.0).update(np.arange(85, 100) + 0.5, np.ones(15)))
+    assert merged.binned()[0].size == 16
+
+
+def test_streaming_features_apply_detrender(rng):
+    time, flux, flux_err = make_curve(rng)
+    flux *= 1.0 + 0.01 * np.sin(time / 2.0)
+    flux[rng.choice(time.size, 40, replace=False)] += 0.05
+    extractor = FeatureExtractor(detrender=LightCurveDetrender())
+    streaming = StreamingFeatureExtractor(extractor, sketch_size=400)
+
+    chunks = [
+        (time[chunk], flux[chunk], flux_err[chunk])
+        for chunk in split(np.arange(time.size), rng, 9)
+    ]
+    features = streaming.extract(lambda: iter(chunks))
+
+    expected = extractor.extract_features(LightCurve(time, flux, flux_err))
+
+    # 클리핑 기준만 스케치 근사값이므로 경계의 몇 점 외에는 같은 점으로 계산
+    for name in ('mean_flux', 'std_flux', 'min_flux', 'max_flux', 'skewness', 'mean_flux_err'):
+        assert features[name] == pytest.approx(expected[name], rel=1e-3), name
+    # 추세와 플레어가 제거된 상대 밝기
+    assert features['max_flux'] < 1.01
+    assert features['median_flux'] == pytest.approx(1.0, abs=1e-3)
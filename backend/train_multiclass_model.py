@@ -14,6 +14,7 @@ import pandas as pd
 import numpy as np
 import pickle
 from pathlib import Path
+from datetime import datetime
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import (
@@ -691,17 +692,27 @@ class MultiClassExoplanetTrainer:
         for i, class_name in enumerate(self.class_names):
             print(f"{class_name:20} {' '.join([f'{cm[i, j]:>15}' for j in range(3)])}")
 
-    def save_model(self, model_name: str = "exoplanet_multiclass_model.pkl"):
-        """모델 저장"""
+    def save_model(self, model_name: str = "exoplanet_multiclass_model.pkl", version: str = None):
+        """
+        모델 저장
+
+        Args:
+            model_name: 모델 파일 이름
+            version: 모델 버전 (지정 시 models/registry/<version>/에 번들로 저장하여
+                     서버의 모델 레지스트리에서 ?model_version=<version>으로 선택 가능)
+        """
         if self.model is None:
             raise ValueError("모델이 학습되지 않았습니다")
 
-        model_path = self.model_dir / model_name
-        scaler_path = self.model_dir / "scaler.pkl"
-        features_path = self.model_dir / "feature_names.pkl"
-        metadata_path = self.model_dir / "model_metadata.pkl"
-        roc_path = self.model_dir / "roc_metrics.pkl"
-        distribution_path = self.model_dir / "distribution_metrics.pkl"
+        output_dir = self.model_dir / "registry" / version if version else self.model_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        model_path = output_dir / model_name
+        scaler_path = output_dir / "scaler.pkl"
+        features_path = output_dir / "feature_names.pkl"
+        metadata_path = output_dir / "model_metadata.pkl"
+        roc_path = output_dir / "roc_metrics.pkl"
+        distribution_path = output_dir / "distribution_metrics.pkl"
 
         print(f"\n" + "="*50)
         print(f"Saving model...")
@@ -725,7 +736,9 @@ class MultiClassExoplanetTrainer:
             'num_classes': 3,
             'class_names': self.class_names,
             'feature_count': len(self.feature_names),
-            'features': self.feature_names
+            'features': self.feature_names,
+            'version': version,
+            'trained_at': datetime.now().isoformat()
         }
         with open(metadata_path, 'wb') as f:
             pickle.dump(metadata, f)
@@ -747,13 +760,14 @@ class MultiClassExoplanetTrainer:
         print(f"Features saved: {features_path}")
         print(f"Metadata saved: {metadata_path}")
 
-    def run(self, optimize=True, n_trials=100):
+    def run(self, optimize=True, n_trials=100, version=None):
         """
         전체 학습 파이프라인 실행
 
         Args:
             optimize: Optuna 최적화 여부 (기본값: True)
             n_trials: Optuna 최적화 시행 횟수 (기본값: 100)
+            version: 모델 버전 (지정 시 models/registry/<version>/에 저장)
         """
         try:
             print("\n" + "="*70)
@@ -784,7 +798,7 @@ class MultiClassExoplanetTrainer:
             X_test, y_test, y_pred, y_pred_proba = self.train(X, y)
 
             # 7. 모델 저장
-            self.save_model()
+            self.save_model(version=version)
 
             print("\n" + "="*70)
             print("TRAINING COMPLETED SUCCESSFULLY!")
@@ -803,4 +817,4 @@ class MultiClassExoplanetTrainer:
 
 if __name__ == "__main__":
     trainer = MultiClassExoplanetTrainer()
-    trainer.run()
+    trainer.run(version=os.getenv("MODEL_VERSION") or None)